@@ -0,0 +1,158 @@
+"""
+Before/after benchmark for `spectre-optimize` on a synthetic metadata database.
+
+Builds a `columns` table with TABLES x VERSIONS x COLUMNS rows (10M by
+default), inserted version by version across all datasets the way
+pipelines append them, and times the per-dataset lookups the dashboard
+runs: one dataset's history (plots) and one dataset version
+(`table_pointer`).
+
+Usage:
+    python benchmarks/layout.py [--tables 1000] [--versions 100] [--columns 100]
+                                [--names distinct|prefixed]
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import duckdb
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from sp3ctrapp.optimize import optimize  # noqa: E402
+
+
+def build(path, tables, versions, columns, names):
+    # DuckDB keeps an 8-byte prefix of strings in its zone maps, so names that
+    # share a long prefix ("dataset_1", "dataset_2", ...) cannot be pruned
+    if names == "prefixed":
+        name = "'dataset_' || t"
+    else:
+        name = "substr(md5(t::VARCHAR), 1, 6) || '_survey'"
+    con = duckdb.connect(path)
+    con.execute(
+        f"""
+        CREATE TABLE pointers AS
+        SELECT
+            {name} AS "table",
+            strftime(TIMESTAMP '2024-01-01' + INTERVAL (v) DAY, '%Y-%m-%dT%H-%M-%S') AS version,
+            'Pass' AS status,
+            'Treischl, Edgar' AS validated_by,
+            'validation/dataset_' || t || '.html' AS report_path
+        FROM range(?) v(v), range(?) t(t)
+        ORDER BY v, t
+        """,
+        [versions, tables],
+    )
+    con.execute(
+        """
+        CREATE TABLE columns AS
+        SELECT
+            p."table",
+            p.version,
+            'column_' || c AS column_name,
+            'Label ' || c AS label,
+            CASE c % 3 WHEN 0 THEN 'factor' WHEN 1 THEN 'numeric' ELSE 'integer' END AS type,
+            CASE c % 3 WHEN 0 THEN 'a, b, c' ELSE 'NA' END AS levels,
+            'Description of column ' || c AS description
+        FROM pointers p, range(?) c(c)
+        ORDER BY p.version, p."table", c
+        """,
+        [columns],
+    )
+    con.close()
+
+
+def bench(path, keys, repeat):
+    con = duckdb.connect(path, read_only=True)
+    timings = {}
+    queries = {
+        "dataset history": (
+            'SELECT version, column_name, type FROM columns WHERE "table" = ?',
+            lambda k: [k[0]],
+        ),
+        "dataset version": (
+            'SELECT column_name, label, type, levels, description FROM columns '
+            'WHERE "table" = ? AND version = ?',
+            lambda k: list(k),
+        ),
+        "pointer lookup": (
+            'SELECT status, validated_by FROM pointers WHERE "table" = ? AND version = ?',
+            lambda k: list(k),
+        ),
+    }
+    for name, (sql, params) in queries.items():
+        samples = []
+        for key in keys[:repeat]:
+            start = time.perf_counter()
+            con.execute(sql, params(key)).fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[name] = statistics.median(samples)
+    con.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--versions", type=int, default=100)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--names",
+        choices=["distinct", "prefixed"],
+        default="distinct",
+        help="Dataset names with distinct prefixes or a shared 'dataset_' prefix",
+    )
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="spectre-layout-")
+    raw = os.path.join(workdir, "raw.duckdb")
+    sorted_only = os.path.join(workdir, "sorted.duckdb")
+    indexed = os.path.join(workdir, "indexed.duckdb")
+
+    start = time.perf_counter()
+    build(raw, args.tables, args.versions, args.columns, args.names)
+    rows = args.tables * args.versions * args.columns
+    print(f"Built {rows:,} column rows in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    optimize(raw, sorted_only)
+    print(f"Sorted in {time.perf_counter() - start:.1f}s")
+
+    # For comparison only: optimize() does not create indexes
+    start = time.perf_counter()
+    optimize(raw, indexed)
+    con = duckdb.connect(indexed)
+    con.execute('CREATE INDEX idx_pointers ON pointers ("table", version)')
+    con.execute('CREATE INDEX idx_columns ON columns ("table", version)')
+    con.close()
+    print(f"Sorted and indexed in {time.perf_counter() - start:.1f}s")
+
+    rng = random.Random(42)
+    con = duckdb.connect(raw, read_only=True)
+    keys = con.execute('SELECT "table", version FROM pointers').fetchall()
+    con.close()
+    rng.shuffle(keys)
+
+    results = {
+        "baseline": bench(raw, keys, args.repeat),
+        "sorted": bench(sorted_only, keys, args.repeat),
+        "sorted + index": bench(indexed, keys, args.repeat),
+    }
+
+    print(f"\n{'median ms':<16}" + "".join(f"{name:>18}" for name in results))
+    for query in results["baseline"]:
+        print(f"{query:<16}" + "".join(f"{r[query]:>18.2f}" for r in results.values()))
+    for name, path in [("baseline", raw), ("sorted", sorted_only), ("sorted + index", indexed)]:
+        print(f"{name} file size: {os.path.getsize(path) / 1024**2:.0f} MB")
+
+    shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
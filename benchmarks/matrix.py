@@ -0,0 +1,112 @@
+"""
+Presence/type matrix benchmark: pandas grid merge vs. the DuckDB matrix builder.
+
+Builds one synthetic dataset with VERSIONS x COLUMNS rows in `columns`, where
+a share of the columns is dropped in every version, and times the data
+preparation of `plot_PresenceMatrixWeb` both ways. The old way reads the long
+table, builds a `MultiIndex.from_product` grid and left-merges the data onto
+it; the new way is `sp3ctrapp.matrix.schema_matrix`. Peak Python memory is
+measured with tracemalloc. The query cache is disabled in both.
+
+Usage:
+    python benchmarks/matrix.py [--versions 2000] [--columns 300] [--runs 3]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import duckdb
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("SPECTRE_WATCH_INTERVAL", "3600")
+os.environ["SPECTRE_CACHE_MB"] = "0"
+
+
+def build(workdir, versions, columns):
+    data = os.path.join(workdir, "src", "sp3ctrapp", "data")
+    os.makedirs(data)
+    path = os.path.join(data, "meta.duckdb")
+    shutil.copyfile(os.path.join(ROOT, "src", "sp3ctrapp", "data", "meta.duckdb"), path)
+    con = duckdb.connect(path)
+    # Every tenth column is missing in every seventh version
+    con.execute(
+        """
+        INSERT INTO columns ("table", version, column_name, type)
+        SELECT
+            'survey',
+            strftime(TIMESTAMP '2020-01-01' + to_hours(v), '%Y-%m-%dT%H-%M-%S'),
+            'column_' || c,
+            CASE c % 3 WHEN 0 THEN 'factor' WHEN 1 THEN 'numeric' ELSE 'integer' END
+        FROM range(?) r(v), range(?) s(c)
+        WHERE NOT (c % 10 = 0 AND v % 7 = 0)
+        """,
+        [versions, columns],
+    )
+    con.close()
+
+
+def pandas_grid(table):
+    # The data preparation of plot_PresenceMatrixWeb before the matrix builder
+    from sp3ctrapp.getduck import duckdb_query
+
+    data = duckdb_query("columns", columns=["version", "column_name"], where={"table": table})
+    data = data.drop_duplicates(subset=["version", "column_name"])
+    full_grid = pd.MultiIndex.from_product(
+        [data["version"].unique(), data["column_name"].unique()], names=["version", "column_name"]
+    ).to_frame(index=False)
+    data["found"] = True
+    presence = pd.merge(full_grid, data[["version", "column_name", "found"]], on=["version", "column_name"], how="left")
+    presence["present"] = presence["found"].fillna(False)
+    col_order = presence.sort_values("column_name", ascending=False)["column_name"].unique()
+    presence["column_name"] = pd.Categorical(presence["column_name"], categories=col_order, ordered=True)
+    return presence
+
+
+def matrix_grid(table):
+    from sp3ctrapp.matrix import schema_matrix
+
+    return schema_matrix(table).to_frame("present")
+
+
+def measure(func, runs):
+    times, peaks = [], []
+    for _ in range(runs):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = func("survey")
+        times.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return result, statistics.median(times) * 1000, max(peaks) / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--versions", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        build(workdir, args.versions, args.columns)
+        os.chdir(workdir)
+
+        print(f"{args.versions} versions x {args.columns} columns")
+        results = {}
+        for name, func in (("pandas merge", pandas_grid), ("duckdb matrix", matrix_grid)):
+            results[name], ms, peak = measure(func, args.runs)
+            print(f"{name:14s} {ms:8.1f} ms  peak {peak:7.1f} MB")
+
+        old, new = results["pandas merge"], results["duckdb matrix"]
+        print("same cells:", int(old["present"].sum()) == int(new["present"].sum()) and len(old) == len(new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Server vs client rendering benchmark for the matrix plots.
+
+For each view (presence, type, labels, pipe) this builds what the app sends
+to the browser in both plot backends: the PNG that `render.image` inlines as
+base64 (`SPECTRE_PLOT_BACKEND=server`) and the Vega-Lite spec with its data
+(`SPECTRE_PLOT_BACKEND=client`). Reports the payload size, raw and gzipped
+as with websocket compression, and the server CPU time per render. The
+render cache is bypassed, so server numbers are those of a cache miss.
+
+With `--versions N` the penguins dataset in a copy of meta.duckdb is given N
+synthetic versions first, to see how both backends scale with history.
+
+Usage:
+    python benchmarks/rendering.py [--versions 0] [--runs 3] [--width 1000]
+"""
+import argparse
+import base64
+import gzip
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import duckdb
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("SPECTRE_WATCH_INTERVAL", "3600")
+
+
+def prepare(workdir, versions):
+    data = os.path.join(workdir, "src", "sp3ctrapp", "data")
+    os.makedirs(data)
+    path = os.path.join(data, "meta.duckdb")
+    shutil.copyfile(os.path.join(ROOT, "src", "sp3ctrapp", "data", "meta.duckdb"), path)
+    if versions:
+        con = duckdb.connect(path)
+        # Copies of the newest penguins version, one hour apart
+        for table in ("pointers", "columns"):
+            con.execute(
+                f"""
+                INSERT INTO {table}
+                SELECT * EXCLUDE (i) REPLACE (
+                    strftime(TIMESTAMP '2024-01-01' + to_hours(i), '%Y-%m-%dT%H-%M-%S') AS version
+                )
+                FROM {table}, range(?) AS r(i)
+                WHERE "table" = 'penguins'
+                  AND version = (SELECT max(version) FROM pointers WHERE "table" = 'penguins')
+                """,
+                [versions],
+            )
+        con.close()
+
+
+def cpu_ms(func, runs):
+    # Median process CPU time, so waiting on DuckDB threads is not counted twice
+    times = []
+    for _ in range(runs):
+        start = time.process_time()
+        result = func()
+        times.append((time.process_time() - start) * 1000)
+    return result, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--versions", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--height", type=int, default=600)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        prepare(workdir, args.versions)
+        os.chdir(workdir)
+
+        from sp3ctrapp import clientplots, plots
+        from sp3ctrapp.rendercache import PX_PER_INCH, encode_plot
+
+        views = {
+            "presence": (lambda: plots.plot_PresenceMatrixWeb("penguins"), lambda: clientplots.spec_presence("penguins")),
+            "type": (lambda: plots.plot_TypeMatrixWeb("penguins"), lambda: clientplots.spec_type("penguins")),
+            "labels": (lambda: plots.plot_LabelMatrix("penguins"), lambda: clientplots.spec_labels("penguins")),
+            "pipe": (lambda: plots.plot_pipe("penguins"), lambda: clientplots.spec_pipe("penguins")),
+        }
+
+        print(f"{'view':10s} {'backend':8s} {'payload':>10s} {'gzipped':>10s} {'server cpu':>11s}")
+        for name, (figure, spec) in views.items():
+            png, server_ms = cpu_ms(
+                lambda: encode_plot(figure(), args.width, args.height, PX_PER_INCH), args.runs
+            )
+            server = ("data:image/png;base64," + base64.b64encode(png).decode("ascii")).encode("ascii")
+
+            text, client_ms = cpu_ms(
+                lambda: json.dumps(spec(), separators=(",", ":"), default=str), args.runs
+            )
+            client = text.encode("utf-8")
+
+            for backend, payload, ms in (("server", server, server_ms), ("client", client, client_ms)):
+                print(
+                    f"{name:10s} {backend:8s} {len(payload) / 1024:8.1f}kB "
+                    f"{len(gzip.compress(payload)) / 1024:8.1f}kB {ms:9.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
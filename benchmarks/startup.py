@@ -0,0 +1,61 @@
+"""
+Startup benchmark: how long it takes to import the app and how many
+database queries run while doing so.
+
+Each run imports `sp3ctrapp.app` in a fresh interpreter, the way a worker
+boots, and reports the import time, the number of queries issued during
+import and whether the import succeeds without a database.
+
+Usage:
+    python benchmarks/startup.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+PROBE = """
+import json, time
+t = time.perf_counter()
+import sp3ctrapp.app
+elapsed = time.perf_counter() - t
+from sp3ctrapp.querylog import query_stats
+queries = sum(entry["queries"] for entry in query_stats().values())
+print(json.dumps({"seconds": elapsed, "queries": queries}))
+"""
+
+
+def probe(cwd):
+    env = dict(os.environ, PYTHONPATH=SRC, SPECTRE_WATCH_INTERVAL="3600")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=cwd, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    root = os.path.dirname(SRC)
+    runs = [probe(root) for _ in range(args.runs)]
+    if any(run is None for run in runs):
+        sys.exit("Importing sp3ctrapp.app failed")
+    print(f"import with database:    {statistics.median(r['seconds'] for r in runs) * 1000:7.1f} ms "
+          f"(median of {args.runs}), {runs[0]['queries']} queries")
+
+    with tempfile.TemporaryDirectory() as empty:
+        run = probe(empty)
+    print("import without database: " + ("ok" if run is not None else "fails"))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,12 @@
 
 # Expose commonly used elements for easy access
 from .getduck import duckdb_table  # Expose the DuckDB function
+from .getduck import duckdb_query, connection_stats, cache_stats, close_connections
+from .getduck import swap_database, start_watcher, database_generation
+from .getduck import duckdb_query_async, duckdb_table_async, run_async
+from .querylog import query_stats
+from .rendercache import render_cache_stats
+from .warmup import warmup_stats
 from .moduleAbout import about_ui, about_server
 from .moduleOverview import overview_ui, overview_server
 from .moduleValidation import validation_ui, validation_server
@@ -16,11 +22,17 @@ from .tables import table_overview, table_pointer
 from .plots import plot_PresenceMatrixWeb, plot_TypeMatrixWeb, plot_LabelMatrix
 
 from .utils import filter_and_sort_versions, datasets
-from .utils import shared_first_choice, shared_second_choice
+from .utils import Selection
+from .history import SchemaHistory, schema_history
+from .levels import label_drift
 
 
 __all__ = [
-    "duckdb_table",
+    "duckdb_table", "duckdb_query",
+    "connection_stats", "cache_stats", "close_connections",
+    "swap_database", "start_watcher", "database_generation",
+    "duckdb_query_async", "duckdb_table_async", "run_async", "query_stats",
+    "render_cache_stats", "warmup_stats",
     "about_ui", "about_server",
     "overview_ui", "overview_server",
     "validation_ui", "validation_server",
@@ -32,5 +44,6 @@ __all__ = [
     "table_overview", "table_pointer",
     "plot_PresenceMatrixWeb", "plot_TypeMatrixWeb", "plot_LabelMatrix",
     "filter_and_sort_versions", "datasets",
-    "shared_first_choice", "shared_second_choice",
+    "Selection",
+    "SchemaHistory", "schema_history", "label_drift",
 ]
\ No newline at end of file
@@ -1,6 +1,8 @@
 # ---- Imports ----
 from shiny import App, Inputs, Outputs, Session, ui
 from pathlib import Path
+from starlette.applications import Starlette
+from starlette.routing import Mount
 import emoji
 
 
@@ -12,6 +14,10 @@ from sp3ctrapp.moduleClass import class_ui, class_server
 from sp3ctrapp.moduleLabels import labels_ui, labels_server
 from sp3ctrapp.moduleDiff import diff_ui, diff_server
 from sp3ctrapp.modulePipe import pipe_ui, pipe_server
+from sp3ctrapp.getduck import start_watcher
+from sp3ctrapp.reports import report_routes
+from sp3ctrapp.utils import Selection
+from sp3ctrapp.warmup import start_warmup
 
 
 # ---- App UI ----
@@ -59,15 +65,28 @@ app_ui = ui.page_navbar(
 
 # ---- App Server ----
 def app_server(input: Inputs, output: Outputs, session: Session):
-    about_server("about")
-    overview_server("overview")
-    pipe_server("pipe")
-    validation_server("validation")
-    variables_server("variables")
-    class_server("class")
-    labels_server("labels")
-    diff_server("diff")
+    selection = Selection()
+    about_server("about", selection)
+    overview_server("overview", selection)
+    pipe_server("pipe", selection)
+    validation_server("validation", selection)
+    variables_server("variables", selection)
+    class_server("class", selection)
+    labels_server("labels", selection)
+    diff_server("diff", selection)
 
 
 www_dir = Path(__file__).parent / "www"
-app = App(app_ui, app_server, static_assets=www_dir)
+shiny_app = App(app_ui, app_server, static_assets=www_dir)
+
+# Validation reports are served over plain HTTP next to the Shiny app, so
+# browsers cache them instead of receiving them through the websocket
+app = Starlette(
+    routes=[*report_routes, Mount("/", app=shiny_app)],
+    lifespan=shiny_app.starlette_app.router.lifespan_context,
+)
+
+# Pick up a replaced meta.duckdb without restarting the server
+start_watcher()
+# Pre-render the plots of all datasets in the background (SPECTRE_WARMUP_WORKERS)
+start_warmup()
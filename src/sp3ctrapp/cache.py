@@ -0,0 +1,100 @@
+# src/sp3ctrapp/cache.py
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def sizeof(value):
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value: A DataFrame, bytes/str or any other Python object.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache.
+
+    Entries are evicted oldest-first once the summed size of all values
+    exceeds `max_bytes`. A single value larger than the budget is not stored.
+
+    Args:
+        max_bytes (int): Total size budget for all cached values.
+        sizer (callable): Function returning the size of a value in bytes.
+    """
+
+    def __init__(self, max_bytes, sizer=sizeof):
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key, default=None):
+        """Return the value for `key` and mark it as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return self._entries[key][0]
+            self._counters["misses"] += 1
+            return default
+
+    def put(self, key, value):
+        """Store `value` under `key`, evicting old entries if needed."""
+        size = self._sizer(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._counters["evictions"] += 1
+
+    def discard(self, predicate):
+        """
+        Drop all entries whose key matches `predicate`.
+
+        Args:
+            predicate (callable): Called with each key; entries are removed when it returns True.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._bytes -= self._entries.pop(key)[1]
+                self._counters["invalidations"] += 1
+
+    def clear(self):
+        """Remove all entries."""
+        self.discard(lambda key: True)
+
+    def stats(self):
+        """
+        Return hit/miss/eviction counters and the current fill level.
+
+        Returns:
+            dict: Counters plus `entries`, `bytes` and `max_bytes`.
+        """
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,292 @@
+# src/sp3ctrapp/clientplots.py
+import json
+import os
+
+from htmltools import HTMLDependency
+from shiny import ui
+from shiny.module import resolve_id
+
+from sp3ctrapp.plots import (
+    label_matrix_data,
+    pipe_coverage_data,
+    presence_matrix_data,
+    type_matrix_data,
+)
+
+VEGA_LITE_SCHEMA = "https://vega.github.io/schema/vega-lite/v5.json"
+
+# Vega 5.30.0, Vega-Lite 5.21.0 and vega-embed 6.28.0, vendored in www/vega
+# so offline deployments work, loaded by the browser only in client mode
+vega_dependency = HTMLDependency(
+    name="vega-embed",
+    version="6.28.0",
+    source={"subdir": os.path.join(os.path.dirname(__file__), "www", "vega")},
+    script=[
+        {"src": "vega.min.js"},
+        {"src": "vega-lite.min.js"},
+        {"src": "vega-embed.min.js"},
+    ],
+)
+
+TYPE_COLORS = {"factor": "#1f77b4", "integer": "#CCCCCC", "numeric": "#2ca02c"}
+OTHER_COLORS = ["#9467bd", "#8c564b", "#e377c2", "#bcbd22", "#17becf", "#ff7f0e"]
+
+
+def plot_backend():
+    """
+    Return where the matrix plots are drawn, set per deployment.
+
+    Returns:
+        str: `server` (default, matplotlib images) or `client` (Vega-Lite in
+        the browser), from `SPECTRE_PLOT_BACKEND`.
+    """
+    return "client" if os.getenv("SPECTRE_PLOT_BACKEND", "server").lower() == "client" else "server"
+
+
+RUN_FIELDS = ["first_version", "last_version", "run_length"]
+
+
+def _values(df, columns):
+    # Plain records; categoricals and Arrow strings become JSON strings
+    columns = columns + [c for c in RUN_FIELDS if c in df.columns]
+    out = df[columns].astype(object).where(df[columns].notna(), None)
+    return out.to_dict(orient="records")
+
+
+def _run_tooltip(df):
+    # First and last version of a run, if the data is compacted
+    if "run_length" not in df.columns:
+        return []
+    return [
+        {"field": "first_version", "title": "from"},
+        {"field": "last_version", "title": "to"},
+        {"field": "run_length", "title": "versions"},
+    ]
+
+
+def _matrix_spec(values, color, y_sort, title_x="Version", title_y="Column"):
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "data": {"values": values},
+        "width": "container",
+        "height": {"step": 28},
+        "mark": {"type": "rect", "stroke": "white", "strokeWidth": 1},
+        "encoding": {
+            # Labels of version runs span several lines
+            "x": {
+                "field": "version",
+                "type": "ordinal",
+                "title": title_x,
+                "axis": {"labelAngle": 0, "labelExpr": "split(datum.label, '\\n')"},
+            },
+            "y": {"field": "column_name", "type": "ordinal", "title": title_y, "sort": y_sort},
+            "color": color,
+        },
+        "config": {"axis": {"labelFontSize": 13, "titleFontSize": 14}, "view": {"stroke": None}},
+    }
+
+
+def spec_presence(table, skip=0, clip_date=False, compact=False):
+    """
+    Vega-Lite spec of the Variables view, see `plot_PresenceMatrixWeb`.
+
+    Args:
+        table (str): Name of the dataset.
+        skip (int): Number of oldest versions to leave out.
+        clip_date (bool): Whether to show the date part of versions only.
+        compact (bool): Whether to collapse versions with an unchanged schema.
+
+    Returns:
+        dict: The Vega-Lite specification with inline data.
+    """
+    data = presence_matrix_data(table, skip=skip, clip_date=clip_date, compact=compact)
+    data["present"] = data["present"].map({True: "Yes", False: "No"})
+    color = {
+        "field": "present",
+        "type": "nominal",
+        "title": "Present",
+        "scale": {"domain": ["Yes", "No"], "range": ["#31572c", "#d00000"]},
+        "legend": {"orient": "bottom"},
+    }
+    spec = _matrix_spec(
+        _values(data, ["version", "column_name", "present"]),
+        color,
+        list(data["column_name"].cat.categories[::-1]),
+    )
+    spec["mark"]["opacity"] = 0.9
+    spec["encoding"]["tooltip"] = [
+        {"field": "version"},
+        {"field": "column_name", "title": "column"},
+        {"field": "present"},
+    ] + _run_tooltip(data)
+    return spec
+
+
+def spec_type(table, skip=0, clip_date=False, compact=False):
+    """
+    Vega-Lite spec of the Classes view, see `plot_TypeMatrixWeb`.
+
+    Args:
+        table (str): Name of the dataset.
+        skip (int): Number of oldest versions to leave out.
+        clip_date (bool): Whether to show the date part of versions only.
+        compact (bool): Whether to collapse versions with an unchanged schema.
+
+    Returns:
+        dict: The Vega-Lite specification with inline data.
+    """
+    data = type_matrix_data(table, skip=skip, clip_date=clip_date, compact=compact)
+    data["type"] = data["type"].astype(object).fillna("missing")
+
+    domain = sorted(t for t in data["type"].unique() if t != "missing")
+    others = iter(OTHER_COLORS * len(domain))
+    colors = [TYPE_COLORS.get(t) or next(others) for t in domain]
+    color = {
+        "field": "type",
+        "type": "nominal",
+        "title": "Type",
+        "scale": {"domain": domain + ["missing"], "range": colors + ["#d62728"]},
+        "legend": {"orient": "bottom"},
+    }
+    spec = _matrix_spec(
+        _values(data, ["version", "column_name", "type"]),
+        color,
+        list(data["column_name"].cat.categories[::-1]),
+    )
+    spec["mark"]["opacity"] = 0.95
+    spec["encoding"]["tooltip"] = [
+        {"field": "version"},
+        {"field": "column_name", "title": "column"},
+        {"field": "type"},
+    ] + _run_tooltip(data)
+    return spec
+
+
+def spec_labels(table, compact=False):
+    """
+    Vega-Lite spec of the Labels view, see `plot_LabelMatrix`.
+
+    Args:
+        table (str): Name of the dataset.
+        compact (bool): Whether to collapse versions with unchanged levels.
+
+    Returns:
+        dict: The Vega-Lite specification with inline data.
+    """
+    data = label_matrix_data(table, compact=compact)
+    data["changed"] = data["changed"].map({True: "Changed", False: "No Change"})
+    values = _values(data, ["version", "column_name", "changed", "label_short", "label_signature"])
+    encoding = {
+        "x": {
+            "field": "version",
+            "type": "ordinal",
+            "title": "Version",
+            # Same truncation as truncate_text in plot_LabelMatrix, runs span several lines
+            "axis": {
+                "labelAngle": 0,
+                "labelExpr": "indexof(datum.label, '\\n') < 0 && length(datum.label) > 14 "
+                "? slice(datum.label, 0, 13) + '…' : split(datum.label, '\\n')",
+            },
+        },
+        "y": {"field": "column_name", "type": "ordinal", "title": "Column"},
+    }
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "data": {"values": values},
+        "width": "container",
+        "height": {"step": 60},
+        "encoding": encoding,
+        "layer": [
+            {
+                "mark": {"type": "rect", "stroke": "white"},
+                "encoding": {
+                    "color": {
+                        "field": "changed",
+                        "type": "nominal",
+                        "title": "Changes",
+                        "scale": {"domain": ["Changed", "No Change"], "range": ["#d00000", "#31572c"]},
+                        "legend": {"orient": "bottom"},
+                    },
+                    "tooltip": [
+                        {"field": "version"},
+                        {"field": "column_name", "title": "column"},
+                        {"field": "label_signature", "title": "levels"},
+                    ] + _run_tooltip(data),
+                },
+            },
+            {
+                "mark": {"type": "text", "color": "white", "fontSize": 11},
+                "encoding": {"text": {"field": "label_short"}},
+            },
+        ],
+        "config": {"axis": {"labelFontSize": 13, "titleFontSize": 14}, "view": {"stroke": None}},
+    }
+
+
+def spec_pipe(table):
+    """
+    Vega-Lite spec of the Pipe view, see `plot_pipe`.
+
+    Args:
+        table (str): Name of the dataset.
+
+    Returns:
+        dict: The Vega-Lite specification with inline data.
+    """
+    data = pipe_coverage_data(table)
+    values = _values(data, ["cols", "cols_short", "validation_type", "count_plot"])
+    encoding = {
+        "x": {"field": "validation_type", "type": "nominal", "title": "Test", "axis": {"labelAngle": -45}},
+        "y": {"field": "cols_short", "type": "nominal", "title": "Column"},
+    }
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "data": {"values": values},
+        "width": "container",
+        "height": {"step": 24},
+        "encoding": encoding,
+        "layer": [
+            {"mark": {"type": "line", "color": "lightgray", "strokeWidth": 1}, "encoding": {"detail": {"field": "cols_short"}}},
+            {
+                "mark": {"type": "point", "filled": True, "size": 120, "stroke": "black", "strokeWidth": 0.5},
+                "encoding": {
+                    "fill": {
+                        "field": "count_plot",
+                        "type": "quantitative",
+                        "scale": {"range": ["white", "#31572c"]},
+                        "legend": None,
+                    },
+                    "tooltip": [{"field": "cols", "title": "column"}, {"field": "validation_type", "title": "test"}],
+                },
+            },
+        ],
+        "config": {"axis": {"labelFontSize": 13, "titleFontSize": 14, "grid": False}, "view": {"stroke": None}},
+    }
+
+
+def vega_output(id, spec):
+    """
+    UI that draws a Vega-Lite spec in the browser.
+
+    Meant to be returned from a `render.ui` output; the id is resolved in
+    the current module namespace.
+
+    Args:
+        id (str): Id of the chart container.
+        spec (dict): The Vega-Lite specification.
+
+    Returns:
+        ui.TagList: Container, inline spec and the embedding script.
+    """
+    element_id = resolve_id(id)
+    payload = json.dumps(spec, separators=(",", ":"), default=str).replace("</", "<\\/")
+    return ui.TagList(
+        vega_dependency,
+        ui.div(id=element_id, style="width: 100%;"),
+        ui.tags.script(
+            ui.HTML(
+                f"vegaEmbed({json.dumps('#' + element_id)}, {payload}, "
+                '{"actions": false, "renderer": "svg"});'
+            )
+        ),
+    )
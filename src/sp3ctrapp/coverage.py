@@ -0,0 +1,141 @@
+# src/sp3ctrapp/coverage.py
+import numpy as np
+import pandas as pd
+
+from sp3ctrapp.cache import LRUCache, sizeof
+from sp3ctrapp.getduck import duckdb_sql, get_pool, has_column, on_database_swap
+from sp3ctrapp.versions import version_index
+
+# Distinct (column, validation type) pairs of the validation pipeline. The
+# comma-separated `columns` of each step are split and unnested in DuckDB.
+_PAIRS_SQL = """
+    SELECT DISTINCT unnest(string_split_regex("columns", ',\\s*')) AS cols, validation_type
+    FROM pipes{where}
+    ORDER BY cols, validation_type
+"""
+
+# Columns of one dataset version that no pipeline step refers to
+_UNCOVERED_SQL = """
+    SELECT DISTINCT c.column_name
+    FROM columns c
+    WHERE c."table" = ? AND c.version = ?
+      AND NOT EXISTS (
+          SELECT 1 FROM ({pairs}) p WHERE p.cols = c.column_name
+      )
+    ORDER BY c.column_name
+"""
+
+
+class PipeCoverage:
+    """
+    Column x validation type matrix of the validation pipeline of a dataset.
+
+    Args:
+        dataset (str): Name of the dataset.
+        columns (np.ndarray): Validated column names, sorted.
+        validation_types (np.ndarray): Validation types, sorted.
+        covered (np.ndarray): Boolean matrix of shape
+            `(len(columns), len(validation_types))`.
+        uncovered (list[str]): Columns of the latest version of the dataset
+            without any validation step.
+    """
+
+    def __init__(self, dataset, columns, validation_types, covered, uncovered):
+        self.dataset = dataset
+        self.columns = columns
+        self.validation_types = validation_types
+        self.covered = covered
+        self.uncovered = uncovered
+
+    @property
+    def nbytes(self):
+        """Approximate memory footprint in bytes."""
+        return self.covered.nbytes + sizeof(pd.Series(self.columns)) + sizeof(pd.Series(self.uncovered))
+
+    def to_frame(self):
+        """
+        Expand the matrix into the long format of the Pipe plot.
+
+        Returns:
+            pd.DataFrame: Columns `cols`, `validation_type` and `count`,
+            1.0 where the column is validated by that type and NaN otherwise,
+            one block of all columns per validation type.
+        """
+        n_columns, n_types = self.covered.shape
+        return pd.DataFrame(
+            {
+                "cols": np.tile(self.columns, n_types),
+                "validation_type": np.repeat(self.validation_types, n_columns),
+                "count": np.where(self.covered.T.ravel(), 1.0, np.nan),
+            }
+        )
+
+
+def _pairs_query(dataset):
+    # Pipelines that record their dataset are filtered by it; a `pipes` table
+    # without a `table` column describes the one pipeline of the deployment.
+    if has_column("pipes", "table"):
+        return _PAIRS_SQL.format(where=' WHERE "table" = ?'), [dataset]
+    return _PAIRS_SQL.format(where=""), []
+
+
+def build_coverage(dataset):
+    """
+    Compute the pipeline coverage of a dataset in DuckDB.
+
+    Args:
+        dataset (str): Name of the dataset.
+
+    Returns:
+        PipeCoverage: The coverage matrix and the uncovered columns.
+    """
+    pairs_sql, params = _pairs_query(dataset)
+    pairs = duckdb_sql(pairs_sql, params, name="pipes", raise_errors=True)
+    if pairs.empty:
+        raise ValueError(f"No validation steps found for '{dataset}'.")
+
+    columns, column_codes = np.unique(pairs["cols"].to_numpy(dtype=object), return_inverse=True)
+    types, type_codes = np.unique(pairs["validation_type"].to_numpy(dtype=object), return_inverse=True)
+    covered = np.zeros((len(columns), len(types)), dtype=bool)
+    covered[column_codes, type_codes] = True
+
+    uncovered = []
+    latest = version_index(dataset).latest()
+    if latest is not None:
+        rows = duckdb_sql(
+            _UNCOVERED_SQL.format(pairs=pairs_sql),
+            [dataset, latest, *params],
+            name="columns",
+            raise_errors=True,
+        )
+        if not rows.empty:
+            uncovered = rows["column_name"].astype(str).tolist()
+    return PipeCoverage(dataset, columns, types, covered, uncovered)
+
+
+_coverages = LRUCache(max_bytes=32 * 1024**2, sizer=lambda coverage: coverage.nbytes)
+
+
+@on_database_swap
+def _drop_coverages():
+    _coverages.clear()
+
+
+def pipe_coverage(dataset):
+    """
+    Return the pipeline coverage of a dataset, computing it on first use.
+
+    Memoized per database fingerprint and dataset and shared by all sessions.
+
+    Args:
+        dataset (str): Name of the dataset.
+
+    Returns:
+        PipeCoverage: The coverage matrix and the uncovered columns.
+    """
+    key = (get_pool().fingerprint, dataset)
+    coverage = _coverages.get(key)
+    if coverage is None:
+        coverage = build_coverage(dataset)
+        _coverages.put(key, coverage)
+    return coverage
@@ -1,34 +1,961 @@
 # src/spectredash/duckdb_table.py
+import asyncio
+import atexit
+import contextvars
+import functools
+import glob
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import duckdb
 import pandas as pd
-import os
+import pyarrow as pa
 
+from sp3ctrapp.cache import LRUCache, sizeof
+from sp3ctrapp.querylog import current_origin, record_query, set_origin
 
-def duckdb_table(table):
+logger = logging.getLogger(__name__)
+
+
+def database_path():
     """
-    Fetch data from the DuckDB database.
+    Return the path of the metadata database shipped with the app.
+
+    Returns:
+        str: Absolute path to `src/sp3ctrapp/data/meta.duckdb`.
+    """
+    return os.path.join(os.getcwd(), "src", "sp3ctrapp", "data", "meta.duckdb")
+
+
+def parquet_path():
+    """
+    Return the root of the Parquet metadata store.
+
+    Returns:
+        str: `SPECTRE_PARQUET_DIR`, or `src/sp3ctrapp/data/parquet`.
+    """
+    default = os.path.join(os.getcwd(), "src", "sp3ctrapp", "data", "parquet")
+    return os.getenv("SPECTRE_PARQUET_DIR", default)
+
+
+def storage_backend():
+    """Return the metadata storage backend, `duckdb` (default) or `parquet` (`SPECTRE_STORAGE`)."""
+    return "parquet" if os.getenv("SPECTRE_STORAGE", "duckdb").lower() == "parquet" else "duckdb"
+
+
+def store_path():
+    """
+    Return the location the dashboard reads its metadata from.
+
+    Returns:
+        str: The Parquet store directory or the DuckDB file, depending on `storage_backend()`.
+    """
+    return parquet_path() if storage_backend() == "parquet" else database_path()
+
+
+def _directory_fingerprint(path):
+    count, newest, size = 0, 0, 0
+    for root, dirs, files in os.walk(path):
+        # Skip staging folders of exports in progress
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if name.endswith(".parquet"):
+                st = os.stat(os.path.join(root, name))
+                count += 1
+                newest = max(newest, st.st_mtime_ns)
+                size += st.st_size
+    return (count, newest, size)
+
+
+def database_fingerprint(db_path=None):
+    """
+    Identify the current contents of the database file.
+
+    The fingerprint changes whenever the file is rewritten or replaced, which
+    is the only way the metadata tables change. For a Parquet store it
+    changes whenever a partition file is added, replaced or removed.
 
     Args:
-    - table (str): The name of the table.
+        db_path (str, optional): Path to the database. Defaults to `store_path()`.
 
     Returns:
-    - pd.DataFrame: Data from the specified table.
+        tuple | None: `(mtime_ns, size)` of the file, `(files, newest mtime_ns,
+        total size)` of a Parquet store, or None if it does not exist.
+    """
+    db_path = db_path or store_path()
+    try:
+        if os.path.isdir(db_path):
+            return _directory_fingerprint(db_path)
+        st = os.stat(db_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when a cursor is requested from a retired or closed pool."""
+
+
+class ConnectionPool:
+    """
+    Process-wide pool of read-only cursors on a single DuckDB database handle.
+
+    The database file is opened once and every query runs on a cursor derived
+    from that handle, so the file open, catalog load and buffer-pool warmup are
+    paid once per process instead of once per query. At most `max_cursors`
+    cursors exist at a time; a thread checks one out for the duration of a
+    query and hands it back afterwards. Nested checkouts on the same thread
+    reuse the cursor the thread already holds.
+
+    A retired pool accepts no new work and closes itself once the last
+    checked-out cursor is returned, so queries already running finish on the
+    snapshot they started on.
+
+    Args:
+        db_path (str): Path to the DuckDB database file.
+        max_cursors (int): Upper bound on concurrently open cursors.
+    """
+
+    def __init__(self, db_path, max_cursors=4):
+        self.db_path = db_path
+        self.max_cursors = max_cursors
+        self.fingerprint = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._slots = threading.BoundedSemaphore(max_cursors)
+        self._idle = queue.LifoQueue()
+        self._con = None
+        self._active = 0
+        self._retired = False
+        self._counters = {
+            "databases_opened": 0,
+            "cursors_opened": 0,
+            "cursors_reused": 0,
+            "cursors_open": 0,
+        }
+
+    def open(self):
+        """
+        Open the database handle if it is not open yet.
+
+        Raises:
+            FileNotFoundError: If the database file does not exist.
+        """
+        with self._lock:
+            if self._con is None:
+                if not os.path.exists(self.db_path):
+                    raise FileNotFoundError(f"Database file not found at {self.db_path}")
+                self.fingerprint = database_fingerprint(self.db_path)
+                # A private in-memory instance per pool: duckdb.connect(path) would
+                # hand back the cached instance of a replaced file instead
+                con = duckdb.connect()
+                self._attach(con)
+                con.execute("USE meta")
+                self._con = con
+                self._counters["databases_opened"] += 1
+        return self
+
+    def _attach(self, con):
+        path = self.db_path.replace("'", "''")
+        con.execute(f"ATTACH '{path}' AS meta (READ_ONLY)")
+
+    @contextmanager
+    def cursor(self):
+        """
+        Check out a cursor for the calling thread.
+
+        Yields:
+            duckdb.DuckDBPyConnection: A cursor on the shared database handle.
+        """
+        held = getattr(self._local, "cursor", None)
+        if held is not None:
+            with self._lock:
+                self._counters["cursors_reused"] += 1
+            yield held
+            return
+
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._retired or self._con is None:
+                    raise PoolClosedError(f"Connection pool for {self.db_path} is closed")
+                self._active += 1
+                try:
+                    cur = self._idle.get_nowait()
+                    self._counters["cursors_reused"] += 1
+                except queue.Empty:
+                    cur = self._con.cursor()
+                    cur.execute("USE meta")
+                    self._counters["cursors_opened"] += 1
+                    self._counters["cursors_open"] += 1
+
+            self._local.cursor = cur
+            try:
+                yield cur
+            finally:
+                self._local.cursor = None
+                self._idle.put(cur)
+                with self._lock:
+                    self._active -= 1
+                    drained = self._retired and self._active == 0
+                if drained:
+                    self.close()
+        finally:
+            self._slots.release()
+
+    def stats(self):
+        """
+        Return a snapshot of the pool counters.
+
+        Returns:
+            dict: Number of database handles and cursors opened, cursor reuses
+            and currently open cursors.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def retire(self):
+        """Stop handing out cursors and close once all in-flight queries finish."""
+        with self._lock:
+            self._retired = True
+            drained = self._active == 0
+        if drained:
+            self.close()
+
+    def close(self):
+        """Close all idle cursors and the database handle."""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                    self._counters["cursors_open"] -= 1
+                except queue.Empty:
+                    break
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+
+class ParquetPool(ConnectionPool):
+    """
+    Connection pool over a Hive-partitioned Parquet store.
+
+    Every subdirectory of `db_path` becomes a view named after it. Tables
+    partitioned by dataset (`<name>/table=<dataset>/*.parquet`) are read with
+    DuckDB's Parquet scanner and Hive partitioning, so a filter on `table`
+    only opens the files of the matching datasets. Other tables are plain
+    `<name>/*.parquet` files. See `sp3ctrapp.parquetstore` for the layout.
+
+    Args:
+        db_path (str): Root directory of the Parquet store.
+        max_cursors (int): Upper bound on concurrently open cursors.
+    """
+
+    def _attach(self, con):
+        con.execute("ATTACH ':memory:' AS meta")
+        con.execute("USE meta")
+        for name in sorted(os.listdir(self.db_path)):
+            folder = os.path.join(self.db_path, name)
+            if name.startswith(".") or not os.path.isdir(folder):
+                continue
+            partitioned = any(entry.startswith("table=") for entry in os.listdir(folder))
+            if partitioned:
+                pattern = os.path.join(folder, "*", "*.parquet")
+            else:
+                pattern = os.path.join(folder, "*.parquet")
+            if not glob.glob(pattern):
+                continue
+            source = pattern.replace("'", "''")
+            if partitioned:
+                sql = (
+                    f'SELECT "table", * EXCLUDE ("table") FROM read_parquet(\'{source}\', '
+                    "hive_partitioning = true, hive_types = {'table': VARCHAR})"
+                )
+            else:
+                sql = f"SELECT * FROM read_parquet('{source}')"
+            con.execute(f"CREATE VIEW {quote_identifier(name)} AS {sql}")
+
+
+def _open_pool(path):
+    pool_class = ParquetPool if os.path.isdir(path) else ConnectionPool
+    return pool_class(path, max_cursors=_pool_size()).open()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_generation = 0
+_swap_listeners = []
+_watcher = None
+_executor = None
+_totals = {
+    "databases_opened": 0,
+    "cursors_opened": 0,
+    "cursors_reused": 0,
+    "cursors_open": 0,
+}
+
+# Query results keyed by (database fingerprint, sql, params).
+_query_cache = LRUCache(max_bytes=int(os.getenv("SPECTRE_CACHE_MB", "256")) * 1024**2)
+
+
+def _retire_pool(pool):
+    for key, value in pool.stats().items():
+        if key != "cursors_open":
+            _totals[key] += value
+    pool.retire()
+
+
+def _pool_size():
+    return int(os.getenv("SPECTRE_DUCKDB_POOL_SIZE", "4"))
+
+
+def get_pool():
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    The pool stays on the snapshot it was opened on until `swap_database`
+    replaces it, usually driven by the `DatabaseWatcher`.
+
+    The pool size can be set with the `SPECTRE_DUCKDB_POOL_SIZE` environment
+    variable (default: 4). With `SPECTRE_STORAGE=parquet` the pool reads the
+    Parquet store at `parquet_path()` instead of `meta.duckdb`.
+
+    Returns:
+        ConnectionPool: The shared pool for the metadata database.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _open_pool(store_path())
+        return _pool
+
+
+def database_generation():
+    """
+    Return a counter that increases every time the database is swapped.
+
+    Returns:
+        int: Number of swaps performed by this process.
+    """
+    return _generation
+
+
+def on_database_swap(callback):
+    """
+    Register a function to call after the database has been swapped.
+
+    Can be used as a decorator. Callbacks run on the thread that performed
+    the swap and receive no arguments.
+
+    Args:
+        callback (callable): The function to register.
+
+    Returns:
+        callable: The unchanged callback.
+    """
+    _swap_listeners.append(callback)
+    return callback
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_database(db_path):
+    """
+    Check a database file against its `.sha256` sidecar.
+
+    Args:
+        db_path (str): Path to the database file.
+
+    Returns:
+        bool: True if the sidecar exists and its digest matches the file.
+    """
+    try:
+        with open(db_path + ".sha256", "r", encoding="utf-8") as f:
+            expected = f.read().split()[0].lower()
+    except (FileNotFoundError, IndexError):
+        return False
+
+    return _file_digest(db_path) == expected
+
+
+def write_checksum(db_path):
+    """
+    Write the `.sha256` sidecar for a database file.
+
+    Args:
+        db_path (str): Path to the database file.
+
+    Returns:
+        str: The hex digest that was written.
+    """
+    digest = _file_digest(db_path)
+    with open(db_path + ".sha256", "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+    return digest
+
+
+def swap_database(verify=True):
+    """
+    Switch all readers to the database file currently on disk.
+
+    The new file is verified and opened before anything changes. Queries
+    already running on the old snapshot finish there; the old handle is
+    closed once they are done. Cached results of the old snapshot are
+    dropped and swap listeners are notified.
+
+    A Parquet store has no checksum: publishers replace partition files by
+    atomic rename, so `verify` only applies to a DuckDB file.
+
+    Args:
+        verify (bool): Whether to require a matching `.sha256` sidecar.
+
+    Returns:
+        ConnectionPool: The pool on the new snapshot.
+
+    Raises:
+        ValueError: If verification fails or the file changes while it is being opened.
+    """
+    global _pool, _generation
+    db_path = store_path()
+    fingerprint = database_fingerprint(db_path)
+
+    if verify and not os.path.isdir(db_path) and not verify_database(db_path):
+        raise ValueError(f"Checksum of {db_path} does not match {db_path}.sha256")
+
+    new_pool = _open_pool(db_path)
+    if new_pool.fingerprint != fingerprint:
+        new_pool.close()
+        raise ValueError(f"{db_path} changed while it was being opened")
+
+    with _pool_lock:
+        old_pool, _pool = _pool, new_pool
+        if old_pool is not None:
+            _retire_pool(old_pool)
+        _generation += 1
+        _query_cache.discard(lambda key: key[0] != fingerprint)
+
+    for callback in list(_swap_listeners):
+        try:
+            callback()
+        except Exception:
+            logger.exception("Database swap listener %r failed", callback)
+    return new_pool
+
+
+class DatabaseWatcher(threading.Thread):
+    """
+    Background thread that picks up a replaced `meta.duckdb`.
+
+    Publishers write the new database next to the old one together with its
+    `.sha256` sidecar and move it into place with an atomic rename. The
+    watcher notices the changed fingerprint, verifies the file and calls
+    `swap_database`. A file that fails verification is not retried until
+    the database or its sidecar changes again. With the Parquet backend it
+    reopens the store whenever a partition file is published.
+
+    Args:
+        interval (float): Seconds between checks.
+    """
+
+    def __init__(self, interval=5.0):
+        super().__init__(name="spectre-db-watcher", daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._rejected = None
+
+    def check(self):
+        """
+        Swap the database if the file on disk has changed.
+
+        Returns:
+            bool: True if a swap happened.
+        """
+        db_path = store_path()
+        current = database_fingerprint(db_path)
+        try:
+            if current is None or current == get_pool().fingerprint:
+                return False
+        except FileNotFoundError:
+            pass
+
+        marker = (current, database_fingerprint(db_path + ".sha256"))
+        if marker == self._rejected:
+            return False
+
+        try:
+            swap_database()
+        except (ValueError, OSError, duckdb.Error) as e:
+            self._rejected = marker
+            logger.warning("Keeping current database snapshot: %s", e)
+            return False
+
+        self._rejected = None
+        logger.info("Switched to new database snapshot %s", current)
+        return True
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Database watcher check failed")
+
+    def stop(self):
+        """Stop the watcher after its current check."""
+        self._stopped.set()
+
+
+def start_watcher(interval=None):
+    """
+    Start the process-wide database watcher if it is not running yet.
+
+    Args:
+        interval (float, optional): Seconds between checks. Defaults to the
+            `SPECTRE_WATCH_INTERVAL` environment variable or 5 seconds.
+
+    Returns:
+        DatabaseWatcher: The running watcher.
+    """
+    global _watcher
+    with _pool_lock:
+        if _watcher is None or not _watcher.is_alive():
+            if interval is None:
+                interval = float(os.getenv("SPECTRE_WATCH_INTERVAL", "5"))
+            _watcher = DatabaseWatcher(interval)
+            _watcher.start()
+        return _watcher
+
+
+def _arrow_types(dtype):
+    # Keep strings in Arrow memory; numeric columns convert to NumPy as usual
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+        return pd.ArrowDtype(dtype)
+    return None
+
+
+def arrow_to_pandas(arrow_table):
+    """
+    Convert an Arrow table to pandas without materializing Python strings.
+
+    String columns become `string[pyarrow]` columns backed by the Arrow
+    buffers; all other columns use the regular NumPy conversion.
+
+    Args:
+        arrow_table (pa.Table): The query result.
+
+    Returns:
+        pd.DataFrame: The converted frame.
+    """
+    return arrow_table.to_pandas(types_mapper=_arrow_types)
+
+
+def fetch_mode():
+    """
+    Return the configured result conversion mode.
+
+    Set `SPECTRE_FETCH=numpy` to fall back to DuckDB's `fetchdf()`, which
+    produces object-dtype string columns. The default is `arrow`.
+
+    Returns:
+        str: Either "arrow" or "numpy".
+    """
+    return "numpy" if os.getenv("SPECTRE_FETCH", "arrow").lower() == "numpy" else "arrow"
+
+
+def _fetch(sql, params):
+    """Run a query on the current pool, retrying if the pool is swapped mid-call."""
+    for _ in range(3):
+        pool = get_pool()
+        try:
+            with pool.cursor() as con:
+                result = con.execute(sql, params)
+                if fetch_mode() == "arrow":
+                    df = arrow_to_pandas(result.fetch_record_batch().read_all())
+                else:
+                    df = result.fetchdf()
+                return pool.fingerprint, df
+        except PoolClosedError:
+            continue
+    raise PoolClosedError("Database was replaced repeatedly while querying")
+
+
+def explain_analyze(sql, params=None):
+    """
+    Run a query under EXPLAIN ANALYZE and return the profiled plan.
+
+    Args:
+        sql (str): The SQL statement, with `?` placeholders for values.
+        params (list, optional): Values bound to the placeholders.
+
+    Returns:
+        str: The plan with per-operator timings and cardinalities.
+    """
+    with get_pool().cursor() as con:
+        rows = con.execute("EXPLAIN ANALYZE " + sql, list(params or [])).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+def connection_stats():
+    """
+    Report how often connections were opened versus reused.
+
+    Returns:
+        dict: Pool counters summed over all pools opened by this process.
+    """
+    with _pool_lock:
+        stats = dict(_totals)
+        if _pool is not None:
+            for key, value in _pool.stats().items():
+                stats[key] += value
+    return stats
+
+
+def cache_stats():
+    """
+    Report hit, miss and eviction counts of the query result cache.
+
+    Returns:
+        dict: Cache counters and fill level.
+    """
+    return _query_cache.stats()
+
+
+@atexit.register
+def close_connections():
+    """Stop the watcher and close the shared pool. Registered as an interpreter shutdown hook."""
+    global _pool, _executor
+    with _pool_lock:
+        if _watcher is not None:
+            _watcher.stop()
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        if _pool is not None:
+            _retire_pool(_pool)
+            _pool = None
+
+
+def quote_identifier(name):
+    """
+    Quote a table or column name for use in SQL.
+
+    Args:
+        name (str): The identifier to quote.
+
+    Returns:
+        str: The identifier wrapped in double quotes, with embedded quotes escaped.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def build_query(table, columns=None, where=None, order_by=None, limit=None, distinct=False):
+    """
+    Build a parameterized SELECT statement.
+
+    Identifiers are quoted and all filter values are passed as bound
+    parameters, never formatted into the SQL string.
+
+    Args:
+        table (str): The name of the table.
+        columns (list[str], optional): Columns to select. Defaults to all columns.
+        where (dict, optional): Mapping of column name to filter value. A list,
+            tuple or set becomes an `IN` filter, `None` becomes `IS NULL` and any
+            other value an equality filter. Filters are combined with `AND`.
+        order_by (str | list, optional): Column name(s) to sort by. An entry may
+            be a `(column, "desc")` tuple to sort descending.
+        limit (int, optional): Maximum number of rows to return.
+        distinct (bool): Whether to select distinct rows only.
+
+    Returns:
+        tuple[str, list]: The SQL string and its bound parameters.
     """
-    db_path = os.path.join(os.getcwd(), "src", "sp3ctrapp", "data", "meta.duckdb")
+    select = "SELECT DISTINCT" if distinct else "SELECT"
+    cols = ", ".join(quote_identifier(c) for c in columns) if columns else "*"
+    sql = f"{select} {cols} FROM {quote_identifier(table)}"
+    params = []
+
+    if where:
+        clauses = []
+        for col, value in where.items():
+            ident = quote_identifier(col)
+            if value is None:
+                clauses.append(f"{ident} IS NULL")
+            elif isinstance(value, (list, tuple, set)):
+                values = list(value)
+                if not values:
+                    clauses.append("FALSE")
+                    continue
+                clauses.append(f"{ident} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+            else:
+                clauses.append(f"{ident} = ?")
+                params.append(value)
+        sql += " WHERE " + " AND ".join(clauses)
 
-    # Check if the database file exists
-    if not os.path.exists(db_path):
-        raise FileNotFoundError(f"Database file not found at {db_path}")
+    if order_by:
+        if isinstance(order_by, (str, tuple)):
+            order_by = [order_by]
+        terms = []
+        for item in order_by:
+            if isinstance(item, tuple):
+                col, direction = item
+                direction = "DESC" if str(direction).lower() == "desc" else "ASC"
+            else:
+                col, direction = item, "ASC"
+            terms.append(f"{quote_identifier(col)} {direction}")
+        sql += " ORDER BY " + ", ".join(terms)
+
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+    return sql, params
+
+
+def duckdb_sql(sql, params=None, cache=True, name=None, raise_errors=False):
+    """
+    Run a parameterized SQL query against the DuckDB database.
+
+    This is the single execution path behind `duckdb_query` and all other
+    readers: it goes through the shared connection pool and the query cache.
+    Results are cached in memory per database fingerprint, so repeated
+    queries against an unchanged database never touch the file. Callers
+    receive a copy and may modify it freely. String columns are returned as
+    Arrow-backed `string[pyarrow]` columns unless `SPECTRE_FETCH=numpy`.
+    Every call is timed and reported to `sp3ctrapp.querylog`.
+
+    Args:
+        sql (str): The SQL statement, with `?` placeholders for values.
+        params (list, optional): Values bound to the placeholders.
+        cache (bool): Whether to serve and store the result in the query cache.
+        name (str, optional): Name of the queried table, used in messages.
+        raise_errors (bool): Raise query errors instead of returning an empty
+            DataFrame. Used by builders whose result is memoized, so a failed
+            query is not remembered as an empty result.
+
+    Returns:
+        pd.DataFrame: The result. An empty DataFrame if the query fails and
+        `raise_errors` is False.
+    """
+    params = list(params or [])
+    name = name or "query"
+    record = {"table": name, "sql": sql, "params": params, "origin": current_origin()}
+    start = time.perf_counter()
+    df = pd.DataFrame()
 
-    con = duckdb.connect(db_path, read_only=True)
     try:
-        query = f"SELECT * FROM {table}"
-        df = con.execute(query).fetchdf()
+        cached = None
+        if cache:
+            cached = _query_cache.get((get_pool().fingerprint, sql, tuple(params)))
+        record["cached"] = cached is not None
+        if cached is not None:
+            df = cached.copy()
+            return df
+
+        fingerprint, df = _fetch(sql, params)
         if df.empty:
-            print(f"Warning: Table '{table}' is empty.")
+            logger.debug("Query on table '%s' returned no rows", name)
+        # Empty results are cached too: filtered queries often legitimately match nothing
+        if cache:
+            _query_cache.put((fingerprint, sql, tuple(params)), df)
+            df = df.copy()
         return df
+    except FileNotFoundError as e:
+        record["error"] = str(e)
+        raise
     except Exception as e:
-        print(f"Error fetching data from table '{table}': {e}")
-        return pd.DataFrame()  # Return an empty DataFrame on error
+        record["error"] = str(e)
+        if raise_errors:
+            raise
+        logger.warning("Error fetching data from table '%s': %s", name, e)
+        return df  # Return an empty DataFrame on error
     finally:
-        con.close()
+        record.setdefault("cached", False)
+        record["wall_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        record["rows"] = len(df)
+        record["bytes"] = sizeof(df)
+        explain = None if "error" in record else (lambda: explain_analyze(sql, params))
+        record_query(record, explain)
+
+
+def duckdb_query(
+    table, columns=None, where=None, order_by=None, limit=None, distinct=False, cache=True
+):
+    """
+    Fetch a filtered projection of a table from the DuckDB database.
+
+    Filtering, ordering and limiting happen inside DuckDB, so only the
+    requested rows and columns are transferred into pandas. See
+    `build_query` for the meaning of the arguments and `duckdb_sql` for
+    caching and result types.
+
+    Args:
+        table (str): The name of the table.
+        columns (list[str], optional): Columns to select.
+        where (dict, optional): Column filters.
+        order_by (str | list, optional): Sort order.
+        limit (int, optional): Maximum number of rows.
+        distinct (bool): Whether to select distinct rows only.
+        cache (bool): Whether to serve and store the result in the query cache.
+
+    Returns:
+        pd.DataFrame: The matching rows. An empty DataFrame if the query fails.
+
+    Example:
+        >>> duckdb_query("columns", columns=["version", "column_name"],
+        ...              where={"table": "penguins"})
+    """
+    sql, params = build_query(table, columns, where, order_by, limit, distinct)
+    return duckdb_sql(sql, params, cache=cache, name=table)
+
+
+def has_table(table):
+    """
+    Check whether a table or view exists in the current database snapshot.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        bool: True if the table exists.
+    """
+    df = duckdb_sql(
+        "SELECT count(*) AS n FROM ("
+        "SELECT table_name AS name FROM duckdb_tables() WHERE database_name = current_database() "
+        "UNION ALL "
+        "SELECT view_name FROM duckdb_views() WHERE database_name = current_database()"
+        ") WHERE name = ?",
+        [table],
+        name="duckdb_tables",
+    )
+    return not df.empty and int(df["n"].iloc[0]) > 0
+
+
+def has_column(table, column):
+    """
+    Check whether a table or view in the current database snapshot has a column.
+
+    Args:
+        table (str): The name of the table.
+        column (str): The name of the column.
+
+    Returns:
+        bool: True if the table exists and has the column.
+    """
+    df = duckdb_sql(
+        "SELECT count(*) AS n FROM duckdb_columns() "
+        "WHERE database_name = current_database() AND table_name = ? AND column_name = ?",
+        [table, column],
+        name="duckdb_columns",
+    )
+    return not df.empty and int(df["n"].iloc[0]) > 0
+
+
+def get_executor():
+    """
+    Return the thread pool that runs queries off the event loop.
+
+    It has as many workers as the connection pool has cursors, so a query
+    submitted to it never waits for a cursor.
+
+    Returns:
+        ThreadPoolExecutor: The shared query executor.
+    """
+    global _executor
+    with _pool_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_pool_size(), thread_name_prefix="spectre-query"
+            )
+        return _executor
+
+
+async def run_async(func, *args, **kwargs):
+    """
+    Run a blocking function on the query thread pool and await its result.
+
+    DuckDB releases the GIL while a query executes, so the asyncio event loop
+    keeps serving other sessions in the meantime. The caller's context
+    variables are carried over to the worker thread.
+
+    Args:
+        func (callable): The blocking function, e.g. `duckdb_query` or a plot builder.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    return await run_in_executor(get_executor(), func, *args, **kwargs)
+
+
+async def run_in_executor(executor, func, *args, **kwargs):
+    """
+    Run a blocking function on the given executor and await its result.
+
+    Like `run_async`, but for work that must not occupy the query thread
+    pool, such as rasterizing plots.
+
+    Args:
+        executor (concurrent.futures.Executor): The executor to run on.
+        func (callable): The blocking function.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    # Attribute the queries to the calc or output that awaited them
+    ctx.run(set_origin, current_origin())
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+async def duckdb_query_async(*args, **kwargs):
+    """
+    Awaitable version of `duckdb_query`, run on the query thread pool.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+    """
+    return await run_async(duckdb_query, *args, **kwargs)
+
+
+async def duckdb_table_async(table):
+    """
+    Awaitable version of `duckdb_table`, run on the query thread pool.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        pd.DataFrame: Data from the specified table.
+    """
+    return await run_async(duckdb_table, table)
+
+
+def duckdb_table(table):
+    """
+    Fetch data from the DuckDB database.
+
+    Args:
+    - table (str): The name of the table.
+
+    Returns:
+    - pd.DataFrame: Data from the specified table.
+    """
+    return duckdb_query(table)
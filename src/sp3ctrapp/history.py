@@ -0,0 +1,171 @@
+# src/sp3ctrapp/history.py
+import numpy as np
+import pandas as pd
+
+from sp3ctrapp.cache import LRUCache
+from sp3ctrapp.getduck import get_pool, on_database_swap
+from sp3ctrapp.matrix import TYPE_OFFSET, schema_matrix
+from sp3ctrapp.versions import version_index
+
+
+class SchemaHistory:
+    """
+    Schema of one dataset across all of its validated versions.
+
+    Wraps the version x column `SchemaMatrix` together with the newest
+    `pointers` row. The Variables and Classes views both read from it, and it
+    answers schema questions from scripts without further queries:
+
+        >>> history = schema_history("penguins")
+        >>> history.changes(history.versions[-1])
+        {'added': [], 'removed': [], 'retyped': []}
+
+    Args:
+        dataset (str): Name of the dataset.
+        matrix (SchemaMatrix): Its presence and type matrix.
+        latest (dict | None): Its newest `pointers` row.
+    """
+
+    def __init__(self, dataset, matrix, latest):
+        self.dataset = dataset
+        self.matrix = matrix
+        self.latest = latest
+        self._version_positions = {v: i for i, v in enumerate(matrix.versions)}
+        self._column_positions = {c: i for i, c in enumerate(matrix.columns)}
+
+    def __len__(self):
+        return len(self.matrix.versions)
+
+    @property
+    def versions(self):
+        """Version names, oldest first."""
+        return self.matrix.versions
+
+    @property
+    def columns(self):
+        """All column names that occur in any version, sorted."""
+        return self.matrix.columns
+
+    @property
+    def present(self):
+        """Boolean presence matrix of shape `(columns, versions)`."""
+        return self.matrix.present
+
+    @property
+    def type_codes(self):
+        """Type code matrix of shape `(columns, versions)`, see `SchemaMatrix`."""
+        return self.matrix.codes
+
+    @property
+    def nbytes(self):
+        """Approximate memory footprint in bytes."""
+        return self.matrix.nbytes
+
+    def _version(self, version):
+        try:
+            return self._version_positions[version]
+        except KeyError:
+            raise KeyError(f"Dataset '{self.dataset}' has no version '{version}'") from None
+
+    def _type_names(self):
+        # Type name per cell code, None for absent and untyped cells
+        return np.concatenate([np.full(TYPE_OFFSET, None, dtype=object), self.matrix.types])
+
+    def columns_at(self, version):
+        """
+        Return the columns of one version with their types.
+
+        Args:
+            version (str): The version.
+
+        Returns:
+            dict: Type per column name, None where no type was recorded.
+        """
+        codes = self.matrix.codes[:, self._version(version)]
+        present = codes > 0
+        return dict(zip(self.matrix.columns[present], self._type_names()[codes[present]]))
+
+    def changes(self, version):
+        """
+        Compare a version with the one before it.
+
+        Args:
+            version (str): The version.
+
+        Returns:
+            dict: Sorted lists of `added`, `removed` and `retyped` columns.
+            Every column counts as added in the first version.
+        """
+        position = self._version(version)
+        now = self.matrix.codes[:, position]
+        before = self.matrix.codes[:, position - 1] if position else np.zeros_like(now)
+        columns = self.matrix.columns
+        return {
+            "added": columns[(now > 0) & (before == 0)].tolist(),
+            "removed": columns[(now == 0) & (before > 0)].tolist(),
+            "retyped": columns[(now > 0) & (before > 0) & (now != before)].tolist(),
+        }
+
+    def runs(self):
+        """
+        Return the runs of consecutive versions with an identical schema.
+
+        Returns:
+            pd.DataFrame: `first_version`, `last_version` and `run_length`
+            of every run, oldest first.
+        """
+        return self.matrix.compact().runs
+
+    def column_history(self, column):
+        """
+        Return presence and type of one column in every version.
+
+        Args:
+            column (str): The column name.
+
+        Returns:
+            pd.DataFrame: Columns `version`, `present` and `type`, oldest first.
+        """
+        try:
+            codes = self.matrix.codes[self._column_positions[column]]
+        except KeyError:
+            raise KeyError(f"Dataset '{self.dataset}' has no column '{column}'") from None
+        return pd.DataFrame(
+            {
+                "version": self.matrix.versions,
+                "present": codes > 0,
+                "type": self._type_names()[codes],
+            }
+        )
+
+
+_histories = LRUCache(max_bytes=64 * 1024**2, sizer=lambda history: history.nbytes)
+
+
+@on_database_swap
+def _drop_histories():
+    _histories.clear()
+
+
+def schema_history(dataset):
+    """
+    Return the schema history of a dataset, building it on first use.
+
+    Histories are memoized per database fingerprint and shared by all
+    sessions, so the Variables and Classes views of every user read the same
+    object until a new database snapshot is swapped in.
+
+    Args:
+        dataset (str): Name of the dataset.
+
+    Returns:
+        SchemaHistory: The history, empty if the dataset has no columns.
+    """
+    key = (get_pool().fingerprint, dataset)
+    history = _histories.get(key)
+    if history is None:
+        index = version_index(dataset)
+        latest = index.rows.iloc[-1].to_dict() if len(index) else None
+        history = SchemaHistory(dataset, schema_matrix(dataset), latest)
+        _histories.put(key, history)
+    return history
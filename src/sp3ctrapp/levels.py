@@ -0,0 +1,140 @@
+# src/sp3ctrapp/levels.py
+from sp3ctrapp.getduck import duckdb_sql, has_column, has_table
+
+# Sorted, de-duplicated level set of a factor column, e.g. "female|male".
+# Aggregates the comma-separated `levels` of all rows of one group.
+LEVEL_SIGNATURE = (
+    "array_to_string(list_sort(list_distinct(flatten(list(string_split_regex(levels, ',\\s*'))))), '|')"
+)
+
+# Stable 64-bit id of a level set: the lower half of its MD5, so ids agree
+# across DuckDB versions, processes and databases.
+SET_ID = "md5_number_lower({signature})"
+
+# Level set of every factor column per (table, column, version)
+_COLUMN_LEVELS_SQL = f"""
+    SELECT "table", column_name, version, {SET_ID.format(signature="label_signature")} AS set_id
+    FROM (
+        SELECT "table", column_name, version, {LEVEL_SIGNATURE} AS label_signature
+        FROM columns
+        WHERE type = 'factor' AND levels IS NOT NULL{{where}}
+        GROUP BY "table", column_name, version
+    )
+"""
+COLUMN_LEVELS_SQL = _COLUMN_LEVELS_SQL.format(where="")
+
+# Each distinct level set of a dataset once. Kept per dataset, so the
+# level sets are partitioned like the `mv_column_levels` rows using them.
+LEVEL_SETS_SQL = f"""
+    SELECT DISTINCT
+        "table",
+        {SET_ID.format(signature="label_signature")} AS set_id,
+        label_signature,
+        len(string_split(label_signature, '|')) AS n_levels
+    FROM (
+        SELECT "table", {LEVEL_SIGNATURE} AS label_signature
+        FROM columns
+        WHERE type = 'factor' AND levels IS NOT NULL
+        GROUP BY "table", column_name, version
+    )
+"""
+
+_MATERIALIZED_SQL = """
+    SELECT c.column_name, c.version, c.set_id, s.label_signature
+    FROM mv_column_levels c
+    JOIN mv_level_sets s USING ("table", set_id)
+    WHERE c."table" = ?
+"""
+
+# Materialized level sets, plus live ones of datasets published since
+_MIXED_COLUMN_LEVELS_SQL = f"""
+    SELECT "table", column_name, version, set_id FROM mv_column_levels
+    UNION ALL
+    {_COLUMN_LEVELS_SQL.format(where=' AND "table" NOT IN (SELECT DISTINCT "table" FROM mv_column_levels)')}
+"""
+
+_LIVE_SQL = f"""
+    SELECT
+        column_name,
+        version,
+        {SET_ID.format(signature="label_signature")} AS set_id,
+        label_signature
+    FROM (
+        SELECT column_name, version, {LEVEL_SIGNATURE} AS label_signature
+        FROM columns
+        WHERE "table" = ? AND type = 'factor' AND levels IS NOT NULL
+        GROUP BY column_name, version
+    )
+"""
+
+_DRIFT_SQL = """
+    SELECT *
+    FROM (
+        SELECT
+            "table",
+            column_name,
+            version,
+            lag(set_id) OVER (PARTITION BY "table", column_name ORDER BY version) AS previous_set_id,
+            set_id
+        FROM {source}
+    )
+    WHERE previous_set_id <> set_id{dataset}
+    ORDER BY "table", column_name, version
+"""
+
+
+def _materialized():
+    # Level sets of earlier versions were one global table without `table`
+    return has_table("mv_column_levels") and has_column("mv_level_sets", "table")
+
+
+def column_level_sets(table):
+    """
+    Return the level set id of every factor column in every version.
+
+    Level sets are interned: each distinct set has one stable integer id,
+    so comparing two versions is an integer comparison. Reads the
+    `mv_column_levels` and `mv_level_sets` tables of `spectre-materialize`
+    when they hold the dataset and computes the same ids in DuckDB
+    otherwise, e.g. for a dataset published to the Parquet store without
+    its derived tables.
+
+    Args:
+        table (str): Name of the dataset.
+
+    Returns:
+        pd.DataFrame: Columns `column_name`, `version`, `set_id` (uint64)
+        and `label_signature`, sorted by column and version.
+    """
+    sets = None
+    if _materialized():
+        sets = duckdb_sql(_MATERIALIZED_SQL, [table], name="mv_column_levels")
+    if sets is None or sets.empty:
+        sets = duckdb_sql(_LIVE_SQL, [table], name="columns")
+    if sets.empty:
+        return sets
+    return sets.sort_values(["column_name", "version"], ignore_index=True)
+
+
+def label_drift(table=None):
+    """
+    Find factor columns whose level set changed from one version to the next.
+
+    Runs as a single window query, across all datasets unless `table` is
+    given. Cheap on a materialized database, where it only reads integer
+    ids; datasets missing from `mv_column_levels` are computed live.
+
+    Args:
+        table (str, optional): Restrict to one dataset.
+
+    Returns:
+        pd.DataFrame: One row per change with `table`, `column_name`,
+        `version`, `previous_set_id` and `set_id`.
+    """
+    if _materialized():
+        source = f"({_MIXED_COLUMN_LEVELS_SQL})"
+    else:
+        source = f"({COLUMN_LEVELS_SQL})"
+    dataset = ' AND "table" = ?' if table is not None else ""
+    params = [table] if table is not None else []
+    return duckdb_sql(_DRIFT_SQL.format(source=source, dataset=dataset), params, name="columns")
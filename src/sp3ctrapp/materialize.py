@@ -0,0 +1,79 @@
+# src/sp3ctrapp/materialize.py
+import argparse
+import shutil
+
+import duckdb
+
+from sp3ctrapp.getduck import database_path, write_checksum
+from sp3ctrapp.levels import COLUMN_LEVELS_SQL, LEVEL_SETS_SQL
+from sp3ctrapp.versions import LATEST_RUNS_SQL
+
+
+# Derived tables written into meta.duckdb. The dashboard reads them when
+# present and computes the same data live from the raw tables otherwise.
+MATERIALIZED_VIEWS = {
+    # Latest run per table, one pointers row each
+    "mv_latest_runs": LATEST_RUNS_SQL + ' ORDER BY "table"',
+    # Each distinct level set of a factor column once per table, with its stable id
+    "mv_level_sets": LEVEL_SETS_SQL + ' ORDER BY "table", set_id',
+    # Level set id of every factor column per version
+    "mv_column_levels": COLUMN_LEVELS_SQL + ' ORDER BY "table", column_name, version',
+}
+
+# Derived tables of earlier versions, dropped when materializing again
+RETIRED_VIEWS = ["mv_schema_matrix", "mv_pipe_coverage", "mv_level_signatures"]
+
+
+def materialize(db_path=None, output=None):
+    """
+    Write the derived tables into a DuckDB metadata database.
+
+    Each view in `MATERIALIZED_VIEWS` is (re)created as a table, so the
+    dashboard can read precomputed results instead of reshaping the raw
+    `pointers`, `columns` and `pipes` tables on every render. A `.sha256`
+    sidecar is written for the resulting file so it can be hot-swapped into a
+    running app.
+
+    Args:
+        db_path (str, optional): Source database. Defaults to the app database.
+        output (str, optional): Write to a copy at this path instead of
+            modifying `db_path` in place. Use this while the app is running.
+
+    Returns:
+        list[str]: Names of the tables that were written.
+    """
+    db_path = db_path or database_path()
+    target = output or db_path
+    if output:
+        shutil.copyfile(db_path, output)
+
+    con = duckdb.connect(target)
+    try:
+        for name in RETIRED_VIEWS:
+            con.execute(f"DROP TABLE IF EXISTS {name}")
+        for name, sql in MATERIALIZED_VIEWS.items():
+            con.execute(f"CREATE OR REPLACE TABLE {name} AS {sql}")
+        con.execute("CHECKPOINT")
+    finally:
+        con.close()
+
+    write_checksum(target)
+    return list(MATERIALIZED_VIEWS)
+
+
+def main(argv=None):
+    """Command line entry point for `spectre-materialize`."""
+    parser = argparse.ArgumentParser(
+        prog="spectre-materialize",
+        description="Precompute the derived tables used by the Spectre dashboard.",
+    )
+    parser.add_argument("--db", help="Path to meta.duckdb (default: the app database)")
+    parser.add_argument("--output", help="Write a materialized copy to this path")
+    args = parser.parse_args(argv)
+
+    tables = materialize(args.db, args.output)
+    print(f"Materialized {', '.join(tables)} into {args.output or args.db or database_path()}")
+
+
+if __name__ == "__main__":
+    main()
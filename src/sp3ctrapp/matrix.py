@@ -0,0 +1,262 @@
+# src/sp3ctrapp/matrix.py
+import re
+
+import numpy as np
+import pandas as pd
+
+from sp3ctrapp.getduck import duckdb_sql
+
+# Cell codes of SchemaMatrix.codes; types are numbered from TYPE_OFFSET on
+ABSENT = 0
+UNTYPED = 1
+TYPE_OFFSET = 2
+
+# One row per (version, column) of a dataset
+_CELLS_SQL = """
+    WITH cells AS (
+        SELECT version, column_name, any_value(type) AS type
+        FROM columns
+        WHERE "table" = ?
+        GROUP BY version, column_name
+    )
+"""
+
+_DICTIONARY_SQL = """
+    SELECT
+        list(DISTINCT version ORDER BY version) AS versions,
+        list(DISTINCT column_name ORDER BY column_name) AS columns,
+        list(DISTINCT type ORDER BY type) FILTER (WHERE type IS NOT NULL) AS types
+    FROM cells
+"""
+
+# Dictionary encoding happens in DuckDB; codes are positions in the sorted
+# dictionaries above, found with hash joins on the few distinct values.
+_CODES_SQL = f"""
+    , versions AS (
+        SELECT version, (row_number() OVER (ORDER BY version) - 1)::INTEGER AS version_code
+        FROM (SELECT DISTINCT version FROM cells)
+    ),
+    names AS (
+        SELECT column_name, (row_number() OVER (ORDER BY column_name) - 1)::INTEGER AS column_code
+        FROM (SELECT DISTINCT column_name FROM cells)
+    ),
+    types AS (
+        SELECT type, (row_number() OVER (ORDER BY type) + {TYPE_OFFSET - 1})::SMALLINT AS type_code
+        FROM (SELECT DISTINCT type FROM cells WHERE type IS NOT NULL)
+    )
+    SELECT version_code, column_code, coalesce(type_code, {UNTYPED})::SMALLINT AS type_code
+    FROM cells
+    JOIN versions USING (version)
+    JOIN names USING (column_name)
+    LEFT JOIN types USING (type)
+"""
+
+
+def run_starts(signatures):
+    """
+    Find runs of consecutive versions with identical signatures.
+
+    Args:
+        signatures (np.ndarray): One column per version, oldest first, e.g.
+            the cell codes of a `SchemaMatrix`.
+
+    Returns:
+        np.ndarray: Position of the first version of every run.
+    """
+    if signatures.shape[1] == 0:
+        return np.array([], dtype=np.intp)
+    changed = np.any(signatures[:, 1:] != signatures[:, :-1], axis=0)
+    return np.flatnonzero(np.concatenate([[True], changed]))
+
+
+def version_runs(versions, starts):
+    """
+    Describe the runs starting at `starts` as first/last version and length.
+
+    Args:
+        versions (np.ndarray): Version names, oldest first.
+        starts (np.ndarray): Run starts, see `run_starts`.
+
+    Returns:
+        pd.DataFrame: Columns `first_version`, `last_version` and
+        `run_length`, one row per run.
+    """
+    ends = np.append(starts[1:], len(versions)) - 1
+    return pd.DataFrame(
+        {
+            "first_version": versions[starts],
+            "last_version": versions[ends],
+            "run_length": ends - starts + 1,
+        }
+    )
+
+
+def run_labels(runs, clip_date=False):
+    """
+    Axis labels of version runs: first and last version and the run length
+    on separate lines.
+
+    Args:
+        runs (pd.DataFrame): Runs as returned by `version_runs`.
+        clip_date (bool): Whether to show the date part of versions only.
+
+    Returns:
+        list[str]: One label per run; single versions keep their name.
+    """
+    def clip(version):
+        return re.sub(r"T.*", "", version) if clip_date else version
+
+    return [
+        clip(first) if n == 1 else f"{clip(first)}\n… {clip(last)}\n({n} versions)"
+        for first, last, n in zip(runs["first_version"], runs["last_version"], runs["run_length"])
+    ]
+
+
+class SchemaMatrix:
+    """
+    Dense version x column matrix of one dataset in compact form.
+
+    Every cell holds one small integer: `ABSENT` if the column does not exist
+    in that version, `UNTYPED` if it exists without a recorded type and
+    `TYPE_OFFSET + i` if its type is `types[i]`. Versions, columns and types
+    are sorted dictionaries, so a dataset with thousands of versions and
+    hundreds of columns takes a few hundred kilobytes.
+
+    Args:
+        versions (np.ndarray): Version names, oldest first.
+        columns (np.ndarray): Column names, sorted.
+        types (np.ndarray): Type names, sorted.
+        codes (np.ndarray): Cell codes of shape `(len(columns), len(versions))`.
+        runs (pd.DataFrame, optional): Set by `compact`; the version run each
+            matrix column stands for.
+    """
+
+    def __init__(self, versions, columns, types, codes, runs=None):
+        self.versions = versions
+        self.columns = columns
+        self.types = types
+        self.codes = codes
+        self.runs = runs
+
+    @property
+    def shape(self):
+        """`(columns, versions)` of the matrix."""
+        return self.codes.shape
+
+    @property
+    def nbytes(self):
+        """Approximate memory footprint in bytes."""
+        names = sum(len(s) for s in self.versions) + sum(len(s) for s in self.columns)
+        return self.codes.nbytes + names
+
+    @property
+    def present(self):
+        """Boolean presence matrix of shape `(columns, versions)`."""
+        return self.codes != ABSENT
+
+    def select_versions(self, start=0):
+        """Return the matrix without the `start` oldest versions."""
+        return SchemaMatrix(
+            self.versions[start:], self.columns, self.types, self.codes[:, start:]
+        )
+
+    def compact(self):
+        """
+        Collapse consecutive versions with an identical schema into runs.
+
+        Two versions belong to the same run if every column has the same
+        presence and type in both. Each run is kept once, under its first
+        version, and described in `runs`.
+
+        Returns:
+            SchemaMatrix: One matrix column per run, with `runs` set.
+        """
+        starts = run_starts(self.codes)
+        return SchemaMatrix(
+            self.versions[starts],
+            self.columns,
+            self.types,
+            self.codes[:, starts],
+            runs=version_runs(self.versions, starts),
+        )
+
+    def to_frame(self, value, version_labels=None):
+        """
+        Expand the matrix into one row per cell, the long format of plotnine.
+
+        Args:
+            value (str): `present` for a boolean column or `type` for a
+                categorical of type names (missing where absent or untyped).
+            version_labels (array-like, optional): Labels to show instead of
+                the version names, one per version.
+
+        Returns:
+            pd.DataFrame: Columns `version`, `column_name` and `value`, sorted
+            by version and column. `column_name` is categorical with its
+            categories in descending order, for a top-down y axis. A compacted
+            matrix adds the run columns of `version_runs`.
+        """
+        n_columns, n_versions = self.shape
+        versions = self.versions if version_labels is None else np.asarray(version_labels)
+        # Version-major order, one block of all columns per version
+        cells = self.codes.T.ravel()
+        frame = pd.DataFrame(
+            {
+                "version": np.repeat(versions, n_columns),
+                "column_name": pd.Categorical.from_codes(
+                    np.tile(np.arange(n_columns - 1, -1, -1), n_versions),
+                    categories=self.columns[::-1],
+                    ordered=True,
+                ),
+            }
+        )
+        if value == "present":
+            frame["present"] = cells != ABSENT
+        elif value == "type":
+            frame["type"] = pd.Categorical.from_codes(
+                np.where(cells >= TYPE_OFFSET, cells.astype(np.int32) - TYPE_OFFSET, -1),
+                categories=self.types,
+            )
+        else:
+            raise ValueError(f"Unknown matrix value '{value}'. Use 'present' or 'type'.")
+        if self.runs is not None:
+            for name in self.runs.columns:
+                frame[name] = np.repeat(self.runs[name].to_numpy(), n_columns)
+        return frame
+
+
+def _empty_matrix():
+    empty = np.array([], dtype=object)
+    return SchemaMatrix(empty, empty, empty, np.zeros((0, 0), dtype=np.uint8))
+
+
+def schema_matrix(table):
+    """
+    Build the presence and type matrix of a dataset inside DuckDB.
+
+    The grid is never materialized as a long frame: DuckDB dictionary-encodes
+    versions, columns and types and returns one row of codes per existing
+    cell, which is scattered into a dense `uint8` array here. Both queries go
+    through the query cache.
+
+    Args:
+        table (str): Name of the dataset.
+
+    Returns:
+        SchemaMatrix: The matrix, empty if the dataset has no columns.
+    """
+    dictionary = duckdb_sql(_CELLS_SQL + _DICTIONARY_SQL, [table], name="columns", raise_errors=True)
+    if dictionary.empty or dictionary.iloc[0]["versions"] is None:
+        return _empty_matrix()
+    row = dictionary.iloc[0]
+    versions = np.asarray(row["versions"], dtype=object)
+    columns = np.asarray(row["columns"], dtype=object)
+    types = np.asarray(row["types"] if row["types"] is not None else [], dtype=object)
+
+    found = duckdb_sql(_CELLS_SQL + _CODES_SQL, [table], name="columns", raise_errors=True)
+    dtype = np.uint8 if len(types) + TYPE_OFFSET <= np.iinfo(np.uint8).max else np.uint16
+    codes = np.zeros((len(columns), len(versions)), dtype=dtype)
+    codes[found["column_code"].to_numpy(), found["version_code"].to_numpy()] = found[
+        "type_code"
+    ].to_numpy()
+    return SchemaMatrix(versions, columns, types, codes)
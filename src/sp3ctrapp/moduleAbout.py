@@ -3,10 +3,10 @@
 from shiny import module, render, ui, reactive
 import emoji
 from sp3ctrapp.utils import filter_and_sort_versions, datasets
-from sp3ctrapp.getduck import duckdb_table
-from sp3ctrapp.tables import table_pointer, table_overview
+from sp3ctrapp.getduck import run_async
+from sp3ctrapp.tables import overview_html, overview_page_count, pointer_html
 
-from sp3ctrapp.utils import shared_first_choice, shared_second_choice
+from sp3ctrapp.utils import database_snapshot
 
 
 @module.ui
@@ -64,12 +64,8 @@ def about_ui():
                     ui.row(
                         ui.column(
                             6,
-                            ui.input_select(
-                                "first_choice",
-                                "Data:",
-                                choices=datasets(),
-                                selected=datasets()[0] if datasets() else None,
-                            ),
+                            # Choices are filled in on session start, see about_server
+                            ui.input_select("first_choice", "Data:", choices=[]),
                         ),
                         ui.column(
                             6,
@@ -79,6 +75,33 @@ def about_ui():
                     ui.br(),
                     # ui.hr(),
                     ui.output_ui("table_html"),
+                    ui.row(
+                        ui.column(
+                            5,
+                            ui.input_select(
+                                "overview_sort",
+                                "Sort by:",
+                                choices={
+                                    "table": "Table",
+                                    "version": "Last run",
+                                    "status": "Status",
+                                    "validated_by": "Agent",
+                                },
+                            ),
+                        ),
+                        ui.column(
+                            4,
+                            ui.input_switch("overview_desc", "Descending", value=False),
+                        ),
+                        ui.column(
+                            3,
+                            ui.input_numeric("overview_page", "Page:", value=1, min=1, step=1),
+                            ui.p(
+                                ui.output_text("overview_pages", inline=True),
+                                class_="text-muted small",
+                            ),
+                        ),
+                    ),
                     ui.p(
                         "Monitoring data made simple with Spectre.",
                         class_="text-muted small",
@@ -90,16 +113,27 @@ def about_ui():
 
 
 @module.server
-def about_server(input, output, session):
+def about_server(input, output, session, selection):
+
+    @reactive.Effect
+    async def _():
+        database_snapshot()
+        choices = await run_async(datasets)
+        with reactive.isolate():
+            current = input.first_choice() if input.first_choice.is_set() else None
+        if current not in choices:
+            current = choices[0] if choices else None
+        ui.update_select("first_choice", choices=choices, selected=current)
 
     @output
     @render.ui
-    def dependent_select():
+    async def dependent_select():
+        database_snapshot()
         choice = input.first_choice()
         if not choice:
             return ui.TagList()  # Return nothing if no choice
 
-        filtered_df = filter_and_sort_versions(choice)
+        filtered_df = await run_async(filter_and_sort_versions, choice)
         versions = filtered_df["version"].astype(str).tolist()
 
         if not versions:
@@ -111,7 +145,8 @@ def about_server(input, output, session):
 
     @output()
     @render.ui
-    def table_html2():
+    async def table_html2():
+        database_snapshot()
         choice = input.first_choice()
         version = input.second_choice()
 
@@ -120,22 +155,51 @@ def about_server(input, output, session):
         if not version:
             return ui.div("Please select a version first.")
 
-        return table_pointer(choice, version)
+        # Rendered once per dataset version, shared with the other tab and all sessions
+        return ui.HTML(await run_async(pointer_html, choice, version))
 
     @output()
     @render.ui
-    def table_html():
-        df = duckdb_table(table="pointers")
-        return table_overview(df)
+    async def table_html():
+        database_snapshot()
+        # One page of the latest runs, sorted and paged in DuckDB and
+        # rendered once per database snapshot for all sessions
+        html = await run_async(
+            overview_html,
+            input.overview_sort(),
+            input.overview_desc(),
+            input.overview_page() or 1,
+        )
+        return ui.HTML(html)
+
+    @reactive.Calc
+    async def page_count():
+        database_snapshot()
+        pages, _ = await run_async(overview_page_count)
+        return pages
+
+    @reactive.Effect
+    async def _():
+        ui.update_numeric("overview_page", max=await page_count())
+
+    @reactive.Effect
+    @reactive.event(input.overview_sort, input.overview_desc, ignore_init=True)
+    def _():
+        ui.update_numeric("overview_page", value=1)
+
+    @output
+    @render.text
+    async def overview_pages():
+        return f"of {await page_count()}"
 
     @reactive.Effect
     def _():
         choice = input.first_choice()
         if choice is not None:
-            shared_first_choice.set(choice)
+            selection.dataset.set(choice)
 
     @reactive.Effect
     def _():
         version = input.second_choice()
         if version is not None:
-            shared_second_choice.set(version)
+            selection.version.set(version)
@@ -2,7 +2,6 @@ from shiny import module, render, ui, reactive
 import emoji
 from htmltools import HTML
 from sp3ctrapp.getgit import get_diff, visualize_diff
-from sp3ctrapp.utils import shared_first_choice
 
 
 @module.ui
@@ -31,7 +30,7 @@ def diff_ui():
 
 
 @module.server
-def diff_server(input, output, session):
+def diff_server(input, output, session, selection):
 
     render_state = reactive.Value({"valid": True, "error": None})
     diff_lines_val = reactive.Value([])
@@ -41,7 +40,7 @@ def diff_server(input, output, session):
     @reactive.event(input.fetch_diff)
     def _():
         try:
-            table_value = shared_first_choice.get()
+            table_value = selection.dataset.get()
             lines = get_diff(table=table_value)
             diff_lines_val.set(lines)
             render_state.set({"valid": True, "error": None})
@@ -2,7 +2,10 @@ from shiny import module, reactive, render, ui
 import emoji
 from plotnine import ggplot
 from sp3ctrapp.plots import plot_LabelMatrix
-from sp3ctrapp.utils import shared_first_choice
+from sp3ctrapp.clientplots import plot_backend, spec_labels, vega_output
+from sp3ctrapp.getduck import run_async
+from sp3ctrapp.rendercache import plot_image
+from sp3ctrapp.utils import database_snapshot
 
 
 @module.ui
@@ -32,6 +35,9 @@ def labels_ui():
                             {"class": "text-muted small"},
                             "Ensure all expected labels are present before modeling.",
                         ),
+                        ui.input_switch(
+                            "compact", "Collapse unchanged versions", value=False
+                        ),
                     ),
                 ),
                 ui.column(
@@ -49,19 +55,29 @@ def labels_ui():
 
 
 @module.server
-def labels_server(input, output, session):
+def labels_server(input, output, session, selection):
     plot_state = reactive.Value({"success": True, "error": None, "plot": None})
 
     @reactive.Calc
-    def labels_plot():
-        user_table = shared_first_choice.get()
+    async def labels_plot():
+        database_snapshot()
+        user_table = selection.dataset.get()
+        compact = input.compact()
 
         if not user_table:
             return {"success": False, "error": "No dataset selected.", "plot": None}
 
         try:
-            plot_obj = plot_LabelMatrix(table=user_table)
-            return {"success": True, "plot": plot_obj, "error": None}
+            # Client mode ships a Vega-Lite spec and draws it in the browser
+            build = spec_labels if plot_backend() == "client" else plot_LabelMatrix
+            plot_obj = await run_async(build, table=user_table, compact=compact)
+            return {
+                "success": True,
+                "plot": plot_obj,
+                "error": None,
+                "dataset": user_table,
+                "compact": compact,
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -70,16 +86,19 @@ def labels_server(input, output, session):
             }
 
     @reactive.Effect
-    def update_state():
-        plot_state.set(labels_plot())
+    async def update_state():
+        plot_state.set(await labels_plot())
 
     @output
     @render.ui
     def labels_plot_ui():
         result = plot_state.get()
-        if result["success"] and isinstance(result["plot"], ggplot):
+        if result["success"] and isinstance(result["plot"], dict):
+            return vega_output("label_matrix_plot_vega", result["plot"])
+        elif result["success"] and isinstance(result["plot"], ggplot):
             return ui.div(
-                # The output_plot ID here must be unique and matched by the render.plot below
+                # The output_plot ID here must be unique and matched by the render.image below,
+                # which renders at the size the browser reports for it
                 ui.output_plot("label_matrix_plot", width="100%", height="600px")
             )
         else:
@@ -94,7 +113,17 @@ def labels_server(input, output, session):
             )
 
     @output
-    @render.plot(alt="Label Matrix")
-    def label_matrix_plot():
+    @render.image
+    async def label_matrix_plot():
         result = plot_state.get()
-        return result["plot"] if result["success"] else None
+        if not isinstance(result["plot"], ggplot):
+            return None
+        # Rendered once per dataset, size and database snapshot, shared by all sessions
+        return await plot_image(
+            "label_matrix_plot",
+            "labels",
+            result["dataset"],
+            result["plot"],
+            options={"compact": result["compact"]},
+            alt="Label Matrix",
+        )
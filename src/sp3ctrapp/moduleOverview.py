@@ -1,9 +1,10 @@
 # overview.py
-from shiny import module, ui, render
+from shiny import module, reactive, req, ui, render
 import emoji
-from sp3ctrapp.tables import table_pointer
+from sp3ctrapp.tables import grid_page_size, pointer_columns, pointer_html
+from sp3ctrapp.getduck import run_async
 
-from sp3ctrapp.utils import shared_first_choice, shared_second_choice
+from sp3ctrapp.utils import database_snapshot
 
 
 @module.ui
@@ -11,21 +12,99 @@ def overview_ui():
     return ui.navset_card_underline(
         ui.nav_panel(
             ui.h4(f"{emoji.emojize(':clipboard:')} Overview", class_="m-0"),
-            ui.div({"style": "overflow-x: auto"}, ui.output_ui("table_html2")),
+            ui.input_switch("grid", "Grid view (for wide datasets)", value=False),
+            # Hidden outputs are not rendered, so only the active view is built
+            ui.panel_conditional(
+                "!input.grid",
+                ui.div({"style": "overflow-x: auto"}, ui.output_ui("table_html2")),
+            ),
+            ui.panel_conditional(
+                "input.grid",
+                ui.row(
+                    ui.column(
+                        5,
+                        ui.input_text(
+                            "grid_search",
+                            "Search:",
+                            placeholder="Column, label, type or description",
+                        ),
+                    ),
+                    ui.column(
+                        3,
+                        ui.input_select(
+                            "grid_sort",
+                            "Sort by:",
+                            choices={"column": "Column", "label": "Label", "type": "Type"},
+                        ),
+                    ),
+                    ui.column(2, ui.input_switch("grid_desc", "Descending", value=False)),
+                    ui.column(
+                        2, ui.input_numeric("grid_page", "Page:", value=1, min=1, step=1)
+                    ),
+                ),
+                ui.output_data_frame("pointer_grid"),
+                ui.p(ui.output_text("grid_summary", inline=True), class_="text-muted small mt-2"),
+            ),
         )
     )
 
 
 @module.server
-def overview_server(input, output, session):
+def overview_server(input, output, session, selection):
 
     @output
     @render.ui
-    def table_html2():
-        choice = shared_first_choice.get()
-        version = shared_second_choice.get()
+    async def table_html2():
+        database_snapshot()
+        choice = selection.dataset.get()
+        version = selection.version.get()
 
         if not choice or not version:
             return ui.div("Please select both a table and a version.")
 
-        return table_pointer(choice, version)
+        # Rendered once per dataset version, shared with the other tab and all sessions
+        return ui.HTML(await run_async(pointer_html, choice, version))
+
+    @reactive.Calc
+    async def grid_rows():
+        database_snapshot()
+        choice = selection.dataset.get()
+        version = selection.version.get()
+        req(choice, version)
+
+        # Filtered, sorted and paged in DuckDB; only the visible rows are sent
+        return await run_async(
+            pointer_columns,
+            choice,
+            version,
+            input.grid_search(),
+            input.grid_sort(),
+            input.grid_desc(),
+            input.grid_page() or 1,
+        )
+
+    @reactive.Effect
+    @reactive.event(
+        input.grid_search, input.grid_sort, input.grid_desc, selection.version, ignore_init=True
+    )
+    def _():
+        ui.update_numeric("grid_page", value=1)
+
+    @output
+    @render.data_frame
+    async def pointer_grid():
+        rows, _, _ = await grid_rows()
+        return render.DataGrid(rows, width="100%", height="600px", summary=False)
+
+    @output
+    @render.text
+    async def grid_summary():
+        rows, page, total = await grid_rows()
+        if not total:
+            return "No matching columns."
+        page_size = grid_page_size()
+        first = (page - 1) * page_size + 1
+        return (
+            f"Columns {first}-{first + len(rows) - 1} of {total}, "
+            f"page {page} of {-(-total // page_size)}"
+        )
@@ -2,12 +2,27 @@ from shiny import module, reactive, render, ui
 import emoji
 from plotnine import ggplot
 from sp3ctrapp.plots import plot_pipe
-from sp3ctrapp.utils import shared_first_choice
+from sp3ctrapp.clientplots import plot_backend, spec_pipe, vega_output
+from sp3ctrapp.coverage import pipe_coverage
+from sp3ctrapp.getduck import run_async
+from sp3ctrapp.rendercache import plot_image
+from sp3ctrapp.utils import database_snapshot
 
 
 
 
 
+def uncovered_note(columns):
+    """Note listing the columns of the latest version that no step validates."""
+    if not columns:
+        return None
+    return ui.p(
+        ui.tags.strong("Not validated in the latest version: "),
+        ", ".join(columns),
+        class_="text-muted small mt-2",
+    )
+
+
 @module.ui
 def pipe_ui():
     return ui.navset_card_underline(
@@ -47,19 +62,29 @@ def pipe_ui():
 
 
 @module.server
-def pipe_server(input, output, session):
+def pipe_server(input, output, session, selection):
     plot_state = reactive.Value({"success": True, "error": None, "plot": None})
 
     @reactive.Calc
-    def pipe_plot():
-        user_table = shared_first_choice.get()
+    async def pipe_plot():
+        database_snapshot()
+        user_table = selection.dataset.get()
 
         if not user_table:
             return {"success": False, "error": "No dataset selected.", "plot": None}
 
         try:
-            plot_obj = plot_pipe()
-            return {"success": True, "plot": plot_obj, "error": None}
+            # Client mode ships a Vega-Lite spec and draws it in the browser
+            build = spec_pipe if plot_backend() == "client" else plot_pipe
+            plot_obj = await run_async(build, user_table)
+            coverage = await run_async(pipe_coverage, user_table)
+            return {
+                "success": True,
+                "plot": plot_obj,
+                "error": None,
+                "dataset": user_table,
+                "uncovered": coverage.uncovered,
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -68,17 +93,24 @@ def pipe_server(input, output, session):
             }
 
     @reactive.Effect
-    def update_state():
-        plot_state.set(pipe_plot())
+    async def update_state():
+        plot_state.set(await pipe_plot())
 
     @output
     @render.ui
     def pipe_plot_ui():
         result = plot_state.get()
-        if result["success"] and isinstance(result["plot"], ggplot):
+        if result["success"] and isinstance(result["plot"], dict):
+            return ui.div(
+                vega_output("label_dot_plot_vega", result["plot"]),
+                uncovered_note(result["uncovered"]),
+            )
+        elif result["success"] and isinstance(result["plot"], ggplot):
             return ui.div(
-                # The output_plot ID here must be unique and matched by the render.plot below
-                ui.output_plot("label_dot_plot", width="100%", height="600px")
+                # The output_plot ID here must be unique and matched by the render.image below,
+                # which renders at the size the browser reports for it
+                ui.output_plot("label_dot_plot", width="100%", height="600px"),
+                uncovered_note(result["uncovered"]),
             )
         else:
             return ui.div(
@@ -90,7 +122,12 @@ def pipe_server(input, output, session):
             )
 
     @output
-    @render.plot(alt="Pipe Dot Plot")
-    def label_dot_plot():
+    @render.image
+    async def label_dot_plot():
         result = plot_state.get()
-        return result["plot"] if result["success"] else None
+        if not isinstance(result["plot"], ggplot):
+            return None
+        # Rendered once per dataset, size and database snapshot, shared by all sessions
+        return await plot_image(
+            "label_dot_plot", "pipe", result["dataset"], result["plot"], alt="Pipe Dot Plot"
+        )
@@ -5,9 +5,10 @@ from shiny import module, reactive, render, ui
 import os
 import emoji
 
-from sp3ctrapp.getduck import duckdb_table
+from sp3ctrapp.getduck import run_async
+from sp3ctrapp.reports import report_path, report_url
 
-from sp3ctrapp.utils import shared_first_choice, shared_second_choice
+from sp3ctrapp.utils import database_snapshot
 
 
 @module.ui
@@ -57,41 +58,34 @@ def validation_ui():
 
 
 @module.server
-def validation_server(input, output, session):
+def validation_server(input, output, session, selection):
     report_state = reactive.Value({"valid": True, "error": None})
 
     @reactive.Calc
-    def validation_report():
-        ds = shared_first_choice.get()
-        ver = shared_second_choice.get()
+    async def validation_report():
+        database_snapshot()
+        ds = selection.dataset.get()
+        ver = selection.version.get()
 
         if not ds or not ver:
             return {"success": False, "error": "No dataset or version selected."}
 
         try:
-            pointer_df = duckdb_table(table="pointers")
-            pointer_df = pointer_df[pointer_df["table"] == ds]
-            pointer_df = pointer_df[pointer_df["version"] == ver]
+            path = await run_async(report_path, ds, ver)
 
-            if pointer_df.empty:
+            if path is None:
                 return {
                     "success": False,
                     "error": f"No matching report found for dataset '{ds}' and version '{ver}'.",
                 }
 
-            # report_path = os.path.join("data", pointer_df.iloc[0]["report_path"])
-            report_path = os.path.join(
-                "src", "sp3ctrapp", "data", pointer_df.iloc[0]["report_path"]
-            )
-
-            if os.path.exists(report_path):
-                with open(report_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                return {"success": True, "content": content, "path": report_path}
+            if os.path.exists(path):
+                # The browser loads the report itself and revalidates it with a 304
+                return {"success": True, "url": report_url(ds, ver), "path": path}
             else:
                 return {
                     "success": False,
-                    "error": f"Report file not found: {report_path}",
+                    "error": f"Report file not found: {os.path.relpath(path)}",
                 }
 
         except Exception as e:
@@ -101,17 +95,21 @@ def validation_server(input, output, session):
             }
 
     @reactive.Effect
-    def update_state():
-        result = validation_report()
+    async def update_state():
+        result = await validation_report()
         report_state.set({"valid": result["success"], "error": result.get("error")})
 
     @output
     @render.ui
-    def validation_report_ui():
+    async def validation_report_ui():
         state = report_state.get()
 
         if state["valid"]:
-            return ui.HTML(validation_report()["content"])
+            return ui.tags.iframe(
+                src=(await validation_report())["url"],
+                title="Validation report",
+                style="width: 100%; height: 80vh; border: 0;",
+            )
         else:
             return ui.div(
                 {
@@ -131,11 +129,11 @@ def validation_server(input, output, session):
     @render.download
     def download_report():
         def filename():
-            ds = shared_first_choice.get() or "report"
+            ds = selection.dataset.get() or "report"
             return f"{ds}_validation_report.html"
 
-        def content(file):
-            result = validation_report()
+        async def content(file):
+            result = await validation_report()
             if result["success"]:
                 with open(result["path"], "rb") as fsrc:
                     file.write(fsrc.read())
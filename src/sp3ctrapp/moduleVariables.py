@@ -2,7 +2,10 @@ from shiny import module, reactive, render, ui
 import emoji
 from plotnine import ggplot
 from sp3ctrapp.plots import plot_PresenceMatrixWeb
-from sp3ctrapp.utils import shared_first_choice
+from sp3ctrapp.clientplots import plot_backend, spec_presence, vega_output
+from sp3ctrapp.getduck import run_async
+from sp3ctrapp.rendercache import plot_image
+from sp3ctrapp.utils import database_snapshot
 
 
 @module.ui
@@ -28,6 +31,9 @@ def variables_ui():
                             {"class": "text-muted small"},
                             "Use this to detect schema drift or inconsistencies over time.",
                         ),
+                        ui.input_switch(
+                            "compact", "Collapse unchanged versions", value=False
+                        ),
                     ),
                 ),
                 ui.column(
@@ -45,19 +51,29 @@ def variables_ui():
 
 
 @module.server
-def variables_server(input, output, session):
+def variables_server(input, output, session, selection):
     plot_state = reactive.Value({"success": True, "error": None, "plot": None})
 
     @reactive.Calc
-    def presence_plot():
-        user_table = shared_first_choice.get()
+    async def presence_plot():
+        database_snapshot()
+        user_table = selection.dataset.get()
+        compact = input.compact()
 
         if not user_table:
             return {"success": False, "error": "No dataset selected.", "plot": None}
 
         try:
-            plot_obj = plot_PresenceMatrixWeb(table=user_table)
-            return {"success": True, "plot": plot_obj, "error": None}
+            # Client mode ships a Vega-Lite spec and draws it in the browser
+            build = spec_presence if plot_backend() == "client" else plot_PresenceMatrixWeb
+            plot_obj = await run_async(build, table=user_table, compact=compact)
+            return {
+                "success": True,
+                "plot": plot_obj,
+                "error": None,
+                "dataset": user_table,
+                "compact": compact,
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -66,14 +82,16 @@ def variables_server(input, output, session):
             }
 
     @reactive.Effect
-    def update_state():
-        plot_state.set(presence_plot())
+    async def update_state():
+        plot_state.set(await presence_plot())
 
     @output
     @render.ui
     def presence_plot_ui():
         result = plot_state.get()
-        if result["success"] and isinstance(result["plot"], ggplot):
+        if result["success"] and isinstance(result["plot"], dict):
+            return vega_output("presence_matrix_plot_vega", result["plot"])
+        elif result["success"] and isinstance(result["plot"], ggplot):
             return ui.div(
                 ui.output_plot("presence_matrix_plot", width="100%", height="500px")
             )
@@ -89,7 +107,17 @@ def variables_server(input, output, session):
             )
 
     @output
-    @render.plot(alt="Presence Matrix")
-    def presence_matrix_plot():
+    @render.image
+    async def presence_matrix_plot():
         result = plot_state.get()
-        return result["plot"] if result["success"] else None
+        if not isinstance(result["plot"], ggplot):
+            return None
+        # Rendered once per dataset, size and database snapshot, shared by all sessions
+        return await plot_image(
+            "presence_matrix_plot",
+            "presence",
+            result["dataset"],
+            result["plot"],
+            options={"compact": result["compact"]},
+            alt="Presence Matrix",
+        )
@@ -0,0 +1,220 @@
+# src/sp3ctrapp/parquetstore.py
+import argparse
+import os
+import shutil
+import uuid
+
+import duckdb
+
+from sp3ctrapp.getduck import (
+    ParquetPool,
+    database_path,
+    parquet_path,
+    quote_identifier,
+    write_checksum,
+)
+from sp3ctrapp.materialize import MATERIALIZED_VIEWS
+from sp3ctrapp.optimize import SORT_KEYS
+
+
+# Store layout, one folder per table:
+#
+#   pointers/table=<dataset>/data_0.parquet
+#   columns/table=<dataset>/data_0.parquet
+#   pipes/data_0.parquet
+#
+# Tables with a `table` column are partitioned by dataset, everything else
+# (`pipes`, `global_data`, ...) is stored as plain Parquet files. The derived
+# `mv_*` tables of `spectre-materialize` are partitioned by dataset as well.
+
+
+def _publish(staged, target, prune):
+    """Move staged Parquet files into `target`, replacing files one by one."""
+    os.makedirs(target, exist_ok=True)
+    fresh = set()
+    for name in os.listdir(staged):
+        if name.endswith(".parquet"):
+            os.replace(os.path.join(staged, name), os.path.join(target, name))
+            fresh.add(name)
+    if prune:
+        for name in os.listdir(target):
+            if name.endswith(".parquet") and name not in fresh:
+                os.remove(os.path.join(target, name))
+
+
+def export_parquet(db_path=None, output=None, datasets=None):
+    """
+    Export a metadata database to a Hive-partitioned Parquet store.
+
+    Every file is written to a staging folder first and then moved into
+    place with an atomic rename, so a running app never reads a partially
+    written partition. Partitions of other datasets are left untouched,
+    which lets pipelines publish their datasets independently.
+
+    If the store holds derived `mv_*` tables the source database lacks, the
+    exported datasets' partitions of them are computed from the source's
+    raw tables, so they never go stale next to the fresh raw partitions.
+
+    Args:
+        db_path (str, optional): Source database. Defaults to the app database.
+        output (str, optional): Store directory. Defaults to `parquet_path()`.
+        datasets (list[str], optional): Only export these datasets. Tables
+            without a `table` column are skipped in this case, and partitions
+            of these datasets a table no longer has rows for are removed.
+            Without it the whole database is exported and partitions of
+            datasets that no longer exist are removed.
+
+    Returns:
+        list[str]: Names of the exported tables.
+    """
+    db_path = db_path or database_path()
+    output = output or parquet_path()
+    staging = os.path.join(output, f".staging-{uuid.uuid4().hex}")
+    os.makedirs(staging)
+
+    con = duckdb.connect()
+    exported = []
+    try:
+        source = db_path.replace("'", "''")
+        con.execute(f"ATTACH '{source}' AS src (READ_ONLY)")
+        con.execute("USE src")
+        tables = [
+            (table, f"src.{quote_identifier(table)}", partitioned)
+            for table, partitioned in con.execute(
+                "SELECT table_name, list_contains(list(column_name), 'table') "
+                "FROM duckdb_columns() WHERE database_name = 'src' "
+                "GROUP BY table_name ORDER BY table_name"
+            ).fetchall()
+        ]
+        # Derived tables the source lacks, or has in an unpartitioned layout
+        # of earlier versions, are computed from its raw tables
+        current = {table for table, _, partitioned in tables if partitioned}
+        derived = [
+            name
+            for name in MATERIALIZED_VIEWS
+            if name not in current and os.path.isdir(os.path.join(output, name))
+        ]
+        tables = [entry for entry in tables if entry[0] not in derived]
+        tables += [(name, f"({MATERIALIZED_VIEWS[name]})", True) for name in derived]
+
+        for table, relation, partitioned in tables:
+            if datasets is not None and not partitioned:
+                continue
+            query = f"SELECT * FROM {relation}"
+            params = []
+            if datasets is not None:
+                query += ' WHERE "table" IN (' + ", ".join("?" for _ in datasets) + ")"
+                params = list(datasets)
+
+            staged = os.path.join(staging, table)
+            if partitioned:
+                destination, options = staged, 'FORMAT parquet, PARTITION_BY ("table")'
+            else:
+                os.makedirs(staged)
+                destination, options = os.path.join(staged, "data_0.parquet"), "FORMAT parquet"
+            destination = destination.replace("'", "''")
+            con.execute(f"COPY ({query}) TO '{destination}' ({options})", params)
+
+            target = os.path.join(output, table)
+            os.makedirs(staged, exist_ok=True)
+            if partitioned:
+                os.makedirs(target, exist_ok=True)
+                published = set(os.listdir(staged))
+                for partition in published:
+                    _publish(os.path.join(staged, partition), os.path.join(target, partition), True)
+                stale = set(os.listdir(target)) - published
+                if datasets is not None:
+                    stale &= {f"table={name}" for name in datasets}
+                for partition in stale:
+                    shutil.rmtree(os.path.join(target, partition))
+            else:
+                _publish(staged, target, True)
+            exported.append(table)
+    finally:
+        con.close()
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return exported
+
+
+def import_parquet(store=None, output=None):
+    """
+    Build a DuckDB metadata database from a Parquet store.
+
+    Tables are written sorted by their `SORT_KEYS`, like `spectre-optimize`
+    does, and a `.sha256` sidecar is written for the result.
+
+    Args:
+        store (str, optional): Store directory. Defaults to `parquet_path()`.
+        output (str, optional): Database to create. Defaults to the app database.
+
+    Returns:
+        list[str]: Names of the imported tables.
+    """
+    store = store or parquet_path()
+    output = output or database_path()
+    target = output + ".importing"
+    if os.path.exists(target):
+        os.remove(target)
+
+    pool = ParquetPool(store, max_cursors=1).open()
+    try:
+        with pool.cursor() as con:
+            tables = [
+                row[0]
+                for row in con.execute(
+                    "SELECT view_name FROM duckdb_views() "
+                    "WHERE database_name = 'meta' AND NOT internal ORDER BY view_name"
+                ).fetchall()
+            ]
+            path = target.replace("'", "''")
+            con.execute(f"ATTACH '{path}' AS dst")
+            for table in tables:
+                keys = SORT_KEYS.get(table, [])
+                order = ""
+                if keys:
+                    order = " ORDER BY " + ", ".join(quote_identifier(k) for k in keys)
+                con.execute(
+                    f"CREATE TABLE dst.{quote_identifier(table)} AS "
+                    f"SELECT * FROM meta.{quote_identifier(table)}{order}"
+                )
+            con.execute("DETACH dst")
+    finally:
+        pool.close()
+
+    write_checksum(target)
+    os.replace(target + ".sha256", output + ".sha256")
+    os.replace(target, output)
+    return tables
+
+
+def main(argv=None):
+    """Command line entry point for `spectre-parquet`."""
+    parser = argparse.ArgumentParser(
+        prog="spectre-parquet",
+        description="Convert the Spectre metadata between meta.duckdb and a partitioned Parquet store.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write meta.duckdb as Parquet partitioned by dataset")
+    export.add_argument("--db", help="Path to meta.duckdb (default: the app database)")
+    export.add_argument("--output", help="Store directory (default: SPECTRE_PARQUET_DIR)")
+    export.add_argument(
+        "--dataset", action="append", help="Only publish this dataset (repeatable)"
+    )
+
+    imp = commands.add_parser("import", help="Build meta.duckdb from a Parquet store")
+    imp.add_argument("--store", help="Store directory (default: SPECTRE_PARQUET_DIR)")
+    imp.add_argument("--output", help="Database to write (default: the app database)")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        tables = export_parquet(args.db, args.output, args.dataset)
+        print(f"Exported {', '.join(tables)} to {args.output or parquet_path()}")
+    else:
+        tables = import_parquet(args.store, args.output)
+        print(f"Imported {', '.join(tables)} into {args.output or database_path()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 # ---- Imports ----
 import re
+import numpy as np
 import pandas as pd
 
 from plotnine import (
@@ -20,68 +21,49 @@ from plotnine import (
     element_blank,
 )
 
-from sp3ctrapp.getduck import duckdb_table
+from sp3ctrapp.coverage import pipe_coverage
+from sp3ctrapp.history import schema_history
+from sp3ctrapp.matrix import run_labels, run_starts, version_runs
+from sp3ctrapp.levels import column_level_sets
 
 
 # ---- plot_PresenceMatrixWeb ----
-def plot_PresenceMatrixWeb(table, skip=0, clip_date=False):
-    # Step 1: Read column-level metadata in long format
-    data = duckdb_table(table="columns")
-    data = data[data["table"] == table]
-
-    # Step 2: Ensure no duplicates
-    data = data.drop_duplicates(subset=["version", "column_name"])
-
-    # Step 3: Create full presence grid
-    all_versions = data["version"].unique()
-    all_columns = data["column_name"].unique()
-
-    full_grid = pd.MultiIndex.from_product(
-        [all_versions, all_columns], names=["version", "column_name"]
-    ).to_frame(index=False)
-
-    # Metadata for latest version and validator (not used in plot but included for parity)
-    meta = duckdb_table(table="pointers")
-    meta = meta[meta["table"] == table]
-    latest_version = meta.sort_values("version", ascending=False).iloc[0]["version"]
-    validator = meta.sort_values("version", ascending=False).iloc[0]["validated_by"]
-
-    # Step 4: Join and compute presence
-    data["found"] = True
-    presence_data = pd.merge(
-        full_grid,
-        data[["version", "column_name", "found"]],
-        on=["version", "column_name"],
-        how="left",
-    )
-    presence_data["present"] = presence_data["found"].fillna(False)
-
+def _select_versions(matrix, skip, clip_date, compact=False):
     # Handle version filtering by `skip`
     if clip_date is not None:
         if not isinstance(skip, int):
             raise ValueError("Skip must be a numeric value.")
-        unique_versions = data["version"].unique()
-        max_skip = len(unique_versions) - 1
+        max_skip = len(matrix.versions) - 1
         if skip > max_skip:
             raise ValueError(
                 f"Skip value is too large! Maximum skip can only be {max_skip}"
             )
-        selected_versions = unique_versions[skip:]
-        presence_data = presence_data[presence_data["version"].isin(selected_versions)]
+        matrix = matrix.select_versions(skip)
 
+    # Collapse runs of versions with an unchanged schema
+    labels = None
+    if compact:
+        matrix = matrix.compact()
+        labels = run_labels(matrix.runs, clip_date)
     # Clip date if needed
-    if clip_date:
-        presence_data["version"] = presence_data["version"].str.replace(
-            r"T.*", "", regex=True
-        )
+    elif clip_date:
+        labels = [re.sub(r"T.*", "", version) for version in matrix.versions]
+    return matrix, labels
 
-    # Sort factor levels for columns
-    col_order = presence_data.sort_values("column_name", ascending=False)[
-        "column_name"
-    ].unique()
-    presence_data["column_name"] = pd.Categorical(
-        presence_data["column_name"], categories=col_order, ordered=True
+
+def presence_matrix_data(table, skip=0, clip_date=False, compact=False):
+    # Version x column grid of the shared schema history, one row per cell
+    matrix, labels = _select_versions(
+        schema_history(table).matrix, skip, clip_date, compact
     )
+    return matrix.to_frame("present", version_labels=labels)
+
+
+def plot_PresenceMatrixWeb(table, skip=0, clip_date=False, compact=False):
+    presence_data = presence_matrix_data(
+        table, skip=skip, clip_date=clip_date, compact=compact
+    )
+    col_order = presence_data["column_name"].cat.categories
 
     # presence_data['version'] = presence_data['version'].apply(
     # lambda x: x[:13] + '...' if len(x) > 13 else x
@@ -140,63 +122,16 @@ def plot_PresenceMatrixWeb(table, skip=0, clip_date=False):
 
 
 # ---- plot_TypeMatrixWeb ----
-def plot_TypeMatrixWeb(table, skip=0, clip_date=False):
-    # Step 1: Read column-level metadata in long format
-    data = duckdb_table(table="columns")
-    data = data[data["table"] == table]
-
-    # Step 2: Ensure no duplicates
-    data = data.drop_duplicates(subset=["version", "column_name", "type"])
-
-    # Step 3: Create full presence grid
-    all_versions = data["version"].unique()
-    all_columns = data["column_name"].unique()
-
-    full_grid = pd.MultiIndex.from_product(
-        [all_versions, all_columns], names=["version", "column_name"]
-    ).to_frame(index=False)
-
-    # Metadata (used only for display or future use)
-    meta = duckdb_table(table="pointers")
-    meta = meta[meta["table"] == table]
-    latest_version = meta.sort_values("version", ascending=False).iloc[0]["version"]
-    validator = meta.sort_values("version", ascending=False).iloc[0]["validated_by"]
-
-    # Step 4: Join grid with real data (type info)
-    type_data = pd.merge(
-        full_grid,
-        data[["version", "column_name", "type"]],
-        on=["version", "column_name"],
-        how="left",
+def type_matrix_data(table, skip=0, clip_date=False, compact=False):
+    # Same grid as presence_matrix_data, with the type as categorical
+    matrix, labels = _select_versions(
+        schema_history(table).matrix, skip, clip_date, compact
     )
+    return matrix.to_frame("type", version_labels=labels)
 
-    # Handle version skipping
-    if clip_date is not None:
-        if not isinstance(skip, int):
-            raise ValueError("Skip must be a numeric value.")
-        unique_versions = type_data["version"].unique()
-        max_skip = len(unique_versions) - 1
-        if skip > max_skip:
-            raise ValueError(
-                f"Skip value is too large! Maximum skip can only be {max_skip}"
-            )
-        selected_versions = unique_versions[skip:]
-        type_data = type_data[type_data["version"].isin(selected_versions)]
-
-    # Clip date from version string
-    if clip_date:
-        type_data["version"] = type_data["version"].str.replace(r"T.*", "", regex=True)
-
-    # Ensure column_name is ordered descending for Y axis
-    col_order = type_data.sort_values("column_name", ascending=False)[
-        "column_name"
-    ].unique()
-    type_data["column_name"] = pd.Categorical(
-        type_data["column_name"], categories=col_order, ordered=True
-    )
 
-    # Ensure type is categorical
-    type_data["type"] = pd.Categorical(type_data["type"])
+def plot_TypeMatrixWeb(table, skip=0, clip_date=False, compact=False):
+    type_data = type_matrix_data(table, skip=skip, clip_date=clip_date, compact=compact)
 
     # Plot
     plot = (
@@ -229,40 +164,53 @@ def truncate_text(s, maxlen=20):
 
 
 # ---- plot_LabelMatrix ----
-def plot_LabelMatrix(table: str) -> ggplot:
-    # Step 1: Load data
-    data = duckdb_table(table="columns")
-    data = data[data["table"] == table]
-
-    # Step 2: Filter for factors and split levels into rows
-    label_data = data[data["type"] == "factor"][
-        ["version", "column_name", "levels"]
-    ].copy()
-    label_data = label_data.dropna(subset=["levels"])
-    label_data["levels"] = label_data["levels"].str.split(r",\s*")
-    label_data = label_data.explode("levels")
-
-    # Step 3: Create label signature per (column, version)
-    grouped = (
-        label_data.groupby(["column_name", "version"])["levels"]
-        .apply(lambda levels: "|".join(sorted(set(levels))))
-        .reset_index(name="label_signature")
+def _compact_label_runs(grouped):
+    # Level set of every column per version; -1 where the column is missing
+    versions, version_idx = np.unique(grouped["version"].to_numpy(dtype=object), return_inverse=True)
+    columns, column_idx = np.unique(grouped["column_name"].to_numpy(dtype=object), return_inverse=True)
+    signatures = np.full((len(columns), len(versions)), -1, dtype=np.int64)
+    signatures[column_idx, version_idx] = pd.factorize(grouped["set_id"])[0]
+
+    starts = run_starts(signatures)
+    runs = version_runs(versions, starts)
+    # `changed` already compares each run start with the version before it
+    grouped = grouped[grouped["version"].isin(runs["first_version"])]
+    grouped = grouped.merge(runs, left_on="version", right_on="first_version")
+    grouped["version"] = grouped["version"].map(
+        dict(zip(runs["first_version"], run_labels(runs)))
     )
+    return grouped
 
-    # Step 4: Detect changes across versions per column
-    grouped = grouped.sort_values(["column_name", "version"])
-    grouped["prev_signature"] = grouped.groupby("column_name")[
-        "label_signature"
-    ].shift()
-    grouped["changed"] = grouped["label_signature"] != grouped["prev_signature"]
-    grouped["changed"] = grouped["changed"].where(
-        ~grouped["prev_signature"].isna(), False
-    )
 
-    # Step 5: Truncate label signatures for display (fix)
-    grouped["label_short"] = grouped["label_signature"].apply(
-        lambda s: truncate_text(s, 20)
-    )
+def label_matrix_data(table: str, compact: bool = False) -> pd.DataFrame:
+    # Steps 1-3: Interned level set per (column, version), sorted by both
+    grouped = column_level_sets(table)
+    if grouped.empty:
+        grouped = pd.DataFrame(
+            columns=["column_name", "version", "set_id", "label_signature"]
+        )
+
+    # Step 4: Detect changes across versions per column by comparing set ids
+    column = grouped["column_name"].to_numpy()
+    set_id = grouped["set_id"].to_numpy()
+    changed = np.zeros(len(grouped), dtype=bool)
+    changed[1:] = (column[1:] == column[:-1]) & (set_id[1:] != set_id[:-1])
+    grouped["changed"] = changed
+
+    # Optionally keep only the first version of each run with unchanged levels
+    if compact:
+        grouped = _compact_label_runs(grouped)
+
+    # Step 5: Truncate label signatures for display, once per distinct set
+    short = {
+        s: truncate_text(s, 20) for s in grouped["label_signature"].unique()
+    }
+    grouped["label_short"] = grouped["label_signature"].map(short)
+    return grouped
+
+
+def plot_LabelMatrix(table: str, compact: bool = False) -> ggplot:
+    grouped = label_matrix_data(table, compact=compact)
 
     # Step 6: Plot (fix scale_x_discrete too)
     plot = (
@@ -282,41 +230,19 @@ def plot_LabelMatrix(table: str) -> ggplot:
             legend_position="bottom",
         )
         + scale_x_discrete(
-            labels=lambda labels: [truncate_text(str(label), 14) for label in labels]
+            labels=lambda labels: [
+                "\n".join(truncate_text(line, 14) for line in str(label).split("\n"))
+                for label in labels
+            ]
         )
     )
 
     return plot
 
 
-def plot_pipe():
-    # Read the table from duckdb
-    data = duckdb_table(table="pipes")
-
-    # Filter rows for the specified table
-    # data = data[data["table"] == table]
-
-    if not isinstance(data, pd.DataFrame):
-        raise ValueError("The input is not a data frame.")
-
-    # Expand columns so each row is one (column, validation_type) pair
-    # Split the 'columns' column by comma + optional spaces
-    data["cols"] = data["columns"].apply(lambda x: re.split(r",\s*", x))
-    columns_expanded = data.explode("cols").reset_index(drop=True)
-
-    # Create wide validation matrix
-    distinct = (
-        columns_expanded[["cols", "validation_type"]].drop_duplicates().assign(count=1)
-    )
-
-    validation_matrix = distinct.pivot(
-        index="cols", columns="validation_type", values="count"
-    )
-
-    # Convert to long format
-    validation_long = validation_matrix.reset_index().melt(
-        id_vars="cols", var_name="validation_type", value_name="count"
-    )
+def pipe_coverage_data(table):
+    # Column x validation type grid of the dataset's pipeline, memoized
+    validation_long = pipe_coverage(table).to_frame()
 
     # Shorten long column names for better visualization
     def shorten_label(x, max_len=9):
@@ -328,6 +254,11 @@ def plot_pipe():
 
     # Replace NA counts with 0 for plotting
     validation_long["count_plot"] = validation_long["count"].fillna(0)
+    return validation_long
+
+
+def plot_pipe(table):
+    validation_long = pipe_coverage_data(table)
 
     # Plot heatmap (points + lines)
     plot = (
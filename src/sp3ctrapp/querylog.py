@@ -0,0 +1,149 @@
+# src/sp3ctrapp/querylog.py
+import contextvars
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Slow queries go to their own logger so they can be routed to a file
+slow_logger = logging.getLogger("sp3ctrapp.slow_queries")
+
+_origin = contextvars.ContextVar("spectre_query_origin", default=None)
+_stats_lock = threading.Lock()
+_stats = {}
+_handler = None
+
+# Frames from these modules are plumbing, not the code that asked for the data
+_INTERNAL = ("sp3ctrapp.getduck", "sp3ctrapp.querylog", "functools", "asyncio", "concurrent")
+
+
+def slow_query_ms():
+    """Threshold in milliseconds above which a query is written to the slow-query log."""
+    return float(os.getenv("SPECTRE_SLOW_QUERY_MS", "500"))
+
+
+def explain_slow_queries():
+    """Whether slow queries are re-run with EXPLAIN ANALYZE and the plan is logged."""
+    return os.getenv("SPECTRE_EXPLAIN_SLOW", "0").lower() in ("1", "true", "yes")
+
+
+def configure_slow_log(path=None):
+    """
+    Write slow-query records as JSON lines to a file.
+
+    Called on import with `SPECTRE_SLOW_QUERY_LOG`. Without a path, records
+    still go to the `sp3ctrapp.slow_queries` logger and follow the app's
+    logging configuration.
+
+    Args:
+        path (str, optional): Log file. Defaults to `SPECTRE_SLOW_QUERY_LOG`.
+    """
+    global _handler
+    path = path or os.getenv("SPECTRE_SLOW_QUERY_LOG")
+    if _handler is not None:
+        slow_logger.removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    if not path:
+        return
+    _handler = logging.FileHandler(path, encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_logger.addHandler(_handler)
+    slow_logger.setLevel(logging.INFO)
+
+
+def set_origin(label):
+    """
+    Label the queries issued from the current context.
+
+    Args:
+        label (str): Typically `module.function` of the reactive calc or output.
+
+    Returns:
+        contextvars.Token: Token to restore the previous label.
+    """
+    return _origin.set(label)
+
+
+def current_origin():
+    """
+    Name the code that issued the current query.
+
+    Uses the label set with `set_origin` (carried into worker threads by
+    `run_async`), otherwise the first caller outside the query plumbing.
+
+    Returns:
+        str: The origin label.
+    """
+    label = _origin.get()
+    if label:
+        return label
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_globals.get("__name__", "")
+        if name and not name.startswith(_INTERNAL):
+            return f"{name}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def record_query(record, explain=None):
+    """
+    Account for a finished query and log it if it was slow.
+
+    Args:
+        record (dict): Query facts: `table`, `sql`, `params`, `wall_ms`,
+            `rows`, `bytes`, `cached`, `origin` and, on failure, `error`.
+        explain (callable, optional): Returns the EXPLAIN ANALYZE output of
+            the query. Only called for slow queries with `SPECTRE_EXPLAIN_SLOW`.
+    """
+    with _stats_lock:
+        entry = _stats.setdefault(
+            record["origin"],
+            {"queries": 0, "cached": 0, "errors": 0, "wall_ms": 0.0, "rows": 0, "bytes": 0},
+        )
+        entry["queries"] += 1
+        entry["cached"] += int(record["cached"])
+        entry["errors"] += int("error" in record)
+        entry["wall_ms"] += record["wall_ms"]
+        entry["rows"] += record["rows"]
+        entry["bytes"] += record["bytes"]
+
+    logger.debug(
+        "%s %s: %.1f ms, %d rows, %d bytes%s",
+        record["origin"],
+        record["table"],
+        record["wall_ms"],
+        record["rows"],
+        record["bytes"],
+        " (cached)" if record["cached"] else "",
+    )
+
+    if record["cached"] or record["wall_ms"] < slow_query_ms():
+        return
+    record = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S%z"), **record}
+    if explain is not None and explain_slow_queries():
+        try:
+            record["explain"] = explain()
+        except Exception as e:
+            record["explain_error"] = str(e)
+    slow_logger.warning(json.dumps(record, default=str))
+
+
+def query_stats():
+    """
+    Summarize the queries issued so far, grouped by origin.
+
+    Returns:
+        dict: Per origin the number of queries, cache hits, errors, total wall
+        time in milliseconds, rows and bytes returned.
+    """
+    with _stats_lock:
+        return {origin: dict(entry) for origin, entry in _stats.items()}
+
+
+configure_slow_log()
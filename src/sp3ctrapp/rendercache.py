@@ -0,0 +1,372 @@
+# src/sp3ctrapp/rendercache.py
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from shiny import req
+from shiny.session import require_active_session
+
+from sp3ctrapp.getduck import get_pool, run_in_executor
+
+# CSS pixels per inch, as used by the browser and by shiny's render.plot
+PX_PER_INCH = 96
+# Plots are rendered at output sizes snapped to these steps and pixel
+# ratios, so browsers of similar size share one cached image
+SIZE_STEP = 100
+PIXEL_RATIOS = (1, 2, 3)
+
+
+class RenderCache:
+    """
+    Size-bounded LRU cache of rendered images on disk.
+
+    Each entry is one file named after the hash of its key, written with an
+    atomic rename so that several worker processes can share the directory.
+    The directory itself is the index: a hit refreshes the file's
+    modification time, and after every write the files of all processes are
+    scanned and the least recently used ones removed until their summed size
+    fits `max_bytes`.
+
+    Args:
+        directory (str): Folder holding the image files.
+        max_bytes (int): Total size budget for all files.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+        os.makedirs(directory, exist_ok=True)
+        self._evict()
+
+    def _scan(self):
+        # (mtime, size, path) of every cached file, oldest first
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime_ns, st.st_size, entry.path))
+        return sorted(files)
+
+    def _evict(self):
+        files = self._scan()
+        total = sum(size for _, size, _ in files)
+        # The most recent entry is kept even if it exceeds the budget on its own
+        for _, size, path in files[:-1]:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                continue
+            with self._lock:
+                self._counters["evictions"] += 1
+
+    @staticmethod
+    def filename(key, fmt):
+        """Return the file name for a cache key and image format."""
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + "." + fmt
+
+    def get(self, key, fmt="png"):
+        """
+        Return the path of a cached image and mark it as recently used.
+
+        Args:
+            key (tuple): The cache key.
+            fmt (str): Image format and file extension.
+
+        Returns:
+            str | None: Path to the image file, or None on a miss.
+        """
+        path = os.path.join(self.directory, self.filename(key, fmt))
+        try:
+            # Mark as recently used for every process sharing the directory
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+        with self._lock:
+            self._counters["hits"] += 1
+        return path
+
+    def put(self, key, data, fmt="png"):
+        """
+        Store an encoded image and return its path.
+
+        Args:
+            key (tuple): The cache key.
+            data (bytes): The encoded image.
+            fmt (str): Image format and file extension.
+
+        Returns:
+            str: Path to the image file.
+        """
+        name = self.filename(key, fmt)
+        path = os.path.join(self.directory, name)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix="." + fmt)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._evict()
+        return path
+
+    def stats(self):
+        """
+        Return hit/miss/eviction counters and the current fill level.
+
+        Returns:
+            dict: Counters plus `entries`, `bytes` and `max_bytes`.
+        """
+        files = self._scan()
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(files),
+                "bytes": sum(size for _, size, _ in files),
+                "max_bytes": self.max_bytes,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+_render_executor = None
+# plotnine's save changes global matplotlib and pandas options while it
+# runs, so two figures must never be rasterized at the same time
+_encode_lock = threading.Lock()
+# How often each (kind, width, height, dpi) was requested by a browser,
+# trimmed to the most frequent half once it holds MAX_REQUESTED_SIZES
+_requested_sizes = Counter()
+MAX_REQUESTED_SIZES = 256
+
+
+def plot_format():
+    """Return the image format for plots, `png` (default) or `svg` (`SPECTRE_PLOT_FORMAT`)."""
+    return "svg" if os.getenv("SPECTRE_PLOT_FORMAT", "png").lower() == "svg" else "png"
+
+
+def get_render_cache():
+    """
+    Return the process-wide render cache, creating it on first use.
+
+    The directory is `SPECTRE_RENDER_CACHE_DIR` (default: `spectre-render-cache`
+    in the system temp folder) and the budget `SPECTRE_RENDER_CACHE_MB`
+    (default: 256).
+
+    Returns:
+        RenderCache: The shared cache.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            directory = os.getenv(
+                "SPECTRE_RENDER_CACHE_DIR",
+                os.path.join(tempfile.gettempdir(), "spectre-render-cache"),
+            )
+            max_bytes = int(os.getenv("SPECTRE_RENDER_CACHE_MB", "256")) * 1024**2
+            _cache = RenderCache(directory, max_bytes)
+        return _cache
+
+
+def get_render_executor():
+    """
+    Return the thread pool that builds and rasterizes plots.
+
+    Kept apart from the query thread pool, so rendering never holds up
+    queries. `SPECTRE_RENDER_THREADS` threads (default: 2) can build figures
+    in parallel; rasterizing itself is serialized by `encode_plot`.
+
+    Returns:
+        ThreadPoolExecutor: The shared render executor.
+    """
+    global _render_executor
+    with _cache_lock:
+        if _render_executor is None:
+            _render_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("SPECTRE_RENDER_THREADS", "2")),
+                thread_name_prefix="spectre-render",
+            )
+        return _render_executor
+
+
+def render_cache_stats():
+    """
+    Report hit, miss and eviction counts of the render cache.
+
+    Returns:
+        dict: Cache counters and fill level.
+    """
+    return get_render_cache().stats()
+
+
+def size_bucket(width, height, pixelratio=1):
+    """
+    Snap an output size to the sizes plots are rendered at.
+
+    Only the width is snapped, down to a multiple of `SIZE_STEP`, so the
+    image never overflows its output. The height is the fixed height the
+    UI declares for the output and is kept as is.
+
+    Args:
+        width (float): Width in CSS pixels.
+        height (float): Height in CSS pixels.
+        pixelratio (float): Device pixel ratio of the browser.
+
+    Returns:
+        tuple: `(width, height, dpi)` of the image to render.
+    """
+    width = max(SIZE_STEP, int(width // SIZE_STEP) * SIZE_STEP)
+    height = round(height)
+    ratio = min(PIXEL_RATIOS, key=lambda r: abs(r - pixelratio))
+    return width, height, PX_PER_INCH * ratio
+
+
+def _count_size(kind, width, height, dpi):
+    global _requested_sizes
+    _requested_sizes[(kind, round(width), round(height), round(dpi, 2))] += 1
+    if len(_requested_sizes) > MAX_REQUESTED_SIZES:
+        _requested_sizes = Counter(dict(_requested_sizes.most_common(MAX_REQUESTED_SIZES // 2)))
+
+
+def requested_sizes(kind, n=2):
+    """
+    Return the size buckets browsers requested most often for a plot.
+
+    Args:
+        kind (str): Name of the plot, e.g. `presence`.
+        n (int): Maximum number of sizes.
+
+    Returns:
+        list[tuple]: `(width, height, dpi)`, most frequent first.
+    """
+    sizes = [(key[1:], count) for key, count in _requested_sizes.items() if key[0] == kind]
+    return [size for size, _ in sorted(sizes, key=lambda item: -item[1])[:n]]
+
+
+def encode_plot(plot, width, height, dpi, fmt="png"):
+    """
+    Rasterize a plotnine figure.
+
+    Only one figure is rasterized at a time per process, since plotnine
+    changes global matplotlib and pandas settings while saving.
+
+    Args:
+        plot (ggplot): The figure.
+        width (float): Width in CSS pixels.
+        height (float): Height in CSS pixels.
+        dpi (float): Resolution, `PX_PER_INCH` times the device pixel ratio.
+        fmt (str): `png` or `svg`.
+
+    Returns:
+        bytes: The encoded image.
+    """
+    with _encode_lock, io.BytesIO() as buf:
+        plot.save(
+            buf,
+            format=fmt,
+            units="in",
+            width=width / PX_PER_INCH,
+            height=height / PX_PER_INCH,
+            dpi=dpi,
+            verbose=False,
+        )
+        return buf.getvalue()
+
+
+def cached_plot(kind, dataset, options, plot, width, height, dpi):
+    """
+    Return the path of a rendered plot, rendering it only on a cache miss.
+
+    The cache key is `(kind, dataset, options, width, height, dpi, database
+    fingerprint, format)`, so a figure is rendered once per size and database
+    snapshot and then served to every session from disk.
+
+    Args:
+        kind (str): Name of the plot, e.g. `presence`.
+        dataset (str | None): The dataset shown.
+        options (dict): Further arguments the figure depends on, e.g. `skip`.
+        plot (ggplot | callable): The figure, or a function returning it.
+        width (float): Width in CSS pixels.
+        height (float): Height in CSS pixels.
+        dpi (float): Resolution of the image.
+
+    Returns:
+        str: Path to the image file.
+    """
+    fmt = plot_format()
+    key = (
+        kind,
+        dataset,
+        tuple(sorted(options.items())),
+        round(width),
+        round(height),
+        round(dpi, 2),
+        get_pool().fingerprint,
+        fmt,
+    )
+    cache = get_render_cache()
+    path = cache.get(key, fmt)
+    if path is None:
+        figure = plot() if callable(plot) else plot
+        path = cache.put(key, encode_plot(figure, width, height, dpi, fmt), fmt)
+    return path
+
+
+async def plot_image(output_id, kind, dataset, plot, options=None, alt=None):
+    """
+    Serve a plot to a `render.image` output from the render cache.
+
+    Reads the output size and pixel ratio reported by the browser, the way
+    `render.plot` does, snaps them to a `size_bucket` and renders on the
+    render thread pool on a miss. The image is shown at the size it was
+    rendered at, centred in the output, so the browser never rescales it.
+
+    Args:
+        output_id (str): Id of the output inside the current module.
+        kind (str): Name of the plot, part of the cache key.
+        dataset (str | None): The dataset shown.
+        plot (ggplot | callable): The figure, or a function returning it.
+        options (dict, optional): Further arguments the figure depends on.
+        alt (str, optional): Alternative text of the image.
+
+    Returns:
+        dict: `ImgData` for `render.image`.
+    """
+    session = require_active_session(None)
+    clientdata = session.root_scope().clientdata
+    name = session.ns(output_id)
+    width = clientdata.output_width(name)
+    height = clientdata.output_height(name)
+    req(width, height)
+    bucket_width, bucket_height, dpi = size_bucket(width, height, clientdata.pixelratio() or 1)
+    _count_size(kind, bucket_width, bucket_height, dpi)
+
+    path = await run_in_executor(
+        get_render_executor(),
+        cached_plot,
+        kind,
+        dataset,
+        options or {},
+        plot,
+        bucket_width,
+        bucket_height,
+        dpi,
+    )
+    # Letterboxed by less than SIZE_STEP pixels rather than scaled and blurred
+    return {
+        "src": path,
+        "width": bucket_width,
+        "height": bucket_height,
+        "alt": alt or "",
+        "style": "display: block; margin: 0 auto;",
+    }
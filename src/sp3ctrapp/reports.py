@@ -0,0 +1,179 @@
+# src/sp3ctrapp/reports.py
+import gzip
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import quote
+
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from sp3ctrapp.cache import LRUCache
+from sp3ctrapp.getduck import duckdb_query, run_async
+
+try:
+    import brotli
+except ImportError:  # Optional: without it reports are served gzip-compressed
+    brotli = None
+
+
+def report_dir():
+    """
+    Return the folder the `report_path` of the pointers table is relative to.
+
+    Returns:
+        str: Absolute path to `src/sp3ctrapp/data`.
+    """
+    return os.path.join(os.getcwd(), "src", "sp3ctrapp", "data")
+
+
+def report_path(dataset, version):
+    """
+    Look up the validation report of a dataset version.
+
+    Args:
+        dataset (str): Name of the dataset.
+        version (str): The version, e.g. "2025-08-20T13-52-15".
+
+    Returns:
+        str | None: Path of the report file, which may not exist, or None if
+        the version has no pointers row.
+    """
+    pointer_df = duckdb_query(
+        "pointers",
+        columns=["report_path"],
+        where={"table": dataset, "version": version},
+        limit=1,
+    )
+    if pointer_df.empty:
+        return None
+    return os.path.join(report_dir(), pointer_df.iloc[0]["report_path"])
+
+
+def report_url(dataset, version):
+    """
+    Return the URL of the validation report of a dataset version.
+
+    The URL is relative, so it also works behind a proxy that serves the app
+    under a sub-path.
+
+    Args:
+        dataset (str): Name of the dataset.
+        version (str): The version, e.g. "2025-08-20T13-52-15".
+
+    Returns:
+        str: URL served by `report_endpoint`.
+    """
+    return f"reports/{quote(dataset, safe='')}/{quote(version, safe='')}"
+
+
+def cache_control():
+    """
+    Return the `Cache-Control` header of reports.
+
+    Browsers keep reports for `SPECTRE_REPORT_MAX_AGE` seconds (default: 0)
+    and revalidate them afterwards, which costs a 304 while the file is
+    unchanged.
+
+    Returns:
+        str: The header value.
+    """
+    max_age = int(os.getenv("SPECTRE_REPORT_MAX_AGE", "0"))
+    return f"public, max-age={max_age}" + ("" if max_age else ", must-revalidate")
+
+
+def _accepted_encoding(header):
+    # Preferred content coding the client accepts, honouring `;q=0`
+    accepted = set()
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        _, _, quality = params.partition("q=")
+        try:
+            if float(quality or 1) > 0:
+                accepted.add(name.strip().lower())
+        except ValueError:
+            continue
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+
+# Report bodies per file state and content coding, compressed once
+_bodies = LRUCache(max_bytes=64 * 1024**2)
+
+
+def _encoded_body(path, stat, encoding):
+    key = (path, stat.st_mtime_ns, stat.st_size, encoding)
+    body = _bodies.get(key)
+    if body is None:
+        with open(path, "rb") as f:
+            body = f.read()
+        if encoding == "br":
+            body = brotli.compress(body, quality=9)
+        elif encoding == "gzip":
+            body = gzip.compress(body, compresslevel=6, mtime=0)
+        _bodies.put(key, body)
+    return body
+
+
+def _not_modified(headers, etag, mtime):
+    if "if-none-match" in headers:
+        tags = [tag.strip() for tag in headers["if-none-match"].split(",")]
+        return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+    if "if-modified-since" in headers:
+        try:
+            since = parsedate_to_datetime(headers["if-modified-since"])
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= since.timestamp()
+    return False
+
+
+def _inside(path, folder):
+    path, folder = os.path.realpath(path), os.path.realpath(folder)
+    return os.path.commonpath([path, folder]) == folder
+
+
+async def report_endpoint(request):
+    """
+    Serve the validation report of a dataset version over plain HTTP.
+
+    Responses carry an `ETag` and `Last-Modified` from the report file, so
+    repeat views are answered with 304 Not Modified, and are compressed with
+    brotli (if installed) or gzip.
+
+    Args:
+        request (starlette.requests.Request): Request for
+            `/reports/{dataset}/{version}`.
+
+    Returns:
+        starlette.responses.Response: The report, a 304 or a 404.
+    """
+    dataset = request.path_params["dataset"]
+    version = request.path_params["version"]
+    path = await run_async(report_path, dataset, version)
+    if path is None or not os.path.isfile(path) or not _inside(path, report_dir()):
+        return PlainTextResponse(f"No report found for '{dataset}' on '{version}'.", status_code=404)
+
+    stat = os.stat(path)
+    # Weak, since the bytes differ per content coding
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": cache_control(),
+        "Vary": "Accept-Encoding",
+    }
+    if _not_modified(request.headers, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    encoding = _accepted_encoding(request.headers.get("accept-encoding", ""))
+    body = await run_async(_encoded_body, path, stat, encoding)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="text/html", headers=headers)
+
+
+# Mounted next to the Shiny app in app.py
+report_routes = [Route("/reports/{dataset}/{version}", report_endpoint, methods=["GET", "HEAD"])]
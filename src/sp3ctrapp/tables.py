@@ -2,72 +2,197 @@ import os
 import pandas as pd
 import emoji
 from great_tables import GT, md, pct, google_font, style, loc
-from sp3ctrapp.getduck import duckdb_table
+from sp3ctrapp.cache import LRUCache
+from sp3ctrapp.getduck import duckdb_query, duckdb_sql, get_pool, has_table, on_database_swap
+from sp3ctrapp.versions import LATEST_RUNS_SQL, VERSION_TIMESTAMP, latest_runs_sql
 
 
-def table_overview(df: pd.DataFrame) -> GT:
+# Sort keys of the overview, mapped to columns of `_OVERVIEW_SQL`
+OVERVIEW_SORT = {
+    "table": '"table"',
+    "version": "validated",
+    "status": "status",
+    "validated_by": "validated_by",
+}
+
+_OVERVIEW_SQL = """
+    SELECT
+        "table",
+        coalesce(strftime(validated, '%Y-%m-%d %H:%M:%S'), version) AS version,
+        status,
+        report_path,
+        validated_by
+    FROM (SELECT *, {timestamp} AS validated FROM {source})
+    ORDER BY {order} {direction} NULLS LAST, "table"
+    LIMIT ? OFFSET ?
+"""
+
+
+# Materialized latest runs, plus live ones of datasets published since
+_MIXED_LATEST_RUNS_SQL = f"""
+    SELECT * FROM mv_latest_runs
+    UNION ALL BY NAME
+    {latest_runs_sql(' WHERE "table" NOT IN (SELECT "table" FROM mv_latest_runs)')}
+"""
+
+
+def overview_page_size():
+    """Number of tables per page of the overview, `SPECTRE_OVERVIEW_PAGE_SIZE` (default: 25)."""
+    return int(os.getenv("SPECTRE_OVERVIEW_PAGE_SIZE", "25"))
+
+
+def _latest_runs_source():
+    # Query log name and relation of the latest run per table
+    if has_table("mv_latest_runs"):
+        return "mv_latest_runs", f"({_MIXED_LATEST_RUNS_SQL})"
+    return "pointers", f"({LATEST_RUNS_SQL})"
+
+
+def overview_page_count(page_size=None):
     """
-    Generate a styled table overview of the latest runs per table.
+    Return the number of pages of the overview.
 
     Args:
-        df (pd.DataFrame): Input dataframe containing columns
-            - 'table': table name
-            - 'version': datetime string (possibly malformed)
-            - 'status': status string
-            - 'report_path': path strings used to extract basename for link text
-            - 'validated_by': agent or validator name
+        page_size (int, optional): Tables per page. Defaults to
+            `overview_page_size()`.
 
     Returns:
-        GT: great_tables GT object representing the styled summary table
+        tuple[int, int]: The number of pages, at least 1, and the total
+        number of tables.
     """
-    # Extract basename from 'report_path' to use as link text
-    df["report_path"] = df["report_path"].apply(os.path.basename)
+    page_size = page_size or overview_page_size()
+    name, source = _latest_runs_source()
+    total = duckdb_sql(f"SELECT count(*) AS n FROM {source}", name=name)
+    total = int(total["n"].iloc[0]) if not total.empty else 0
+    return max(1, -(-total // page_size)), total
 
-    # Fix datetime string format if needed (convert Txx-xx-xx to Txx:xx:xx)
-    df["version"] = df["version"].str.replace(
-        r"T(\d+)-(\d+)-(\d+)", r"T\1:\2:\3", regex=True
-    )
 
-    # Convert 'version' to datetime
-    df["version"] = pd.to_datetime(df["version"])
+def latest_runs(sort="table", descending=False, page=1, page_size=None):
+    """
+    Query one page of the latest validation run per table.
+
+    The latest run is selected in DuckDB, from `mv_latest_runs` for the
+    datasets `spectre-materialize` wrote it for and from `pointers` for all
+    others. Sorting, paging and the count run on the same rows, so only the
+    rows shown are loaded.
+
+    Args:
+        sort (str): Sort key, one of `OVERVIEW_SORT`. Defaults to "table".
+        descending (bool): Sort in descending order.
+        page (int): Page number, starting at 1. Clamped to the last page.
+        page_size (int, optional): Tables per page. Defaults to
+            `overview_page_size()`.
+
+    Returns:
+        tuple[pd.DataFrame, int, int]: The rows of the page with columns
+        `table`, `version`, `status`, `report_path` and `validated_by`, the
+        page number and the total number of tables.
+    """
+    if sort not in OVERVIEW_SORT:
+        raise ValueError(f"Unknown sort key '{sort}', expected one of {list(OVERVIEW_SORT)}")
+    page_size = page_size or overview_page_size()
 
-    # Filter to keep only the latest version per 'table'
-    df_latest = df.loc[df.groupby("table")["version"].idxmax()].copy()
+    name, source = _latest_runs_source()
+    pages, total = overview_page_count(page_size)
+    page = max(1, min(int(page), pages))
 
-    # Create markdown links using 'report_path' as link text
-    df_latest["html_link"] = df_latest["report_path"].apply(
-        lambda t: f"[{t}](https://gitlab.lrz.de/edgar-treischl/OddJob/-/tree/main/{t}/pointers?ref_type=heads)"
+    sql = _OVERVIEW_SQL.format(
+        timestamp=VERSION_TIMESTAMP,
+        source=source,
+        order=OVERVIEW_SORT[sort],
+        direction="DESC" if descending else "ASC",
     )
+    rows = duckdb_sql(sql, [page_size, (page - 1) * page_size], name=name)
+    return rows, page, total
 
-    # Select and rename columns for display with emojis
-    df_display = df_latest[
-        ["table", "version", "status", "html_link", "validated_by"]
-    ].copy()
 
-    # deleted {emoji.emojize(':compass:')}
-    df_display.columns = [
-        "Table",
-        "Version",
-        "Status",
-        f"{emoji.emojize(':link:')} Link",
-        f"{emoji.emojize(':detective:')} Agent",
-    ]
+def table_overview(sort="table", descending=False, page=1, page_size=None) -> GT:
+    """
+    Generate a styled table overview of the latest runs per table.
+
+    Args:
+        sort (str): Sort key, one of `OVERVIEW_SORT`. Defaults to "table".
+        descending (bool): Sort in descending order.
+        page (int): Page number, starting at 1.
+        page_size (int, optional): Tables per page. Defaults to
+            `overview_page_size()`.
+
+    Returns:
+        GT: great_tables GT object representing the styled summary table
+    """
+    page_size = page_size or overview_page_size()
+    df_latest, page, total = latest_runs(sort, descending, page, page_size)
+
+    # Create markdown links using the basename of 'report_path' as link text
+    links = df_latest["report_path"].map(os.path.basename)
+    df_display = pd.DataFrame(
+        {
+            "Table": df_latest["table"],
+            "Version": df_latest["version"],
+            "Status": df_latest["status"],
+            f"{emoji.emojize(':link:')} Link": links.map(
+                lambda t: f"[{t}](https://gitlab.lrz.de/edgar-treischl/OddJob/-/tree/main/{t}/pointers?ref_type=heads)"
+            ),
+            f"{emoji.emojize(':detective:')} Agent": df_latest["validated_by"],
+        }
+    )
 
     # Build and style the great_tables GT table
     gt_table = (
         GT(df_display)
         .tab_header(title=md(f"{emoji.emojize(':man_running:')} Summary Last Run"))
-        .fmt_datetime(
-            columns=[f"{emoji.emojize(':compass:')} Version"], date_style="iso"
-        )
         .cols_align("left", columns=df_display.columns.tolist())
         .opt_table_font(font=google_font("IBM Plex Sans"))
         .fmt_markdown(columns=[f"{emoji.emojize(':link:')} Link"])
     )
+    if total > page_size:
+        first = (page - 1) * page_size + 1
+        gt_table = gt_table.tab_source_note(
+            source_note=f"Tables {first}-{first + len(df_display) - 1} of {total}, "
+            f"page {page} of {-(-total // page_size)}"
+        )
 
     return gt_table
 
 
+# Rendered HTML of the overview pages and the pointer tables
+_html = LRUCache(max_bytes=32 * 1024**2)
+
+
+@on_database_swap
+def _drop_html():
+    _html.clear()
+
+
+def overview_html(sort="table", descending=False, page=1, page_size=None):
+    """
+    Return the overview table as HTML, rendering it on first use.
+
+    Memoized per database fingerprint and page and shared by all sessions.
+    The page is clamped to the existing pages first, so pages past the end
+    share the entry of the last page.
+
+    Args:
+        sort (str): Sort key, one of `OVERVIEW_SORT`. Defaults to "table".
+        descending (bool): Sort in descending order.
+        page (int): Page number, starting at 1.
+        page_size (int, optional): Tables per page. Defaults to
+            `overview_page_size()`.
+
+    Returns:
+        str: The rendered table.
+    """
+    page_size = page_size or overview_page_size()
+    pages, _ = overview_page_count(page_size)
+    page = max(1, min(int(page), pages))
+    key = ("overview", get_pool().fingerprint, sort, bool(descending), page, page_size)
+    html = _html.get(key)
+    if html is None:
+        html = table_overview(sort, descending, page, page_size).as_raw_html()
+        _html.put(key, html)
+    return html
+
+
 def table_pointer(pointer_name="penguins", date="2025-08-20T13-52-15"):
     """
     Generate a formatted summary table of metadata for a specific dataset version.
@@ -93,26 +218,23 @@ def table_pointer(pointer_name="penguins", date="2025-08-20T13-52-15"):
         >>> table.show()  # In Jupyter or render in Shiny via .as_raw_html()
     """
 
-    # Load data from DuckDB
-    pointers_df = duckdb_table(table="pointers")
-    meta_df = duckdb_table(table="columns")
-
-    # Filter pointer info
-    pointer_row = pointers_df[
-        (pointers_df["table"] == pointer_name) & (pointers_df["version"] == date)
-    ].copy()
+    # Load only the requested dataset version from DuckDB
+    pointer_row = duckdb_query(
+        "pointers",
+        columns=["version", "status", "validated_by"],
+        where={"table": pointer_name, "version": date},
+        limit=1,
+    )
 
     if pointer_row.empty:
         raise ValueError(f"No pointer found for '{pointer_name}' on '{date}'")
 
     # Prepare metadata table
-    meta_filtered = (
-        meta_df[(meta_df["table"] == pointer_name) & (meta_df["version"] == date)][
-            ["column_name", "label", "type", "levels", "description"]
-        ]
-        .rename(columns={"column_name": "column"})
-        .copy()
-    )
+    meta_filtered = duckdb_query(
+        "columns",
+        columns=["column_name", "label", "type", "levels", "description"],
+        where={"table": pointer_name, "version": date},
+    ).rename(columns={"column_name": "column"})
 
     # Titles and notes
     table_title = f"**Data:** {pointer_name}"
@@ -134,6 +256,7 @@ def table_pointer(pointer_name="penguins", date="2025-08-20T13-52-15"):
             description=md("**Description**"),
         )
         .fmt_markdown(columns=meta_filtered.columns.tolist())
+        .cols_align("left", columns=meta_filtered.columns.tolist())
         .tab_style(
             style=style.text(size="22px", weight="500", align="left", color="#444444"),
             locations=loc.title(),
@@ -147,3 +270,88 @@ def table_pointer(pointer_name="penguins", date="2025-08-20T13-52-15"):
     )
 
     return gt_table
+
+
+def pointer_html(pointer_name, date):
+    """
+    Return the metadata table of a dataset version as HTML, rendering it on first use.
+
+    A written version never changes, so the HTML is memoized per database
+    fingerprint, dataset and version and shared by all sessions.
+
+    Args:
+        pointer_name (str): The name of the dataset/pointer.
+        date (str): The version timestamp, e.g. "2025-08-20T13-52-15".
+
+    Returns:
+        str: The rendered table.
+
+    Raises:
+        ValueError: If the version does not exist, see `table_pointer`.
+    """
+    key = ("pointer", get_pool().fingerprint, pointer_name, date)
+    html = _html.get(key)
+    if html is None:
+        html = table_pointer(pointer_name, date).as_raw_html()
+        _html.put(key, html)
+    return html
+
+
+# Sort keys of the metadata grid, mapped to columns of `columns`
+GRID_SORT = {"column": "column_name", "label": "label", "type": "type"}
+
+_GRID_WHERE = """
+    WHERE "table" = ? AND version = ?
+      AND contains(lower(concat_ws(' ', column_name, label, type, description)), lower(?))
+"""
+
+_GRID_SQL = """
+    SELECT column_name AS "column", label, type, levels, description
+    FROM columns
+    {where}
+    ORDER BY {order} {direction} NULLS LAST, column_name
+    LIMIT ? OFFSET ?
+"""
+
+
+def grid_page_size():
+    """Number of rows per page of the metadata grid, `SPECTRE_GRID_PAGE_SIZE` (default: 100)."""
+    return int(os.getenv("SPECTRE_GRID_PAGE_SIZE", "100"))
+
+
+def pointer_columns(pointer_name, date, search="", sort="column", descending=False, page=1, page_size=None):
+    """
+    Query one page of the column metadata of a dataset version.
+
+    Filtering, sorting and paging run in DuckDB, so for very wide datasets
+    only the rows shown are loaded and sent to the browser.
+
+    Args:
+        pointer_name (str): The name of the dataset/pointer.
+        date (str): The version timestamp, e.g. "2025-08-20T13-52-15".
+        search (str): Only keep columns whose name, label, type or
+            description contains this text, ignoring case.
+        sort (str): Sort key, one of `GRID_SORT`. Defaults to "column".
+        descending (bool): Sort in descending order.
+        page (int): Page number, starting at 1. Clamped to the last page.
+        page_size (int, optional): Rows per page. Defaults to `grid_page_size()`.
+
+    Returns:
+        tuple[pd.DataFrame, int, int]: The rows of the page with columns
+        `column`, `label`, `type`, `levels` and `description`, the page
+        number and the number of matching columns.
+    """
+    if sort not in GRID_SORT:
+        raise ValueError(f"Unknown sort key '{sort}', expected one of {list(GRID_SORT)}")
+    page_size = page_size or grid_page_size()
+    params = [pointer_name, date, search or ""]
+
+    total = duckdb_sql(f"SELECT count(*) AS n FROM columns {_GRID_WHERE}", params, name="columns")
+    total = int(total["n"].iloc[0]) if not total.empty else 0
+    page = max(1, min(int(page), -(-total // page_size) or 1))
+
+    sql = _GRID_SQL.format(
+        where=_GRID_WHERE, order=GRID_SORT[sort], direction="DESC" if descending else "ASC"
+    )
+    rows = duckdb_sql(sql, [*params, page_size, (page - 1) * page_size], name="columns")
+    return rows, page, total
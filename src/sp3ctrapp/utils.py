@@ -1,42 +1,48 @@
 # from shiny import App, Inputs, Outputs, Session, render, ui
 import pandas as pd
-from sp3ctrapp.getduck import duckdb_table
+from sp3ctrapp.getduck import duckdb_query, database_generation
+from sp3ctrapp.versions import version_index
 from shiny import reactive
 
-# Shared reactive values
-shared_first_choice = reactive.Value(None)
-shared_second_choice = reactive.Value(None)
-
-
-def filter_and_sort_versions(dataset_name: str) -> pd.DataFrame:
+class Selection:
     """
-    Fetches the 'pointers' table via duckdb_table(),
-    filters for rows where 'table' == dataset_name,
-    extracts and parses timestamps from the 'version' column,
-    sorts by timestamp descending, and returns the resulting DataFrame.
+    Dataset and version picked in one session.
+
+    Created once per session in `app_server` and passed to every module
+    server, so a pick only invalidates the outputs of the session it was
+    made in.
     """
-    df = duckdb_table(table="pointers")
-    filtered_df = df[df["table"] == dataset_name].copy()
 
-    pattern = r"(\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2})"
-    filtered_df["timestamp_str"] = filtered_df["version"].str.extract(pattern)
+    def __init__(self):
+        self.dataset = reactive.Value(None)
+        self.version = reactive.Value(None)
+
+
+# Invalidates every session's outputs when a new meta.duckdb is swapped in
+@reactive.poll(database_generation, 2)
+def database_snapshot():
+    return database_generation()
 
-    filtered_df["timestamp_iso"] = filtered_df["timestamp_str"].str.replace(
-        r"(\d{4}-\d{2}-\d{2}T)(\d{2})-(\d{2})-(\d{2})",
-        lambda m: f"{m.group(1)}{m.group(2)}:{m.group(3)}:{m.group(4)}",
-        regex=True,
-    )
 
-    filtered_df["timestamp"] = pd.to_datetime(
-        filtered_df["timestamp_iso"], utc=True, errors="coerce"
-    )
-    filtered_df = filtered_df.dropna(subset=["timestamp"])
-    filtered_df = filtered_df.sort_values("timestamp", ascending=False)
+def filter_and_sort_versions(dataset_name: str) -> pd.DataFrame:
+    """
+    Returns the rows of the 'pointers' table where 'table' == dataset_name,
+    with the timestamp parsed from the 'version' column, sorted by timestamp
+    descending. Rows without a parsable timestamp are dropped.
 
-    return filtered_df
+    The rows come from the memoized `version_index` of the dataset.
+    """
+    return version_index(dataset_name).frame(descending=True)
 
 
 def datasets():
-    df = duckdb_table(table="pointers")
-    tables = df["table"].unique().tolist()
-    return tables
+    """
+    Returns the names of all datasets in the 'pointers' table, sorted.
+
+    Runs a `SELECT DISTINCT` that is cached per database snapshot, so it is
+    cheap to call on every session start.
+    """
+    df = duckdb_query("pointers", columns=["table"], order_by="table", distinct=True)
+    if df.empty:
+        return []
+    return df["table"].tolist()
@@ -0,0 +1,204 @@
+# src/sp3ctrapp/versions.py
+import numpy as np
+import pandas as pd
+
+from sp3ctrapp.cache import LRUCache, sizeof
+from sp3ctrapp.getduck import duckdb_sql, get_pool, on_database_swap
+
+# Versions are named after the time of the validation run, e.g. 2025-08-20T13-44-51
+VERSION_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}"
+VERSION_FORMAT = "%Y-%m-%dT%H-%M-%S"
+# SQL expression parsing the `version` column, NULL for malformed names
+VERSION_TIMESTAMP = f"try_strptime(regexp_extract(version, '{VERSION_PATTERN}'), '{VERSION_FORMAT}')"
+
+def latest_runs_sql(where=""):
+    """
+    Return the query of the latest run per dataset, one pointers row each.
+
+    Versions are ordered by their timestamp, malformed names first, and by
+    name on ties.
+
+    Args:
+        where (str): Optional `WHERE` clause restricting the pointers rows.
+
+    Returns:
+        str: The query.
+    """
+    return f"""
+    SELECT
+        "table",
+        arg_max(version, run) AS version,
+        arg_max(status, run) AS status,
+        arg_max(report_path, run) AS report_path,
+        arg_max(validated_by, run) AS validated_by
+    FROM (
+        SELECT
+            *,
+            {{'timestamp': coalesce({VERSION_TIMESTAMP}, '-infinity'::TIMESTAMP), 'version': version}} AS run
+        FROM pointers{where}
+    )
+    GROUP BY "table"
+"""
+
+
+LATEST_RUNS_SQL = latest_runs_sql()
+
+_INDEX_SQL = f"""
+    SELECT *
+    FROM (
+        SELECT
+            *,
+            {VERSION_TIMESTAMP} AS timestamp
+        FROM pointers
+        WHERE "table" = ?
+    )
+    WHERE timestamp IS NOT NULL
+    ORDER BY timestamp, version
+"""
+
+
+class VersionIndex:
+    """
+    Sorted index of the validated versions of one dataset.
+
+    Versions are parsed into timestamps once, inside DuckDB, and kept as
+    arrays sorted from oldest to newest. Lookups by position, version name or
+    time range take at most O(log n).
+
+    Args:
+        dataset (str): Name of the dataset.
+        rows (pd.DataFrame): Its `pointers` rows with a parsed `timestamp`
+            column, sorted by timestamp.
+    """
+
+    def __init__(self, dataset, rows):
+        self.dataset = dataset
+        self.rows = rows.reset_index(drop=True)
+        timestamps = pd.to_datetime(self.rows["timestamp"])
+        self.rows["timestamp"] = timestamps.dt.tz_localize("UTC")
+        self.versions = self.rows["version"].astype(str).to_numpy()
+        self.timestamps = self.rows["timestamp"].to_numpy(dtype="datetime64[ns]")
+        # Position of the newest row of each version
+        self._positions = {version: i for i, version in enumerate(self.versions)}
+
+    def __len__(self):
+        return len(self.versions)
+
+    @property
+    def nbytes(self):
+        """Approximate memory footprint of the index in bytes."""
+        return sizeof(self.rows) + self.versions.nbytes + self.timestamps.nbytes
+
+    def latest(self):
+        """Return the newest version, or None if the dataset has none."""
+        return self.versions[-1] if len(self) else None
+
+    def list(self, descending=True):
+        """
+        Return all versions in chronological order.
+
+        Args:
+            descending (bool): Newest first if True.
+
+        Returns:
+            list[str]: Version names.
+        """
+        versions = self.versions[::-1] if descending else self.versions
+        return versions.tolist()
+
+    def frame(self, descending=True):
+        """
+        Return the `pointers` rows of the dataset, sorted by version timestamp.
+
+        Args:
+            descending (bool): Newest first if True.
+
+        Returns:
+            pd.DataFrame: A copy of the rows, including the parsed `timestamp`.
+        """
+        rows = self.rows.iloc[::-1] if descending else self.rows
+        return rows.copy()
+
+    def range(self, start=None, end=None):
+        """
+        Return the versions whose timestamp lies within `[start, end]`.
+
+        Args:
+            start (str | datetime, optional): Lower bound, open if None.
+            end (str | datetime, optional): Upper bound, open if None.
+
+        Returns:
+            list[str]: Version names, oldest first.
+        """
+        lo, hi = 0, len(self)
+        if start is not None:
+            lo = np.searchsorted(self.timestamps, self._as_datetime64(start), side="left")
+        if end is not None:
+            hi = np.searchsorted(self.timestamps, self._as_datetime64(end), side="right")
+        return self.versions[lo:hi].tolist()
+
+    def previous(self, version):
+        """Return the version before `version`, or None if it is the first or unknown."""
+        i = self._positions.get(version)
+        return self.versions[i - 1] if i else None
+
+    def next(self, version):
+        """Return the version after `version`, or None if it is the latest or unknown."""
+        i = self._positions.get(version)
+        if i is None or i + 1 >= len(self):
+            return None
+        return self.versions[i + 1]
+
+    def at(self, when):
+        """
+        Return the version that was current at a point in time.
+
+        Args:
+            when (str | datetime): The point in time.
+
+        Returns:
+            str | None: The newest version not later than `when`.
+        """
+        i = np.searchsorted(self.timestamps, self._as_datetime64(when), side="right")
+        return self.versions[i - 1] if i else None
+
+    @staticmethod
+    def _as_datetime64(value):
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return np.datetime64(ts.to_datetime64(), "ns")
+
+
+_indexes = LRUCache(max_bytes=64 * 1024**2, sizer=lambda index: index.nbytes)
+
+
+@on_database_swap
+def _drop_indexes():
+    _indexes.clear()
+
+
+def version_index(dataset):
+    """
+    Return the version index of a dataset, building it on first use.
+
+    Indexes are memoized per database fingerprint, so they are rebuilt only
+    after a new database snapshot has been swapped in.
+
+    Args:
+        dataset (str): Name of the dataset.
+
+    Returns:
+        VersionIndex: The index, empty if the dataset has no parsable versions.
+    """
+    key = (get_pool().fingerprint, dataset)
+    index = _indexes.get(key)
+    if index is None:
+        rows = duckdb_sql(
+            _INDEX_SQL, [dataset], cache=False, name="pointers", raise_errors=True
+        )
+        if rows.empty:
+            rows = pd.DataFrame(columns=["version", "timestamp"])
+        index = VersionIndex(dataset, rows)
+        _indexes.put(key, index)
+    return index
@@ -0,0 +1,340 @@
+# src/sp3ctrapp/warmup.py
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sp3ctrapp.getduck import (
+    database_fingerprint,
+    duckdb_sql,
+    get_pool,
+    on_database_swap,
+    swap_database,
+)
+from sp3ctrapp.versions import VERSION_TIMESTAMP
+
+logger = logging.getLogger(__name__)
+
+# Plot views as the modules serve them: default options and the output
+# height declared in their UI
+VIEWS = {
+    "presence": ({"compact": False}, 500),
+    "class": ({"compact": False}, 600),
+    "labels": ({"compact": False}, 600),
+    "pipe": ({}, 600),
+}
+
+_DATASETS_SQL = f"""
+    SELECT
+        "table",
+        max(version) AS version,
+        max({VERSION_TIMESTAMP}) AS validated
+    FROM pointers
+    GROUP BY "table"
+    ORDER BY validated DESC NULLS LAST, "table"
+"""
+
+
+def _figure(kind, dataset, options):
+    from sp3ctrapp import plots
+
+    if kind == "presence":
+        return plots.plot_PresenceMatrixWeb(dataset, **options)
+    if kind == "class":
+        return plots.plot_TypeMatrixWeb(dataset, **options)
+    if kind == "labels":
+        return plots.plot_LabelMatrix(dataset, **options)
+    return plots.plot_pipe(dataset)
+
+
+def warm_dataset(dataset, jobs):
+    """
+    Render the plots of one dataset into the render cache.
+
+    Runs in a warmup worker process. The worker follows database swaps by
+    itself, since it has no watcher of its own. Plots already in the cache
+    are not rendered again.
+
+    Args:
+        dataset (str): Name of the dataset.
+        jobs (list[tuple]): `(kind, width, height, dpi)` per image.
+
+    Returns:
+        dict: `dataset`, number of `rendered` images, `failed` jobs and `seconds`.
+    """
+    from sp3ctrapp.rendercache import cached_plot, get_render_cache
+
+    if get_pool().fingerprint != database_fingerprint():
+        swap_database()
+
+    cache = get_render_cache()
+    start = time.perf_counter()
+    misses = cache.stats()["misses"]
+    failed = 0
+    for kind, width, height, dpi in jobs:
+        options = VIEWS[kind][0]
+        try:
+            cached_plot(
+                kind, dataset, options, lambda: _figure(kind, dataset, options), width, height, dpi
+            )
+        except Exception:
+            logger.exception("Warmup of %s for '%s' failed", kind, dataset)
+            failed += 1
+    return {
+        "dataset": dataset,
+        "rendered": cache.stats()["misses"] - misses - failed,
+        "failed": failed,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def warm_data(dataset):
+    """
+    Fill the data and table caches of this process for one dataset.
+
+    The worker processes only fill the render cache, so the app process
+    loads the data of the views itself, with their default options, and
+    renders the metadata table of the latest version the About tab opens
+    with.
+
+    Args:
+        dataset (str): Name of the dataset.
+    """
+    from sp3ctrapp import plots
+    from sp3ctrapp.tables import pointer_html
+    from sp3ctrapp.versions import version_index
+
+    for load in (
+        plots.presence_matrix_data,
+        plots.type_matrix_data,
+        plots.label_matrix_data,
+        plots.pipe_coverage_data,
+    ):
+        try:
+            load(dataset)
+        except Exception:
+            logger.exception("Loading %s for '%s' failed", load.__name__, dataset)
+    try:
+        latest = version_index(dataset).latest()
+        if latest is not None:
+            pointer_html(dataset, latest)
+    except Exception:
+        logger.exception("Rendering the metadata table of '%s' failed", dataset)
+
+
+def warm_overview():
+    """Render the first page of the overview table, as the About tab opens it."""
+    from sp3ctrapp.tables import overview_html
+
+    try:
+        overview_html()
+    except Exception:
+        logger.exception("Rendering the overview table failed")
+
+
+def warmup_jobs():
+    """
+    Return the images to pre-render for each dataset.
+
+    Uses the size buckets browsers requested most often in this process, the
+    same ones `plot_image` renders at. Before the first request, plots are
+    rendered in the bucket of an output `SPECTRE_WARMUP_WIDTH` pixels wide
+    (default: 1000) at the height declared in the UI.
+
+    Returns:
+        list[tuple]: `(kind, width, height, dpi)` per image.
+    """
+    from sp3ctrapp.rendercache import requested_sizes, size_bucket
+
+    width = int(os.getenv("SPECTRE_WARMUP_WIDTH", "1000"))
+    jobs = []
+    for kind, (_, height) in VIEWS.items():
+        sizes = requested_sizes(kind) or [size_bucket(width, height)]
+        jobs.extend((kind, *size) for size in sizes)
+    return jobs
+
+
+class WarmupScheduler:
+    """
+    Pre-renders the plots of all datasets in a pool of worker processes.
+
+    Every round lists the datasets, newest validation first, and queues one
+    task per dataset. Datasets whose latest version changed since the
+    previous round go first. A new round cancels the tasks of the previous
+    one that have not started yet. Workers write into the shared on-disk
+    render cache, so every app process serves the result. A thread of the
+    app process meanwhile renders the overview table and loads the same
+    datasets into its data and table caches, which the workers cannot fill.
+
+    Args:
+        workers (int): Number of worker processes.
+        limit (int | None): Only warm the `limit` most recently validated datasets.
+    """
+
+    def __init__(self, workers, limit=None):
+        self.workers = workers
+        self.limit = limit
+        self._executor = None
+        self._futures = []
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "rounds": 0,
+            "datasets": 0,
+            "loaded": 0,
+            "rendered": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Spawned workers do not inherit the app's threads, pools or event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def datasets(self):
+        """
+        Return the datasets of the next round in priority order.
+
+        Returns:
+            list[str]: Changed datasets first, then by latest validation.
+        """
+        rows = duckdb_sql(_DATASETS_SQL, name="pointers", cache=False)
+        if rows.empty:
+            return []
+        latest = dict(zip(rows["table"].astype(str), rows["version"].astype(str)))
+        order = list(latest)
+        with self._lock:
+            changed = [name for name in order if self._latest.get(name) != latest[name]]
+            self._latest = latest
+        order = changed + [name for name in order if name not in changed]
+        return order[: self.limit] if self.limit else order
+
+    def _done(self, future):
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception:
+            logger.exception("Warmup worker failed")
+            with self._lock:
+                self._stats["failed"] += 1
+            return
+        with self._lock:
+            self._stats["datasets"] += 1
+            self._stats["rendered"] += result["rendered"]
+            self._stats["failed"] += result["failed"]
+        logger.info(
+            "Warmed '%s': %d images in %.1fs", result["dataset"], result["rendered"], result["seconds"]
+        )
+
+    def schedule(self):
+        """
+        Start a warmup round, replacing the queued part of the previous one.
+
+        Returns:
+            int: Number of datasets queued.
+        """
+        datasets = self.datasets()
+        jobs = warmup_jobs()
+        with self._lock:
+            for future in self._futures:
+                if future.cancel():
+                    self._stats["cancelled"] += 1
+            executor = self._get_executor()
+            self._futures = [executor.submit(warm_dataset, name, jobs) for name in datasets]
+            self._stats["rounds"] += 1
+            current = self._stats["rounds"]
+        for future in self._futures:
+            future.add_done_callback(self._done)
+        threading.Thread(
+            target=self._warm_data, args=(current, datasets), name="spectre-warmup-data", daemon=True
+        ).start()
+        return len(datasets)
+
+    def _warm_data(self, current, datasets):
+        # Same priority order as the workers; stops when a new round starts
+        warm_overview()
+        for dataset in datasets:
+            with self._lock:
+                if self._stats["rounds"] != current:
+                    return
+            warm_data(dataset)
+            with self._lock:
+                self._stats["loaded"] += 1
+
+    def schedule_in_background(self):
+        """Start a round from a background thread, so callers never wait for the query."""
+        threading.Thread(target=self._schedule_logged, name="spectre-warmup", daemon=True).start()
+
+    def _schedule_logged(self):
+        try:
+            self.schedule()
+        except Exception:
+            logger.exception("Scheduling warmup failed")
+
+    def stats(self):
+        """
+        Return counters of all rounds so far.
+
+        Returns:
+            dict: `rounds`, `datasets` rendered by the workers, datasets
+            `loaded` into this process's data caches, `rendered` images,
+            `failed` jobs, `cancelled` tasks and `pending` tasks.
+        """
+        with self._lock:
+            pending = sum(not future.done() for future in self._futures)
+            return {**self._stats, "pending": pending}
+
+    def shutdown(self):
+        """Cancel queued tasks and stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def start_warmup():
+    """
+    Pre-render all datasets now and after every database swap.
+
+    Enabled by setting `SPECTRE_WARMUP_WORKERS` to the number of worker
+    processes (default: 0, off). `SPECTRE_WARMUP_DATASETS` limits each round
+    to the most recently validated datasets. Does nothing with the client
+    plot backend, where the server renders no images.
+
+    Returns:
+        WarmupScheduler | None: The running scheduler, or None if disabled.
+    """
+    from sp3ctrapp.clientplots import plot_backend
+
+    global _scheduler
+    workers = int(os.getenv("SPECTRE_WARMUP_WORKERS", "0"))
+    if workers <= 0 or plot_backend() == "client":
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            limit = int(os.getenv("SPECTRE_WARMUP_DATASETS", "0")) or None
+            _scheduler = WarmupScheduler(workers, limit)
+            on_database_swap(_scheduler.schedule_in_background)
+            _scheduler.schedule_in_background()
+        return _scheduler
+
+
+def warmup_stats():
+    """
+    Report progress of the background warmup.
+
+    Returns:
+        dict: Counters of `WarmupScheduler.stats`, empty if warmup is off.
+    """
+    return _scheduler.stats() if _scheduler is not None else {}
@@ -0,0 +1,2 @@
+!function(e,t){"object"==typeof exports&&"undefined"!=typeof module?t(exports,require("vega")):"function"==typeof define&&define.amd?define(["exports","vega"],t):t((e="undefined"!=typeof globalThis?globalThis:e||self).vegaLite={},e.vega)}(this,(function(e,t){"use strict";var n="5.21.0";function i(e){return Q(e,"or")}function r(e){return Q(e,"and")}function o(e){return Q(e,"not")}function a(e,t){if(o(e))a(e.not,t);else if(r(e))for(const n of e.and)a(n,t);else if(i(e))for(const n of e.or)a(n,t);else t(e)}function s(e,t){return o(e)?{not:s(e.not,t)}:r(e)?{and:e.and.map((e=>s(e,t)))}:i(e)?{or:e.or.map((e=>s(e,t)))}:t(e)}const l=structuredClone;function c(e){throw new Error(e)}function u(e,n){const i={};for(const r of n)t.hasOwnProperty(e,r)&&(i[r]=e[r]);return i}function f(e,t){const n={...e};for(const e of t)delete n[e];return n}function d(e){if(t.isNumber(e))return e;const n=t.isString(e)?e:X(e);if(n.length<250)return n;let i=0;for(let e=0;e<n.length;e++){i=(i<<5)-i+n.charCodeAt(e),i|=0}return i}function m(e){return!1===e||null===e}function p(e,t){return e.includes(t)}function g(e,t){let n=0;for(const[i,r]of e.entries())if(t(r,i,n++))return!0;return!1}function h(e,t){let n=0;for(const[i,r]of e.entries())if(!t(r,i,n++))return!1;return!0}function y(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),i=1;i<t;i++)n[i-1]=arguments[i];for(const t of n)v(e,t??{});return e}function v(e,n){for(const i of D(n))t.writeConfig(e,i,n[i],!0)}function b(e,t){const n=[],i={};let r;for(const o of e)r=t(o),r in i||(i[r]=1,n.push(o));return n}function x(e,t){if(e.size!==t.size)return!1;for(const n of e)if(!t.has(n))return!1;return!0}function $(e,t){for(const n of e)if(t.has(n))return!0;return!1}function w(e){const n=new Set;for(const i of e){const e=t.splitAccessPath(i).map(((e,t)=>0===t?e:`[${e}]`)),r=e.map(((t,n)=>e.slice(0,n+1).join("")));for(const e of r)n.add(e)}return n}function k(e,t){return void 0===e||void 0===t||$(w(e),w(t))}function S(e){return 0===D(e).length}Set.prototype.toJSON=function(){return`Set(${[...this].map((e=>X(e))).join(",")})`};const D=Object.keys,F=Object.values,O=Object.entries;function z(e){return!0===e||!1===e}function C(e){const t=e.replace(/\W/g,"_");return(e.match(/^\d+/)?"_":"")+t}function N(e,t){return o(e)?`!(${N(e.not,t)})`:r(e)?`(${e.and.map((e=>N(e,t))).join(") && (")})`:i(e)?`(${e.or.map((e=>N(e,t))).join(") || (")})`:t(e)}function P(e,t){if(0===t.length)return!0;const n=t.shift();return n in e&&P(e[n],t)&&delete e[n],S(e)}function _(e){return e.charAt(0).toUpperCase()+e.substr(1)}function A(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"datum";const i=t.splitAccessPath(e),r=[];for(let e=1;e<=i.length;e++){const o=`[${i.slice(0,e).map(t.stringValue).join("][")}]`;r.push(`${n}${o}`)}return r.join(" && ")}function T(e){return`${arguments.length>1&&void 0!==arguments[1]?arguments[1]:"datum"}[${t.stringValue(t.splitAccessPath(e).join("."))}]`}function j(e){return e.replace(/(\[|\]|\.|'|")/g,"\\$1")}function E(e){return`${t.splitAccessPath(e).map(j).join("\\.")}`}function M(e,t,n){return e.replace(new RegExp(t.replace(/[-/\\^$*+?.()|[\]{}]/g,"\\$&"),"g"),n)}function R(e){return`${t.splitAccessPath(e).join(".")}`}function L(e){return e?t.splitAccessPath(e).length:0}function q(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.find((e=>void 0!==e))}let U=42;function W(e){const t=++U;return e?String(e)+t:t}function I(e){return B(e)?e:`__${e}`}function B(e){return e.startsWith("__")}function V(e){if(void 0!==e)return(e%360+360)%360}function H(e){return!!t.isNumber(e)||!isNaN(e)&&!isNaN(parseFloat(e))}const G=Object.getPrototypeOf(structuredClone({}));function Y(e,t){if(e===t)return!0;if(e&&t&&"object"==typeof e&&"object"==typeof t){if(e.constructor.name!==t.constructor.name)return!1;let n,i;if(Array.isArray(e)){if(n=e.length,n!=t.length)return!1;for(i=n;0!=i--;)if(!Y(e[i],t[i]))return!1;return!0}if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;for(const n of e.entries())if(!t.has(n[0]))return!1;for(const n of e.entries())if(!Y(n[1],t.get(n[0])))return!1;return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;for(const n of e.entries())if(!t.has(n[0]))return!1;return!0}if(ArrayBuffer.isView(e)&&ArrayBuffer.isView(t)){if(n=e.length,n!=t.length)return!1;for(i=n;0!=i--;)if(e[i]!==t[i])return!1;return!0}if(e.constructor===RegExp)return e.source===t.source&&e.flags===t.flags;if(e.valueOf!==Object.prototype.valueOf&&e.valueOf!==G.valueOf)return e.valueOf()===t.valueOf();if(e.toString!==Object.prototype.toString&&e.toString!==G.toString)return e.toString()===t.toString();const r=Object.keys(e);if(n=r.length,n!==Object.keys(t).length)return!1;for(i=n;0!=i--;)if(!Object.prototype.hasOwnProperty.call(t,r[i]))return!1;for(i=n;0!=i--;){const n=r[i];if(!Y(e[n],t[n]))return!1}return!0}return e!=e&&t!=t}function X(e){const t=[];return function e(n){if(n&&n.toJSON&&"function"==typeof n.toJSON&&(n=n.toJSON()),void 0===n)return;if("number"==typeof n)return isFinite(n)?""+n:"null";if("object"!=typeof n)return JSON.stringify(n);let i,r;if(Array.isArray(n)){for(r="[",i=0;i<n.length;i++)i&&(r+=","),r+=e(n[i])||"null";return r+"]"}if(null===n)return"null";if(t.includes(n))throw new TypeError("Converting circular structure to JSON");const o=t.push(n)-1,a=Object.keys(n).sort();for(r="",i=0;i<a.length;i++){const t=a[i],o=e(n[t]);o&&(r&&(r+=","),r+=JSON.stringify(t)+":"+o)}return t.splice(o,1),`{${r}}`}(e)}function Q(e,n){return t.isObject(e)&&t.hasOwnProperty(e,n)&&void 0!==e[n]}const J="row",K="column",Z="facet",ee="x",te="y",ne="x2",ie="y2",re="xOffset",oe="yOffset",ae="radius",se="radius2",le="theta",ce="theta2",ue="latitude",fe="longitude",de="latitude2",me="longitude2",pe="color",ge="fill",he="stroke",ye="shape",ve="size",be="angle",xe="opacity",$e="fillOpacity",we="strokeOpacity",ke="strokeWidth",Se="strokeDash",De="text",Fe="order",Oe="detail",ze="key",Ce="tooltip",Ne="href",Pe="url",_e="description",Ae={theta:1,theta2:1,radius:1,radius2:1};function Te(e){return t.hasOwnProperty(Ae,e)}const je={longitude:1,longitude2:1,latitude:1,latitude2:1};function Ee(e){switch(e){case ue:return"y";case de:return"y2";case fe:return"x";case me:return"x2"}}function Me(e){return t.hasOwnProperty(je,e)}const Re=D(je),Le={x:1,y:1,x2:1,y2:1,...Ae,...je,xOffset:1,yOffset:1,color:1,fill:1,stroke:1,opacity:1,fillOpacity:1,strokeOpacity:1,strokeWidth:1,strokeDash:1,size:1,angle:1,shape:1,order:1,text:1,detail:1,key:1,tooltip:1,href:1,url:1,description:1};function qe(e){return e===pe||e===ge||e===he}const Ue={row:1,column:1,facet:1},We=D(Ue),Ie={...Le,...Ue},Be=D(Ie),{order:Ve,detail:He,tooltip:Ge,...Ye}=Ie,{row:Xe,column:Qe,facet:Je,...Ke}=Ye;function Ze(e){return t.hasOwnProperty(Ie,e)}const et=[ne,ie,de,me,ce,se];function tt(e){return nt(e)!==e}function nt(e){switch(e){case ne:return ee;case ie:return te;case de:return ue;case me:return fe;case ce:return le;case se:return ae}return e}function it(e){if(Te(e))switch(e){case le:return"startAngle";case ce:return"endAngle";case ae:return"outerRadius";case se:return"innerRadius"}return e}function rt(e){switch(e){case ee:return ne;case te:return ie;case ue:return de;case fe:return me;case le:return ce;case ae:return se}}function ot(e){switch(e){case ee:case ne:return"width";case te:case ie:return"height"}}function at(e){switch(e){case ee:return"xOffset";case te:return"yOffset";case ne:return"x2Offset";case ie:return"y2Offset";case le:return"thetaOffset";case ae:return"radiusOffset";case ce:return"theta2Offset";case se:return"radius2Offset"}}function st(e){switch(e){case ee:return"xOffset";case te:return"yOffset"}}function lt(e){switch(e){case"xOffset":return"x";case"yOffset":return"y"}}const ct=D(Le),{x:ut,y:ft,x2:dt,y2:mt,xOffset:pt,yOffset:gt,latitude:ht,longitude:yt,latitude2:vt,longitude2:bt,theta:xt,theta2:$t,radius:wt,radius2:kt,...St}=Le,Dt=D(St),Ft={x:1,y:1},Ot=D(Ft);function zt(e){return t.hasOwnProperty(Ft,e)}const Ct={theta:1,radius:1},Nt=D(Ct);function Pt(e){return"width"===e?ee:te}const _t={xOffset:1,yOffset:1};function At(e){return t.hasOwnProperty(_t,e)}const{text:Tt,tooltip:jt,href:Et,url:Mt,description:Rt,detail:Lt,key:qt,order:Ut,...Wt}=St,It=D(Wt);const Bt={...Ft,...Ct,..._t,...Wt},Vt=D(Bt);function Ht(e){return t.hasOwnProperty(Bt,e)}function Gt(e,t){return function(e){switch(e){case pe:case ge:case he:case _e:case Oe:case ze:case Ce:case Ne:case Fe:case xe:case $e:case we:case ke:case Z:case J:case K:return Yt;case ee:case te:case re:case oe:case ue:case fe:return Qt;case ne:case ie:case de:case me:return{area:"always",bar:"always",image:"always",rect:"always",rule:"always",circle:"binned",point:"binned",square:"binned",tick:"binned",line:"binned",trail:"binned"};case ve:return{point:"always",tick:"always",rule:"always",circle:"always",square:"always",bar:"always",text:"always",line:"always",trail:"always"};case Se:return{line:"always",point:"always",tick:"always",rule:"always",circle:"always",square:"always",bar:"always",geoshape:"always"};case ye:return{point:"always",geoshape:"always"};case De:return{text:"always"};case be:return{point:"always",square:"always",text:"always"};case Pe:return{image:"always"};case le:case ae:return{text:"always",arc:"always"};case ce:case se:return{arc:"always"}}}(e)[t]}const Yt={arc:"always",area:"always",bar:"always",circle:"always",geoshape:"always",image:"always",line:"always",rule:"always",point:"always",rect:"always",square:"always",trail:"always",text:"always",tick:"always"},{geoshape:Xt,...Qt}=Yt;function Jt(e){switch(e){case ee:case te:case le:case ae:case re:case oe:case ve:case be:case ke:case xe:case $e:case we:case ne:case ie:case ce:case se:return;case Z:case J:case K:case ye:case Se:case De:case Ce:case Ne:case Pe:case _e:return"discrete";case pe:case ge:case he:return"flexible";case ue:case fe:case de:case me:case Oe:case ze:case Fe:return}}const Kt={argmax:1,argmin:1,average:1,count:1,distinct:1,exponential:1,exponentialb:1,product:1,max:1,mean:1,median:1,min:1,missing:1,q1:1,q3:1,ci0:1,ci1:1,stderr:1,stdev:1,stdevp:1,sum:1,valid:1,values:1,variance:1,variancep:1},Zt={count:1,min:1,max:1};function en(e){return Q(e,"argmin")}function tn(e){return Q(e,"argmax")}function nn(e){return t.isString(e)&&t.hasOwnProperty(Kt,e)}const rn=new Set(["count","valid","missing","distinct"]);function on(e){return t.isString(e)&&rn.has(e)}const an=new Set(["count","sum","distinct","valid","missing"]),sn=new Set(["mean","average","median","q1","q3","min","max"]);function ln(e){return t.isBoolean(e)&&(e=$a(e,void 0)),"bin"+D(e).map((t=>dn(e[t])?C(`_${t}_${O(e[t])}`):C(`_${t}_${e[t]}`))).join("")}function cn(e){return!0===e||fn(e)&&!e.binned}function un(e){return"binned"===e||fn(e)&&!0===e.binned}function fn(e){return t.isObject(e)}function dn(e){return Q(e,"param")}function mn(e){switch(e){case J:case K:case ve:case pe:case ge:case he:case ke:case xe:case $e:case we:case ye:return 6;case Se:return 4;default:return 10}}function pn(e){return Q(e,"expr")}function gn(e){let{level:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{level:0};const n=D(e||{}),i={};for(const r of n)i[r]=0===t?Dn(e[r]):gn(e[r],{level:t-1});return i}function hn(e){const{anchor:t,frame:n,offset:i,orient:r,angle:o,limit:a,color:s,subtitleColor:l,subtitleFont:c,subtitleFontSize:f,subtitleFontStyle:d,subtitleFontWeight:m,subtitleLineHeight:p,subtitlePadding:g,...h}=e,y={...t?{anchor:t}:{},...n?{frame:n}:{},...i?{offset:i}:{},...r?{orient:r}:{},...void 0!==o?{angle:o}:{},...void 0!==a?{limit:a}:{}},v={...l?{subtitleColor:l}:{},...c?{subtitleFont:c}:{},...f?{subtitleFontSize:f}:{},...d?{subtitleFontStyle:d}:{},...m?{subtitleFontWeight:m}:{},...p?{subtitleLineHeight:p}:{},...g?{subtitlePadding:g}:{}};return{titleMarkConfig:{...h,...s?{fill:s}:{}},subtitleMarkConfig:u(e,["align","baseline","dx","dy","limit"]),nonMarkTitleProperties:y,subtitle:v}}function yn(e){return t.isString(e)||t.isArray(e)&&t.isString(e[0])}function vn(e){return Q(e,"signal")}function bn(e){return Q(e,"step")}function xn(e){return!t.isArray(e)&&(Q(e,"field")&&Q(e,"data"))}const $n=D({aria:1,description:1,ariaRole:1,ariaRoleDescription:1,blend:1,opacity:1,fill:1,fillOpacity:1,stroke:1,strokeCap:1,strokeWidth:1,strokeOpacity:1,strokeDash:1,strokeDashOffset:1,strokeJoin:1,strokeOffset:1,strokeMiterLimit:1,startAngle:1,endAngle:1,padAngle:1,innerRadius:1,outerRadius:1,size:1,shape:1,interpolate:1,tension:1,orient:1,align:1,baseline:1,text:1,dir:1,dx:1,dy:1,ellipsis:1,limit:1,radius:1,theta:1,angle:1,font:1,fontSize:1,fontWeight:1,fontStyle:1,lineBreak:1,lineHeight:1,cursor:1,href:1,tooltip:1,cornerRadius:1,cornerRadiusTopLeft:1,cornerRadiusTopRight:1,cornerRadiusBottomLeft:1,cornerRadiusBottomRight:1,aspect:1,width:1,height:1,url:1,smooth:1}),wn={arc:1,area:1,group:1,image:1,line:1,path:1,rect:1,rule:1,shape:1,symbol:1,text:1,trail:1},kn=["cornerRadius","cornerRadiusTopLeft","cornerRadiusTopRight","cornerRadiusBottomLeft","cornerRadiusBottomRight"];function Sn(e){const n=t.isArray(e.condition)?e.condition.map(Fn):Fn(e.condition);return{...Dn(e),condition:n}}function Dn(e){if(pn(e)){const{expr:t,...n}=e;return{signal:t,...n}}return e}function Fn(e){if(pn(e)){const{expr:t,...n}=e;return{signal:t,...n}}return e}function On(e){if(pn(e)){const{expr:t,...n}=e;return{signal:t,...n}}return vn(e)?e:void 0!==e?{value:e}:void 0}function zn(e){return vn(e)?e.signal:t.stringValue(e.value)}function Cn(e){return vn(e)?e.signal:null==e?null:t.stringValue(e)}function Nn(e,t,n){for(const i of n){const n=An(i,t.markDef,t.config);void 0!==n&&(e[i]=On(n))}return e}function Pn(e){return[].concat(e.type,e.style??[])}function _n(e,t,n){let i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const{vgChannel:r,ignoreVgConfig:o}=i;return r&&Q(t,r)?t[r]:void 0!==t[e]?t[e]:!o||r&&r!==e?An(e,t,n,i):void 0}function An(e,t,n){let{vgChannel:i}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const r=Tn(e,t,n.style);return q(i?r:void 0,r,i?n[t.type][i]:void 0,n[t.type][e],i?n.mark[i]:n.mark[e])}function Tn(e,t,n){return jn(e,Pn(t),n)}function jn(e,n,i){let r;n=t.array(n);for(const t of n){const n=i[t];Q(n,e)&&(r=n[e])}return r}function En(e,n){return t.array(e).reduce(((e,t)=>(e.field.push(sa(t,n)),e.order.push(t.sort??"ascending"),e)),{field:[],order:[]})}function Mn(e,t){const n=[...e];return t.forEach((e=>{for(const t of n)if(Y(t,e))return;n.push(e)})),n}function Rn(e,n){return Y(e,n)||!n?e:e?[...t.array(e),...t.array(n)].join(", "):n}function Ln(e,t){const n=e.value,i=t.value;if(null==n||null===i)return{explicit:e.explicit,value:null};if((yn(n)||vn(n))&&(yn(i)||vn(i)))return{explicit:e.explicit,value:Rn(n,i)};if(yn(n)||vn(n))return{explicit:e.explicit,value:n};if(yn(i)||vn(i))return{explicit:e.explicit,value:i};if(!(yn(n)||vn(n)||yn(i)||vn(i)))return{explicit:e.explicit,value:Mn(n,i)};throw new Error("It should never reach here")}function qn(e){return`Invalid specification ${X(e)}. Make sure the specification includes at least one of the following properties: "mark", "layer", "facet", "hconcat", "vconcat", "concat", or "repeat".`}const Un='Autosize "fit" only works for single views and layered views.';function Wn(e){return`${"width"==e?"Width":"Height"} "container" only works for single views and layered views.`}function In(e){return`${"width"==e?"Width":"Height"} "container" only works well with autosize "fit" or "fit-${"width"==e?"x":"y"}".`}function Bn(e){return e?`Dropping "fit-${e}" because spec has discrete ${ot(e)}.`:'Dropping "fit" because spec has discrete size.'}function Vn(e){return`Unknown field for ${e}. Cannot calculate view size.`}function Hn(e){return`Cannot project a selection on encoding channel "${e}", which has no field.`}function Gn(e,t){return`Cannot project a selection on encoding channel "${e}" as it uses an aggregate function ("${t}").`}function Yn(e){return`Selection not supported for ${e} yet.`}const Xn="The same selection must be used to override scale domains in a layered view.";function Qn(e){return`The "columns" property cannot be used when "${e}" has nested row/column.`}function Jn(e,t,n){return`An ancestor parsed field "${e}" as ${n} but a child wants to parse the field as ${t}.`}function Kn(e){return`Config.customFormatTypes is not true, thus custom format type and format for channel ${e} are dropped.`}function Zn(e){return`${e}Offset dropped because ${e} is continuous`}function ei(e){return`Invalid field type "${e}".`}function ti(e,t){const{fill:n,stroke:i}=t;return`Dropping color ${e} as the plot also has ${n&&i?"fill and stroke":n?"fill":"stroke"}.`}function ni(e,t){return`Dropping ${X(e)} from channel "${t}" since it does not contain any data field, datum, value, or signal.`}function ii(e,t,n){return`${e} dropped as it is incompatible with "${t}".`}function ri(e){return`${e} encoding should be discrete (ordinal / nominal / binned).`}function oi(e){return`${e} encoding should be discrete (ordinal / nominal / binned) or use a discretizing scale (e.g. threshold).`}function ai(e,t){return`Using discrete channel "${e}" to encode "${t}" field can be misleading as it does not encode ${"ordinal"===t?"order":"magnitude"}.`}function si(e){return`Using unaggregated domain with raw field has no effect (${X(e)}).`}function li(e){return`Unaggregated domain not applicable for "${e}" since it produces values outside the origin domain of the source data.`}function ci(e){return`Unaggregated domain is currently unsupported for log scale (${X(e)}).`}function ui(e,t,n){return`${n}-scale's "${t}" is dropped as it does not work with ${e} scale.`}function fi(e){return`The step for "${e}" is dropped because the ${"width"===e?"x":"y"} is continuous.`}const di="Domains that should be unioned has conflicting sort properties. Sort will be set to true.";function mi(e,t){return`Invalid ${e}: ${X(t)}.`}function pi(e){return`1D error band does not support ${e}.`}function gi(e){return`Channel ${e} is required for "binned" bin.`}const hi=t.logger(t.Warn);let yi=hi;function vi(){yi.warn(...arguments)}function bi(e){if(e&&t.isObject(e))for(const t of Oi)if(Q(e,t))return!0;return!1}const xi=["january","february","march","april","may","june","july","august","september","october","november","december"],$i=xi.map((e=>e.substr(0,3))),wi=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],ki=wi.map((e=>e.substr(0,3)));function Si(e,n){const i=[];if(n&&void 0!==e.day&&D(e).length>1&&(vi(function(e){return`Dropping day from datetime ${X(e)} as day cannot be combined with other units.`}(e)),delete(e=l(e)).day),void 0!==e.year?i.push(e.year):i.push(2012),void 0!==e.month){const r=n?function(e){if(H(e)&&(e=+e),t.isNumber(e))return e-1;{const t=e.toLowerCase(),n=xi.indexOf(t);if(-1!==n)return n;const i=t.substr(0,3),r=$i.indexOf(i);if(-1!==r)return r;throw new Error(mi("month",e))}}(e.month):e.month;i.push(r)}else if(void 0!==e.quarter){const r=n?function(e){if(H(e)&&(e=+e),t.isNumber(e))return e>4&&vi(mi("quarter",e)),e-1;throw new Error(mi("quarter",e))}(e.quarter):e.quarter;i.push(t.isNumber(r)?3*r:`${r}*3`)}else i.push(0);if(void 0!==e.date)i.push(e.date);else if(void 0!==e.day){const r=n?function(e){if(H(e)&&(e=+e),t.isNumber(e))return e%7;{const t=e.toLowerCase(),n=wi.indexOf(t);if(-1!==n)return n;const i=t.substr(0,3),r=ki.indexOf(i);if(-1!==r)return r;throw new Error(mi("day",e))}}(e.day):e.day;i.push(t.isNumber(r)?r+1:`${r}+1`)}else i.push(1);for(const t of["hours","minutes","seconds","milliseconds"]){const n=e[t];i.push(void 0===n?0:n)}return i}function Di(e){const t=Si(e,!0).join(", ");return e.utc?`utc(${t})`:`datetime(${t})`}const Fi={year:1,quarter:1,month:1,week:1,day:1,dayofyear:1,date:1,hours:1,minutes:1,seconds:1,milliseconds:1},Oi=D(Fi);function zi(e){return t.isObject(e)?e.binned:Ci(e)}function Ci(e){return e&&e.startsWith("binned")}function Ni(e){return e.startsWith("utc")}const Pi={"year-month":"%b %Y ","year-month-date":"%b %d, %Y "};function _i(e){return Oi.filter((t=>Ti(e,t)))}function Ai(e){const t=_i(e);return t[t.length-1]}function Ti(e,t){const n=e.indexOf(t);return!(n<0)&&(!(n>0&&"seconds"===t&&"i"===e.charAt(n-1))&&(!(e.length>n+3&&"day"===t&&"o"===e.charAt(n+3))&&!(n>0&&"year"===t&&"f"===e.charAt(n-1))))}function ji(e,t){let{end:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{end:!1};const i=A(t),r=Ni(e)?"utc":"";let o;const a={};for(const t of Oi)Ti(e,t)&&(a[t]="quarter"===(s=t)?`(${r}quarter(${i})-1)`:`${r}${s}(${i})`,o=t);var s;return n&&(a[o]+="+1"),function(e){const t=Si(e,!1).join(", ");return e.utc?`utc(${t})`:`datetime(${t})`}(a)}function Ei(e){if(!e)return;return`timeUnitSpecifier(${X(_i(e))}, ${X(Pi)})`}function Mi(e){if(!e)return;let n;return t.isString(e)?n=Ci(e)?{unit:e.substring(6),binned:!0}:{unit:e}:t.isObject(e)&&(n={...e,...e.unit?{unit:e.unit}:{}}),Ni(n.unit)&&(n.utc=!0,n.unit=n.unit.substring(3)),n}function Ri(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e=>e;const n=Mi(e),i=Ai(n.unit);if(i&&"day"!==i){const e={year:2001,month:1,date:1,hours:0,minutes:0,seconds:0,milliseconds:0},{step:r,part:o}=qi(i,n.step);return`${t(Di({...e,[o]:+e[o]+r}))} - ${t(Di(e))}`}}const Li={year:1,month:1,date:1,hours:1,minutes:1,seconds:1,milliseconds:1};function qi(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1;if(function(e){return t.hasOwnProperty(Li,e)}(e))return{part:e,step:n};switch(e){case"day":case"dayofyear":return{part:"date",step:n};case"quarter":return{part:"month",step:3*n};case"week":return{part:"date",step:7*n}}}function Ui(e){return!!e?.field&&void 0!==e.equal}function Wi(e){return!!e?.field&&void 0!==e.lt}function Ii(e){return!!e?.field&&void 0!==e.lte}function Bi(e){return!!e?.field&&void 0!==e.gt}function Vi(e){return!!e?.field&&void 0!==e.gte}function Hi(e){if(e?.field){if(t.isArray(e.range)&&2===e.range.length)return!0;if(vn(e.range))return!0}return!1}function Gi(e){return!!e?.field&&(t.isArray(e.oneOf)||t.isArray(e.in))}function Yi(e){return Gi(e)||Ui(e)||Hi(e)||Wi(e)||Bi(e)||Ii(e)||Vi(e)}function Xi(e,t){return Sa(e,{timeUnit:t,wrapTime:!0})}function Qi(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const{field:n}=e,i=Mi(e.timeUnit),{unit:r,binned:o}=i||{},a=sa(e,{expr:"datum"}),s=r?`time(${o?a:ji(r,n)})`:a;if(Ui(e))return`${s}===${Xi(e.equal,r)}`;if(Wi(e)){return`${s}<${Xi(e.lt,r)}`}if(Bi(e)){return`${s}>${Xi(e.gt,r)}`}if(Ii(e)){return`${s}<=${Xi(e.lte,r)}`}if(Vi(e)){return`${s}>=${Xi(e.gte,r)}`}if(Gi(e))return`indexof([${function(e,t){return e.map((e=>Xi(e,t)))}(e.oneOf,r).join(",")}], ${s}) !== -1`;if(function(e){return!!e?.field&&void 0!==e.valid}(e))return Ji(s,e.valid);if(Hi(e)){const{range:n}=gn(e),i=vn(n)?{signal:`${n.signal}[0]`}:n[0],o=vn(n)?{signal:`${n.signal}[1]`}:n[1];if(null!==i&&null!==o&&t)return"inrange("+s+", ["+Xi(i,r)+", "+Xi(o,r)+"])";const a=[];return null!==i&&a.push(`${s} >= ${Xi(i,r)}`),null!==o&&a.push(`${s} <= ${Xi(o,r)}`),a.length>0?a.join(" && "):"true"}throw new Error(`Invalid field predicate: ${X(e)}`)}function Ji(e){return!(arguments.length>1&&void 0!==arguments[1])||arguments[1]?`isValid(${e}) && isFinite(+${e})`:`!isValid(${e}) || !isFinite(+${e})`}function Ki(e){return Yi(e)&&e.timeUnit?{...e,timeUnit:Mi(e.timeUnit)}:e}function Zi(e){return"quantitative"===e||"temporal"===e}function er(e){return"ordinal"===e||"nominal"===e}const tr="quantitative",nr="ordinal",ir="temporal",rr="nominal",or="geojson";const ar={LINEAR:"linear",LOG:"log",POW:"pow",SQRT:"sqrt",SYMLOG:"symlog",IDENTITY:"identity",SEQUENTIAL:"sequential",TIME:"time",UTC:"utc",QUANTILE:"quantile",QUANTIZE:"quantize",THRESHOLD:"threshold",BIN_ORDINAL:"bin-ordinal",ORDINAL:"ordinal",POINT:"point",BAND:"band"},sr={linear:"numeric",log:"numeric",pow:"numeric",sqrt:"numeric",symlog:"numeric",identity:"numeric",sequential:"numeric",time:"time",utc:"time",ordinal:"ordinal","bin-ordinal":"bin-ordinal",point:"ordinal-position",band:"ordinal-position",quantile:"discretizing",quantize:"discretizing",threshold:"discretizing"};function lr(e,t){const n=sr[e],i=sr[t];return n===i||"ordinal-position"===n&&"time"===i||"ordinal-position"===i&&"time"===n}const cr={linear:0,log:1,pow:1,sqrt:1,symlog:1,identity:1,sequential:1,time:0,utc:0,point:10,band:11,ordinal:0,"bin-ordinal":0,quantile:0,quantize:0,threshold:0};function ur(e){return cr[e]}const fr=new Set(["linear","log","pow","sqrt","symlog"]),dr=new Set([...fr,"time","utc"]);function mr(e){return fr.has(e)}const pr=new Set(["quantile","quantize","threshold"]),gr=new Set([...dr,...pr,"sequential","identity"]),hr=new Set(["ordinal","bin-ordinal","point","band"]);function yr(e){return hr.has(e)}function vr(e){return gr.has(e)}function br(e){return dr.has(e)}function xr(e){return pr.has(e)}function $r(e){return Q(e,"param")}const{type:wr,domain:kr,range:Sr,rangeMax:Dr,rangeMin:Fr,scheme:Or,...zr}={type:1,domain:1,domainMax:1,domainMin:1,domainMid:1,domainRaw:1,align:1,range:1,rangeMax:1,rangeMin:1,scheme:1,bins:1,reverse:1,round:1,clamp:1,nice:1,base:1,exponent:1,constant:1,interpolate:1,zero:1,padding:1,paddingInner:1,paddingOuter:1},Cr=D(zr);function Nr(e,t){switch(t){case"type":case"domain":case"reverse":case"range":return!0;case"scheme":case"interpolate":return!["point","band","identity"].includes(e);case"bins":return!["point","band","identity","ordinal"].includes(e);case"round":return br(e)||"band"===e||"point"===e;case"padding":case"rangeMin":case"rangeMax":return br(e)||["point","band"].includes(e);case"paddingOuter":case"align":return["point","band"].includes(e);case"paddingInner":return"band"===e;case"domainMax":case"domainMid":case"domainMin":case"domainRaw":case"clamp":return br(e);case"nice":return br(e)||"quantize"===e||"threshold"===e;case"exponent":return"pow"===e;case"base":return"log"===e;case"constant":return"symlog"===e;case"zero":return vr(e)&&!p(["log","time","utc","threshold","quantile"],e)}}function Pr(e,t){switch(t){case"interpolate":case"scheme":case"domainMid":return qe(e)?void 0:`Cannot use the scale property "${t}" with non-color channel.`;case"align":case"type":case"bins":case"domain":case"domainMax":case"domainMin":case"domainRaw":case"range":case"base":case"exponent":case"constant":case"nice":case"padding":case"paddingInner":case"paddingOuter":case"rangeMax":case"rangeMin":case"reverse":case"round":case"clamp":case"zero":return}}const _r={arc:"arc",area:"area",bar:"bar",image:"image",line:"line",point:"point",rect:"rect",rule:"rule",text:"text",tick:"tick",trail:"trail",circle:"circle",square:"square",geoshape:"geoshape"},Ar=_r.arc,Tr=_r.area,jr=_r.bar,Er=_r.image,Mr=_r.line,Rr=_r.point,Lr=_r.rect,qr=_r.rule,Ur=_r.text,Wr=_r.tick,Ir=_r.trail,Br=_r.circle,Vr=_r.square,Hr=_r.geoshape;function Gr(e){return["line","area","trail"].includes(e)}function Yr(e){return["rect","bar","image","arc","tick"].includes(e)}const Xr=new Set(D(_r));function Qr(e){return Q(e,"type")}const Jr=["stroke","strokeWidth","strokeDash","strokeDashOffset","strokeOpacity","strokeJoin","strokeMiterLimit","fill","fillOpacity"],Kr=D({color:1,filled:1,invalid:1,order:1,radius2:1,theta2:1,timeUnitBandSize:1,timeUnitBandPosition:1}),Zr=["binSpacing","continuousBandSize","discreteBandSize","minBandSize"],eo={area:["line","point"],bar:Zr,rect:Zr,line:["point"],tick:["bandSize","thickness",...Zr]},to=D({mark:1,arc:1,area:1,bar:1,circle:1,image:1,line:1,point:1,rect:1,rule:1,square:1,text:1,tick:1,trail:1,geoshape:1});function no(e){return Q(e,"band")}const io={horizontal:["cornerRadiusTopRight","cornerRadiusBottomRight"],vertical:["cornerRadiusTopLeft","cornerRadiusTopRight"]},ro={binSpacing:0,continuousBandSize:5,minBandSize:.25,timeUnitBandPosition:.5},oo={...ro,binSpacing:1},ao={...ro,thickness:1};function so(e,t){let{isPath:n}=t;return void 0===e||"break-paths-show-path-domains"===e?n?"break-paths-show-domains":"filter":null===e?"show":e}function lo(e){let{markDef:t,config:n,scaleChannel:i,scaleType:r,isCountAggregate:o}=e;if(!r||!vr(r)||o)return"always-valid";const a=so(_n("invalid",t,n),{isPath:Gr(t.type)}),s=n.scale?.invalid?.[i];return void 0!==s?"show":a}function co(e){let{scaleName:t,scale:n,mode:i}=e;const r=`domain('${t}')`;if(!n||!t)return;const o=`${r}[0]`,a=`peek(${r})`,s=n.domainHasZero();if("definitely"===s)return{scale:t,value:0};if("maybe"===s){return{signal:`scale('${t}', inrange(0, ${r}) ? 0 : ${"zeroOrMin"===i?o:a})`}}return{signal:`scale('${t}', ${"zeroOrMin"===i?o:a})`}}function uo(e){let{scaleChannel:t,channelDef:n,scale:i,scaleName:r,markDef:o,config:a}=e;const s=i?.get("type"),l=ha(n),c=lo({scaleChannel:t,markDef:o,config:a,scaleType:s,isCountAggregate:on(l?.aggregate)});if(l&&"show"===c){const e=a.scale.invalid?.[t]??"zero-or-min";return{test:Ji(sa(l,{expr:"datum"}),!1),...fo(e,i,r)}}}function fo(e,n,i){if(r=e,t.isObject(r)&&"value"in r){const{value:t}=e;return vn(t)?{signal:t.signal}:{value:t}}var r;return co({scale:n,scaleName:i,mode:"zeroOrMin"})}function mo(e){const{channel:t,channelDef:n,markDef:i,scale:r,scaleName:o,config:a}=e,s=nt(t),l=ho(e),c=uo({scaleChannel:s,channelDef:n,scale:r,scaleName:o,markDef:i,config:a});return void 0!==c?[c,l]:l}function po(e,t,n,i){const r={};if(t&&(r.scale=t),Xo(e)){const{datum:t}=e;bi(t)?r.signal=Di(t):vn(t)?r.signal=t.signal:pn(t)?r.signal=t.expr:r.value=t}else r.field=sa(e,n);if(i){const{offset:e,band:t}=i;e&&(r.offset=e),t&&(r.band=t)}return r}function go(e){let{scaleName:t,fieldOrDatumDef:n,fieldOrDatumDef2:i,offset:r,startSuffix:o,endSuffix:a="end",bandPosition:s=.5}=e;const l=!vn(s)&&0<s&&s<1?"datum":void 0,c=sa(n,{expr:l,suffix:o}),u=void 0!==i?sa(i,{expr:l}):sa(n,{suffix:a,expr:l}),f={};if(0===s||1===s){f.scale=t;const e=0===s?c:u;f.field=e}else{const e=vn(s)?`(1-${s.signal}) * ${c} + ${s.signal} * ${u}`:`${1-s} * ${c} + ${s} * ${u}`;f.signal=`scale("${t}", ${e})`}return r&&(f.offset=r),f}function ho(e){let{channel:n,channelDef:i,channel2Def:r,markDef:o,config:a,scaleName:s,scale:l,stack:c,offset:u,defaultRef:f,bandPosition:d}=e;if(i){if(Zo(i)){const e=l?.get("type");if(ea(i)){d??=qo({fieldDef:i,fieldDef2:r,markDef:o,config:a});const{bin:t,timeUnit:l,type:f}=i;if(cn(t)||d&&l&&f===ir)return c?.impute?po(i,s,{binSuffix:"mid"},{offset:u}):d&&!yr(e)?go({scaleName:s,fieldOrDatumDef:i,bandPosition:d,offset:u}):po(i,s,Fa(i,n)?{binSuffix:"range"}:{},{offset:u});if(un(t)){if(Go(r))return go({scaleName:s,fieldOrDatumDef:i,fieldOrDatumDef2:r,bandPosition:d,offset:u});vi(gi(n===ee?ne:ie))}}return po(i,s,yr(e)?{binSuffix:"range"}:{},{offset:u,band:"band"===e?d??i.bandPosition??.5:void 0})}if(ta(i)){const e=u?{offset:u}:{};return{...yo(n,i.value),...e}}}return t.isFunction(f)&&(f=f()),f?{...f,...u?{offset:u}:{}}:f}function yo(e,t){return p(["x","x2"],e)&&"width"===t?{field:{group:"width"}}:p(["y","y2"],e)&&"height"===t?{field:{group:"height"}}:On(t)}function vo(e){return e&&"number"!==e&&"time"!==e}function bo(e,t,n){return`${e}(${t}${n?`, ${X(n)}`:""})`}const xo=" – ";function $o(e){let{fieldOrDatumDef:n,format:i,formatType:r,expr:o,normalizeStack:a,config:s}=e;if(vo(r))return ko({fieldOrDatumDef:n,format:i,formatType:r,expr:o,config:s});const l=wo(n,o,a),c=Yo(n);if(void 0===i&&void 0===r&&s.customFormatTypes){if("quantitative"===c){if(a&&s.normalizedNumberFormatType)return ko({fieldOrDatumDef:n,format:s.normalizedNumberFormat,formatType:s.normalizedNumberFormatType,expr:o,config:s});if(s.numberFormatType)return ko({fieldOrDatumDef:n,format:s.numberFormat,formatType:s.numberFormatType,expr:o,config:s})}if("temporal"===c&&s.timeFormatType&&Go(n)&&void 0===n.timeUnit)return ko({fieldOrDatumDef:n,format:s.timeFormat,formatType:s.timeFormatType,expr:o,config:s})}if(ka(n)){const e=function(e){let{field:n,timeUnit:i,format:r,formatType:o,rawTimeFormat:a,isUTCScale:s}=e;return!i||r?!i&&o?`${o}(${n}, '${r}')`:(r=t.isString(r)?r:a,`${s?"utc":"time"}Format(${n}, '${r}')`):function(e,t,n){if(!e)return;const i=Ei(e);return`${n||Ni(e)?"utc":"time"}Format(${t}, ${i})`}(i,n,s)}({field:l,timeUnit:Go(n)?Mi(n.timeUnit)?.unit:void 0,format:i,formatType:s.timeFormatType,rawTimeFormat:s.timeFormat,isUTCScale:na(n)&&n.scale?.type===ar.UTC});return e?{signal:e}:void 0}if(i=Fo({type:c,specifiedFormat:i,config:s,normalizeStack:a}),Go(n)&&cn(n.bin)){return{signal:Co(l,sa(n,{expr:o,binSuffix:"end"}),i,r,s)}}return i||"quantitative"===Yo(n)?{signal:`${Oo(l,i)}`}:{signal:`isValid(${l}) ? ${l} : ""+${l}`}}function wo(e,t,n){return Go(e)?n?`${sa(e,{expr:t,suffix:"end"})}-${sa(e,{expr:t,suffix:"start"})}`:sa(e,{expr:t}):function(e){const{datum:t}=e;return bi(t)?Di(t):`${X(t)}`}(e)}function ko(e){let{fieldOrDatumDef:t,format:n,formatType:i,expr:r,normalizeStack:o,config:a,field:s}=e;if(s??=wo(t,r,o),"datum.value"!==s&&Go(t)&&cn(t.bin)){return{signal:Co(s,sa(t,{expr:r,binSuffix:"end"}),n,i,a)}}return{signal:bo(i,s,n)}}function So(e,n,i,r,o,a){if(!t.isString(r)||!vo(r)){if(void 0===i&&void 0===r&&o.customFormatTypes&&"quantitative"===Yo(e)){if(o.normalizedNumberFormatType&&ia(e)&&"normalize"===e.stack)return;if(o.numberFormatType)return}if(ia(e)&&"normalize"===e.stack&&o.normalizedNumberFormat)return Fo({type:"quantitative",config:o,normalizeStack:!0});if(ka(e)){const t=Go(e)?Mi(e.timeUnit)?.unit:void 0;if(void 0===t&&o.customFormatTypes&&o.timeFormatType)return;return function(e){let{specifiedFormat:t,timeUnit:n,config:i,omitTimeFormatConfig:r}=e;if(t)return t;if(n)return{signal:Ei(n)};return r?void 0:i.timeFormat}({specifiedFormat:i,timeUnit:t,config:o,omitTimeFormatConfig:a})}return Fo({type:n,specifiedFormat:i,config:o})}}function Do(e,t,n){return e&&(vn(e)||"number"===e||"time"===e)?e:ka(t)&&"time"!==n&&"utc"!==n?Go(t)&&Mi(t?.timeUnit)?.utc?"utc":"time":void 0}function Fo(e){let{type:n,specifiedFormat:i,config:r,normalizeStack:o}=e;return t.isString(i)?i:n===tr?o?r.normalizedNumberFormat:r.numberFormat:void 0}function Oo(e,t){return`format(${e}, "${t||""}")`}function zo(e,n,i,r){return vo(i)?bo(i,e,n):Oo(e,(t.isString(n)?n:void 0)??r.numberFormat)}function Co(e,t,n,i,r){if(void 0===n&&void 0===i&&r.customFormatTypes&&r.numberFormatType)return Co(e,t,r.numberFormat,r.numberFormatType,r);const o=zo(e,n,i,r),a=zo(t,n,i,r);return`${Ji(e,!1)} ? "null" : ${o} + "${xo}" + ${a}`}const No="min",Po={x:1,y:1,color:1,fill:1,stroke:1,strokeWidth:1,size:1,shape:1,fillOpacity:1,strokeOpacity:1,opacity:1,text:1};function _o(e){return t.hasOwnProperty(Po,e)}function Ao(e){return e&&("count"===e.op||Q(e,"field"))}function To(e){return e&&t.isArray(e)}function jo(e){return Q(e,"row")||Q(e,"column")}function Eo(e){return Q(e,"header")}function Mo(e){return Q(e,"facet")}function Ro(e){const{field:t,timeUnit:n,bin:i,aggregate:r}=e;return{...n?{timeUnit:n}:{},...i?{bin:i}:{},...r?{aggregate:r}:{},field:t}}function Lo(e){return Q(e,"sort")}function qo(e){let{fieldDef:t,fieldDef2:n,markDef:i,config:r}=e;if(Zo(t)&&void 0!==t.bandPosition)return t.bandPosition;if(Go(t)){const{timeUnit:e,bin:o}=t;if(e&&!n)return An("timeUnitBandPosition",i,r);if(cn(o))return.5}}function Uo(e){let{channel:t,fieldDef:n,fieldDef2:i,markDef:r,config:o,scaleType:a,useVlSizeChannel:s}=e;const l=ot(t),c=_n(s?"size":l,r,o,{vgChannel:l});if(void 0!==c)return c;if(Go(n)){const{timeUnit:e,bin:t}=n;if(e&&!i)return{band:An("timeUnitBandSize",r,o)};if(cn(t)&&!yr(a))return{band:1}}return Yr(r.type)?a?yr(a)?o[r.type]?.discreteBandSize||{band:1}:o[r.type]?.continuousBandSize:o[r.type]?.discreteBandSize:void 0}function Wo(e,t,n,i){return!!(cn(e.bin)||e.timeUnit&&ea(e)&&"temporal"===e.type)&&void 0!==qo({fieldDef:e,fieldDef2:t,markDef:n,config:i})}function Io(e){return Q(e,"sort")&&!Q(e,"field")}function Bo(e){return Q(e,"condition")}function Vo(e){const n=e?.condition;return!!n&&!t.isArray(n)&&Go(n)}function Ho(e){const n=e?.condition;return!!n&&!t.isArray(n)&&Zo(n)}function Go(e){return Q(e,"field")||"count"===e?.aggregate}function Yo(e){return e?.type}function Xo(e){return Q(e,"datum")}function Qo(e){return ea(e)&&!la(e)||Ko(e)}function Jo(e){return ea(e)&&"quantitative"===e.type&&!e.bin||Ko(e)}function Ko(e){return Xo(e)&&t.isNumber(e.datum)}function Zo(e){return Go(e)||Xo(e)}function ea(e){return e&&(Q(e,"field")||"count"===e.aggregate)&&Q(e,"type")}function ta(e){return Q(e,"value")}function na(e){return Q(e,"scale")||Q(e,"sort")}function ia(e){return Q(e,"axis")||Q(e,"stack")||Q(e,"impute")}function ra(e){return Q(e,"legend")}function oa(e){return Q(e,"format")||Q(e,"formatType")}function aa(e){return f(e,["legend","axis","header","scale"])}function sa(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=e.field;const i=t.prefix;let r=t.suffix,o="";if(function(e){return"count"===e.aggregate}(e))n=I("count");else{let i;if(!t.nofn)if(function(e){return Q(e,"op")}(e))i=e.op;else{const{bin:a,aggregate:s,timeUnit:l}=e;cn(a)?(i=ln(a),r=(t.binSuffix??"")+(t.suffix??"")):s?tn(s)?(o=`["${n}"]`,n=`argmax_${s.argmax}`):en(s)?(o=`["${n}"]`,n=`argmin_${s.argmin}`):i=String(s):l&&!zi(l)&&(i=function(e){const{utc:t,...n}=Mi(e);return n.unit?(t?"utc":"")+D(n).map((e=>C(`${"unit"===e?"":`_${e}_`}${n[e]}`))).join(""):(t?"utc":"")+"timeunit"+D(n).map((e=>C(`_${e}_${n[e]}`))).join("")}(l),r=(!["range","mid"].includes(t.binSuffix)&&t.binSuffix||"")+(t.suffix??""))}i&&(n=n?`${i}_${n}`:i)}return r&&(n=`${n}_${r}`),i&&(n=`${i}_${n}`),t.forAs?R(n):t.expr?T(n,t.expr)+o:E(n)+o}function la(e){switch(e.type){case"nominal":case"ordinal":case"geojson":return!0;case"quantitative":return Go(e)&&!!e.bin;case"temporal":return!1}throw new Error(ei(e.type))}const ca=(e,t)=>{switch(t.fieldTitle){case"plain":return e.field;case"functional":return function(e){const{aggregate:t,bin:n,timeUnit:i,field:r}=e;if(tn(t))return`${r} for argmax(${t.argmax})`;if(en(t))return`${r} for argmin(${t.argmin})`;const o=i&&!zi(i)?Mi(i):void 0,a=t||o?.unit||o?.maxbins&&"timeunit"||cn(n)&&"bin";return a?`${a.toUpperCase()}(${r})`:r}(e);default:return function(e,t){const{field:n,bin:i,timeUnit:r,aggregate:o}=e;if("count"===o)return t.countTitle;if(cn(i))return`${n} (binned)`;if(r&&!zi(r)){const e=Mi(r)?.unit;if(e)return`${n} (${_i(e).join("-")})`}else if(o)return tn(o)?`${n} for max ${o.argmax}`:en(o)?`${n} for min ${o.argmin}`:`${_(o)} of ${n}`;return n}(e,t)}};let ua=ca;function fa(e){ua=e}function da(e,t,n){let{allowDisabling:i,includeDefault:r=!0}=n;const o=ma(e)?.title;if(!Go(e))return o??e.title;const a=e,s=r?pa(a,t):void 0;return i?q(o,a.title,s):o??a.title??s}function ma(e){return ia(e)&&e.axis?e.axis:ra(e)&&e.legend?e.legend:Eo(e)&&e.header?e.header:void 0}function pa(e,t){return ua(e,t)}function ga(e){if(oa(e)){const{format:t,formatType:n}=e;return{format:t,formatType:n}}{const t=ma(e)??{},{format:n,formatType:i}=t;return{format:n,formatType:i}}}function ha(e){return Go(e)?e:Vo(e)?e.condition:void 0}function ya(e){return Zo(e)?e:Ho(e)?e.condition:void 0}function va(e,n,i){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};if(t.isString(e)||t.isNumber(e)||t.isBoolean(e)){return vi(function(e,t,n){return`Channel ${e} is a ${t}. Converted to {value: ${X(n)}}.`}(n,t.isString(e)?"string":t.isNumber(e)?"number":"boolean",e)),{value:e}}return Zo(e)?ba(e,n,i,r):Ho(e)?{...e,condition:ba(e.condition,n,i,r)}:e}function ba(e,n,i,r){if(oa(e)){const{format:t,formatType:o,...a}=e;if(vo(o)&&!i.customFormatTypes)return vi(Kn(n)),ba(a,n,i,r)}else{const t=ia(e)?"axis":ra(e)?"legend":Eo(e)?"header":null;if(t&&e[t]){const{format:o,formatType:a,...s}=e[t];if(vo(a)&&!i.customFormatTypes)return vi(Kn(n)),ba({...e,[t]:s},n,i,r)}}return Go(e)?xa(e,n,r):function(e){let n=e.type;if(n)return e;const{datum:i}=e;return n=t.isNumber(i)?"quantitative":t.isString(i)?"nominal":bi(i)?"temporal":void 0,{...e,type:n}}(e)}function xa(e,n){let{compositeMark:i=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const{aggregate:r,timeUnit:o,bin:a,field:s}=e,l={...e};if(i||!r||nn(r)||tn(r)||en(r)||(vi(function(e){return`Invalid aggregation operator "${e}".`}(r)),delete l.aggregate),o&&(l.timeUnit=Mi(o)),s&&(l.field=`${s}`),cn(a)&&(l.bin=$a(a,n)),un(a)&&!zt(n)&&vi(function(e){return`Channel ${e} should not be used with "binned" bin.`}(n)),ea(l)){const{type:e}=l,t=function(e){if(e)switch(e=e.toLowerCase()){case"q":case tr:return"quantitative";case"t":case ir:return"temporal";case"o":case nr:return"ordinal";case"n":case rr:return"nominal";case or:return"geojson"}}(e);e!==t&&(l.type=t),"quantitative"!==e&&on(r)&&(vi(function(e,t){return`Invalid field type "${e}" for aggregate: "${t}", using "quantitative" instead.`}(e,r)),l.type="quantitative")}else if(!tt(n)){const e=function(e,n){switch(n){case"latitude":case"longitude":return"quantitative";case"row":case"column":case"facet":case"shape":case"strokeDash":return"nominal";case"order":return"ordinal"}if(Lo(e)&&t.isArray(e.sort))return"ordinal";const{aggregate:i,bin:r,timeUnit:o}=e;if(o)return"temporal";if(r||i&&!tn(i)&&!en(i))return"quantitative";if(na(e)&&e.scale?.type)switch(sr[e.scale.type]){case"numeric":case"discretizing":return"quantitative";case"time":return"temporal"}return"nominal"}(l,n);l.type=e}if(ea(l)){const{compatible:e,warning:t}=function(e,t){const n=e.type;if("geojson"===n&&"shape"!==t)return{compatible:!1,warning:`Channel ${t} should not be used with a geojson data.`};switch(t){case J:case K:case Z:return la(e)?wa:{compatible:!1,warning:ri(t)};case ee:case te:case re:case oe:case pe:case ge:case he:case De:case Oe:case ze:case Ce:case Ne:case Pe:case be:case le:case ae:case _e:return wa;case fe:case me:case ue:case de:return n!==tr?{compatible:!1,warning:`Channel ${t} should be used with a quantitative field only, not ${e.type} field.`}:wa;case xe:case $e:case we:case ke:case ve:case ce:case se:case ne:case ie:return"nominal"!==n||e.sort?wa:{compatible:!1,warning:`Channel ${t} should not be used with an unsorted discrete field.`};case ye:case Se:return la(e)||na(i=e)&&xr(i.scale?.type)?wa:{compatible:!1,warning:oi(t)};case Fe:return"nominal"!==e.type||"sort"in e?wa:{compatible:!1,warning:"Channel order is inappropriate for nominal field, which has no inherent order."}}var i}(l,n)||{};!1===e&&vi(t)}if(Lo(l)&&t.isString(l.sort)){const{sort:e}=l;if(_o(e))return{...l,sort:{encoding:e}};const t=e.substring(1);if("-"===e.charAt(0)&&_o(t))return{...l,sort:{encoding:t,order:"descending"}}}if(Eo(l)){const{header:e}=l;if(e){const{orient:t,...n}=e;if(t)return{...l,header:{...n,labelOrient:e.labelOrient||t,titleOrient:e.titleOrient||t}}}}return l}function $a(e,n){return t.isBoolean(e)?{maxbins:mn(n)}:"binned"===e?{binned:!0}:e.maxbins||e.step?e:{...e,maxbins:mn(n)}}const wa={compatible:!0};function ka(e){const{formatType:t}=ga(e);return"time"===t||!t&&((n=e)&&("temporal"===n.type||Go(n)&&!!n.timeUnit));var n}function Sa(e,n){let{timeUnit:i,type:r,wrapTime:o,undefinedIfExprNotRequired:a}=n;const s=i&&Mi(i)?.unit;let l,c=s||"temporal"===r;return pn(e)?l=e.expr:vn(e)?l=e.signal:bi(e)?(c=!0,l=Di(e)):(t.isString(e)||t.isNumber(e))&&c&&(l=`datetime(${X(e)})`,function(e){return t.hasOwnProperty(Fi,e)}(s)&&(t.isNumber(e)&&e<1e4||t.isString(e)&&isNaN(Date.parse(e)))&&(l=Di({[s]:e}))),l?o&&c?`time(${l})`:l:a?void 0:X(e)}function Da(e,t){const{type:n}=e;return t.map((t=>{const i=Sa(t,{timeUnit:Go(e)&&!zi(e.timeUnit)?e.timeUnit:void 0,type:n,undefinedIfExprNotRequired:!0});return void 0!==i?{signal:i}:t}))}function Fa(e,t){return cn(e.bin)?Ht(t)&&["ordinal","nominal"].includes(e.type):(console.warn("Only call this method for binned field defs."),!1)}const Oa={labelAlign:{part:"labels",vgProp:"align"},labelBaseline:{part:"labels",vgProp:"baseline"},labelColor:{part:"labels",vgProp:"fill"},labelFont:{part:"labels",vgProp:"font"},labelFontSize:{part:"labels",vgProp:"fontSize"},labelFontStyle:{part:"labels",vgProp:"fontStyle"},labelFontWeight:{part:"labels",vgProp:"fontWeight"},labelOpacity:{part:"labels",vgProp:"opacity"},labelOffset:null,labelPadding:null,gridColor:{part:"grid",vgProp:"stroke"},gridDash:{part:"grid",vgProp:"strokeDash"},gridDashOffset:{part:"grid",vgProp:"strokeDashOffset"},gridOpacity:{part:"grid",vgProp:"opacity"},gridWidth:{part:"grid",vgProp:"strokeWidth"},tickColor:{part:"ticks",vgProp:"stroke"},tickDash:{part:"ticks",vgProp:"strokeDash"},tickDashOffset:{part:"ticks",vgProp:"strokeDashOffset"},tickOpacity:{part:"ticks",vgProp:"opacity"},tickSize:null,tickWidth:{part:"ticks",vgProp:"strokeWidth"}};function za(e){return e?.condition}const Ca=["domain","grid","labels","ticks","title"],Na={grid:"grid",gridCap:"grid",gridColor:"grid",gridDash:"grid",gridDashOffset:"grid",gridOpacity:"grid",gridScale:"grid",gridWidth:"grid",orient:"main",bandPosition:"both",aria:"main",description:"main",domain:"main",domainCap:"main",domainColor:"main",domainDash:"main",domainDashOffset:"main",domainOpacity:"main",domainWidth:"main",format:"main",formatType:"main",labelAlign:"main",labelAngle:"main",labelBaseline:"main",labelBound:"main",labelColor:"main",labelFlush:"main",labelFlushOffset:"main",labelFont:"main",labelFontSize:"main",labelFontStyle:"main",labelFontWeight:"main",labelLimit:"main",labelLineHeight:"main",labelOffset:"main",labelOpacity:"main",labelOverlap:"main",labelPadding:"main",labels:"main",labelSeparation:"main",maxExtent:"main",minExtent:"main",offset:"both",position:"main",tickCap:"main",tickColor:"main",tickDash:"main",tickDashOffset:"main",tickMinStep:"both",tickOffset:"both",tickOpacity:"main",tickRound:"both",ticks:"main",tickSize:"main",tickWidth:"both",title:"main",titleAlign:"main",titleAnchor:"main",titleAngle:"main",titleBaseline:"main",titleColor:"main",titleFont:"main",titleFontSize:"main",titleFontStyle:"main",titleFontWeight:"main",titleLimit:"main",titleLineHeight:"main",titleOpacity:"main",titlePadding:"main",titleX:"main",titleY:"main",encode:"both",scale:"both",tickBand:"both",tickCount:"both",tickExtra:"both",translate:"both",values:"both",zindex:"both"},Pa={orient:1,aria:1,bandPosition:1,description:1,domain:1,domainCap:1,domainColor:1,domainDash:1,domainDashOffset:1,domainOpacity:1,domainWidth:1,format:1,formatType:1,grid:1,gridCap:1,gridColor:1,gridDash:1,gridDashOffset:1,gridOpacity:1,gridWidth:1,labelAlign:1,labelAngle:1,labelBaseline:1,labelBound:1,labelColor:1,labelFlush:1,labelFlushOffset:1,labelFont:1,labelFontSize:1,labelFontStyle:1,labelFontWeight:1,labelLimit:1,labelLineHeight:1,labelOffset:1,labelOpacity:1,labelOverlap:1,labelPadding:1,labels:1,labelSeparation:1,maxExtent:1,minExtent:1,offset:1,position:1,tickBand:1,tickCap:1,tickColor:1,tickCount:1,tickDash:1,tickDashOffset:1,tickExtra:1,tickMinStep:1,tickOffset:1,tickOpacity:1,tickRound:1,ticks:1,tickSize:1,tickWidth:1,title:1,titleAlign:1,titleAnchor:1,titleAngle:1,titleBaseline:1,titleColor:1,titleFont:1,titleFontSize:1,titleFontStyle:1,titleFontWeight:1,titleLimit:1,titleLineHeight:1,titleOpacity:1,titlePadding:1,titleX:1,titleY:1,translate:1,values:1,zindex:1},_a={...Pa,style:1,labelExpr:1,encoding:1};function Aa(e){return t.hasOwnProperty(_a,e)}const Ta=D({axis:1,axisBand:1,axisBottom:1,axisDiscrete:1,axisLeft:1,axisPoint:1,axisQuantitative:1,axisRight:1,axisTemporal:1,axisTop:1,axisX:1,axisXBand:1,axisXDiscrete:1,axisXPoint:1,axisXQuantitative:1,axisXTemporal:1,axisY:1,axisYBand:1,axisYDiscrete:1,axisYPoint:1,axisYQuantitative:1,axisYTemporal:1});function ja(e){return Q(e,"mark")}class Ea{constructor(e,t){this.name=e,this.run=t}hasMatchingType(e){return!!ja(e)&&(Qr(t=e.mark)?t.type:t)===this.name;var t}}function Ma(e,n){const i=e&&e[n];return!!i&&(t.isArray(i)?g(i,(e=>!!e.field)):Go(i)||Vo(i))}function Ra(e,n){const i=e&&e[n];return!!i&&(t.isArray(i)?g(i,(e=>!!e.field)):Go(i)||Xo(i)||Ho(i))}function La(e,t){if(zt(t)){const n=e[t];if((Go(n)||Xo(n))&&(er(n.type)||Go(n)&&n.timeUnit)){return Ra(e,st(t))}}return!1}function qa(e){return g(Be,(n=>{if(Ma(e,n)){const i=e[n];if(t.isArray(i))return g(i,(e=>!!e.aggregate));{const e=ha(i);return e&&!!e.aggregate}}return!1}))}function Ua(e,n){const i=[],r=[],o=[],a=[],s={};return Ba(e,((l,c)=>{if(Go(l)){const{field:u,aggregate:f,bin:d,timeUnit:m,...p}=l;if(f||m||d){const e=ma(l),g=e?.title;let h=sa(l,{forAs:!0});const y={...g?[]:{title:da(l,n,{allowDisabling:!0})},...p,field:h};if(f){let e;if(tn(f)?(e="argmax",h=sa({op:"argmax",field:f.argmax},{forAs:!0}),y.field=`${h}.${u}`):en(f)?(e="argmin",h=sa({op:"argmin",field:f.argmin},{forAs:!0}),y.field=`${h}.${u}`):"boxplot"!==f&&"errorbar"!==f&&"errorband"!==f&&(e=f),e){const t={op:e,as:h};u&&(t.field=u),a.push(t)}}else if(i.push(h),ea(l)&&cn(d)){if(r.push({bin:d,field:u,as:h}),i.push(sa(l,{binSuffix:"end"})),Fa(l,c)&&i.push(sa(l,{binSuffix:"range"})),zt(c)){const e={field:`${h}_end`};s[`${c}2`]=e}y.bin="binned",tt(c)||(y.type=tr)}else if(m&&!zi(m)){o.push({timeUnit:m,field:u,as:h});const e=ea(l)&&l.type!==ir&&"time";e&&(c===De||c===Ce?y.formatType=e:!function(e){return t.hasOwnProperty(St,e)}(c)?zt(c)&&(y.axis={formatType:e,...y.axis}):y.legend={formatType:e,...y.legend})}s[c]=y}else i.push(u),s[c]=e[c]}else s[c]=e[c]})),{bins:r,timeUnits:o,aggregate:a,groupby:i,encoding:s}}function Wa(e,t,n){const i=Gt(t,n);if(!i)return!1;if("binned"===i){const n=e[t===ne?ee:te];return!!(Go(n)&&Go(e[t])&&un(n.bin))}return!0}function Ia(e,t){const n={};for(const i of D(e)){const r=va(e[i],i,t,{compositeMark:!0});n[i]=r}return n}function Ba(e,n,i){if(e)for(const r of D(e)){const o=e[r];if(t.isArray(o))for(const e of o)n.call(i,e,r);else n.call(i,o,r)}}function Va(e,n){return D(n).reduce(((i,r)=>{switch(r){case ee:case te:case Ne:case _e:case Pe:case ne:case ie:case re:case oe:case le:case ce:case ae:case se:case ue:case fe:case de:case me:case De:case ye:case be:case Ce:return i;case Fe:if("line"===e||"trail"===e)return i;case Oe:case ze:{const e=n[r];if(t.isArray(e)||Go(e))for(const n of t.array(e))n.aggregate||i.push(sa(n,{}));return i}case ve:if("trail"===e)return i;case pe:case ge:case he:case xe:case $e:case we:case Se:case ke:{const e=ha(n[r]);return e&&!e.aggregate&&i.push(sa(e,{})),i}}}),[])}function Ha(e,n,i){let r=!(arguments.length>3&&void 0!==arguments[3])||arguments[3];if("tooltip"in i)return{tooltip:i.tooltip};return{tooltip:[...e.map((e=>{let{fieldPrefix:t,titlePrefix:i}=e;const o=r?` of ${Ga(n)}`:"";return{field:t+n.field,type:n.type,title:vn(i)?{signal:`${i}"${escape(o)}"`}:i+o}})),...b(function(e){const n=[];for(const i of D(e))if(Ma(e,i)){const r=e[i],o=t.array(r);for(const e of o)Go(e)?n.push(e):Vo(e)&&n.push(e.condition)}return n}(i).map(aa),d)]}}function Ga(e){const{title:t,field:n}=e;return q(t,n)}function Ya(e,n,i,r,o){const{scale:a,axis:s}=i;return l=>{let{partName:c,mark:u,positionPrefix:f,endPositionPrefix:d,extraEncoding:m={}}=l;const p=Ga(i);return Xa(e,c,o,{mark:u,encoding:{[n]:{field:`${f}_${i.field}`,type:i.type,...void 0!==p?{title:p}:{},...void 0!==a?{scale:a}:{},...void 0!==s?{axis:s}:{}},...t.isString(d)?{[`${n}2`]:{field:`${d}_${i.field}`}}:{},...r,...m}})}}function Xa(e,n,i,r){const{clip:o,color:a,opacity:s}=e,l=e.type;return e[n]||void 0===e[n]&&i[n]?[{...r,mark:{...i[n],...o?{clip:o}:{},...a?{color:a}:{},...s?{opacity:s}:{},...Qr(r.mark)?r.mark:{type:r.mark},style:`${l}-${String(n)}`,...t.isBoolean(e[n])?{}:e[n]}}]:[]}function Qa(e,t,n){const{encoding:i}=e,r="vertical"===t?"y":"x",o=i[r],a=i[`${r}2`],s=i[`${r}Error`],l=i[`${r}Error2`];return{continuousAxisChannelDef:Ja(o,n),continuousAxisChannelDef2:Ja(a,n),continuousAxisChannelDefError:Ja(s,n),continuousAxisChannelDefError2:Ja(l,n),continuousAxis:r}}function Ja(e,t){if(e?.aggregate){const{aggregate:n,...i}=e;return n!==t&&vi(function(e,t){return`Continuous axis should not have customized aggregation function ${e}; ${t} already agregates the axis.`}(n,t)),i}return e}function Ka(e,t){const{mark:n,encoding:i}=e,{x:r,y:o}=i;if(Qr(n)&&n.orient)return n.orient;if(Qo(r)){if(Qo(o)){const e=Go(r)&&r.aggregate,n=Go(o)&&o.aggregate;if(e||n!==t){if(n||e!==t){if(e===t&&n===t)throw new Error("Both x and y cannot have aggregate");return ka(o)&&!ka(r)?"horizontal":"vertical"}return"horizontal"}return"vertical"}return"horizontal"}if(Qo(o))return"vertical";throw new Error(`Need a valid continuous axis for ${t}s`)}const Za="boxplot",es=new Ea(Za,ns);function ts(e){return t.isNumber(e)?"tukey":e}function ns(e,n){let{config:i}=n;e={...e,encoding:Ia(e.encoding,i)};const{mark:r,encoding:o,params:a,projection:s,...l}=e,c=Qr(r)?r:{type:r};a&&vi(Yn("boxplot"));const u=c.extent??i.boxplot.extent,d=_n("size",c,i),m=c.invalid,p=ts(u),{bins:g,timeUnits:h,transform:y,continuousAxisChannelDef:v,continuousAxis:b,groupby:x,aggregate:$,encodingWithoutContinuousAxis:w,ticksOrient:k,boxOrient:D,customTooltipWithoutAggregatedField:F}=function(e,n,i){const r=Ka(e,Za),{continuousAxisChannelDef:o,continuousAxis:a}=Qa(e,r,Za),s=o.field,l=R(s),c=ts(n),u=[...is(s),{op:"median",field:s,as:`mid_box_${l}`},{op:"min",field:s,as:("min-max"===c?"lower_whisker_":"min_")+l},{op:"max",field:s,as:("min-max"===c?"upper_whisker_":"max_")+l}],f="min-max"===c||"tukey"===c?[]:[{calculate:`datum["upper_box_${l}"] - datum["lower_box_${l}"]`,as:`iqr_${l}`},{calculate:`min(datum["upper_box_${l}"] + datum["iqr_${l}"] * ${n}, datum["max_${l}"])`,as:`upper_whisker_${l}`},{calculate:`max(datum["lower_box_${l}"] - datum["iqr_${l}"] * ${n}, datum["min_${l}"])`,as:`lower_whisker_${l}`}],{[a]:d,...m}=e.encoding,{customTooltipWithoutAggregatedField:p,filteredEncoding:g}=function(e){const{tooltip:n,...i}=e;if(!n)return{filteredEncoding:i};let r,o;if(t.isArray(n)){for(const e of n)e.aggregate?(r||(r=[]),r.push(e)):(o||(o=[]),o.push(e));r&&(i.tooltip=r)}else n.aggregate?i.tooltip=n:o=n;return t.isArray(o)&&1===o.length&&(o=o[0]),{customTooltipWithoutAggregatedField:o,filteredEncoding:i}}(m),{bins:h,timeUnits:y,aggregate:v,groupby:b,encoding:x}=Ua(g,i),$="vertical"===r?"horizontal":"vertical",w=r,k=[...h,...y,{aggregate:[...v,...u],groupby:b},...f];return{bins:h,timeUnits:y,transform:k,groupby:b,aggregate:v,continuousAxisChannelDef:o,continuousAxis:a,encodingWithoutContinuousAxis:x,ticksOrient:$,boxOrient:w,customTooltipWithoutAggregatedField:p}}(e,u,i),O=R(v.field),{color:z,size:C,...N}=w,P=e=>Ya(c,b,v,e,i.boxplot),_=P(N),A=P(w),T=(t.isObject(i.boxplot.box)?i.boxplot.box.color:i.mark.color)||"#4c78a8",j=P({...N,...C?{size:C}:{},color:{condition:{test:`datum['lower_box_${v.field}'] >= datum['upper_box_${v.field}']`,...z||{value:T}}}}),E=Ha([{fieldPrefix:"min-max"===p?"upper_whisker_":"max_",titlePrefix:"Max"},{fieldPrefix:"upper_box_",titlePrefix:"Q3"},{fieldPrefix:"mid_box_",titlePrefix:"Median"},{fieldPrefix:"lower_box_",titlePrefix:"Q1"},{fieldPrefix:"min-max"===p?"lower_whisker_":"min_",titlePrefix:"Min"}],v,w),M={type:"tick",color:"black",opacity:1,orient:k,invalid:m,aria:!1},L="min-max"===p?E:Ha([{fieldPrefix:"upper_whisker_",titlePrefix:"Upper Whisker"},{fieldPrefix:"lower_whisker_",titlePrefix:"Lower Whisker"}],v,w),q=[..._({partName:"rule",mark:{type:"rule",invalid:m,aria:!1},positionPrefix:"lower_whisker",endPositionPrefix:"lower_box",extraEncoding:L}),..._({partName:"rule",mark:{type:"rule",invalid:m,aria:!1},positionPrefix:"upper_box",endPositionPrefix:"upper_whisker",extraEncoding:L}),..._({partName:"ticks",mark:M,positionPrefix:"lower_whisker",extraEncoding:L}),..._({partName:"ticks",mark:M,positionPrefix:"upper_whisker",extraEncoding:L})],U=[..."tukey"!==p?q:[],...A({partName:"box",mark:{type:"bar",...d?{size:d}:{},orient:D,invalid:m,ariaRoleDescription:"box"},positionPrefix:"lower_box",endPositionPrefix:"upper_box",extraEncoding:E}),...j({partName:"median",mark:{type:"tick",invalid:m,...t.isObject(i.boxplot.median)&&i.boxplot.median.color?{color:i.boxplot.median.color}:{},...d?{size:d}:{},orient:k,aria:!1},positionPrefix:"mid_box",extraEncoding:E})];if("min-max"===p)return{...l,transform:(l.transform??[]).concat(y),layer:U};const W=`datum["lower_box_${v.field}"]`,I=`datum["upper_box_${v.field}"]`,B=`(${I} - ${W})`,V=`${W} - ${u} * ${B}`,H=`${I} + ${u} * ${B}`,G=`datum["${v.field}"]`,Y={joinaggregate:is(v.field),groupby:x},X={transform:[{filter:`(${V} <= ${G}) && (${G} <= ${H})`},{aggregate:[{op:"min",field:v.field,as:`lower_whisker_${O}`},{op:"max",field:v.field,as:`upper_whisker_${O}`},{op:"min",field:`lower_box_${v.field}`,as:`lower_box_${O}`},{op:"max",field:`upper_box_${v.field}`,as:`upper_box_${O}`},...$],groupby:x}],layer:q},{tooltip:Q,...J}=N,{scale:K,axis:Z}=v,ee=Ga(v),te=f(Z,["title"]),ne=Xa(c,"outliers",i.boxplot,{transform:[{filter:`(${G} < ${V}) || (${G} > ${H})`}],mark:"point",encoding:{[b]:{field:v.field,type:v.type,...void 0!==ee?{title:ee}:{},...void 0!==K?{scale:K}:{},...S(te)?{}:{axis:te}},...J,...z?{color:z}:{},...F?{tooltip:F}:{}}})[0];let ie;const re=[...g,...h,Y];return ne?ie={transform:re,layer:[ne,X]}:(ie=X,ie.transform.unshift(...re)),{...l,layer:[ie,{transform:y,layer:U}]}}function is(e){const t=R(e);return[{op:"q1",field:e,as:`lower_box_${t}`},{op:"q3",field:e,as:`upper_box_${t}`}]}const rs="errorbar",os=new Ea(rs,as);function as(e,t){let{config:n}=t;e={...e,encoding:Ia(e.encoding,n)};const{transform:i,continuousAxisChannelDef:r,continuousAxis:o,encodingWithoutContinuousAxis:a,ticksOrient:s,markDef:l,outerSpec:c,tooltipEncoding:u}=ls(e,rs,n);delete a.size;const f=Ya(l,o,r,a,n.errorbar),d=l.thickness,m=l.size,p={type:"tick",orient:s,aria:!1,...void 0!==d?{thickness:d}:{},...void 0!==m?{size:m}:{}},g=[...f({partName:"ticks",mark:p,positionPrefix:"lower",extraEncoding:u}),...f({partName:"ticks",mark:p,positionPrefix:"upper",extraEncoding:u}),...f({partName:"rule",mark:{type:"rule",ariaRoleDescription:"errorbar",...void 0!==d?{size:d}:{}},positionPrefix:"lower",endPositionPrefix:"upper",extraEncoding:u})];return{...c,transform:i,...g.length>1?{layer:g}:{...g[0]}}}function ss(e,t){const{encoding:n}=e;if(function(e){return(Zo(e.x)||Zo(e.y))&&!Zo(e.x2)&&!Zo(e.y2)&&!Zo(e.xError)&&!Zo(e.xError2)&&!Zo(e.yError)&&!Zo(e.yError2)}(n))return{orient:Ka(e,t),inputType:"raw"};const i=function(e){return Zo(e.x2)||Zo(e.y2)}(n),r=function(e){return Zo(e.xError)||Zo(e.xError2)||Zo(e.yError)||Zo(e.yError2)}(n),o=n.x,a=n.y;if(i){if(r)throw new Error(`${t} cannot be both type aggregated-upper-lower and aggregated-error`);const e=n.x2,i=n.y2;if(Zo(e)&&Zo(i))throw new Error(`${t} cannot have both x2 and y2`);if(Zo(e)){if(Qo(o))return{orient:"horizontal",inputType:"aggregated-upper-lower"};throw new Error(`Both x and x2 have to be quantitative in ${t}`)}if(Zo(i)){if(Qo(a))return{orient:"vertical",inputType:"aggregated-upper-lower"};throw new Error(`Both y and y2 have to be quantitative in ${t}`)}throw new Error("No ranged axis")}{const e=n.xError,i=n.xError2,r=n.yError,s=n.yError2;if(Zo(i)&&!Zo(e))throw new Error(`${t} cannot have xError2 without xError`);if(Zo(s)&&!Zo(r))throw new Error(`${t} cannot have yError2 without yError`);if(Zo(e)&&Zo(r))throw new Error(`${t} cannot have both xError and yError with both are quantiative`);if(Zo(e)){if(Qo(o))return{orient:"horizontal",inputType:"aggregated-error"};throw new Error("All x, xError, and xError2 (if exist) have to be quantitative")}if(Zo(r)){if(Qo(a))return{orient:"vertical",inputType:"aggregated-error"};throw new Error("All y, yError, and yError2 (if exist) have to be quantitative")}throw new Error("No ranged axis")}}function ls(e,t,n){const{mark:i,encoding:r,params:o,projection:a,...s}=e,l=Qr(i)?i:{type:i};o&&vi(Yn(t));const{orient:c,inputType:u}=ss(e,t),{continuousAxisChannelDef:f,continuousAxisChannelDef2:d,continuousAxisChannelDefError:m,continuousAxisChannelDefError2:p,continuousAxis:g}=Qa(e,c,t),{errorBarSpecificAggregate:h,postAggregateCalculates:y,tooltipSummary:v,tooltipTitleWithFieldName:b}=function(e,t,n,i,r,o,a,s){let l=[],c=[];const u=t.field;let f,d=!1;if("raw"===o){const t=e.center?e.center:e.extent?"iqr"===e.extent?"median":"mean":s.errorbar.center,n=e.extent?e.extent:"mean"===t?"stderr":"iqr";if("median"===t!=("iqr"===n)&&vi(function(e,t,n){return`${e} is not usually used with ${t} for ${n}.`}(t,n,a)),"stderr"===n||"stdev"===n)l=[{op:n,field:u,as:`extent_${u}`},{op:t,field:u,as:`center_${u}`}],c=[{calculate:`datum["center_${u}"] + datum["extent_${u}"]`,as:`upper_${u}`},{calculate:`datum["center_${u}"] - datum["extent_${u}"]`,as:`lower_${u}`}],f=[{fieldPrefix:"center_",titlePrefix:_(t)},{fieldPrefix:"upper_",titlePrefix:cs(t,n,"+")},{fieldPrefix:"lower_",titlePrefix:cs(t,n,"-")}],d=!0;else{let e,t,i;"ci"===n?(e="mean",t="ci0",i="ci1"):(e="median",t="q1",i="q3"),l=[{op:t,field:u,as:`lower_${u}`},{op:i,field:u,as:`upper_${u}`},{op:e,field:u,as:`center_${u}`}],f=[{fieldPrefix:"upper_",titlePrefix:da({field:u,aggregate:i,type:"quantitative"},s,{allowDisabling:!1})},{fieldPrefix:"lower_",titlePrefix:da({field:u,aggregate:t,type:"quantitative"},s,{allowDisabling:!1})},{fieldPrefix:"center_",titlePrefix:da({field:u,aggregate:e,type:"quantitative"},s,{allowDisabling:!1})}]}}else{(e.center||e.extent)&&vi((m=e.center,`${(p=e.extent)?"extent ":""}${p&&m?"and ":""}${m?"center ":""}${p&&m?"are ":"is "}not needed when data are aggregated.`)),"aggregated-upper-lower"===o?(f=[],c=[{calculate:`datum["${n.field}"]`,as:`upper_${u}`},{calculate:`datum["${u}"]`,as:`lower_${u}`}]):"aggregated-error"===o&&(f=[{fieldPrefix:"",titlePrefix:u}],c=[{calculate:`datum["${u}"] + datum["${i.field}"]`,as:`upper_${u}`}],r?c.push({calculate:`datum["${u}"] + datum["${r.field}"]`,as:`lower_${u}`}):c.push({calculate:`datum["${u}"] - datum["${i.field}"]`,as:`lower_${u}`}));for(const e of c)f.push({fieldPrefix:e.as.substring(0,6),titlePrefix:M(M(e.calculate,'datum["',""),'"]',"")})}var m,p;return{postAggregateCalculates:c,errorBarSpecificAggregate:l,tooltipSummary:f,tooltipTitleWithFieldName:d}}(l,f,d,m,p,u,t,n),{[g]:x,["x"===g?"x2":"y2"]:$,["x"===g?"xError":"yError"]:w,["x"===g?"xError2":"yError2"]:k,...S}=r,{bins:D,timeUnits:F,aggregate:O,groupby:z,encoding:C}=Ua(S,n),N=[...O,...h],P="raw"!==u?[]:z,A=Ha(v,f,C,b);return{transform:[...s.transform??[],...D,...F,...0===N.length?[]:[{aggregate:N,groupby:P}],...y],groupby:P,continuousAxisChannelDef:f,continuousAxis:g,encodingWithoutContinuousAxis:C,ticksOrient:"vertical"===c?"horizontal":"vertical",markDef:l,outerSpec:s,tooltipEncoding:A}}function cs(e,t,n){return`${_(e)} ${n} ${t}`}const us="errorband",fs=new Ea(us,ds);function ds(e,t){let{config:n}=t;e={...e,encoding:Ia(e.encoding,n)};const{transform:i,continuousAxisChannelDef:r,continuousAxis:o,encodingWithoutContinuousAxis:a,markDef:s,outerSpec:l,tooltipEncoding:c}=ls(e,us,n),u=s,f=Ya(u,o,r,a,n.errorband),d=void 0!==e.encoding.x&&void 0!==e.encoding.y;let m={type:d?"area":"rect"},p={type:d?"line":"rule"};const g={...u.interpolate?{interpolate:u.interpolate}:{},...u.tension&&u.interpolate?{tension:u.tension}:{}};return d?(m={...m,...g,ariaRoleDescription:"errorband"},p={...p,...g,aria:!1}):u.interpolate?vi(pi("interpolate")):u.tension&&vi(pi("tension")),{...l,transform:i,layer:[...f({partName:"band",mark:m,positionPrefix:"lower",endPositionPrefix:"upper",extraEncoding:c}),...f({partName:"borders",mark:p,positionPrefix:"lower",extraEncoding:c}),...f({partName:"borders",mark:p,positionPrefix:"upper",extraEncoding:c})]}}const ms={};function ps(e,t,n){const i=new Ea(e,t);ms[e]={normalizer:i,parts:n}}ps(Za,ns,["box","median","outliers","rule","ticks"]),ps(rs,as,["ticks","rule"]),ps(us,ds,["band","borders"]);const gs=["gradientHorizontalMaxLength","gradientHorizontalMinLength","gradientVerticalMaxLength","gradientVerticalMinLength","unselectedOpacity"],hs={titleAlign:"align",titleAnchor:"anchor",titleAngle:"angle",titleBaseline:"baseline",titleColor:"color",titleFont:"font",titleFontSize:"fontSize",titleFontStyle:"fontStyle",titleFontWeight:"fontWeight",titleLimit:"limit",titleLineHeight:"lineHeight",titleOrient:"orient",titlePadding:"offset"},ys={labelAlign:"align",labelAnchor:"anchor",labelAngle:"angle",labelBaseline:"baseline",labelColor:"color",labelFont:"font",labelFontSize:"fontSize",labelFontStyle:"fontStyle",labelFontWeight:"fontWeight",labelLimit:"limit",labelLineHeight:"lineHeight",labelOrient:"orient",labelPadding:"offset"},vs=D(hs),bs=D(ys),xs=D({header:1,headerRow:1,headerColumn:1,headerFacet:1}),$s=["size","shape","fill","stroke","strokeDash","strokeWidth","opacity"],ws="_vgsid_",ks={point:{on:"click",fields:[ws],toggle:"event.shiftKey",resolve:"global",clear:"dblclick"},interval:{on:"[pointerdown, window:pointerup] > window:pointermove!",encodings:["x","y"],translate:"[pointerdown, window:pointerup] > window:pointermove!",zoom:"wheel!",mark:{fill:"#333",fillOpacity:.125,stroke:"white"},resolve:"global",clear:"dblclick"}};function Ss(e){return"legend"===e||!!e?.legend}function Ds(e){return Ss(e)&&t.isObject(e)}function Fs(e){return!!e?.select}function Os(e){const t=[];for(const n of e||[]){if(Fs(n))continue;const{expr:e,bind:i,...r}=n;if(i&&e){const n={...r,bind:i,init:e};t.push(n)}else{const n={...r,...e?{update:e}:{},...i?{bind:i}:{}};t.push(n)}}return t}function zs(e){return Q(e,"concat")}function Cs(e){return Q(e,"vconcat")}function Ns(e){return Q(e,"hconcat")}function Ps(e){let{step:t,offsetIsDiscrete:n}=e;return n?t.for??"offset":"position"}function _s(e){return Q(e,"step")}function As(e){return Q(e,"view")||Q(e,"width")||Q(e,"height")}const Ts=D({align:1,bounds:1,center:1,columns:1,spacing:1});function js(e,t){return e[t]??e["width"===t?"continuousWidth":"continuousHeight"]}function Es(e,t){const n=Ms(e,t);return _s(n)?n.step:Rs}function Ms(e,t){return q(e[t]??e["width"===t?"discreteWidth":"discreteHeight"],{step:e.step})}const Rs=20,Ls={background:"white",padding:5,timeFormat:"%b %d, %Y",countTitle:"Count of Records",view:{continuousWidth:200,continuousHeight:200,step:Rs},mark:{color:"#4c78a8",invalid:"break-paths-show-path-domains",timeUnitBandSize:1},arc:{},area:{},bar:oo,circle:{},geoshape:{},image:{},line:{},point:{},rect:ro,rule:{color:"black"},square:{},text:{color:"black"},tick:ao,trail:{},boxplot:{size:14,extent:1.5,box:{},median:{color:"white"},outliers:{},rule:{},ticks:null},errorbar:{center:"mean",rule:!0,ticks:!1},errorband:{band:{opacity:.3},borders:!1},scale:{pointPadding:.5,barBandPaddingInner:.1,rectBandPaddingInner:0,tickBandPaddingInner:.25,bandWithNestedOffsetPaddingInner:.2,bandWithNestedOffsetPaddingOuter:.2,minBandSize:2,minFontSize:8,maxFontSize:40,minOpacity:.3,maxOpacity:.8,minSize:4,minStrokeWidth:1,maxStrokeWidth:4,quantileCount:4,quantizeCount:4,zero:!0},projection:{},legend:{gradientHorizontalMaxLength:200,gradientHorizontalMinLength:100,gradientVerticalMaxLength:200,gradientVerticalMinLength:64,unselectedOpacity:.35},header:{titlePadding:10,labelPadding:10},headerColumn:{},headerRow:{},headerFacet:{},selection:ks,style:{},title:{},facet:{spacing:20},concat:{spacing:20},normalizedNumberFormat:".0%"},qs=["#4c78a8","#f58518","#e45756","#72b7b2","#54a24b","#eeca3b","#b279a2","#ff9da6","#9d755d","#bab0ac"],Us={text:11,guideLabel:10,guideTitle:11,groupTitle:13,groupSubtitle:12},Ws={blue:qs[0],orange:qs[1],red:qs[2],teal:qs[3],green:qs[4],yellow:qs[5],purple:qs[6],pink:qs[7],brown:qs[8],gray0:"#000",gray1:"#111",gray2:"#222",gray3:"#333",gray4:"#444",gray5:"#555",gray6:"#666",gray7:"#777",gray8:"#888",gray9:"#999",gray10:"#aaa",gray11:"#bbb",gray12:"#ccc",gray13:"#ddd",gray14:"#eee",gray15:"#fff"};function Is(e){const t=D(e||{}),n={};for(const i of t){const t=e[i];n[i]=za(t)?Sn(t):Dn(t)}return n}const Bs=[...to,...Ta,...xs,"background","padding","legend","lineBreak","scale","style","title","view"];function Vs(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{color:n,font:i,fontSize:r,selection:o,...a}=e,s=t.mergeConfig({},l(Ls),i?function(e){return{text:{font:e},style:{"guide-label":{font:e},"guide-title":{font:e},"group-title":{font:e},"group-subtitle":{font:e}}}}(i):{},n?function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return{signals:[{name:"color",value:t.isObject(e)?{...Ws,...e}:Ws}],mark:{color:{signal:"color.blue"}},rule:{color:{signal:"color.gray0"}},text:{color:{signal:"color.gray0"}},style:{"guide-label":{fill:{signal:"color.gray0"}},"guide-title":{fill:{signal:"color.gray0"}},"group-title":{fill:{signal:"color.gray0"}},"group-subtitle":{fill:{signal:"color.gray0"}},cell:{stroke:{signal:"color.gray8"}}},axis:{domainColor:{signal:"color.gray13"},gridColor:{signal:"color.gray8"},tickColor:{signal:"color.gray13"}},range:{category:[{signal:"color.blue"},{signal:"color.orange"},{signal:"color.red"},{signal:"color.teal"},{signal:"color.green"},{signal:"color.yellow"},{signal:"color.purple"},{signal:"color.pink"},{signal:"color.brown"},{signal:"color.grey8"}]}}}(n):{},r?function(e){return{signals:[{name:"fontSize",value:t.isObject(e)?{...Us,...e}:Us}],text:{fontSize:{signal:"fontSize.text"}},style:{"guide-label":{fontSize:{signal:"fontSize.guideLabel"}},"guide-title":{fontSize:{signal:"fontSize.guideTitle"}},"group-title":{fontSize:{signal:"fontSize.groupTitle"}},"group-subtitle":{fontSize:{signal:"fontSize.groupSubtitle"}}}}}(r):{},a||{});o&&t.writeConfig(s,"selection",o,!0);const c=f(s,Bs);for(const e of["background","lineBreak","padding"])s[e]&&(c[e]=Dn(s[e]));for(const e of to)s[e]&&(c[e]=gn(s[e]));for(const e of Ta)s[e]&&(c[e]=Is(s[e]));for(const e of xs)s[e]&&(c[e]=gn(s[e]));if(s.legend&&(c.legend=gn(s.legend)),s.scale){const{invalid:e,...t}=s.scale,n=gn(e,{level:1});c.scale={...gn(t),...D(n).length>0?{invalid:n}:{}}}return s.style&&(c.style=function(e){const t=D(e),n={};for(const i of t)n[i]=Is(e[i]);return n}(s.style)),s.title&&(c.title=gn(s.title)),s.view&&(c.view=gn(s.view)),c}const Hs=new Set(["view",...Xr]),Gs=["color","fontSize","background","padding","facet","concat","numberFormat","numberFormatType","normalizedNumberFormat","normalizedNumberFormatType","timeFormat","countTitle","header","axisQuantitative","axisTemporal","axisDiscrete","axisPoint","axisXBand","axisXPoint","axisXDiscrete","axisXQuantitative","axisXTemporal","axisYBand","axisYPoint","axisYDiscrete","axisYQuantitative","axisYTemporal","scale","selection","overlay"],Ys={view:["continuousWidth","continuousHeight","discreteWidth","discreteHeight","step"],...eo};function Xs(e){e=l(e);for(const t of Gs)delete e[t];if(e.axis)for(const t in e.axis)za(e.axis[t])&&delete e.axis[t];if(e.legend)for(const t of gs)delete e.legend[t];if(e.mark){for(const t of Kr)delete e.mark[t];e.mark.tooltip&&t.isObject(e.mark.tooltip)&&delete e.mark.tooltip}e.params&&(e.signals=(e.signals||[]).concat(Os(e.params)),delete e.params);for(const t of Hs){for(const n of Kr)delete e[t][n];const n=Ys[t];if(n)for(const i of n)delete e[t][i];Qs(e,t)}for(const t of D(ms))delete e[t];!function(e){const{titleMarkConfig:t,subtitleMarkConfig:n,subtitle:i}=hn(e.title);S(t)||(e.style["group-title"]={...e.style["group-title"],...t});S(n)||(e.style["group-subtitle"]={...e.style["group-subtitle"],...n});S(i)?delete e.title:e.title=i}(e);for(const n in e)t.isObject(e[n])&&S(e[n])&&delete e[n];return S(e)?void 0:e}function Qs(e,t,n,i){"view"===t&&(n="cell");const r={...e[t],...e.style[n??t]};S(r)||(e.style[n??t]=r),delete e[t]}function Js(e){return Q(e,"layer")}class Ks{map(e,t){return Mo(e)?this.mapFacet(e,t):function(e){return Q(e,"repeat")}(e)?this.mapRepeat(e,t):Ns(e)?this.mapHConcat(e,t):Cs(e)?this.mapVConcat(e,t):zs(e)?this.mapConcat(e,t):this.mapLayerOrUnit(e,t)}mapLayerOrUnit(e,t){if(Js(e))return this.mapLayer(e,t);if(ja(e))return this.mapUnit(e,t);throw new Error(qn(e))}mapLayer(e,t){return{...e,layer:e.layer.map((e=>this.mapLayerOrUnit(e,t)))}}mapHConcat(e,t){return{...e,hconcat:e.hconcat.map((e=>this.map(e,t)))}}mapVConcat(e,t){return{...e,vconcat:e.vconcat.map((e=>this.map(e,t)))}}mapConcat(e,t){const{concat:n,...i}=e;return{...i,concat:n.map((e=>this.map(e,t)))}}mapFacet(e,t){return{...e,spec:this.map(e.spec,t)}}mapRepeat(e,t){return{...e,spec:this.map(e.spec,t)}}}const Zs={zero:1,center:1,normalize:1};const el=new Set([Ar,jr,Tr,qr,Rr,Br,Vr,Mr,Ur,Wr]),tl=new Set([jr,Tr,Ar]);function nl(e){return Go(e)&&"quantitative"===Yo(e)&&!e.bin}function il(e,t,n){let{orient:i,type:r}=n;const o="x"===t?"y":"radius",a="x"===t&&["bar","area"].includes(r),s=e[t],l=e[o];if(Go(s)&&Go(l))if(nl(s)&&nl(l)){if(s.stack)return t;if(l.stack)return o;const e=Go(s)&&!!s.aggregate;if(e!==(Go(l)&&!!l.aggregate))return e?t:o;if(a){if("vertical"===i)return o;if("horizontal"===i)return t}}else{if(nl(s))return t;if(nl(l))return o}else{if(nl(s)){if(a&&"vertical"===i)return;return t}if(nl(l)){if(a&&"horizontal"===i)return;return o}}}function rl(e,n){const i=Qr(e)?e:{type:e},r=i.type;if(!el.has(r))return null;const o=il(n,"x",i)||il(n,"theta",i);if(!o)return null;const a=n[o],s=Go(a)?sa(a,{}):void 0,l=function(e){switch(e){case"x":return"y";case"y":return"x";case"theta":return"radius";case"radius":return"theta"}}(o),c=[],u=new Set;if(n[l]){const e=n[l],t=Go(e)?sa(e,{}):void 0;t&&t!==s&&(c.push(l),u.add(t))}const f="x"===l?"xOffset":"yOffset",d=n[f],m=Go(d)?sa(d,{}):void 0;m&&m!==s&&(c.push(f),u.add(m));const p=Dt.reduce(((e,i)=>{if("tooltip"!==i&&Ma(n,i)){const r=n[i];for(const n of t.array(r)){const t=ha(n);if(t.aggregate)continue;const r=sa(t,{});r&&u.has(r)||e.push({channel:i,fieldDef:t})}}return e}),[]);let g;return void 0!==a.stack?g=t.isBoolean(a.stack)?a.stack?"zero":null:a.stack:tl.has(r)&&(g="zero"),g&&(h=g,t.hasOwnProperty(Zs,h))?qa(n)&&0===p.length?null:(a?.scale?.type&&a?.scale?.type!==ar.LINEAR&&a?.stack&&vi(function(e){return`Stack is applied to a non-linear scale (${e}).`}(a.scale.type)),Zo(n[rt(o)])?(void 0!==a.stack&&vi(`Cannot stack "${y=o}" if there is already "${y}2".`),null):(Go(a)&&a.aggregate&&!an.has(a.aggregate)&&vi(`Stacking is applied even though the aggregate function is non-summative ("${a.aggregate}").`),{groupbyChannels:c,groupbyFields:u,fieldChannel:o,impute:null!==a.impute&&Gr(r),stackBy:p,offset:g})):null;var h,y}function ol(e,t,n){const i=gn(e),r=_n("orient",i,n);if(i.orient=function(e,t,n){switch(e){case Rr:case Br:case Vr:case Ur:case Lr:case Er:return}const{x:i,y:r,x2:o,y2:a}=t;switch(e){case jr:if(Go(i)&&(un(i.bin)||Go(r)&&r.aggregate&&!i.aggregate))return"vertical";if(Go(r)&&(un(r.bin)||Go(i)&&i.aggregate&&!r.aggregate))return"horizontal";if(a||o){if(n)return n;if(!o)return(Go(i)&&i.type===tr&&!cn(i.bin)||Ko(i))&&Go(r)&&un(r.bin)?"horizontal":"vertical";if(!a)return(Go(r)&&r.type===tr&&!cn(r.bin)||Ko(r))&&Go(i)&&un(i.bin)?"vertical":"horizontal"}case qr:if(o&&(!Go(i)||!un(i.bin))&&a&&(!Go(r)||!un(r.bin)))return;case Tr:if(a)return Go(r)&&un(r.bin)?"horizontal":"vertical";if(o)return Go(i)&&un(i.bin)?"vertical":"horizontal";if(e===qr){if(i&&!r)return"vertical";if(r&&!i)return"horizontal"}case Mr:case Wr:{const t=Jo(i),o=Jo(r);if(n)return n;if(t&&!o)return"tick"!==e?"horizontal":"vertical";if(!t&&o)return"tick"!==e?"vertical":"horizontal";if(t&&o)return"vertical";{const e=ea(i)&&i.type===ir,t=ea(r)&&r.type===ir;if(e&&!t)return"vertical";if(!e&&t)return"horizontal"}return}}return"vertical"}(i.type,t,r),void 0!==r&&r!==i.orient&&vi(`Specified orient "${i.orient}" overridden with "${r}".`),"bar"===i.type&&i.orient){const e=_n("cornerRadiusEnd",i,n);if(void 0!==e){const n="horizontal"===i.orient&&t.x2||"vertical"===i.orient&&t.y2?["cornerRadius"]:io[i.orient];for(const t of n)i[t]=e;void 0!==i.cornerRadiusEnd&&delete i.cornerRadiusEnd}}const o=_n("opacity",i,n),a=_n("fillOpacity",i,n);void 0===o&&void 0===a&&(i.opacity=function(e,t){if(p([Rr,Wr,Br,Vr],e)&&!qa(t))return.7;return}(i.type,t));return void 0===_n("cursor",i,n)&&(i.cursor=function(e,t,n){if(t.href||e.href||_n("href",e,n))return"pointer";return e.cursor}(i,t,n)),i}function al(e){const{point:t,line:n,...i}=e;return D(i).length>1?i:i.type}function sl(e){for(const t of["line","area","rule","trail"])e[t]&&(e={...e,[t]:f(e[t],["point","line"])});return e}function ll(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=arguments.length>2?arguments[2]:void 0;return"transparent"===e.point?{opacity:0}:e.point?t.isObject(e.point)?e.point:{}:void 0!==e.point?null:n.point||i.shape?t.isObject(n.point)?n.point:{}:void 0}function cl(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return e.line?!0===e.line?{}:e.line:void 0!==e.line?null:t.line?!0===t.line?{}:t.line:void 0}class ul{name="path-overlay";hasMatchingType(e,t){if(ja(e)){const{mark:n,encoding:i}=e,r=Qr(n)?n:{type:n};switch(r.type){case"line":case"rule":case"trail":return!!ll(r,t[r.type],i);case"area":return!!ll(r,t[r.type],i)||!!cl(r,t[r.type])}}return!1}run(e,t,n){const{config:i}=t,{params:r,projection:o,mark:a,name:s,encoding:l,...c}=e,d=Ia(l,i),m=Qr(a)?a:{type:a},p=ll(m,i[m.type],d),g="area"===m.type&&cl(m,i[m.type]),h=[{name:s,...r?{params:r}:{},mark:al({..."area"===m.type&&void 0===m.opacity&&void 0===m.fillOpacity?{opacity:.7}:{},...m}),encoding:f(d,["shape"])}],y=rl(ol(m,d,i),d);let v=d;if(y){const{fieldChannel:e,offset:t}=y;v={...d,[e]:{...d[e],...t?{stack:t}:{}}}}return v=f(v,["y2","x2"]),g&&h.push({...o?{projection:o}:{},mark:{type:"line",...u(m,["clip","interpolate","tension","tooltip"]),...g},encoding:v}),p&&h.push({...o?{projection:o}:{},mark:{type:"point",opacity:1,filled:!0,...u(m,["clip","tooltip"]),...p},encoding:v}),n({...c,layer:h},{...t,config:sl(i)})}}function fl(e,t){return t?jo(e)?yl(e,t):pl(e,t):e}function dl(e,t){return t?yl(e,t):e}function ml(e,n,i){const r=n[e];return o=r,!t.isString(o)&&Q(o,"repeat")?r.repeat in i?{...n,[e]:i[r.repeat]}:void vi(function(e){return`Unknown repeated value "${e}".`}(r.repeat)):n;var o}function pl(e,t){if(void 0!==(e=ml("field",e,t))){if(null===e)return null;if(Lo(e)&&Ao(e.sort)){const n=ml("field",e.sort,t);e={...e,...n?{sort:n}:{}}}return e}}function gl(e,t){if(Go(e))return pl(e,t);{const n=ml("datum",e,t);return n===e||n.type||(n.type="nominal"),n}}function hl(e,t){if(!Zo(e)){if(Ho(e)){const n=gl(e.condition,t);if(n)return{...e,condition:n};{const{condition:t,...n}=e;return n}}return e}{const n=gl(e,t);if(n)return n;if(Bo(e))return{condition:e.condition}}}function yl(e,n){const i={};for(const r in e)if(Q(e,r)){const o=e[r];if(t.isArray(o))i[r]=o.map((e=>hl(e,n))).filter((e=>e));else{const e=hl(o,n);void 0!==e&&(i[r]=e)}}return i}class vl{name="RuleForRangedLine";hasMatchingType(e){if(ja(e)){const{encoding:t,mark:n}=e;if("line"===n||Qr(n)&&"line"===n.type)for(const e of et){const n=t[nt(e)];if(t[e]&&(Go(n)&&!un(n.bin)||Xo(n)))return!0}}return!1}run(e,n,i){const{encoding:r,mark:o}=e;var a,s;return vi((a=!!r.x2,s=!!r.y2,`Line mark is for continuous lines and thus cannot be used with ${a&&s?"x2 and y2":a?"x2":"y2"}. We will use the rule mark (line segments) instead.`)),i({...e,mark:t.isObject(o)?{...o,type:"rule"}:"rule"},n)}}function bl(e){let{parentEncoding:n,encoding:i={},layer:r}=e,o={};if(n){const e=new Set([...D(n),...D(i)]);for(const a of e){const e=i[a],s=n[a];if(Zo(e)){const t={...s,...e};o[a]=t}else Ho(e)?o[a]={...e,condition:{...s,...e.condition}}:e||null===e?o[a]=e:(r||ta(s)||vn(s)||Zo(s)||t.isArray(s))&&(o[a]=s)}}else o=i;return!o||S(o)?void 0:o}function xl(e){const{parentProjection:t,projection:n}=e;return t&&n&&vi(function(e){const{parentProjection:t,projection:n}=e;return`Layer's shared projection ${X(t)} is overridden by a child projection ${X(n)}.`}({parentProjection:t,projection:n})),n??t}function $l(e){return Q(e,"filter")}function wl(e){return Q(e,"lookup")}function kl(e){return Q(e,"pivot")}function Sl(e){return Q(e,"density")}function Dl(e){return Q(e,"quantile")}function Fl(e){return Q(e,"regression")}function Ol(e){return Q(e,"loess")}function zl(e){return Q(e,"sample")}function Cl(e){return Q(e,"window")}function Nl(e){return Q(e,"joinaggregate")}function Pl(e){return Q(e,"flatten")}function _l(e){return Q(e,"calculate")}function Al(e){return Q(e,"bin")}function Tl(e){return Q(e,"impute")}function jl(e){return Q(e,"timeUnit")}function El(e){return Q(e,"aggregate")}function Ml(e){return Q(e,"stack")}function Rl(e){return Q(e,"fold")}function Ll(e){return Q(e,"extent")&&!Q(e,"density")&&!Q(e,"regression")}function ql(e,t){const{transform:n,...i}=e;if(n){return{...i,transform:n.map((e=>{if($l(e))return{filter:Il(e,t)};if(Al(e)&&fn(e.bin))return{...e,bin:Wl(e.bin)};if(wl(e)){const{selection:t,...n}=e.from;return t?{...e,from:{param:t,...n}}:e}return e}))}}return e}function Ul(e,n){const i=l(e);if(Go(i)&&fn(i.bin)&&(i.bin=Wl(i.bin)),na(i)&&i.scale?.domain?.selection){const{selection:e,...t}=i.scale.domain;i.scale.domain={...t,...e?{param:e}:{}}}if(Bo(i))if(t.isArray(i.condition))i.condition=i.condition.map((e=>{const{selection:t,param:i,test:r,...o}=e;return i?e:{...o,test:Il(e,n)}}));else{const{selection:e,param:t,test:r,...o}=Ul(i.condition,n);i.condition=t?i.condition:{...o,test:Il(i.condition,n)}}return i}function Wl(e){const t=e.extent;if(t?.selection){const{selection:n,...i}=t;return{...e,extent:{...i,param:n}}}return e}function Il(e,t){const n=e=>s(e,(e=>{const n={param:e,empty:t.emptySelections[e]??!0};return t.selectionPredicates[e]??=[],t.selectionPredicates[e].push(n),n}));return e.selection?n(e.selection):s(e.test||e.filter,(e=>e.selection?n(e.selection):e))}class Bl extends Ks{map(e,t){const n=t.selections??[];if(e.params&&!ja(e)){const t=[];for(const i of e.params)Fs(i)?n.push(i):t.push(i);e.params=t}return t.selections=n,super.map(e,t)}mapUnit(e,n){const i=n.selections;if(!i||!i.length)return e;const r=(n.path??[]).concat(e.name),o=[];for(const n of i)if(n.views&&n.views.length)for(const i of n.views)(t.isString(i)&&(i===e.name||r.includes(i))||t.isArray(i)&&i.map((e=>r.indexOf(e))).every(((e,t,n)=>-1!==e&&(0===t||e>n[t-1]))))&&o.push(n);else o.push(n);return o.length&&(e.params=o),e}}for(const e of["mapFacet","mapRepeat","mapHConcat","mapVConcat","mapLayer"]){const t=Bl.prototype[e];Bl.prototype[e]=function(e,n){return t.call(this,e,Vl(e,n))}}function Vl(e,t){return e.name?{...t,path:(t.path??[]).concat(e.name)}:t}function Hl(e,t){void 0===t&&(t=Vs(e.config));const n=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const n={config:t};return Xl.map(Gl.map(Yl.map(e,n),n),n)}(e,t),{width:i,height:r}=e,o=function(e,t,n){let{width:i,height:r}=t;const o=ja(e)||Js(e),a={};o?"container"==i&&"container"==r?(a.type="fit",a.contains="padding"):"container"==i?(a.type="fit-x",a.contains="padding"):"container"==r&&(a.type="fit-y",a.contains="padding"):("container"==i&&(vi(Wn("width")),i=void 0),"container"==r&&(vi(Wn("height")),r=void 0));const s={type:"pad",...a,...n?Ql(n.autosize):{},...Ql(e.autosize)};"fit"!==s.type||o||(vi(Un),s.type="pad");"container"==i&&"fit"!=s.type&&"fit-x"!=s.type&&vi(In("width"));"container"==r&&"fit"!=s.type&&"fit-y"!=s.type&&vi(In("height"));if(Y(s,{type:"pad"}))return;return s}(n,{width:i,height:r,autosize:e.autosize},t);return{...n,...o?{autosize:o}:{}}}const Gl=new class extends Ks{nonFacetUnitNormalizers=(()=>[es,os,fs,new ul,new vl])();map(e,t){if(ja(e)){const n=Ma(e.encoding,J),i=Ma(e.encoding,K),r=Ma(e.encoding,Z);if(n||i||r)return this.mapFacetedUnit(e,t)}return super.map(e,t)}mapUnit(e,t){const{parentEncoding:n,parentProjection:i}=t,r=dl(e.encoding,t.repeater),o={...e,...e.name?{name:[t.repeaterPrefix,e.name].filter((e=>e)).join("_")}:{},...r?{encoding:r}:{}};if(n||i)return this.mapUnitWithParentEncodingOrProjection(o,t);const a=this.mapLayerOrUnit.bind(this);for(const e of this.nonFacetUnitNormalizers)if(e.hasMatchingType(o,t.config))return e.run(o,t,a);return o}mapRepeat(e,n){return function(e){return!t.isArray(e.repeat)&&Q(e.repeat,"layer")}(e)?this.mapLayerRepeat(e,n):this.mapNonLayerRepeat(e,n)}mapLayerRepeat(e,t){const{repeat:n,spec:i,...r}=e,{row:o,column:a,layer:s}=n,{repeater:l={},repeaterPrefix:c=""}=t;return o||a?this.mapRepeat({...e,repeat:{...o?{row:o}:{},...a?{column:a}:{}},spec:{repeat:{layer:s},spec:i}},t):{...r,layer:s.map((e=>{const n={...l,layer:e},r=`${(i.name?`${i.name}_`:"")+c}child__layer_${C(e)}`,o=this.mapLayerOrUnit(i,{...t,repeater:n,repeaterPrefix:r});return o.name=r,o}))}}mapNonLayerRepeat(e,n){const{repeat:i,spec:r,data:o,...a}=e;!t.isArray(i)&&e.columns&&(e=f(e,["columns"]),vi(Qn("repeat")));const s=[],{repeater:l={},repeaterPrefix:c=""}=n,u=!t.isArray(i)&&i.row||[l?l.row:null],d=!t.isArray(i)&&i.column||[l?l.column:null],m=t.isArray(i)&&i||[l?l.repeat:null];for(const e of m)for(const o of u)for(const a of d){const u={repeat:e,row:o,column:a,layer:l.layer},d=(r.name?`${r.name}_`:"")+c+"child__"+(t.isArray(i)?`${C(e)}`:(i.row?`row_${C(o)}`:"")+(i.column?`column_${C(a)}`:"")),m=this.map(r,{...n,repeater:u,repeaterPrefix:d});m.name=d,s.push(f(m,["data"]))}const p=t.isArray(i)?e.columns:i.column?i.column.length:1;return{data:r.data??o,align:"all",...a,columns:p,concat:s}}mapFacet(e,t){const{facet:n}=e;return jo(n)&&e.columns&&(e=f(e,["columns"]),vi(Qn("facet"))),super.mapFacet(e,t)}mapUnitWithParentEncodingOrProjection(e,t){const{encoding:n,projection:i}=e,{parentEncoding:r,parentProjection:o,config:a}=t,s=xl({parentProjection:o,projection:i}),l=bl({parentEncoding:r,encoding:dl(n,t.repeater)});return this.mapUnit({...e,...s?{projection:s}:{},...l?{encoding:l}:{}},{config:a})}mapFacetedUnit(e,t){const{row:n,column:i,facet:r,...o}=e.encoding,{mark:a,width:s,projection:l,height:c,view:u,params:f,encoding:d,...m}=e,{facetMapping:p,layout:g}=this.getFacetMappingAndLayout({row:n,column:i,facet:r},t),h=dl(o,t.repeater);return this.mapFacet({...m,...g,facet:p,spec:{...s?{width:s}:{},...c?{height:c}:{},...u?{view:u}:{},...l?{projection:l}:{},mark:a,encoding:h,...f?{params:f}:{}}},t)}getFacetMappingAndLayout(e,t){const{row:n,column:i,facet:r}=e;if(n||i){r&&vi(`Facet encoding dropped as ${(o=[...n?[J]:[],...i?[K]:[]]).join(" and ")} ${o.length>1?"are":"is"} also specified.`);const t={},a={};for(const n of[J,K]){const i=e[n];if(i){const{align:e,center:r,spacing:o,columns:s,...l}=i;t[n]=l;for(const e of["align","center","spacing"])void 0!==i[e]&&(a[e]??={},a[e][n]=i[e])}}return{facetMapping:t,layout:a}}{const{align:e,center:n,spacing:i,columns:o,...a}=r;return{facetMapping:fl(a,t.repeater),layout:{...e?{align:e}:{},...n?{center:n}:{},...i?{spacing:i}:{},...o?{columns:o}:{}}}}var o}mapLayer(e,t){let{parentEncoding:n,parentProjection:i,...r}=t;const{encoding:o,projection:a,...s}=e,l={...r,parentEncoding:bl({parentEncoding:n,encoding:o,layer:!0}),parentProjection:xl({parentProjection:i,projection:a})};return super.mapLayer({...s,...e.name?{name:[l.repeaterPrefix,e.name].filter((e=>e)).join("_")}:{}},l)}},Yl=new class extends Ks{map(e,t){return t.emptySelections??={},t.selectionPredicates??={},e=ql(e,t),super.map(e,t)}mapLayerOrUnit(e,t){if((e=ql(e,t)).encoding){const n={};for(const[i,r]of O(e.encoding))n[i]=Ul(r,t);e={...e,encoding:n}}return super.mapLayerOrUnit(e,t)}mapUnit(e,t){const{selection:n,...i}=e;return n?{...i,params:O(n).map((e=>{let[n,i]=e;const{init:r,bind:o,empty:a,...s}=i;"single"===s.type?(s.type="point",s.toggle=!1):"multi"===s.type&&(s.type="point"),t.emptySelections[n]="none"!==a;for(const e of F(t.selectionPredicates[n]??{}))e.empty="none"!==a;return{name:n,value:r,select:s,bind:o}}))}:e}},Xl=new Bl;function Ql(e){return t.isString(e)?{type:e}:e??{}}const Jl=["background","padding"];function Kl(e,t){const n={};for(const t of Jl)e&&void 0!==e[t]&&(n[t]=Dn(e[t]));return t&&(n.params=e.params),n}class Zl{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};this.explicit=e,this.implicit=t}clone(){return new Zl(l(this.explicit),l(this.implicit))}combine(){return{...this.explicit,...this.implicit}}get(e){return q(this.explicit[e],this.implicit[e])}getWithExplicit(e){return void 0!==this.explicit[e]?{explicit:!0,value:this.explicit[e]}:void 0!==this.implicit[e]?{explicit:!1,value:this.implicit[e]}:{explicit:!1,value:void 0}}setWithExplicit(e,t){let{value:n,explicit:i}=t;void 0!==n&&this.set(e,n,i)}set(e,t,n){return delete this[n?"implicit":"explicit"][e],this[n?"explicit":"implicit"][e]=t,this}copyKeyFromSplit(e,t){let{explicit:n,implicit:i}=t;void 0!==n[e]?this.set(e,n[e],!0):void 0!==i[e]&&this.set(e,i[e],!1)}copyKeyFromObject(e,t){void 0!==t[e]&&this.set(e,t[e],!0)}copyAll(e){for(const t of D(e.combine())){const n=e.getWithExplicit(t);this.setWithExplicit(t,n)}}}function ec(e){return{explicit:!0,value:e}}function tc(e){return{explicit:!1,value:e}}function nc(e){return(t,n,i,r)=>{const o=e(t.value,n.value);return o>0?t:o<0?n:ic(t,n,i,r)}}function ic(e,t,n,i){return e.explicit&&t.explicit&&vi(function(e,t,n,i){return`Conflicting ${t.toString()} property "${e.toString()}" (${X(n)} and ${X(i)}). Using ${X(n)}.`}(n,i,e.value,t.value)),e}function rc(e,t,n,i){let r=arguments.length>4&&void 0!==arguments[4]?arguments[4]:ic;return void 0===e||void 0===e.value?t:e.explicit&&!t.explicit?e:t.explicit&&!e.explicit?t:Y(e.value,t.value)?e:r(e,t,n,i)}class oc extends Zl{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];super(e,t),this.explicit=e,this.implicit=t,this.parseNothing=n}clone(){const e=super.clone();return e.parseNothing=this.parseNothing,e}}function ac(e){return Q(e,"url")}function sc(e){return Q(e,"values")}function lc(e){return Q(e,"name")&&!ac(e)&&!sc(e)&&!cc(e)}function cc(e){return e&&(uc(e)||fc(e)||dc(e))}function uc(e){return Q(e,"sequence")}function fc(e){return Q(e,"sphere")}function dc(e){return Q(e,"graticule")}let mc=function(e){return e[e.Raw=0]="Raw",e[e.Main=1]="Main",e[e.Row=2]="Row",e[e.Column=3]="Column",e[e.Lookup=4]="Lookup",e[e.PreFilterInvalid=5]="PreFilterInvalid",e[e.PostFilterInvalid=6]="PostFilterInvalid",e}({});function pc(e){let{invalid:t,isPath:n}=e;switch(so(t,{isPath:n})){case"filter":return{marks:"exclude-invalid-values",scales:"exclude-invalid-values"};case"break-paths-show-domains":return{marks:n?"include-invalid-values":"exclude-invalid-values",scales:"include-invalid-values"};case"break-paths-filter-domains":return{marks:n?"include-invalid-values":"exclude-invalid-values",scales:"exclude-invalid-values"};case"show":return{marks:"include-invalid-values",scales:"include-invalid-values"}}}function gc(e){const{signals:t,hasLegend:n,index:i,...r}=e;return r.field=E(r.field),r}function hc(e){let n=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t.identity;if(t.isArray(e)){const t=e.map((e=>hc(e,n,i)));return n?`[${t.join(", ")}]`:t}return bi(e)?i(n?Di(e):function(e){const t=Si(e,!0);return e.utc?+new Date(Date.UTC(...t)):+new Date(...t)}(e)):n?i(X(e)):e}function yc(e,n){for(const i of F(e.component.selection??{})){const r=i.name;let o=`${r}${Mu}, ${"global"===i.resolve?"true":`{unit: ${Uu(e)}}`}`;for(const t of qu)t.defined(i)&&(t.signals&&(n=t.signals(e,i,n)),t.modifyExpr&&(o=t.modifyExpr(e,i,o)));n.push({name:r+Ru,on:[{events:{signal:i.name+Mu},update:`modify(${t.stringValue(i.name+Eu)}, ${o})`}]})}return xc(n)}function vc(e,n){if(e.component.selection&&D(e.component.selection).length){const i=t.stringValue(e.getName("cell"));n.unshift({name:"facet",value:{},on:[{events:t.parseSelector("pointermove","scope"),update:`isTuple(facet) ? facet : group(${i}).datum`}]})}return xc(n)}function bc(e,t){for(const n of F(e.component.selection??{}))for(const i of qu)i.defined(n)&&i.marks&&(t=i.marks(e,n,t));return t}function xc(e){return e.map((e=>(e.on&&!e.on.length&&delete e.on,e)))}class $c{_children=[];_parent=null;constructor(e,t){this.debugName=t,e&&(this.parent=e)}clone(){throw new Error("Cannot clone node")}get parent(){return this._parent}set parent(e){this._parent=e,e&&e.addChild(this)}get children(){return this._children}numChildren(){return this._children.length}addChild(e,t){this._children.includes(e)?vi("Attempt to add the same child twice."):void 0!==t?this._children.splice(t,0,e):this._children.push(e)}removeChild(e){const t=this._children.indexOf(e);return this._children.splice(t,1),t}remove(){let e=this._parent.removeChild(this);for(const t of this._children)t._parent=this._parent,this._parent.addChild(t,e++)}insertAsParentOf(e){const t=e.parent;t.removeChild(this),this.parent=t,e.parent=this}swapWithParent(){const e=this._parent,t=e.parent;for(const t of this._children)t.parent=e;this._children=[],e.removeChild(this);const n=e.parent.removeChild(e);this._parent=t,t.addChild(this,n),e.parent=this}}class wc extends $c{clone(){const e=new this.constructor;return e.debugName=`clone_${this.debugName}`,e._source=this._source,e._name=`clone_${this._name}`,e.type=this.type,e.refCounts=this.refCounts,e.refCounts[e._name]=0,e}constructor(e,t,n,i){super(e,t),this.type=n,this.refCounts=i,this._source=this._name=t,this.refCounts&&!(this._name in this.refCounts)&&(this.refCounts[this._name]=0)}dependentFields(){return new Set}producedFields(){return new Set}hash(){return void 0===this._hash&&(this._hash=`Output ${W()}`),this._hash}getSource(){return this.refCounts[this._name]++,this._source}isRequired(){return!!this.refCounts[this._name]}setSource(e){this._source=e}}function kc(e){return void 0!==e.as}function Sc(e){return`${e}_end`}class Dc extends $c{clone(){return new Dc(null,l(this.timeUnits))}constructor(e,t){super(e),this.timeUnits=t}static makeFromEncoding(e,t){const n=t.reduceFieldDef(((e,n,i)=>{const{field:r,timeUnit:o}=n;if(o){let a;if(zi(o)){if(Sm(t)){const{mark:e,markDef:i,config:s}=t,l=qo({fieldDef:n,markDef:i,config:s});(Yr(e)||l)&&(a={timeUnit:Mi(o),field:r})}}else a={as:sa(n,{forAs:!0}),field:r,timeUnit:o};if(Sm(t)){const{mark:e,markDef:r,config:o}=t,s=qo({fieldDef:n,markDef:r,config:o});Yr(e)&&zt(i)&&.5!==s&&(a.rectBandPosition=s)}a&&(e[d(a)]=a)}return e}),{});return S(n)?null:new Dc(e,n)}static makeFromTransform(e,t){const{timeUnit:n,...i}={...t},r={...i,timeUnit:Mi(n)};return new Dc(e,{[d(r)]:r})}merge(e){this.timeUnits={...this.timeUnits};for(const t in e.timeUnits)this.timeUnits[t]||(this.timeUnits[t]=e.timeUnits[t]);for(const t of e.children)e.removeChild(t),t.parent=this;e.remove()}removeFormulas(e){const t={};for(const[n,i]of O(this.timeUnits)){const r=kc(i)?i.as:`${i.field}_end`;e.has(r)||(t[n]=i)}this.timeUnits=t}producedFields(){return new Set(F(this.timeUnits).map((e=>kc(e)?e.as:Sc(e.field))))}dependentFields(){return new Set(F(this.timeUnits).map((e=>e.field)))}hash(){return`TimeUnit ${d(this.timeUnits)}`}assemble(){const e=[];for(const t of F(this.timeUnits)){const{rectBandPosition:n}=t,i=Mi(t.timeUnit);if(kc(t)){const{field:r,as:o}=t,{unit:a,utc:s,...l}=i,c=[o,`${o}_end`];e.push({field:E(r),type:"timeunit",...a?{units:_i(a)}:{},...s?{timezone:"utc"}:{},...l,as:c}),e.push(...Cc(c,n,i))}else if(t){const{field:r}=t,o=r.replaceAll("\\.","."),a=zc({timeUnit:i,field:o}),s=Sc(o);e.push({type:"formula",expr:a,as:s}),e.push(...Cc([o,s],n,i))}}return e}}const Fc="offsetted_rect_start",Oc="offsetted_rect_end";function zc(e){let{timeUnit:t,field:n,reverse:i}=e;const{unit:r,utc:o}=t,a=Ai(r),{part:s,step:l}=qi(a,t.step);return`${o?"utcOffset":"timeOffset"}('${s}', datum['${n}'], ${i?-l:l})`}function Cc(e,t,n){let[i,r]=e;if(void 0!==t&&.5!==t){const e=`datum['${i}']`,o=`datum['${r}']`;return[{type:"formula",expr:Nc([zc({timeUnit:n,field:i,reverse:!0}),e],t+.5),as:`${i}_${Fc}`},{type:"formula",expr:Nc([e,o],t+.5),as:`${i}_${Oc}`}]}return[]}function Nc(e,t){let[n,i]=e;return`${1-t} * ${n} + ${t} * ${i}`}const Pc="_tuple_fields";class _c{constructor(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];this.items=t,this.hasChannel={},this.hasField={},this.hasSelectionId=!1}}const Ac={defined:()=>!0,parse:(e,n,i)=>{const r=n.name,o=n.project??=new _c,a={},s={},l=new Set,c=(e,t)=>{const n="visual"===t?e.channel:e.field;let i=C(`${r}_${n}`);for(let e=1;l.has(i);e++)i=C(`${r}_${n}_${e}`);return l.add(i),{[t]:i}},u=n.type,f=e.config.selection[u],m=void 0!==i.value?t.array(i.value):null;let{fields:p,encodings:g}=t.isObject(i.select)?i.select:{};if(!p&&!g&&m)for(const e of m)if(t.isObject(e))for(const n of D(e))h=n,t.hasOwnProperty(Ke,h)?(g||(g=[])).push(n):"interval"===u?(vi('Interval selections should be initialized using "x", "y", "longitude", or "latitude" keys.'),g=f.encodings):(p??=[]).push(n);var h;p||g||(g=f.encodings,"fields"in f&&(p=f.fields));for(const t of g??[]){const n=e.fieldDef(t);if(n){let i=n.field;if(n.aggregate){vi(Gn(t,n.aggregate));continue}if(!i){vi(Hn(t));continue}if(n.timeUnit&&!zi(n.timeUnit)){i=e.vgField(t);const r={timeUnit:n.timeUnit,as:i,field:n.field};s[d(r)]=r}if(!a[i]){const r={field:i,channel:t,type:"interval"===u&&Ht(t)&&vr(e.getScaleComponent(t).get("type"))?"R":n.bin?"R-RE":"E",index:o.items.length};r.signals={...c(r,"data"),...c(r,"visual")},o.items.push(a[i]=r),o.hasField[i]=a[i],o.hasSelectionId=o.hasSelectionId||i===ws,Me(t)?(r.geoChannel=t,r.channel=Ee(t),o.hasChannel[r.channel]=a[i]):o.hasChannel[t]=a[i]}}else vi(Hn(t))}for(const e of p??[]){if(o.hasField[e])continue;const t={type:"E",field:e,index:o.items.length};t.signals={...c(t,"data")},o.items.push(t),o.hasField[e]=t,o.hasSelectionId=o.hasSelectionId||e===ws}m&&(n.init=m.map((e=>o.items.map((n=>t.isObject(e)?void 0!==e[n.geoChannel||n.channel]?e[n.geoChannel||n.channel]:e[n.field]:e))))),S(s)||(o.timeUnit=new Dc(null,s))},signals:(e,t,n)=>{const i=t.name+Pc;return n.filter((e=>e.name===i)).length>0||t.project.hasSelectionId?n:n.concat({name:i,value:t.project.items.map(gc)})}},Tc={defined:e=>"interval"===e.type&&"global"===e.resolve&&e.bind&&"scales"===e.bind,parse:(e,t)=>{const n=t.scales=[];for(const i of t.project.items){const r=i.channel;if(!Ht(r))continue;const o=e.getScaleComponent(r),a=o?o.get("type"):void 0;"sequential"==a&&vi("Sequntial scales are deprecated. The available quantitative scale type values are linear, log, pow, sqrt, symlog, time and utc"),o&&vr(a)?(o.set("selectionExtent",{param:t.name,field:i.field},!0),n.push(i)):vi("Scale bindings are currently only supported for scales with unbinned, continuous domains.")}},topLevelSignals:(e,n,i)=>{const r=n.scales.filter((e=>0===i.filter((t=>t.name===e.signals.data)).length));if(!e.parent||Ec(e)||0===r.length)return i;const o=i.find((e=>e.name===n.name));let a=o.update;if(a.includes(Lu))o.update=`{${r.map((e=>`${t.stringValue(E(e.field))}: ${e.signals.data}`)).join(", ")}}`;else{for(const e of r){const n=`${t.stringValue(E(e.field))}: ${e.signals.data}`;a.includes(n)||(a=`${a.substring(0,a.length-1)}, ${n}}`)}o.update=a}return i.concat(r.map((e=>({name:e.signals.data}))))},signals:(e,t,n)=>{if(e.parent&&!Ec(e))for(const e of t.scales){const t=n.find((t=>t.name===e.signals.data));t.push="outer",delete t.value,delete t.update}return n}};function jc(e,n){return`domain(${t.stringValue(e.scaleName(n))})`}function Ec(e){return e.parent&&Om(e.parent)&&(!e.parent.parent??Ec(e.parent.parent))}const Mc="_brush",Rc="_scale_trigger",Lc="geo_interval_init_tick",qc="_init",Uc={defined:e=>"interval"===e.type,parse:(e,n,i)=>{if(e.hasProjection){const e={...t.isObject(i.select)?i.select:{}};e.fields=[ws],e.encodings||(e.encodings=i.value?D(i.value):[fe,ue]),i.select={type:"interval",...e}}if(n.translate&&!Tc.defined(n)){const e=`!event.item || event.item.mark.name !== ${t.stringValue(n.name+Mc)}`;for(const i of n.events){if(!i.between){vi(`${i} is not an ordered event stream for interval selections.`);continue}const n=t.array(i.between[0].filter??=[]);n.includes(e)||n.push(e)}}},signals:(e,n,i)=>{const r=n.name,o=r+Mu,a=F(n.project.hasChannel).filter((e=>e.channel===ee||e.channel===te)),s=n.init?n.init[0]:null;if(i.push(...a.reduce(((i,r)=>i.concat(function(e,n,i,r){const o=!e.hasProjection,a=i.channel,s=i.signals.visual,l=t.stringValue(o?e.scaleName(a):e.projectionName()),c=e=>`scale(${l}, ${e})`,u=e.getSizeSignalRef(a===ee?"width":"height").signal,f=`${a}(unit)`,d=n.events.reduce(((e,t)=>[...e,{events:t.between[0],update:`[${f}, ${f}]`},{events:t,update:`[${s}[0], clamp(${f}, 0, ${u})]`}]),[]);if(o){const t=i.signals.data,o=Tc.defined(n),u=e.getScaleComponent(a),f=u?u.get("type"):void 0,m=r?{init:hc(r,!0,c)}:{value:[]};return d.push({events:{signal:n.name+Rc},update:vr(f)?`[${c(`${t}[0]`)}, ${c(`${t}[1]`)}]`:"[0, 0]"}),o?[{name:t,on:[]}]:[{name:s,...m,on:d},{name:t,...r?{init:hc(r)}:{},on:[{events:{signal:s},update:`${s}[0] === ${s}[1] ? null : invert(${l}, ${s})`}]}]}{const e=a===ee?0:1,t=n.name+qc;return[{name:s,...r?{init:`[${t}[0][${e}], ${t}[1][${e}]]`}:{value:[]},on:d}]}}(e,n,r,s&&s[r.index]))),[])),e.hasProjection){const l=t.stringValue(e.projectionName()),c=e.projectionName()+"_center",{x:u,y:f}=n.project.hasChannel,d=u&&u.signals.visual,m=f&&f.signals.visual,p=u?s&&s[u.index]:`${c}[0]`,g=f?s&&s[f.index]:`${c}[1]`,h=t=>e.getSizeSignalRef(t).signal,y=`[[${d?d+"[0]":"0"}, ${m?m+"[0]":"0"}],[${d?d+"[1]":h("width")}, ${m?m+"[1]":h("height")}]]`;if(s&&(i.unshift({name:r+qc,init:`[scale(${l}, [${u?p[0]:p}, ${f?g[0]:g}]), scale(${l}, [${u?p[1]:p}, ${f?g[1]:g}])]`}),!u||!f)){i.find((e=>e.name===c))||i.unshift({name:c,update:`invert(${l}, [${h("width")}/2, ${h("height")}/2])`})}const v=`vlSelectionTuples(${`intersect(${y}, {markname: ${t.stringValue(e.getName("marks"))}}, unit.mark)`}, ${`{unit: ${Uu(e)}}`})`,b=a.map((e=>e.signals.visual));return i.concat({name:o,on:[{events:[...b.length?[{signal:b.join(" || ")}]:[],...s?[{signal:Lc}]:[]],update:v}]})}{if(!Tc.defined(n)){const n=r+Rc,o=a.map((n=>{const i=n.channel,{data:r,visual:o}=n.signals,a=t.stringValue(e.scaleName(i)),s=vr(e.getScaleComponent(i).get("type"))?"+":"";return`(!isArray(${r}) || (${s}invert(${a}, ${o})[0] === ${s}${r}[0] && ${s}invert(${a}, ${o})[1] === ${s}${r}[1]))`}));o.length&&i.push({name:n,value:{},on:[{events:a.map((t=>({scale:e.scaleName(t.channel)}))),update:o.join(" && ")+` ? ${n} : {}`}]})}const l=a.map((e=>e.signals.data)),c=`unit: ${Uu(e)}, fields: ${r+Pc}, values`;return i.concat({name:o,...s?{init:`{${c}: ${hc(s)}}`}:{},...l.length?{on:[{events:[{signal:l.join(" || ")}],update:`${l.join(" && ")} ? {${c}: [${l}]} : null`}]}:{}})}},topLevelSignals:(e,t,n)=>{if(Sm(e)&&e.hasProjection&&t.init){n.filter((e=>e.name===Lc)).length||n.unshift({name:Lc,value:null,on:[{events:"timer{1}",update:`${Lc} === null ? {} : ${Lc}`}]})}return n},marks:(e,n,i)=>{const r=n.name,{x:o,y:a}=n.project.hasChannel,s=o?.signals.visual,l=a?.signals.visual,c=`data(${t.stringValue(n.name+Eu)})`;if(Tc.defined(n)||!o&&!a)return i;const u={x:void 0!==o?{signal:`${s}[0]`}:{value:0},y:void 0!==a?{signal:`${l}[0]`}:{value:0},x2:void 0!==o?{signal:`${s}[1]`}:{field:{group:"width"}},y2:void 0!==a?{signal:`${l}[1]`}:{field:{group:"height"}}};if("global"===n.resolve)for(const t of D(u))u[t]=[{test:`${c}.length && ${c}[0].unit === ${Uu(e)}`,...u[t]},{value:0}];const{fill:f,fillOpacity:d,cursor:m,...p}=n.mark,g=D(p).reduce(((e,t)=>(e[t]=[{test:[void 0!==o&&`${s}[0] !== ${s}[1]`,void 0!==a&&`${l}[0] !== ${l}[1]`].filter((e=>e)).join(" && "),value:p[t]},{value:null}],e)),{}),h=m??(n.translate?"move":null);return[{name:`${r+Mc}_bg`,type:"rect",clip:!0,encode:{enter:{fill:{value:f},fillOpacity:{value:d}},update:u}},...i,{name:r+Mc,type:"rect",clip:!0,encode:{enter:{...h?{cursor:{value:h}}:{},fill:{value:"transparent"}},update:{...u,...g}}}]}};const Wc={defined:e=>"point"===e.type,signals:(e,n,i)=>{const r=n.name,o=r+Pc,a=n.project,s="(item().isVoronoi ? datum.datum : datum)",l=F(e.component.selection??{}).reduce(((e,t)=>"interval"===t.type?e.concat(t.name+Mc):e),[]).map((e=>`indexof(item().mark.name, '${e}') < 0`)).join(" && "),c="datum && item().mark.marktype !== 'group' && indexof(item().mark.role, 'legend') < 0"+(l?` && ${l}`:"");let u=`unit: ${Uu(e)}, `;if(n.project.hasSelectionId)u+=`${ws}: ${s}[${t.stringValue(ws)}]`;else{u+=`fields: ${o}, values: [${a.items.map((n=>{const i=e.fieldDef(n.channel);return i?.bin?`[${s}[${t.stringValue(e.vgField(n.channel,{}))}], ${s}[${t.stringValue(e.vgField(n.channel,{binSuffix:"end"}))}]]`:`${s}[${t.stringValue(n.field)}]`})).join(", ")}]`}const f=n.events;return i.concat([{name:r+Mu,on:f?[{events:f,update:`${c} ? {${u}} : null`,force:!0}]:[]}])}};function Ic(e){let{model:n,channelDef:i,vgChannel:r,invalidValueRef:o,mainRefFn:a}=e;const s=Bo(i)&&i.condition;let l=[];if(s){l=t.array(s).map((e=>{const t=a(e);if(function(e){return Q(e,"param")}(e)){const{param:i,empty:r}=e;return{test:Yu(n,{param:i,empty:r}),...t}}return{test:Qu(n,e.test),...t}}))}void 0!==o&&l.push(o);const c=a(i);return void 0!==c&&l.push(c),l.length>1||1===l.length&&Boolean(l[0].test)?{[r]:l}:1===l.length?{[r]:l[0]}:{}}function Bc(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"text";const n=e.encoding[t];return Ic({model:e,channelDef:n,vgChannel:t,mainRefFn:t=>Vc(t,e.config),invalidValueRef:void 0})}function Vc(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"datum";if(e){if(ta(e))return On(e.value);if(Zo(e)){const{format:i,formatType:r}=ga(e);return $o({fieldOrDatumDef:e,format:i,formatType:r,expr:n,config:t})}}}function Hc(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{encoding:i,markDef:r,config:o,stack:a}=e,s=i.tooltip;if(t.isArray(s))return{tooltip:Yc({tooltip:s},a,o,n)};{const l=n.reactiveGeom?"datum.datum":"datum";return Ic({model:e,channelDef:s,vgChannel:"tooltip",mainRefFn:e=>{const s=Vc(e,o,l);if(s)return s;if(null===e)return;let c=_n("tooltip",r,o);return!0===c&&(c={content:"encoding"}),t.isString(c)?{value:c}:t.isObject(c)?vn(c)?c:"encoding"===c.content?Yc(i,a,o,n):{signal:l}:void 0},invalidValueRef:void 0})}}function Gc(e,n,i){let{reactiveGeom:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const o={...i,...i.tooltipFormat},a=new Set,s=r?"datum.datum":"datum",l=[];function c(i,r){const c=nt(r),u=ea(i)?i:{...i,type:e[c].type},f=u.title||pa(u,o),d=t.array(f).join(", ").replaceAll(/"/g,'\\"');let m;if(zt(r)){const t="x"===r?"x2":"y2",n=ha(e[t]);if(un(u.bin)&&n){const e=sa(u,{expr:s}),i=sa(n,{expr:s}),{format:r,formatType:l}=ga(u);m=Co(e,i,r,l,o),a.add(t)}}if((zt(r)||r===le||r===ae)&&n&&n.fieldChannel===r&&"normalize"===n.offset){const{format:e,formatType:t}=ga(u);m=$o({fieldOrDatumDef:u,format:e,formatType:t,expr:s,config:o,normalizeStack:!0}).signal}m??=Vc(u,o,s).signal,l.push({channel:r,key:d,value:m})}Ba(e,((e,t)=>{Go(e)?c(e,t):Vo(e)&&c(e.condition,t)}));const u={};for(const{channel:e,key:t,value:n}of l)a.has(e)||u[t]||(u[t]=n);return u}function Yc(e,t,n){let{reactiveGeom:i}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const r=Gc(e,t,n,{reactiveGeom:i}),o=O(r).map((e=>{let[t,n]=e;return`"${t}": ${n}`}));return o.length>0?{signal:`{${o.join(", ")}}`}:void 0}function Xc(e){const{markDef:t,config:n}=e,i=_n("aria",t,n);return!1===i?{}:{...i?{aria:i}:{},...Qc(e),...Jc(e)}}function Qc(e){const{mark:n,markDef:i,config:r}=e;if(!1===r.aria)return{};const o=_n("ariaRoleDescription",i,r);return null!=o?{ariaRoleDescription:{value:o}}:t.hasOwnProperty(wn,n)?{}:{ariaRoleDescription:{value:n}}}function Jc(e){const{encoding:t,markDef:n,config:i,stack:r}=e,o=t.description;if(o)return Ic({model:e,channelDef:o,vgChannel:"description",mainRefFn:t=>Vc(t,e.config),invalidValueRef:void 0});const a=_n("description",n,i);if(null!=a)return{description:On(a)};if(!1===i.aria)return{};const s=Gc(t,r,i);return S(s)?void 0:{description:{signal:O(s).map(((e,t)=>{let[n,i]=e;return`"${t>0?"; ":""}${n}: " + (${i})`})).join(" + ")}}}function Kc(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const{markDef:i,encoding:r,config:o}=t,{vgChannel:a}=n;let{defaultRef:s,defaultValue:l}=n;const c=r[e];void 0===s&&(l??=_n(e,i,o,{vgChannel:a,ignoreVgConfig:!Bo(c)}),void 0!==l&&(s=On(l)));const u={markDef:i,config:o,scaleName:t.scaleName(e),scale:t.getScaleComponent(e)},f=uo({...u,scaleChannel:e,channelDef:c});return Ic({model:t,channelDef:c,vgChannel:a??e,invalidValueRef:f,mainRefFn:t=>ho({...u,channel:e,channelDef:t,stack:null,defaultRef:s})})}function Zc(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{filled:void 0};const{markDef:n,encoding:i,config:r}=e,{type:o}=n,a=t.filled??_n("filled",n,r),s=p(["bar","point","circle","square","geoshape"],o)?"transparent":void 0,l=_n(!0===a?"color":void 0,n,r,{vgChannel:"fill"})??r.mark[!0===a&&"color"]??s,c=_n(!1===a?"color":void 0,n,r,{vgChannel:"stroke"})??r.mark[!1===a&&"color"],u=a?"fill":"stroke",f={...l?{fill:On(l)}:{},...c?{stroke:On(c)}:{}};return n.color&&(a?n.fill:n.stroke)&&vi(ti("property",{fill:"fill"in n,stroke:"stroke"in n})),{...f,...Kc("color",e,{vgChannel:u,defaultValue:a?l:c}),...Kc("fill",e,{defaultValue:i.fill?l:void 0}),...Kc("stroke",e,{defaultValue:i.stroke?c:void 0})}}function eu(e){const{encoding:t,mark:n}=e,i=t.order;return!Gr(n)&&ta(i)?Ic({model:e,channelDef:i,vgChannel:"zindex",mainRefFn:e=>On(e.value),invalidValueRef:void 0}):{}}function tu(e){let{channel:t,markDef:n,encoding:i={},model:r,bandPosition:o}=e;const a=`${t}Offset`,s=n[a],l=i[a];if(("xOffset"===a||"yOffset"===a)&&l){return{offsetType:"encoding",offset:ho({channel:a,channelDef:l,markDef:n,config:r?.config,scaleName:r.scaleName(a),scale:r.getScaleComponent(a),stack:null,defaultRef:On(s),bandPosition:o})}}const c=n[a];return c?{offsetType:"visual",offset:c}:{}}function nu(e,t,n){let{defaultPos:i,vgChannel:r}=n;const{encoding:o,markDef:a,config:s,stack:l}=t,c=o[e],u=o[rt(e)],f=t.scaleName(e),d=t.getScaleComponent(e),{offset:m,offsetType:p}=tu({channel:e,markDef:a,encoding:o,model:t,bandPosition:.5}),g=iu({model:t,defaultPos:i,channel:e,scaleName:f,scale:d}),h=!c&&zt(e)&&(o.latitude||o.longitude)?{field:t.getName(e)}:function(e){const{channel:t,channelDef:n,scaleName:i,stack:r,offset:o,markDef:a}=e;if(Zo(n)&&r&&t===r.fieldChannel){if(Go(n)){let e=n.bandPosition;if(void 0!==e||"text"!==a.type||"radius"!==t&&"theta"!==t||(e=.5),void 0!==e)return go({scaleName:i,fieldOrDatumDef:n,startSuffix:"start",bandPosition:e,offset:o})}return po(n,i,{suffix:"end"},{offset:o})}return mo(e)}({channel:e,channelDef:c,channel2Def:u,markDef:a,config:s,scaleName:f,scale:d,stack:l,offset:m,defaultRef:g,bandPosition:"encoding"===p?0:void 0});return h?{[r||e]:h}:void 0}function iu(e){let{model:t,defaultPos:n,channel:i,scaleName:r,scale:o}=e;const{markDef:a,config:s}=t;return()=>{const e=nt(i),l=it(i),c=_n(i,a,s,{vgChannel:l});if(void 0!==c)return yo(i,c);switch(n){case"zeroOrMin":return ru({scaleName:r,scale:o,mode:"zeroOrMin",mainChannel:e,config:s});case"zeroOrMax":return ru({scaleName:r,scale:o,mode:{zeroOrMax:{widthSignal:t.width.signal,heightSignal:t.height.signal}},mainChannel:e,config:s});case"mid":return{...t[ot(i)],mult:.5}}}}function ru(e){let{mainChannel:t,config:n,...i}=e;const r=co(i),{mode:o}=i;if(r)return r;switch(t){case"radius":{if("zeroOrMin"===o)return{value:0};const{widthSignal:e,heightSignal:t}=o.zeroOrMax;return{signal:`min(${e},${t})/2`}}case"theta":return"zeroOrMin"===o?{value:0}:{signal:"2*PI"};case"x":return"zeroOrMin"===o?{value:0}:{field:{group:"width"}};case"y":return"zeroOrMin"===o?{field:{group:"height"}}:{value:0}}}const ou={left:"x",center:"xc",right:"x2"},au={top:"y",middle:"yc",bottom:"y2"};function su(e,t,n){let i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"middle";if("radius"===e||"theta"===e)return it(e);const r="x"===e?"align":"baseline",o=_n(r,t,n);let a;return vn(o)?(vi(function(e){return`The ${e} for range marks cannot be an expression`}(r)),a=void 0):a=o,"x"===e?ou[a||("top"===i?"left":"center")]:au[a||i]}function lu(e,t,n){let{defaultPos:i,defaultPos2:r,range:o}=n;return o?cu(e,t,{defaultPos:i,defaultPos2:r}):nu(e,t,{defaultPos:i})}function cu(e,t,n){let{defaultPos:i,defaultPos2:r}=n;const{markDef:o,config:a}=t,s=rt(e),l=ot(e),c=function(e,t,n){const{encoding:i,mark:r,markDef:o,stack:a,config:s}=e,l=nt(n),c=ot(n),u=it(n),f=i[l],d=e.scaleName(l),m=e.getScaleComponent(l),{offset:p}=tu(n in i||n in o?{channel:n,markDef:o,encoding:i,model:e}:{channel:l,markDef:o,encoding:i,model:e});if(!f&&("x2"===n||"y2"===n)&&(i.latitude||i.longitude)){const t=ot(n),i=e.markDef[t];return null!=i?{[t]:{value:i}}:{[u]:{field:e.getName(n)}}}const g=function(e){let{channel:t,channelDef:n,channel2Def:i,markDef:r,config:o,scaleName:a,scale:s,stack:l,offset:c,defaultRef:u}=e;if(Zo(n)&&l&&t.charAt(0)===l.fieldChannel.charAt(0))return po(n,a,{suffix:"start"},{offset:c});return mo({channel:t,channelDef:i,scaleName:a,scale:s,stack:l,markDef:r,config:o,offset:c,defaultRef:u})}({channel:n,channelDef:f,channel2Def:i[n],markDef:o,config:s,scaleName:d,scale:m,stack:a,offset:p,defaultRef:void 0});if(void 0!==g)return{[u]:g};return uu(n,o)||uu(n,{[n]:Tn(n,o,s.style),[c]:Tn(c,o,s.style)})||uu(n,s[r])||uu(n,s.mark)||{[u]:iu({model:e,defaultPos:t,channel:n,scaleName:d,scale:m})()}}(t,r,s);return{...nu(e,t,{defaultPos:i,vgChannel:c[l]?su(e,o,a):it(e)}),...c}}function uu(e,t){const n=ot(e),i=it(e);if(void 0!==t[i])return{[i]:yo(e,t[i])};if(void 0!==t[e])return{[i]:yo(e,t[e])};if(t[n]){const i=t[n];if(!no(i))return{[n]:yo(e,i)};vi(function(e){return`Position range does not support relative band size for ${e}.`}(n))}}function fu(e,n){const{config:i,encoding:r,markDef:o}=e,a=o.type,s=rt(n),l=ot(n),c=r[n],u=r[s],f=e.getScaleComponent(n),d=f?f.get("type"):void 0,m=o.orient,p=r[l]??r.size??_n("size",o,i,{vgChannel:l}),g=at(n),h="bar"===a&&("x"===n?"vertical"===m:"horizontal"===m)||"tick"===a&&("y"===n?"vertical"===m:"horizontal"===m);return!Go(c)||!(cn(c.bin)||un(c.bin)||c.timeUnit&&!u)||p&&!no(p)||r[g]||yr(d)?(Zo(c)&&yr(d)||h)&&!u?function(e,n,i){const{markDef:r,encoding:o,config:a,stack:s}=i,l=r.orient,c=i.scaleName(n),u=i.getScaleComponent(n),f=ot(n),d=rt(n),m=at(n),p=i.scaleName(m),g=i.getScaleComponent(st(n)),h="tick"===r.type||"horizontal"===l&&"y"===n||"vertical"===l&&"x"===n;let y;(o.size||r.size)&&(h?y=Kc("size",i,{vgChannel:f,defaultRef:On(r.size)}):vi(function(e){return`Cannot apply size to non-oriented mark "${e}".`}(r.type)));const v=!!y,b=Uo({channel:n,fieldDef:e,markDef:r,config:a,scaleType:(u||g)?.get("type"),useVlSizeChannel:h});y=y||{[f]:du(f,p||c,g||u,a,b,!!e,r.type)};const x="band"===(u||g)?.get("type")&&no(b)&&!v?"top":"middle",$=su(n,r,a,x),w="xc"===$||"yc"===$,{offset:k,offsetType:S}=tu({channel:n,markDef:r,encoding:o,model:i,bandPosition:w?.5:0}),D=mo({channel:n,channelDef:e,markDef:r,config:a,scaleName:c,scale:u,stack:s,offset:k,defaultRef:iu({model:i,defaultPos:"mid",channel:n,scaleName:c,scale:u}),bandPosition:w?"encoding"===S?0:.5:vn(b)?{signal:`(1-${b})/2`}:no(b)?(1-b.band)/2:0});if(f)return{[$]:D,...y};{const e=it(d),n=y[f],i=k?{...n,offset:k}:n;return{[$]:D,[e]:t.isArray(D)?[D[0],{...D[1],offset:i}]:{...D,offset:i}}}}(c,n,e):cu(n,e,{defaultPos:"zeroOrMax",defaultPos2:"zeroOrMin"}):function(e){let{fieldDef:t,fieldDef2:n,channel:i,model:r}=e;const{config:o,markDef:a,encoding:s}=r,l=r.getScaleComponent(i),c=r.scaleName(i),u=l?l.get("type"):void 0,f=l.get("reverse"),d=Uo({channel:i,fieldDef:t,markDef:a,config:o,scaleType:u}),m=r.component.axes[i]?.[0],p=m?.get("translate")??.5,g=zt(i)?_n("binSpacing",a,o)??0:0,h=rt(i),y=it(i),v=it(h),b=An("minBandSize",a,o),{offset:x}=tu({channel:i,markDef:a,encoding:s,model:r,bandPosition:0}),{offset:$}=tu({channel:h,markDef:a,encoding:s,model:r,bandPosition:0}),w=function(e){let{scaleName:t,fieldDef:n}=e;const i=sa(n,{expr:"datum"});return`abs(scale("${t}", ${sa(n,{expr:"datum",suffix:"end"})}) - scale("${t}", ${i}))`}({fieldDef:t,scaleName:c}),k=mu(i,g,f,p,x,b,w),S=mu(h,g,f,p,$??x,b,w),D=vn(d)?{signal:`(1-${d.signal})/2`}:no(d)?(1-d.band)/2:.5,F=qo({fieldDef:t,fieldDef2:n,markDef:a,config:o});if(cn(t.bin)||t.timeUnit){const e=t.timeUnit&&.5!==F;return{[v]:pu({fieldDef:t,scaleName:c,bandPosition:D,offset:S,useRectOffsetField:e}),[y]:pu({fieldDef:t,scaleName:c,bandPosition:vn(D)?{signal:`1-${D.signal}`}:1-D,offset:k,useRectOffsetField:e})}}if(un(t.bin)){const e=po(t,c,{},{offset:S});if(Go(n))return{[v]:e,[y]:po(n,c,{},{offset:k})};if(fn(t.bin)&&t.bin.step)return{[v]:e,[y]:{signal:`scale("${c}", ${sa(t,{expr:"datum"})} + ${t.bin.step})`,offset:k}}}return void vi(gi(h))}({fieldDef:c,fieldDef2:u,channel:n,model:e})}function du(e,n,i,r,o,a,s){if(no(o)){if(!i)return{mult:o.band,field:{group:e}};{const e=i.get("type");if("band"===e){let e=`bandwidth('${n}')`;1!==o.band&&(e=`${o.band} * ${e}`);const t=An("minBandSize",{type:s},r);return{signal:t?`max(${Cn(t)}, ${e})`:e}}1!==o.band&&(vi(function(e){return`Cannot use the relative band size with ${e} scale.`}(e)),o=void 0)}}else{if(vn(o))return o;if(o)return{value:o}}if(i){const e=i.get("range");if(bn(e)&&t.isNumber(e.step))return{value:e.step-2}}if(!a){const{bandPaddingInner:n,barBandPaddingInner:i,rectBandPaddingInner:o,tickBandPaddingInner:a}=r.scale,l=q(n,"tick"===s?a:"bar"===s?i:o);if(vn(l))return{signal:`(1 - (${l.signal})) * ${e}`};if(t.isNumber(l))return{signal:`${1-l} * ${e}`}}return{value:Es(r.view,e)-2}}function mu(e,t,n,i,r,o,a){if(Te(e))return 0;const s="x"===e||"y2"===e,l=s?-t/2:t/2;if(vn(n)||vn(r)||vn(i)||o){const e=Cn(n),t=Cn(r),c=Cn(i),u=Cn(o),f=o?`(${a} < ${u} ? ${s?"":"-"}0.5 * (${u} - (${a})) : ${l})`:l;return{signal:(c?`${c} + `:"")+(e?`(${e} ? -1 : 1) * `:"")+(t?`(${t} + ${f})`:f)}}return r=r||0,i+(n?-r-l:+r+l)}function pu(e){let{fieldDef:t,scaleName:n,bandPosition:i,offset:r,useRectOffsetField:o}=e;return go({scaleName:n,fieldOrDatumDef:t,bandPosition:i,offset:r,...o?{startSuffix:Fc,endSuffix:Oc}:{}})}const gu=new Set(["aria","width","height"]);function hu(e,t){const{fill:n,stroke:i}="include"===t.color?Zc(e):{};return{...vu(e.markDef,t),...yu("fill",n),...yu("stroke",i),...Kc("opacity",e),...Kc("fillOpacity",e),...Kc("strokeOpacity",e),...Kc("strokeWidth",e),...Kc("strokeDash",e),...eu(e),...Hc(e),...Bc(e,"href"),...Xc(e)}}function yu(e,t){return t?{[e]:t}:{}}function vu(e,t){return $n.reduce(((n,i)=>(!gu.has(i)&&Q(e,i)&&"ignore"!==t[i]&&(n[i]=On(e[i])),n)),{})}function bu(e){const{config:t,markDef:n}=e,i=new Set;if(e.forEachFieldDef(((r,o)=>{let a;if(!Ht(o)||!(a=e.getScaleType(o)))return;const s=on(r.aggregate),l=lo({scaleChannel:o,markDef:n,config:t,scaleType:a,isCountAggregate:s});if("break-paths-filter-domains"===(c=l)||"break-paths-show-domains"===c){const t=e.vgField(o,{expr:"datum",binSuffix:e.stack?.impute?"mid":void 0});t&&i.add(t)}var c})),i.size>0){return{defined:{signal:[...i].map((e=>Ji(e,!0))).join(" && ")}}}}function xu(e,t){if(void 0!==t)return{[e]:On(t)}}const $u="voronoi",wu={defined:e=>"point"===e.type&&e.nearest,parse:(e,t)=>{if(t.events)for(const n of t.events)n.markname=e.getName($u)},marks:(e,t,n)=>{const{x:i,y:r}=t.project.hasChannel,o=e.mark;if(Gr(o))return vi(`The "nearest" transform is not supported for ${o} marks.`),n;const a={name:e.getName($u),type:"path",interactive:!0,from:{data:e.getName("marks")},encode:{update:{fill:{value:"transparent"},strokeWidth:{value:.35},stroke:{value:"transparent"},isVoronoi:{value:!0},...Hc(e,{reactiveGeom:!0})}},transform:[{type:"voronoi",x:{expr:i||!r?"datum.datum.x || 0":"0"},y:{expr:r||!i?"datum.datum.y || 0":"0"},size:[e.getSizeSignalRef("width"),e.getSizeSignalRef("height")]}]};let s=0,l=!1;return n.forEach(((t,n)=>{const i=t.name??"";i===e.component.mark[0].name?s=n:i.includes($u)&&(l=!0)})),l||n.splice(s+1,0,a),n}},ku={defined:e=>"point"===e.type&&"global"===e.resolve&&e.bind&&"scales"!==e.bind&&!Ss(e.bind),parse:(e,t,n)=>Iu(t,n),topLevelSignals:(e,n,i)=>{const r=n.name,o=n.project,a=n.bind,s=n.init&&n.init[0],l=wu.defined(n)?"(item().isVoronoi ? datum.datum : datum)":"datum";return o.items.forEach(((e,o)=>{const c=C(`${r}_${e.field}`);i.filter((e=>e.name===c)).length||i.unshift({name:c,...s?{init:hc(s[o])}:{value:null},on:n.events?[{events:n.events,update:`datum && item().mark.marktype !== 'group' ? ${l}[${t.stringValue(e.field)}] : null`}]:[],bind:a[e.field]??a[e.channel]??a})})),i},signals:(e,t,n)=>{const i=t.name,r=t.project,o=n.find((e=>e.name===i+Mu)),a=i+Pc,s=r.items.map((e=>C(`${i}_${e.field}`))),l=s.map((e=>`${e} !== null`)).join(" && ");return s.length&&(o.update=`${l} ? {fields: ${a}, values: [${s.join(", ")}]} : null`),delete o.value,delete o.on,n}},Su="_toggle",Du={defined:e=>"point"===e.type&&!!e.toggle,signals:(e,t,n)=>n.concat({name:t.name+Su,value:!1,on:[{events:t.events,update:t.toggle}]}),modifyExpr:(e,t)=>{const n=t.name+Mu,i=t.name+Su;return`${i} ? null : ${n}, `+("global"===t.resolve?`${i} ? null : true, `:`${i} ? null : {unit: ${Uu(e)}}, `)+`${i} ? ${n} : null`}},Fu={defined:e=>void 0!==e.clear&&!1!==e.clear,parse:(e,n)=>{n.clear&&(n.clear=t.isString(n.clear)?t.parseSelector(n.clear,"view"):n.clear)},topLevelSignals:(e,t,n)=>{if(ku.defined(t))for(const e of t.project.items){const i=n.findIndex((n=>n.name===C(`${t.name}_${e.field}`)));-1!==i&&n[i].on.push({events:t.clear,update:"null"})}return n},signals:(e,t,n)=>{function i(e,i){-1!==e&&n[e].on&&n[e].on.push({events:t.clear,update:i})}if("interval"===t.type)for(const e of t.project.items){const t=n.findIndex((t=>t.name===e.signals.visual));if(i(t,"[0, 0]"),-1===t){i(n.findIndex((t=>t.name===e.signals.data)),"null")}}else{let e=n.findIndex((e=>e.name===t.name+Mu));i(e,"null"),Du.defined(t)&&(e=n.findIndex((e=>e.name===t.name+Su)),i(e,"false"))}return n}},Ou={defined:e=>{const t="global"===e.resolve&&e.bind&&Ss(e.bind),n=1===e.project.items.length&&e.project.items[0].field!==ws;return t&&!n&&vi("Legend bindings are only supported for selections over an individual field or encoding channel."),t&&n},parse:(e,n,i)=>{const r=l(i);if(r.select=t.isString(r.select)?{type:r.select,toggle:n.toggle}:{...r.select,toggle:n.toggle},Iu(n,r),t.isObject(i.select)&&(i.select.on||i.select.clear)){const e='event.item && indexof(event.item.mark.role, "legend") < 0';for(const i of n.events)i.filter=t.array(i.filter??[]),i.filter.includes(e)||i.filter.push(e)}const o=Ds(n.bind)?n.bind.legend:"click",a=t.isString(o)?t.parseSelector(o,"view"):t.array(o);n.bind={legend:{merge:a}}},topLevelSignals:(e,t,n)=>{const i=t.name,r=Ds(t.bind)&&t.bind.legend,o=e=>t=>{const n=l(t);return n.markname=e,n};for(const e of t.project.items){if(!e.hasLegend)continue;const a=`${C(e.field)}_legend`,s=`${i}_${a}`;if(0===n.filter((e=>e.name===s)).length){const e=r.merge.map(o(`${a}_symbols`)).concat(r.merge.map(o(`${a}_labels`))).concat(r.merge.map(o(`${a}_entries`)));n.unshift({name:s,...t.init?{}:{value:null},on:[{events:e,update:"isDefined(datum.value) ? datum.value : item().items[0].items[0].datum.value",force:!0},{events:r.merge,update:`!event.item || !datum ? null : ${s}`,force:!0}]})}}return n},signals:(e,t,n)=>{const i=t.name,r=t.project,o=n.find((e=>e.name===i+Mu)),a=i+Pc,s=r.items.filter((e=>e.hasLegend)).map((e=>C(`${i}_${C(e.field)}_legend`))),l=`${s.map((e=>`${e} !== null`)).join(" && ")} ? {fields: ${a}, values: [${s.join(", ")}]} : null`;t.events&&s.length>0?o.on.push({events:s.map((e=>({signal:e}))),update:l}):s.length>0&&(o.update=l,delete o.value,delete o.on);const c=n.find((e=>e.name===i+Su)),u=Ds(t.bind)&&t.bind.legend;return c&&(t.events?c.on.push({...c.on[0],events:u}):c.on[0].events=u),n}};const zu="_translate_anchor",Cu="_translate_delta",Nu={defined:e=>"interval"===e.type&&e.translate,signals:(e,n,i)=>{const r=n.name,o=Tc.defined(n),a=r+zu,{x:s,y:l}=n.project.hasChannel;let c=t.parseSelector(n.translate,"scope");return o||(c=c.map((e=>(e.between[0].markname=r+Mc,e)))),i.push({name:a,value:{},on:[{events:c.map((e=>e.between[0])),update:"{x: x(unit), y: y(unit)"+(void 0!==s?`, extent_x: ${o?jc(e,ee):`slice(${s.signals.visual})`}`:"")+(void 0!==l?`, extent_y: ${o?jc(e,te):`slice(${l.signals.visual})`}`:"")+"}"}]},{name:r+Cu,value:{},on:[{events:c,update:`{x: ${a}.x - x(unit), y: ${a}.y - y(unit)}`}]}),void 0!==s&&Pu(e,n,s,"width",i),void 0!==l&&Pu(e,n,l,"height",i),i}};function Pu(e,t,n,i,r){const o=t.name,a=o+zu,s=o+Cu,l=n.channel,c=Tc.defined(t),u=r.find((e=>e.name===n.signals[c?"data":"visual"])),f=e.getSizeSignalRef(i).signal,d=e.getScaleComponent(l),m=d&&d.get("type"),p=d&&d.get("reverse"),g=`${a}.extent_${l}`,h=`${c&&d?"log"===m?"panLog":"symlog"===m?"panSymlog":"pow"===m?"panPow":"panLinear":"panLinear"}(${g}, ${`${c?l===ee?p?"":"-":p?"-":"":""}${s}.${l} / ${c?`${f}`:`span(${g})`}`}${c?"pow"===m?`, ${d.get("exponent")??1}`:"symlog"===m?`, ${d.get("constant")??1}`:"":""})`;u.on.push({events:{signal:s},update:c?h:`clampRange(${h}, 0, ${f})`})}const _u="_zoom_anchor",Au="_zoom_delta",Tu={defined:e=>"interval"===e.type&&e.zoom,signals:(e,n,i)=>{const r=n.name,o=Tc.defined(n),a=r+Au,{x:s,y:l}=n.project.hasChannel,c=t.stringValue(e.scaleName(ee)),u=t.stringValue(e.scaleName(te));let f=t.parseSelector(n.zoom,"scope");return o||(f=f.map((e=>(e.markname=r+Mc,e)))),i.push({name:r+_u,on:[{events:f,update:o?"{"+[c?`x: invert(${c}, x(unit))`:"",u?`y: invert(${u}, y(unit))`:""].filter((e=>e)).join(", ")+"}":"{x: x(unit), y: y(unit)}"}]},{name:a,on:[{events:f,force:!0,update:"pow(1.001, event.deltaY * pow(16, event.deltaMode))"}]}),void 0!==s&&ju(e,n,s,"width",i),void 0!==l&&ju(e,n,l,"height",i),i}};function ju(e,t,n,i,r){const o=t.name,a=n.channel,s=Tc.defined(t),l=r.find((e=>e.name===n.signals[s?"data":"visual"])),c=e.getSizeSignalRef(i).signal,u=e.getScaleComponent(a),f=u&&u.get("type"),d=s?jc(e,a):l.name,m=o+Au,p=`${s&&u?"log"===f?"zoomLog":"symlog"===f?"zoomSymlog":"pow"===f?"zoomPow":"zoomLinear":"zoomLinear"}(${d}, ${`${o}${_u}.${a}`}, ${m}${s?"pow"===f?`, ${u.get("exponent")??1}`:"symlog"===f?`, ${u.get("constant")??1}`:"":""})`;l.on.push({events:{signal:m},update:s?p:`clampRange(${p}, 0, ${c})`})}const Eu="_store",Mu="_tuple",Ru="_modify",Lu="vlSelectionResolve",qu=[Wc,Uc,Ac,Du,ku,Tc,Ou,Fu,Nu,Tu,wu];function Uu(e){let{escape:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{escape:!0},i=n?t.stringValue(e.name):e.name;const r=function(e){let t=e.parent;for(;t&&!Dm(t);)t=t.parent;return t}(e);if(r){const{facet:e}=r;for(const n of We)e[n]&&(i+=` + '__facet_${n}_' + (facet[${t.stringValue(r.vgField(n))}])`)}return i}function Wu(e){return F(e.component.selection??{}).reduce(((e,t)=>e||t.project.hasSelectionId),!1)}function Iu(e,n){!t.isString(n.select)&&n.select.on||delete e.events,!t.isString(n.select)&&n.select.clear||delete e.clear,!t.isString(n.select)&&n.select.toggle||delete e.toggle}function Bu(e){const t=[];return"Identifier"===e.type?[e.name]:"Literal"===e.type?[e.value]:("MemberExpression"===e.type&&(t.push(...Bu(e.object)),t.push(...Bu(e.property))),t)}function Vu(e){return"MemberExpression"===e.object.type?Vu(e.object):"datum"===e.object.name}function Hu(e){const n=t.parseExpression(e),i=new Set;return n.visit((e=>{"MemberExpression"===e.type&&Vu(e)&&i.add(Bu(e).slice(1).join("."))})),i}class Gu extends $c{clone(){return new Gu(null,this.model,l(this.filter))}constructor(e,t,n){super(e),this.model=t,this.filter=n,this.expr=Qu(this.model,this.filter,this),this._dependentFields=Hu(this.expr)}dependentFields(){return this._dependentFields}producedFields(){return new Set}assemble(){return{type:"filter",expr:this.expr}}hash(){return`Filter ${this.expr}`}}function Yu(e,n,i){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"datum";const o=t.isString(n)?n:n.param,a=C(o),s=t.stringValue(a+Eu);let l;try{l=e.getSelectionComponent(a,o)}catch(e){return`!!${a}`}if(l.project.timeUnit){const t=i??e.component.data.raw,n=l.project.timeUnit.clone();t.parent?n.insertAsParentOf(t):t.parent=n}const c=`${l.project.hasSelectionId?"vlSelectionIdTest(":"vlSelectionTest("}${s}, ${r}${"global"===l.resolve?")":`, ${t.stringValue(l.resolve)})`}`,u=`length(data(${s}))`;return!1===n.empty?`${u} && ${c}`:`!${u} || ${c}`}function Xu(e,n,i){const r=C(n),o=i.encoding;let a,s=i.field;try{a=e.getSelectionComponent(r,n)}catch(e){return r}if(o||s){if(o&&!s){const e=a.project.items.filter((e=>e.channel===o));!e.length||e.length>1?(s=a.project.items[0].field,vi((e.length?"Multiple ":"No ")+`matching ${t.stringValue(o)} encoding found for selection ${t.stringValue(i.param)}. `+`Using "field": ${t.stringValue(s)}.`)):s=e[0].field}}else s=a.project.items[0].field,a.project.items.length>1&&vi(`A "field" or "encoding" must be specified when using a selection as a scale domain. Using "field": ${t.stringValue(s)}.`);return`${a.name}[${t.stringValue(E(s))}]`}function Qu(e,n,i){return N(n,(n=>t.isString(n)?n:function(e){return Q(e,"param")}(n)?Yu(e,n,i):Qi(n)))}function Ju(e,t,n,i){e.encode??={},e.encode[t]??={},e.encode[t].update??={},e.encode[t].update[n]=i}function Ku(e,n,i){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{header:!1};const{disable:o,orient:a,scale:s,labelExpr:l,title:c,zindex:u,...f}=e.combine();if(!o){for(const e in f){const i=e,r=Na[i],o=f[i];if(r&&r!==n&&"both"!==r)delete f[i];else if(za(o)){const{condition:e,...n}=o,r=t.array(e),a=Oa[i];if(a){const{vgProp:e,part:t}=a;Ju(f,t,e,[...r.map((e=>{const{test:t,...n}=e;return{test:Qu(null,t),...n}})),n]),delete f[i]}else if(null===a){const e={signal:r.map((e=>{const{test:t,...n}=e;return`${Qu(null,t)} ? ${zn(n)} : `})).join("")+zn(n)};f[i]=e}}else if(vn(o)){const e=Oa[i];if(e){const{vgProp:t,part:n}=e;Ju(f,n,t,o),delete f[i]}}p(["labelAlign","labelBaseline"],i)&&null===f[i]&&delete f[i]}if("grid"===n){if(!f.grid)return;if(f.encode){const{grid:e}=f.encode;f.encode={...e?{grid:e}:{}},S(f.encode)&&delete f.encode}return{scale:s,orient:a,...f,domain:!1,labels:!1,aria:!1,maxExtent:0,minExtent:0,ticks:!1,zindex:q(u,0)}}{if(!r.header&&e.mainExtracted)return;if(void 0!==l){let e=l;f.encode?.labels?.update&&vn(f.encode.labels.update.text)&&(e=M(l,"datum.label",f.encode.labels.update.text.signal)),Ju(f,"labels","text",{signal:e})}if(null===f.labelAlign&&delete f.labelAlign,f.encode){for(const t of Ca)e.hasAxisPart(t)||delete f.encode[t];S(f.encode)&&delete f.encode}const n=function(e,n){if(e)return t.isArray(e)&&!yn(e)?e.map((e=>pa(e,n))).join(", "):e}(c,i);return{scale:s,orient:a,grid:!1,...n?{title:n}:{},...f,...!1===i.aria?{aria:!1}:{},zindex:q(u,0)}}}}function Zu(e){const{axes:t}=e.component,n=[];for(const i of Ot)if(t[i])for(const r of t[i])if(!r.get("disable")&&!r.get("gridScale")){const t="x"===i?"height":"width",r=e.getSizeSignalRef(t).signal;t!==r&&n.push({name:t,update:r})}return n}function ef(e,t,n,i){return Object.assign.apply(null,[{},...e.map((e=>{if("axisOrient"===e){const e="x"===n?"bottom":"left",r=t["x"===n?"axisBottom":"axisLeft"]||{},o=t["x"===n?"axisTop":"axisRight"]||{},a=new Set([...D(r),...D(o)]),s={};for(const t of a.values())s[t]={signal:`${i.signal} === "${e}" ? ${Cn(r[t])} : ${Cn(o[t])}`};return s}return t[e]}))])}function tf(e,n){const i=[{}];for(const r of e){let e=n[r]?.style;if(e){e=t.array(e);for(const t of e)i.push(n.style[t])}}return Object.assign.apply(null,i)}function nf(e,t,n){let i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const r=jn(e,n,t);if(void 0!==r)return{configFrom:"style",configValue:r};for(const t of["vlOnlyAxisConfig","vgAxisConfig","axisConfigStyle"])if(void 0!==i[t]?.[e])return{configFrom:t,configValue:i[t][e]};return{}}const rf={scale:e=>{let{model:t,channel:n}=e;return t.scaleName(n)},format:e=>{let{format:t}=e;return t},formatType:e=>{let{formatType:t}=e;return t},grid:e=>{let{fieldOrDatumDef:t,axis:n,scaleType:i}=e;return n.grid??function(e,t){return!yr(e)&&Go(t)&&!cn(t?.bin)&&!un(t?.bin)}(i,t)},gridScale:e=>{let{model:t,channel:n}=e;return function(e,t){const n="x"===t?"y":"x";if(e.getScaleComponent(n))return e.scaleName(n);return}(t,n)},labelAlign:e=>{let{axis:t,labelAngle:n,orient:i,channel:r}=e;return t.labelAlign||sf(n,i,r)},labelAngle:e=>{let{labelAngle:t}=e;return t},labelBaseline:e=>{let{axis:t,labelAngle:n,orient:i,channel:r}=e;return t.labelBaseline||af(n,i,r)},labelFlush:e=>{let{axis:t,fieldOrDatumDef:n,channel:i}=e;return t.labelFlush??function(e,t){if("x"===t&&p(["quantitative","temporal"],e))return!0;return}(n.type,i)},labelOverlap:e=>{let{axis:n,fieldOrDatumDef:i,scaleType:r}=e;return n.labelOverlap??function(e,n,i,r){if(i&&!t.isObject(r)||"nominal"!==e&&"ordinal"!==e)return"log"!==n&&"symlog"!==n||"greedy";return}(i.type,r,Go(i)&&!!i.timeUnit,Go(i)?i.sort:void 0)},orient:e=>{let{orient:t}=e;return t},tickCount:e=>{let{channel:t,model:n,axis:i,fieldOrDatumDef:r,scaleType:o}=e;const a="x"===t?"width":"y"===t?"height":void 0,s=a?n.getSizeSignalRef(a):void 0;return i.tickCount??function(e){let{fieldOrDatumDef:t,scaleType:n,size:i,values:r}=e;if(!r&&!yr(n)&&"log"!==n){if(Go(t)){if(cn(t.bin))return{signal:`ceil(${i.signal}/10)`};if(t.timeUnit&&p(["month","hours","day","quarter"],Mi(t.timeUnit)?.unit))return}return{signal:`ceil(${i.signal}/40)`}}return}({fieldOrDatumDef:r,scaleType:o,size:s,values:i.values})},tickMinStep:function(e){let{format:t,fieldOrDatumDef:n}=e;if("d"===t)return 1;if(Go(n)){const{timeUnit:e}=n;if(e){const t=Ri(e);if(t)return{signal:t}}}return},title:e=>{let{axis:t,model:n,channel:i}=e;if(void 0!==t.title)return t.title;const r=lf(n,i);if(void 0!==r)return r;const o=n.typedFieldDef(i),a="x"===i?"x2":"y2",s=n.fieldDef(a);return Mn(o?[Ro(o)]:[],Go(s)?[Ro(s)]:[])},values:e=>{let{axis:n,fieldOrDatumDef:i}=e;return function(e,n){const i=e.values;if(t.isArray(i))return Da(n,i);if(vn(i))return i;return}(n,i)},zindex:e=>{let{axis:t,fieldOrDatumDef:n,mark:i}=e;return t.zindex??function(e,t){if("rect"===e&&la(t))return 1;return 0}(i,n)}};function of(e){return`(((${e.signal} % 360) + 360) % 360)`}function af(e,t,n,i){if(void 0!==e){if("x"===n){if(vn(e)){const n=of(e);return{signal:`(45 < ${n} && ${n} < 135) || (225 < ${n} && ${n} < 315) ? "middle" :(${n} <= 45 || 315 <= ${n}) === ${vn(t)?`(${t.signal} === "top")`:"top"===t} ? "bottom" : "top"`}}if(45<e&&e<135||225<e&&e<315)return"middle";if(vn(t)){const n=e<=45||315<=e?"===":"!==";return{signal:`${t.signal} ${n} "top" ? "bottom" : "top"`}}return(e<=45||315<=e)==("top"===t)?"bottom":"top"}if(vn(e)){const n=of(e);return{signal:`${n} <= 45 || 315 <= ${n} || (135 <= ${n} && ${n} <= 225) ? ${i?'"middle"':"null"} : (45 <= ${n} && ${n} <= 135) === ${vn(t)?`(${t.signal} === "left")`:"left"===t} ? "top" : "bottom"`}}if(e<=45||315<=e||135<=e&&e<=225)return i?"middle":null;if(vn(t)){const n=45<=e&&e<=135?"===":"!==";return{signal:`${t.signal} ${n} "left" ? "top" : "bottom"`}}return(45<=e&&e<=135)==("left"===t)?"top":"bottom"}}function sf(e,t,n){if(void 0===e)return;const i="x"===n,r=i?0:90,o=i?"bottom":"left";if(vn(e)){const n=of(e);return{signal:`(${r?`(${n} + 90)`:n} % 180 === 0) ? ${i?null:'"center"'} :(${r} < ${n} && ${n} < ${180+r}) === ${vn(t)?`(${t.signal} === "${o}")`:t===o} ? "left" : "right"`}}if((e+r)%180==0)return i?null:"center";if(vn(t)){const n=r<e&&e<180+r?"===":"!==";return{signal:`${`${t.signal} ${n} "${o}"`} ? "left" : "right"`}}return(r<e&&e<180+r)==(t===o)?"left":"right"}function lf(e,t){const n="x"===t?"x2":"y2",i=e.fieldDef(t),r=e.fieldDef(n),o=i?i.title:void 0,a=r?r.title:void 0;return o&&a?Rn(o,a):o||(a||(void 0!==o?o:void 0!==a?a:void 0))}class cf extends $c{clone(){return new cf(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this._dependentFields=Hu(this.transform.calculate)}static parseAllForSortIndex(e,t){return t.forEachFieldDef(((t,n)=>{if(na(t)&&To(t.sort)){const{field:i,timeUnit:r}=t,o=t.sort,a=o.map(((e,t)=>`${Qi({field:i,timeUnit:r,equal:e})} ? ${t} : `)).join("")+o.length;e=new cf(e,{calculate:a,as:uf(t,n,{forAs:!0})})}})),e}producedFields(){return new Set([this.transform.as])}dependentFields(){return this._dependentFields}assemble(){return{type:"formula",expr:this.transform.calculate,as:this.transform.as}}hash(){return`Calculate ${d(this.transform)}`}}function uf(e,t,n){return sa(e,{prefix:t,suffix:"sort_index",...n})}function ff(e,t){return p(["top","bottom"],t)?"column":p(["left","right"],t)||"row"===e?"row":"column"}function df(e,t,n,i){const r="row"===i?n.headerRow:"column"===i?n.headerColumn:n.headerFacet;return q((t||{})[e],r[e],n.header[e])}function mf(e,t,n,i){const r={};for(const o of e){const e=df(o,t||{},n,i);void 0!==e&&(r[o]=e)}return r}const pf=["row","column"],gf=["header","footer"];function hf(e,t){const n=e.component.layoutHeaders[t].title,i=e.config?e.config:void 0,r=e.component.layoutHeaders[t].facetFieldDef?e.component.layoutHeaders[t].facetFieldDef:void 0,{titleAnchor:o,titleAngle:a,titleOrient:s}=mf(["titleAnchor","titleAngle","titleOrient"],r.header,i,t),l=ff(t,s),c=V(a);return{name:`${t}-title`,type:"group",role:`${l}-title`,title:{text:n,..."row"===t?{orient:"left"}:{},style:"guide-title",...vf(c,l),...yf(l,c,o),...Df(i,r,t,vs,hs)}}}function yf(e,t){switch(arguments.length>2&&void 0!==arguments[2]?arguments[2]:"middle"){case"start":return{align:"left"};case"end":return{align:"right"}}const n=sf(t,"row"===e?"left":"top","row"===e?"y":"x");return n?{align:n}:{}}function vf(e,t){const n=af(e,"row"===t?"left":"top","row"===t?"y":"x",!0);return n?{baseline:n}:{}}function bf(e,t){const n=e.component.layoutHeaders[t],i=[];for(const r of gf)if(n[r])for(const o of n[r]){const a=wf(e,t,r,n,o);null!=a&&i.push(a)}return i}function xf(e,n){const{sort:i}=e;return Ao(i)?{field:sa(i,{expr:"datum"}),order:i.order??"ascending"}:t.isArray(i)?{field:uf(e,n,{expr:"datum"}),order:"ascending"}:{field:sa(e,{expr:"datum"}),order:i??"ascending"}}function $f(e,t,n){const{format:i,formatType:r,labelAngle:o,labelAnchor:a,labelOrient:s,labelExpr:l}=mf(["format","formatType","labelAngle","labelAnchor","labelOrient","labelExpr"],e.header,n,t),c=$o({fieldOrDatumDef:e,format:i,formatType:r,expr:"parent",config:n}).signal,u=ff(t,s);return{text:{signal:l?M(M(l,"datum.label",c),"datum.value",sa(e,{expr:"parent"})):c},..."row"===t?{orient:"left"}:{},style:"guide-label",frame:"group",...vf(o,u),...yf(u,o,a),...Df(n,e,t,bs,ys)}}function wf(e,t,n,i,r){if(r){let o=null;const{facetFieldDef:a}=i,s=e.config?e.config:void 0;if(a&&r.labels){const{labelOrient:e}=mf(["labelOrient"],a.header,s,t);("row"===t&&!p(["top","bottom"],e)||"column"===t&&!p(["left","right"],e))&&(o=$f(a,t,s))}const l=Dm(e)&&!jo(e.facet),c=r.axes,u=c?.length>0;if(o||u){const s="row"===t?"height":"width";return{name:e.getName(`${t}_${n}`),type:"group",role:`${t}-${n}`,...i.facetFieldDef?{from:{data:e.getName(`${t}_domain`)},sort:xf(a,t)}:{},...u&&l?{from:{data:e.getName(`facet_domain_${t}`)}}:{},...o?{title:o}:{},...r.sizeSignal?{encode:{update:{[s]:r.sizeSignal}}}:{},...u?{axes:c}:{}}}}return null}const kf={column:{start:0,end:1},row:{start:1,end:0}};function Sf(e,t){return kf[t][e]}function Df(e,t,n,i,r){const o={};for(const a of i){if(!r[a])continue;const i=df(a,t?.header,e,n);void 0!==i&&(o[r[a]]=i)}return o}function Ff(e){return[...Of(e,"width"),...Of(e,"height"),...Of(e,"childWidth"),...Of(e,"childHeight")]}function Of(e,t){const n="width"===t?"x":"y",i=e.component.layoutSize.get(t);if(!i||"merged"===i)return[];const r=e.getSizeSignalRef(t).signal;if("step"===i){const t=e.getScaleComponent(n);if(t){const i=t.get("type"),o=t.get("range");if(yr(i)&&bn(o)){const i=e.scaleName(n);if(Dm(e.parent)){if("independent"===e.parent.component.resolve.scale[n])return[zf(i,o)]}return[zf(i,o),{name:r,update:Cf(i,t,`domain('${i}').length`)}]}}throw new Error("layout size is step although width/height is not step.")}if("container"==i){const t=r.endsWith("width"),n=t?"containerSize()[0]":"containerSize()[1]",i=`isFinite(${n}) ? ${n} : ${js(e.config.view,t?"width":"height")}`;return[{name:r,init:i,on:[{update:i,events:"window:resize"}]}]}return[{name:r,value:i}]}function zf(e,t){const n=`${e}_step`;return vn(t.step)?{name:n,update:t.step.signal}:{name:n,value:t.step}}function Cf(e,t,n){const i=t.get("type"),r=t.get("padding"),o=q(t.get("paddingOuter"),r);let a=t.get("paddingInner");return a="band"===i?void 0!==a?a:r:1,`bandspace(${n}, ${Cn(a)}, ${Cn(o)}) * ${e}_step`}function Nf(e){return"childWidth"===e?"width":"childHeight"===e?"height":e}function Pf(e,t){return D(e).reduce(((n,i)=>({...n,...Ic({model:t,channelDef:e[i],vgChannel:i,mainRefFn:e=>On(e.value),invalidValueRef:void 0})})),{})}function _f(e,t){if(Dm(t))return"theta"===e?"independent":"shared";if(Om(t))return"shared";if(Fm(t))return zt(e)||"theta"===e||"radius"===e?"independent":"shared";throw new Error("invalid model type for resolve")}function Af(e,t){const n=e.scale[t],i=zt(t)?"axis":"legend";return"independent"===n?("shared"===e[i][t]&&vi(function(e){return`Setting the scale to be independent for "${e}" means we also have to set the guide (axis or legend) to be independent.`}(t)),"independent"):e[i][t]||"shared"}const Tf=D({aria:1,clipHeight:1,columnPadding:1,columns:1,cornerRadius:1,description:1,direction:1,fillColor:1,format:1,formatType:1,gradientLength:1,gradientOpacity:1,gradientStrokeColor:1,gradientStrokeWidth:1,gradientThickness:1,gridAlign:1,labelAlign:1,labelBaseline:1,labelColor:1,labelFont:1,labelFontSize:1,labelFontStyle:1,labelFontWeight:1,labelLimit:1,labelOffset:1,labelOpacity:1,labelOverlap:1,labelPadding:1,labelSeparation:1,legendX:1,legendY:1,offset:1,orient:1,padding:1,rowPadding:1,strokeColor:1,symbolDash:1,symbolDashOffset:1,symbolFillColor:1,symbolLimit:1,symbolOffset:1,symbolOpacity:1,symbolSize:1,symbolStrokeColor:1,symbolStrokeWidth:1,symbolType:1,tickCount:1,tickMinStep:1,title:1,titleAlign:1,titleAnchor:1,titleBaseline:1,titleColor:1,titleFont:1,titleFontSize:1,titleFontStyle:1,titleFontWeight:1,titleLimit:1,titleLineHeight:1,titleOpacity:1,titleOrient:1,titlePadding:1,type:1,values:1,zindex:1,disable:1,labelExpr:1,selections:1,opacity:1,shape:1,stroke:1,fill:1,size:1,strokeWidth:1,strokeDash:1,encode:1});class jf extends Zl{}const Ef={symbols:function(e,n){let{fieldOrDatumDef:i,model:r,channel:o,legendCmpt:a,legendType:s}=n;if("symbol"!==s)return;const{markDef:l,encoding:c,config:u,mark:f}=r,d=l.filled&&"trail"!==f;let m={...Nn({},r,Jr),...Zc(r,{filled:d})};const p=a.get("symbolOpacity")??u.legend.symbolOpacity,g=a.get("symbolFillColor")??u.legend.symbolFillColor,h=a.get("symbolStrokeColor")??u.legend.symbolStrokeColor,y=void 0===p?Mf(c.opacity)??l.opacity:void 0;if(m.fill)if("fill"===o||d&&o===pe)delete m.fill;else if(Q(m.fill,"field"))g?delete m.fill:(m.fill=On(u.legend.symbolBaseFillColor??"black"),m.fillOpacity=On(y??1));else if(t.isArray(m.fill)){const e=Rf(c.fill??c.color)??l.fill??(d&&l.color);e&&(m.fill=On(e))}if(m.stroke)if("stroke"===o||!d&&o===pe)delete m.stroke;else if(Q(m.stroke,"field")||h)delete m.stroke;else if(t.isArray(m.stroke)){const e=q(Rf(c.stroke||c.color),l.stroke,d?l.color:void 0);e&&(m.stroke={value:e})}if(o!==xe){const e=Go(i)&&qf(r,a,i);e?m.opacity=[{test:e,...On(y??1)},On(u.legend.unselectedOpacity)]:y&&(m.opacity=On(y))}return m={...m,...e},S(m)?void 0:m},gradient:function(e,t){let{model:n,legendType:i,legendCmpt:r}=t;if("gradient"!==i)return;const{config:o,markDef:a,encoding:s}=n;let l={};const c=void 0===(r.get("gradientOpacity")??o.legend.gradientOpacity)?Mf(s.opacity)||a.opacity:void 0;c&&(l.opacity=On(c));return l={...l,...e},S(l)?void 0:l},labels:function(e,t){let{fieldOrDatumDef:n,model:i,channel:r,legendCmpt:o}=t;const a=i.legend(r)||{},s=i.config,l=Go(n)?qf(i,o,n):void 0,c=l?[{test:l,value:1},{value:s.legend.unselectedOpacity}]:void 0,{format:u,formatType:f}=a;let d;vo(f)?d=ko({fieldOrDatumDef:n,field:"datum.value",format:u,formatType:f,config:s}):void 0===u&&void 0===f&&s.customFormatTypes&&("quantitative"===n.type&&s.numberFormatType?d=ko({fieldOrDatumDef:n,field:"datum.value",format:s.numberFormat,formatType:s.numberFormatType,config:s}):"temporal"===n.type&&s.timeFormatType&&Go(n)&&void 0===n.timeUnit&&(d=ko({fieldOrDatumDef:n,field:"datum.value",format:s.timeFormat,formatType:s.timeFormatType,config:s})));const m={...c?{opacity:c}:{},...d?{text:d}:{},...e};return S(m)?void 0:m},entries:function(e,t){let{legendCmpt:n}=t;const i=n.get("selections");return i?.length?{...e,fill:{value:"transparent"}}:e}};function Mf(e){return Lf(e,((e,t)=>Math.max(e,t.value)))}function Rf(e){return Lf(e,((e,t)=>q(e,t.value)))}function Lf(e,n){return function(e){const n=e?.condition;return!!n&&(t.isArray(n)||ta(n))}(e)?t.array(e.condition).reduce(n,e.value):ta(e)?e.value:void 0}function qf(e,n,i){const r=n.get("selections");if(!r?.length)return;const o=t.stringValue(i.field);return r.map((e=>`(!length(data(${t.stringValue(C(e)+Eu)})) || (${e}[${o}] && indexof(${e}[${o}], datum.value) >= 0))`)).join(" || ")}const Uf={direction:e=>{let{direction:t}=e;return t},format:e=>{let{fieldOrDatumDef:t,legend:n,config:i}=e;const{format:r,formatType:o}=n;return So(t,t.type,r,o,i,!1)},formatType:e=>{let{legend:t,fieldOrDatumDef:n,scaleType:i}=e;const{formatType:r}=t;return Do(r,n,i)},gradientLength:e=>{const{legend:t,legendConfig:n}=e;return t.gradientLength??n.gradientLength??function(e){let{legendConfig:t,model:n,direction:i,orient:r,scaleType:o}=e;const{gradientHorizontalMaxLength:a,gradientHorizontalMinLength:s,gradientVerticalMaxLength:l,gradientVerticalMinLength:c}=t;if(br(o))return"horizontal"===i?"top"===r||"bottom"===r?Bf(n,"width",s,a):s:Bf(n,"height",c,l);return}(e)},labelOverlap:e=>{let{legend:t,legendConfig:n,scaleType:i}=e;return t.labelOverlap??n.labelOverlap??function(e){if(p(["quantile","threshold","log","symlog"],e))return"greedy";return}(i)},symbolType:e=>{let{legend:t,markDef:n,channel:i,encoding:r}=e;return t.symbolType??function(e,t,n,i){if("shape"!==t){const e=Rf(n)??i;if(e)return e}switch(e){case"bar":case"rect":case"image":case"square":return"square";case"line":case"trail":case"rule":return"stroke";case"arc":case"point":case"circle":case"tick":case"geoshape":case"area":case"text":return"circle"}}(n.type,i,r.shape,n.shape)},title:e=>{let{fieldOrDatumDef:t,config:n}=e;return da(t,n,{allowDisabling:!0})},type:e=>{let{legendType:t,scaleType:n,channel:i}=e;if(qe(i)&&br(n)){if("gradient"===t)return}else if("symbol"===t)return;return t},values:e=>{let{fieldOrDatumDef:n,legend:i}=e;return function(e,n){const i=e.values;if(t.isArray(i))return Da(n,i);if(vn(i))return i;return}(i,n)}};function Wf(e){const{legend:t}=e;return q(t.type,function(e){let{channel:t,timeUnit:n,scaleType:i}=e;if(qe(t)){if(p(["quarter","month","day"],n))return"symbol";if(br(i))return"gradient"}return"symbol"}(e))}function If(e){let{legendConfig:t,legendType:n,orient:i,legend:r}=e;return r.direction??t[n?"gradientDirection":"symbolDirection"]??function(e,t){switch(e){case"top":case"bottom":return"horizontal";case"left":case"right":case"none":case void 0:return;default:return"gradient"===t?"horizontal":void 0}}(i,n)}function Bf(e,t,n,i){return{signal:`clamp(${e.getSizeSignalRef(t).signal}, ${n}, ${i})`}}function Vf(e){const t=Sm(e)?function(e){const{encoding:t}=e,n={};for(const i of[pe,...$s]){const r=ya(t[i]);r&&e.getScaleComponent(i)&&(i===ye&&Go(r)&&r.type===or||(n[i]=Gf(e,i)))}return n}(e):function(e){const{legends:t,resolve:n}=e.component;for(const i of e.children){Vf(i);for(const r of D(i.component.legends))n.legend[r]=Af(e.component.resolve,r),"shared"===n.legend[r]&&(t[r]=Yf(t[r],i.component.legends[r]),t[r]||(n.legend[r]="independent",delete t[r]))}for(const i of D(t))for(const t of e.children)t.component.legends[i]&&"shared"===n.legend[i]&&delete t.component.legends[i];return t}(e);return e.component.legends=t,t}function Hf(e,t,n,i){switch(t){case"disable":return void 0!==n;case"values":return!!n?.values;case"title":if("title"===t&&e===i?.title)return!0}return e===(n||{})[t]}function Gf(e,t){let n=e.legend(t);const{markDef:i,encoding:r,config:o}=e,a=o.legend,s=new jf({},function(e,t){const n=e.scaleName(t);if("trail"===e.mark){if("color"===t)return{stroke:n};if("size"===t)return{strokeWidth:n}}return"color"===t?e.markDef.filled?{fill:n}:{stroke:n}:{[t]:n}}(e,t));!function(e,t,n){const i=e.fieldDef(t)?.field;for(const r of F(e.component.selection??{})){const e=r.project.hasField[i]??r.project.hasChannel[t];if(e&&Ou.defined(r)){const t=n.get("selections")??[];t.push(r.name),n.set("selections",t,!1),e.hasLegend=!0}}}(e,t,s);const l=void 0!==n?!n:a.disable;if(s.set("disable",l,void 0!==n),l)return s;n=n||{};const c=e.getScaleComponent(t).get("type"),u=ya(r[t]),f=Go(u)?Mi(u.timeUnit)?.unit:void 0,d=n.orient||o.legend.orient||"right",m=Wf({legend:n,channel:t,timeUnit:f,scaleType:c}),p={legend:n,channel:t,model:e,markDef:i,encoding:r,fieldOrDatumDef:u,legendConfig:a,config:o,scaleType:c,orient:d,legendType:m,direction:If({legend:n,legendType:m,orient:d,legendConfig:a})};for(const i of Tf){if("gradient"===m&&i.startsWith("symbol")||"symbol"===m&&i.startsWith("gradient"))continue;const r=i in Uf?Uf[i](p):n[i];if(void 0!==r){const a=Hf(r,i,n,e.fieldDef(t));(a||void 0===o.legend[i])&&s.set(i,r,a)}}const g=n?.encoding??{},h=s.get("selections"),y={},v={fieldOrDatumDef:u,model:e,channel:t,legendCmpt:s,legendType:m};for(const t of["labels","legend","title","symbols","gradient","entries"]){const n=Pf(g[t]??{},e),i=t in Ef?Ef[t](n,v):n;void 0===i||S(i)||(y[t]={...h?.length&&Go(u)?{name:`${C(u.field)}_legend_${t}`}:{},...h?.length?{interactive:!!h}:{},update:i})}return S(y)||s.set("encode",y,!!n?.encoding),s}function Yf(e,t){if(!e)return t.clone();const n=e.getWithExplicit("orient"),i=t.getWithExplicit("orient");if(n.explicit&&i.explicit&&n.value!==i.value)return;let r=!1;for(const n of Tf){const i=rc(e.getWithExplicit(n),t.getWithExplicit(n),n,"legend",((e,t)=>{switch(n){case"symbolType":return Xf(e,t);case"title":return Ln(e,t);case"type":return r=!0,tc("symbol")}return ic(e,t,n,"legend")}));e.setWithExplicit(n,i)}return r&&(e.implicit?.encode?.gradient&&P(e.implicit,["encode","gradient"]),e.explicit?.encode?.gradient&&P(e.explicit,["encode","gradient"])),e}function Xf(e,t){return"circle"===t.value?t:e}function Qf(e){const t=e.component.legends,n={};for(const i of D(t)){const r=X(e.getScaleComponent(i).get("domains"));if(n[r])for(const e of n[r]){Yf(e,t[i])||n[r].push(t[i])}else n[r]=[t[i].clone()]}return F(n).flat().map((t=>function(e,t){const{disable:n,labelExpr:i,selections:r,...o}=e.combine();if(n)return;!1===t.aria&&null==o.aria&&(o.aria=!1);if(o.encode?.symbols){const e=o.encode.symbols.update;!e.fill||"transparent"===e.fill.value||e.stroke||o.stroke||(e.stroke={value:"transparent"});for(const t of $s)o[t]&&delete e[t]}o.title||delete o.title;if(void 0!==i){let e=i;o.encode?.labels?.update&&vn(o.encode.labels.update.text)&&(e=M(i,"datum.label",o.encode.labels.update.text.signal)),function(e,t,n,i){e.encode??={},e.encode[t]??={},e.encode[t].update??={},e.encode[t].update[n]=i}(o,"labels","text",{signal:e})}return o}(t,e.config))).filter((e=>void 0!==e))}function Jf(e){return Om(e)||Fm(e)?function(e){return e.children.reduce(((e,t)=>e.concat(t.assembleProjections())),Kf(e))}(e):Kf(e)}function Kf(e){const t=e.component.projection;if(!t||t.merged)return[];const n=t.combine(),{name:i}=n;if(t.data){const r={signal:`[${t.size.map((e=>e.signal)).join(", ")}]`},o=t.data.reduce(((t,n)=>{const i=vn(n)?n.signal:`data('${e.lookupDataSource(n)}')`;return p(t,i)||t.push(i),t}),[]);if(o.length<=0)throw new Error("Projection's fit didn't find any data sources");return[{name:i,size:r,fit:{signal:o.length>1?`[${o.join(", ")}]`:o[0]},...n}]}return[{name:i,translate:{signal:"[width / 2, height / 2]"},...n}]}const Zf=["type","clipAngle","clipExtent","center","rotate","precision","reflectX","reflectY","coefficient","distance","fraction","lobes","parallel","radius","ratio","spacing","tilt"];class ed extends Zl{merged=!1;constructor(e,t,n,i){super({...t},{name:e}),this.specifiedProjection=t,this.size=n,this.data=i}get isFit(){return!!this.data}}function td(e){e.component.projection=Sm(e)?function(e){if(e.hasProjection){const t=gn(e.specifiedProjection),n=!(t&&(null!=t.scale||null!=t.translate)),i=n?[e.getSizeSignalRef("width"),e.getSizeSignalRef("height")]:void 0,r=n?function(e){const t=[],{encoding:n}=e;for(const i of[[fe,ue],[me,de]])(ya(n[i[0]])||ya(n[i[1]]))&&t.push({signal:e.getName(`geojson_${t.length}`)});e.channelHasField(ye)&&e.typedFieldDef(ye).type===or&&t.push({signal:e.getName(`geojson_${t.length}`)});0===t.length&&t.push(e.requestDataName(mc.Main));return t}(e):void 0,o=new ed(e.projectionName(!0),{...gn(e.config.projection),...t},i,r);return o.get("type")||o.set("type","equalEarth",!1),o}return}(e):function(e){if(0===e.children.length)return;let n;for(const t of e.children)td(t);const i=h(e.children,(e=>{const i=e.component.projection;if(i){if(n){const e=function(e,n){const i=h(Zf,(i=>!t.hasOwnProperty(e.explicit,i)&&!t.hasOwnProperty(n.explicit,i)||!!(t.hasOwnProperty(e.explicit,i)&&t.hasOwnProperty(n.explicit,i)&&Y(e.get(i),n.get(i)))));if(Y(e.size,n.size)){if(i)return e;if(Y(e.explicit,{}))return n;if(Y(n.explicit,{}))return e}return null}(n,i);return e&&(n=e),!!e}return n=i,!0}return!0}));if(n&&i){const t=e.projectionName(!0),i=new ed(t,n.specifiedProjection,n.size,l(n.data));for(const n of e.children){const e=n.component.projection;e&&(e.isFit&&i.data.push(...n.component.projection.data),n.renameProjection(e.get("name"),t),e.merged=!0)}return i}return}(e)}function nd(e,t,n,i){if(Fa(t,n)){const r=Sm(e)?e.axis(n)??e.legend(n)??{}:{},o=sa(t,{expr:"datum"}),a=sa(t,{expr:"datum",binSuffix:"end"});return{formulaAs:sa(t,{binSuffix:"range",forAs:!0}),formula:Co(o,a,r.format,r.formatType,i)}}return{}}function id(e,t){return`${ln(e)}_${t}`}function rd(e,t,n){const i=id($a(n,void 0)??{},t);return e.getName(`${i}_bins`)}function od(e,n,i){let r,o;r=function(e){return"as"in e}(e)?t.isString(e.as)?[e.as,`${e.as}_end`]:[e.as[0],e.as[1]]:[sa(e,{forAs:!0}),sa(e,{binSuffix:"end",forAs:!0})];const a={...$a(n,void 0)},s=id(a,e.field),{signal:l,extentSignal:c}=function(e,t){return{signal:e.getName(`${t}_bins`),extentSignal:e.getName(`${t}_extent`)}}(i,s);if(dn(a.extent)){const e=a.extent;o=Xu(i,e.param,e),delete a.extent}return{key:s,binComponent:{bin:a,field:e.field,as:[r],...l?{signal:l}:{},...c?{extentSignal:c}:{},...o?{span:o}:{}}}}class ad extends $c{clone(){return new ad(null,l(this.bins))}constructor(e,t){super(e),this.bins=t}static makeFromEncoding(e,t){const n=t.reduceFieldDef(((e,n,i)=>{if(ea(n)&&cn(n.bin)){const{key:r,binComponent:o}=od(n,n.bin,t);e[r]={...o,...e[r],...nd(t,n,i,t.config)}}return e}),{});return S(n)?null:new ad(e,n)}static makeFromTransform(e,t,n){const{key:i,binComponent:r}=od(t,t.bin,n);return new ad(e,{[i]:r})}merge(e,t){for(const n of D(e.bins))n in this.bins?(t(e.bins[n].signal,this.bins[n].signal),this.bins[n].as=b([...this.bins[n].as,...e.bins[n].as],d)):this.bins[n]=e.bins[n];for(const t of e.children)e.removeChild(t),t.parent=this;e.remove()}producedFields(){return new Set(F(this.bins).map((e=>e.as)).flat(2))}dependentFields(){return new Set(F(this.bins).map((e=>e.field)))}hash(){return`Bin ${d(this.bins)}`}assemble(){return F(this.bins).flatMap((e=>{const t=[],[n,...i]=e.as,{extent:r,...o}=e.bin,a={type:"bin",field:E(e.field),as:n,signal:e.signal,...dn(r)?{extent:null}:{extent:r},...e.span?{span:{signal:`span(${e.span})`}}:{},...o};!r&&e.extentSignal&&(t.push({type:"extent",field:E(e.field),signal:e.extentSignal}),a.extent={signal:e.extentSignal}),t.push(a);for(const e of i)for(let i=0;i<2;i++)t.push({type:"formula",expr:sa({field:n[i]},{expr:"datum"}),as:e[i]});return e.formula&&t.push({type:"formula",expr:e.formula,as:e.formulaAs}),t}))}}function sd(e,n,i,r){const o=Sm(r)?r.encoding[rt(n)]:void 0;if(ea(i)&&Sm(r)&&Wo(i,o,r.markDef,r.config)){e.add(sa(i,{})),e.add(sa(i,{suffix:"end"}));const{mark:t,markDef:o,config:a}=r,s=qo({fieldDef:i,markDef:o,config:a});Yr(t)&&.5!==s&&zt(n)&&(e.add(sa(i,{suffix:Fc})),e.add(sa(i,{suffix:Oc}))),i.bin&&Fa(i,n)&&e.add(sa(i,{binSuffix:"range"}))}else if(Me(n)){const t=Ee(n);e.add(r.getName(t))}else e.add(sa(i));return na(i)&&function(e){return t.isObject(e)&&"field"in e}(i.scale?.range)&&e.add(i.scale.range.field),e}class ld extends $c{clone(){return new ld(null,new Set(this.dimensions),l(this.measures))}constructor(e,t,n){super(e),this.dimensions=t,this.measures=n}get groupBy(){return this.dimensions}static makeFromEncoding(e,t){let n=!1;t.forEachFieldDef((e=>{e.aggregate&&(n=!0)}));const i={},r=new Set;return n?(t.forEachFieldDef(((e,n)=>{const{aggregate:o,field:a}=e;if(o)if("count"===o)i["*"]??={},i["*"].count=new Set([sa(e,{forAs:!0})]);else{if(en(o)||tn(o)){const e=en(o)?"argmin":"argmax",t=o[e];i[t]??={},i[t][e]=new Set([sa({op:e,field:t},{forAs:!0})])}else i[a]??={},i[a][o]=new Set([sa(e,{forAs:!0})]);Ht(n)&&"unaggregated"===t.scaleDomain(n)&&(i[a]??={},i[a].min=new Set([sa({field:a,aggregate:"min"},{forAs:!0})]),i[a].max=new Set([sa({field:a,aggregate:"max"},{forAs:!0})]))}else sd(r,n,e,t)})),r.size+D(i).length===0?null:new ld(e,r,i)):null}static makeFromTransform(e,t){const n=new Set,i={};for(const e of t.aggregate){const{op:t,field:n,as:r}=e;t&&("count"===t?(i["*"]??={},i["*"].count=new Set([r||sa(e,{forAs:!0})])):(i[n]??={},i[n][t]??=new Set,i[n][t].add(r||sa(e,{forAs:!0}))))}for(const e of t.groupby??[])n.add(e);return n.size+D(i).length===0?null:new ld(e,n,i)}merge(e){return x(this.dimensions,e.dimensions)?(function(e,t){for(const n of D(t)){const i=t[n];for(const t of D(i))n in e?e[n][t]=new Set([...e[n][t]??[],...i[t]]):e[n]={[t]:i[t]}}}(this.measures,e.measures),!0):(function(){yi.debug(...arguments)}("different dimensions, cannot merge"),!1)}addDimensions(e){e.forEach(this.dimensions.add,this.dimensions)}dependentFields(){return new Set([...this.dimensions,...D(this.measures)])}producedFields(){const e=new Set;for(const t of D(this.measures))for(const n of D(this.measures[t])){const i=this.measures[t][n];0===i.size?e.add(`${n}_${t}`):i.forEach(e.add,e)}return e}hash(){return`Aggregate ${d({dimensions:this.dimensions,measures:this.measures})}`}assemble(){const e=[],t=[],n=[];for(const i of D(this.measures))for(const r of D(this.measures[i]))for(const o of this.measures[i][r])n.push(o),e.push(r),t.push("*"===i?null:E(i));return{type:"aggregate",groupby:[...this.dimensions].map(E),ops:e,fields:t,as:n}}}class cd extends $c{constructor(e,n,i,r){super(e),this.model=n,this.name=i,this.data=r;for(const e of We){const i=n.facet[e];if(i){const{bin:r,sort:o}=i;this[e]={name:n.getName(`${e}_domain`),fields:[sa(i),...cn(r)?[sa(i,{binSuffix:"end"})]:[]],...Ao(o)?{sortField:o}:t.isArray(o)?{sortIndexField:uf(i,e)}:{}}}}this.childModel=n.child}hash(){let e="Facet";for(const t of We)this[t]&&(e+=` ${t.charAt(0)}:${d(this[t])}`);return e}get fields(){const e=[];for(const t of We)this[t]?.fields&&e.push(...this[t].fields);return e}dependentFields(){const e=new Set(this.fields);for(const t of We)this[t]&&(this[t].sortField&&e.add(this[t].sortField.field),this[t].sortIndexField&&e.add(this[t].sortIndexField));return e}producedFields(){return new Set}getSource(){return this.name}getChildIndependentFieldsWithStep(){const e={};for(const t of Ot){const n=this.childModel.component.scales[t];if(n&&!n.merged){const i=n.get("type"),r=n.get("range");if(yr(i)&&bn(r)){const n=tm(nm(this.childModel,t));n?e[t]=n:vi(Vn(t))}}}return e}assembleRowColumnHeaderData(e,t,n){const i={row:"y",column:"x",facet:void 0}[e],r=[],o=[],a=[];i&&n&&n[i]&&(t?(r.push(`distinct_${n[i]}`),o.push("max")):(r.push(n[i]),o.push("distinct")),a.push(`distinct_${n[i]}`));const{sortField:s,sortIndexField:l}=this[e];if(s){const{op:e=No,field:t}=s;r.push(t),o.push(e),a.push(sa(s,{forAs:!0}))}else l&&(r.push(l),o.push("max"),a.push(l));return{name:this[e].name,source:t??this.data,transform:[{type:"aggregate",groupby:this[e].fields,...r.length?{fields:r,ops:o,as:a}:{}}]}}assembleFacetHeaderData(e){const{columns:t}=this.model.layout,{layoutHeaders:n}=this.model.component,i=[],r={};for(const e of pf){for(const t of gf){const i=(n[e]&&n[e][t])??[];for(const t of i)if(t.axes?.length>0){r[e]=!0;break}}if(r[e]){const n=`length(data("${this.facet.name}"))`,r="row"===e?t?{signal:`ceil(${n} / ${t})`}:1:t?{signal:`min(${n}, ${t})`}:{signal:n};i.push({name:`${this.facet.name}_${e}`,transform:[{type:"sequence",start:0,stop:r}]})}}const{row:o,column:a}=r;return(o||a)&&i.unshift(this.assembleRowColumnHeaderData("facet",null,e)),i}assemble(){const e=[];let t=null;const n=this.getChildIndependentFieldsWithStep(),{column:i,row:r,facet:o}=this;if(i&&r&&(n.x||n.y)){t=`cross_${this.column.name}_${this.row.name}`;const i=[].concat(n.x??[],n.y??[]),r=i.map((()=>"distinct"));e.push({name:t,source:this.data,transform:[{type:"aggregate",groupby:this.fields,fields:i,ops:r}]})}for(const i of[K,J])this[i]&&e.push(this.assembleRowColumnHeaderData(i,t,n));if(o){const t=this.assembleFacetHeaderData(n);t&&e.push(...t)}return e}}function ud(e){return e.startsWith("'")&&e.endsWith("'")||e.startsWith('"')&&e.endsWith('"')?e.slice(1,-1):e}function fd(e){const n={};return a(e.filter,(e=>{if(Yi(e)){let i=null;Ui(e)?i=Dn(e.equal):Ii(e)?i=Dn(e.lte):Wi(e)?i=Dn(e.lt):Bi(e)?i=Dn(e.gt):Vi(e)?i=Dn(e.gte):Hi(e)?i=e.range[0]:Gi(e)&&(i=(e.oneOf??e.in)[0]),i&&(bi(i)?n[e.field]="date":t.isNumber(i)?n[e.field]="number":t.isString(i)&&(n[e.field]="string")),e.timeUnit&&(n[e.field]="date")}})),n}function dd(e){const n={};function i(e){var i;ka(e)?n[e.field]="date":"quantitative"===e.type&&(i=e.aggregate,t.isString(i)&&p(["min","max"],i))?n[e.field]="number":L(e.field)>1?e.field in n||(n[e.field]="flatten"):na(e)&&Ao(e.sort)&&L(e.sort.field)>1&&(e.sort.field in n||(n[e.sort.field]="flatten"))}if((Sm(e)||Dm(e))&&e.forEachFieldDef(((t,n)=>{if(ea(t))i(t);else{const r=nt(n),o=e.fieldDef(r);i({...t,type:o.type})}})),Sm(e)){const{mark:t,markDef:i,encoding:r}=e;if(Gr(t)&&!e.encoding.order){const e=r["horizontal"===i.orient?"y":"x"];Go(e)&&"quantitative"===e.type&&!(e.field in n)&&(n[e.field]="number")}}return n}class md extends $c{clone(){return new md(null,l(this._parse))}constructor(e,t){super(e),this._parse=t}hash(){return`Parse ${d(this._parse)}`}static makeExplicit(e,t,n){let i={};const r=t.data;return!cc(r)&&r?.format?.parse&&(i=r.format.parse),this.makeWithAncestors(e,i,{},n)}static makeWithAncestors(e,t,n,i){for(const e of D(n)){const t=i.getWithExplicit(e);void 0!==t.value&&(t.explicit||t.value===n[e]||"derived"===t.value||"flatten"===n[e]?delete n[e]:vi(Jn(e,n[e],t.value)))}for(const e of D(t)){const n=i.get(e);void 0!==n&&(n===t[e]?delete t[e]:vi(Jn(e,t[e],n)))}const r=new Zl(t,n);i.copyAll(r);const o={};for(const e of D(r.combine())){const t=r.get(e);null!==t&&(o[e]=t)}return 0===D(o).length||i.parseNothing?null:new md(e,o)}get parse(){return this._parse}merge(e){this._parse={...this._parse,...e.parse},e.remove()}assembleFormatParse(){const e={};for(const t of D(this._parse)){const n=this._parse[t];1===L(t)&&(e[t]=n)}return e}producedFields(){return new Set(D(this._parse))}dependentFields(){return new Set(D(this._parse))}assembleTransforms(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return D(this._parse).filter((t=>!e||L(t)>1)).map((e=>{const t=function(e,t){const n=A(e);if("number"===t)return`toNumber(${n})`;if("boolean"===t)return`toBoolean(${n})`;if("string"===t)return`toString(${n})`;if("date"===t)return`toDate(${n})`;if("flatten"===t)return n;if(t.startsWith("date:"))return`timeParse(${n},'${ud(t.slice(5,t.length))}')`;if(t.startsWith("utc:"))return`utcParse(${n},'${ud(t.slice(4,t.length))}')`;return vi(`Unrecognized parse "${t}".`),null}(e,this._parse[e]);if(!t)return null;return{type:"formula",expr:t,as:R(e)}})).filter((e=>null!==e))}}class pd extends $c{clone(){return new pd(null)}constructor(e){super(e)}dependentFields(){return new Set}producedFields(){return new Set([ws])}hash(){return"Identifier"}assemble(){return{type:"identifier",as:ws}}}class gd extends $c{clone(){return new gd(null,this.params)}constructor(e,t){super(e),this.params=t}dependentFields(){return new Set}producedFields(){}hash(){return`Graticule ${d(this.params)}`}assemble(){return{type:"graticule",...!0===this.params?{}:this.params}}}class hd extends $c{clone(){return new hd(null,this.params)}constructor(e,t){super(e),this.params=t}dependentFields(){return new Set}producedFields(){return new Set([this.params.as??"data"])}hash(){return`Hash ${d(this.params)}`}assemble(){return{type:"sequence",...this.params}}}class yd extends $c{constructor(e){let t;if(super(null),e??={name:"source"},cc(e)||(t=e.format?{...f(e.format,["parse"])}:{}),sc(e))this._data={values:e.values};else if(ac(e)){if(this._data={url:e.url},!t.type){let n=/(?:\.([^.]+))?$/.exec(e.url)[1];p(["json","csv","tsv","dsv","topojson"],n)||(n="json"),t.type=n}}else fc(e)?this._data={values:[{type:"Sphere"}]}:(lc(e)||cc(e))&&(this._data={});this._generator=cc(e),e.name&&(this._name=e.name),t&&!S(t)&&(this._data.format=t)}dependentFields(){return new Set}producedFields(){}get data(){return this._data}hasName(){return!!this._name}get isGenerator(){return this._generator}get dataName(){return this._name}set dataName(e){this._name=e}set parent(e){throw new Error("Source nodes have to be roots.")}remove(){throw new Error("Source nodes are roots and cannot be removed.")}hash(){throw new Error("Cannot hash sources")}assemble(){return{name:this._name,...this._data,transform:[]}}}function vd(e){return e instanceof yd||e instanceof gd||e instanceof hd}class bd{#e;constructor(){this.#e=!1}setModified(){this.#e=!0}get modifiedFlag(){return this.#e}}class xd extends bd{getNodeDepths(e,t,n){n.set(e,t);for(const i of e.children)this.getNodeDepths(i,t+1,n);return n}optimize(e){const t=[...this.getNodeDepths(e,0,new Map).entries()].sort(((e,t)=>t[1]-e[1]));for(const e of t)this.run(e[0]);return this.modifiedFlag}}class $d extends bd{optimize(e){this.run(e);for(const t of e.children)this.optimize(t);return this.modifiedFlag}}class wd extends $d{mergeNodes(e,t){const n=t.shift();for(const i of t)e.removeChild(i),i.parent=n,i.remove()}run(e){const t=e.children.map((e=>e.hash())),n={};for(let i=0;i<t.length;i++)void 0===n[t[i]]?n[t[i]]=[e.children[i]]:n[t[i]].push(e.children[i]);for(const t of D(n))n[t].length>1&&(this.setModified(),this.mergeNodes(e,n[t]))}}class kd extends $d{constructor(e){super(),this.requiresSelectionId=e&&Wu(e)}run(e){e instanceof pd&&(this.requiresSelectionId&&(vd(e.parent)||e.parent instanceof ld||e.parent instanceof md)||(this.setModified(),e.remove()))}}class Sd extends bd{optimize(e){return this.run(e,new Set),this.modifiedFlag}run(e,t){let n=new Set;e instanceof Dc&&(n=e.producedFields(),$(n,t)&&(this.setModified(),e.removeFormulas(t),0===e.producedFields.length&&e.remove()));for(const i of e.children)this.run(i,new Set([...t,...n]))}}class Dd extends $d{constructor(){super()}run(e){e instanceof wc&&!e.isRequired()&&(this.setModified(),e.remove())}}class Fd extends xd{run(e){if(!(vd(e)||e.numChildren()>1))for(const t of e.children)if(t instanceof md)if(e instanceof md)this.setModified(),e.merge(t);else{if(k(e.producedFields(),t.dependentFields()))continue;this.setModified(),t.swapWithParent()}}}class Od extends xd{run(e){const t=[...e.children],n=e.children.filter((e=>e instanceof md));if(e.numChildren()>1&&n.length>=1){const i={},r=new Set;for(const e of n){const t=e.parse;for(const e of D(t))e in i?i[e]!==t[e]&&r.add(e):i[e]=t[e]}for(const e of r)delete i[e];if(!S(i)){this.setModified();const n=new md(e,i);for(const r of t){if(r instanceof md)for(const e of D(i))delete r.parse[e];e.removeChild(r),r.parent=n,r instanceof md&&0===D(r.parse).length&&r.remove()}}}}}class zd extends xd{run(e){e instanceof wc||e.numChildren()>0||e instanceof cd||e instanceof yd||(this.setModified(),e.remove())}}class Cd extends xd{run(e){const t=e.children.filter((e=>e instanceof Dc)),n=t.pop();for(const e of t)this.setModified(),n.merge(e)}}class Nd extends xd{run(e){const t=e.children.filter((e=>e instanceof ld)),n={};for(const e of t){const t=d(e.groupBy);t in n||(n[t]=[]),n[t].push(e)}for(const t of D(n)){const i=n[t];if(i.length>1){const t=i.pop();for(const n of i)t.merge(n)&&(e.removeChild(n),n.parent=t,n.remove(),this.setModified())}}}}class Pd extends xd{constructor(e){super(),this.model=e}run(e){const t=!(vd(e)||e instanceof Gu||e instanceof md||e instanceof pd),n=[],i=[];for(const r of e.children)r instanceof ad&&(t&&!k(e.producedFields(),r.dependentFields())?n.push(r):i.push(r));if(n.length>0){const t=n.pop();for(const e of n)t.merge(e,this.model.renameSignal.bind(this.model));this.setModified(),e instanceof ad?e.merge(t,this.model.renameSignal.bind(this.model)):t.swapWithParent()}if(i.length>1){const e=i.pop();for(const t of i)e.merge(t,this.model.renameSignal.bind(this.model));this.setModified()}}}class _d extends xd{run(e){const t=[...e.children];if(!g(t,(e=>e instanceof wc))||e.numChildren()<=1)return;const n=[];let i;for(const r of t)if(r instanceof wc){let t=r;for(;1===t.numChildren();){const[e]=t.children;if(!(e instanceof wc))break;t=e}n.push(...t.children),i?(e.removeChild(r),r.parent=i.parent,i.parent.removeChild(i),i.parent=t,this.setModified()):i=t}else n.push(r);if(n.length){this.setModified();for(const e of n)e.parent.removeChild(e),e.parent=i}}}class Ad extends $c{clone(){return new Ad(null,l(this.transform))}constructor(e,t){super(e),this.transform=t}addDimensions(e){this.transform.groupby=b(this.transform.groupby.concat(e),(e=>e))}dependentFields(){const e=new Set;return this.transform.groupby&&this.transform.groupby.forEach(e.add,e),this.transform.joinaggregate.map((e=>e.field)).filter((e=>void 0!==e)).forEach(e.add,e),e}producedFields(){return new Set(this.transform.joinaggregate.map(this.getDefaultName))}getDefaultName(e){return e.as??sa(e)}hash(){return`JoinAggregateTransform ${d(this.transform)}`}assemble(){const e=[],t=[],n=[];for(const i of this.transform.joinaggregate)t.push(i.op),n.push(this.getDefaultName(i)),e.push(void 0===i.field?null:i.field);const i=this.transform.groupby;return{type:"joinaggregate",as:n,ops:t,fields:e,...void 0!==i?{groupby:i}:{}}}}class Td extends $c{clone(){return new Td(null,{...this.filter})}constructor(e,t){super(e),this.filter=t}static make(e,t,n){const{config:i,markDef:r}=t,{marks:o,scales:a}=n;if("include-invalid-values"===o&&"include-invalid-values"===a)return null;const s=t.reduceFieldDef(((e,n,o)=>{const a=Ht(o)&&t.getScaleComponent(o);if(a){const t=a.get("type"),{aggregate:s}=n,l=lo({scaleChannel:o,markDef:r,config:i,scaleType:t,isCountAggregate:on(s)});"show"!==l&&"always-valid"!==l&&(e[n.field]=n)}return e}),{});return D(s).length?new Td(e,s):null}dependentFields(){return new Set(D(this.filter))}producedFields(){return new Set}hash(){return`FilterInvalid ${d(this.filter)}`}assemble(){const e=D(this.filter).reduce(((e,t)=>{const n=this.filter[t],i=sa(n,{expr:"datum"});return null!==n&&("temporal"===n.type?e.push(`(isDate(${i}) || (${jd(i)}))`):"quantitative"===n.type&&e.push(jd(i))),e}),[]);return e.length>0?{type:"filter",expr:e.join(" && ")}:null}}function jd(e){return`isValid(${e}) && isFinite(+${e})`}class Ed extends $c{clone(){return new Ed(null,l(this._stack))}constructor(e,t){super(e),this._stack=t}static makeFromTransform(e,n){const{stack:i,groupby:r,as:o,offset:a="zero"}=n,s=[],l=[];if(void 0!==n.sort)for(const e of n.sort)s.push(e.field),l.push(q(e.order,"ascending"));const c={field:s,order:l};let u;return u=function(e){return t.isArray(e)&&e.every((e=>t.isString(e)))&&e.length>1}(o)?o:t.isString(o)?[o,`${o}_end`]:[`${n.stack}_start`,`${n.stack}_end`],new Ed(e,{dimensionFieldDefs:[],stackField:i,groupby:r,offset:a,sort:c,facetby:[],as:u})}static makeFromEncoding(e,n){const i=n.stack,{encoding:r}=n;if(!i)return null;const{groupbyChannels:o,fieldChannel:a,offset:s,impute:l}=i,c=o.map((e=>ha(r[e]))).filter((e=>!!e)),u=function(e){return e.stack.stackBy.reduce(((e,t)=>{const n=sa(t.fieldDef);return n&&e.push(n),e}),[])}(n),f=n.encoding.order;let d;if(t.isArray(f)||Go(f))d=En(f);else{const e=Io(f)?f.sort:"y"===a?"descending":"ascending";d=u.reduce(((t,n)=>(t.field.includes(n)||(t.field.push(n),t.order.push(e)),t)),{field:[],order:[]})}return new Ed(e,{dimensionFieldDefs:c,stackField:n.vgField(a),facetby:[],stackby:u,sort:d,offset:s,impute:l,as:[n.vgField(a,{suffix:"start",forAs:!0}),n.vgField(a,{suffix:"end",forAs:!0})]})}get stack(){return this._stack}addDimensions(e){this._stack.facetby.push(...e)}dependentFields(){const e=new Set;return e.add(this._stack.stackField),this.getGroupbyFields().forEach(e.add,e),this._stack.facetby.forEach(e.add,e),this._stack.sort.field.forEach(e.add,e),e}producedFields(){return new Set(this._stack.as)}hash(){return`Stack ${d(this._stack)}`}getGroupbyFields(){const{dimensionFieldDefs:e,impute:t,groupby:n}=this._stack;return e.length>0?e.map((e=>e.bin?t?[sa(e,{binSuffix:"mid"})]:[sa(e,{}),sa(e,{binSuffix:"end"})]:[sa(e)])).flat():n??[]}assemble(){const e=[],{facetby:t,dimensionFieldDefs:n,stackField:i,stackby:r,sort:o,offset:a,impute:s,as:l}=this._stack;if(s)for(const o of n){const{bandPosition:n=.5,bin:a}=o;if(a){const t=sa(o,{expr:"datum"}),i=sa(o,{expr:"datum",binSuffix:"end"});e.push({type:"formula",expr:`${jd(t)} ? ${n}*${t}+${1-n}*${i} : ${t}`,as:sa(o,{binSuffix:"mid",forAs:!0})})}e.push({type:"impute",field:i,groupby:[...r,...t],key:sa(o,{binSuffix:"mid"}),method:"value",value:0})}return e.push({type:"stack",groupby:[...this.getGroupbyFields(),...t],field:i,sort:o,as:l,offset:a}),e}}class Md extends $c{clone(){return new Md(null,l(this.transform))}constructor(e,t){super(e),this.transform=t}addDimensions(e){this.transform.groupby=b(this.transform.groupby.concat(e),(e=>e))}dependentFields(){const e=new Set;return(this.transform.groupby??[]).forEach(e.add,e),(this.transform.sort??[]).forEach((t=>e.add(t.field))),this.transform.window.map((e=>e.field)).filter((e=>void 0!==e)).forEach(e.add,e),e}producedFields(){return new Set(this.transform.window.map(this.getDefaultName))}getDefaultName(e){return e.as??sa(e)}hash(){return`WindowTransform ${d(this.transform)}`}assemble(){const e=[],t=[],n=[],i=[];for(const r of this.transform.window)t.push(r.op),n.push(this.getDefaultName(r)),i.push(void 0===r.param?null:r.param),e.push(void 0===r.field?null:r.field);const r=this.transform.frame,o=this.transform.groupby;if(r&&null===r[0]&&null===r[1]&&t.every((e=>nn(e))))return{type:"joinaggregate",as:n,ops:t,fields:e,...void 0!==o?{groupby:o}:{}};const a=[],s=[];if(void 0!==this.transform.sort)for(const e of this.transform.sort)a.push(e.field),s.push(e.order??"ascending");const l={field:a,order:s},c=this.transform.ignorePeers;return{type:"window",params:i,as:n,ops:t,fields:e,sort:l,...void 0!==c?{ignorePeers:c}:{},...void 0!==o?{groupby:o}:{},...void 0!==r?{frame:r}:{}}}}function Rd(e){if(e instanceof cd)if(1!==e.numChildren()||e.children[0]instanceof wc){const n=e.model.component.data.main;Ld(n);const i=(t=e,function e(n){if(!(n instanceof cd)){const i=n.clone();if(i instanceof wc){const e=qd+i.getSource();i.setSource(e),t.model.component.data.outputNodes[e]=i}else(i instanceof ld||i instanceof Ed||i instanceof Md||i instanceof Ad)&&i.addDimensions(t.fields);for(const t of n.children.flatMap(e))t.parent=i;return[i]}return n.children.flatMap(e)}),r=e.children.map(i).flat();for(const e of r)e.parent=n}else{const t=e.children[0];(t instanceof ld||t instanceof Ed||t instanceof Md||t instanceof Ad)&&t.addDimensions(e.fields),t.swapWithParent(),Rd(e)}else e.children.map(Rd);var t}function Ld(e){if(e instanceof wc&&e.type===mc.Main&&1===e.numChildren()){const t=e.children[0];t instanceof cd||(t.swapWithParent(),Ld(e))}}const qd="scale_",Ud=5;function Wd(e){for(const t of e){for(const e of t.children)if(e.parent!==t)return!1;if(!Wd(t.children))return!1}return!0}function Id(e,t){let n=!1;for(const i of t)n=e.optimize(i)||n;return n}function Bd(e,t,n){let i=e.sources,r=!1;return r=Id(new Dd,i)||r,r=Id(new kd(t),i)||r,i=i.filter((e=>e.numChildren()>0)),r=Id(new zd,i)||r,i=i.filter((e=>e.numChildren()>0)),n||(r=Id(new Fd,i)||r,r=Id(new Pd(t),i)||r,r=Id(new Sd,i)||r,r=Id(new Od,i)||r,r=Id(new Nd,i)||r,r=Id(new Cd,i)||r,r=Id(new wd,i)||r,r=Id(new _d,i)||r),e.sources=i,r}class Vd{constructor(e){Object.defineProperty(this,"signal",{enumerable:!0,get:e})}static fromName(e,t){return new Vd((()=>e(t)))}}function Hd(e){Sm(e)?function(e){const t=e.component.scales;for(const n of D(t)){const i=Gd(e,n);if(t[n].setWithExplicit("domains",i),Jd(e,n),e.component.data.isFaceted){let t=e;for(;!Dm(t)&&t.parent;)t=t.parent;if("shared"===t.component.resolve.scale[n])for(const e of i.value)xn(e)&&(e.data=qd+e.data.replace(qd,""))}}}(e):function(e){for(const t of e.children)Hd(t);const t=e.component.scales;for(const n of D(t)){let i,r=null;for(const t of e.children){const e=t.component.scales[n];if(e){i=void 0===i?e.getWithExplicit("domains"):rc(i,e.getWithExplicit("domains"),"domains","scale",Zd);const t=e.get("selectionExtent");r&&t&&r.param!==t.param&&vi(Xn),r=t}}t[n].setWithExplicit("domains",i),r&&t[n].set("selectionExtent",r,!0)}}(e)}function Gd(e,t){const n=e.getScaleComponent(t).get("type"),{encoding:i}=e,r=function(e,t,n,i){if("unaggregated"===e){const{valid:e,reason:i}=Kd(t,n);if(!e)return void vi(i)}else if(void 0===e&&i.useUnaggregatedDomain){const{valid:e}=Kd(t,n);if(e)return"unaggregated"}return e}(e.scaleDomain(t),e.typedFieldDef(t),n,e.config.scale);return r!==e.scaleDomain(t)&&(e.specifiedScales[t]={...e.specifiedScales[t],domain:r}),"x"===t&&ya(i.x2)?ya(i.x)?rc(Xd(n,r,e,"x"),Xd(n,r,e,"x2"),"domain","scale",Zd):Xd(n,r,e,"x2"):"y"===t&&ya(i.y2)?ya(i.y)?rc(Xd(n,r,e,"y"),Xd(n,r,e,"y2"),"domain","scale",Zd):Xd(n,r,e,"y2"):Xd(n,r,e,t)}function Yd(e,t,n){const i=Mi(n)?.unit;return"temporal"===t||i?function(e,t,n){return e.map((e=>({signal:`{data: ${Sa(e,{timeUnit:n,type:t})}}`})))}(e,t,i):[e]}function Xd(e,n,i,r){const{encoding:o,markDef:a,mark:s,config:l,stack:c}=i,u=ya(o[r]),{type:f}=u,d=u.timeUnit,m=function(e){const{marks:t,scales:n}=pc(e);return t===n?mc.Main:"include-invalid-values"===n?mc.PreFilterInvalid:mc.PostFilterInvalid}({invalid:An("invalid",a,l),isPath:Gr(s)});if(function(e){return Q(e,"unionWith")}(n)){const t=Xd(e,void 0,i,r);return ec([...Yd(n.unionWith,f,d),...t.value])}if(vn(n))return ec([n]);if(n&&"unaggregated"!==n&&!$r(n))return ec(Yd(n,f,d));if(c&&r===c.fieldChannel){if("normalize"===c.offset)return tc([[0,1]]);const e=i.requestDataName(m);return tc([{data:e,field:i.vgField(r,{suffix:"start"})},{data:e,field:i.vgField(r,{suffix:"end"})}])}const g=Ht(r)&&Go(u)?function(e,t,n){if(!yr(n))return;const i=e.fieldDef(t),r=i.sort;if(To(r))return{op:"min",field:uf(i,t),order:"ascending"};const{stack:o}=e,a=o?new Set([...o.groupbyFields,...o.stackBy.map((e=>e.fieldDef.field))]):void 0;if(Ao(r)){return Qd(r,o&&!a.has(r.field))}if(function(e){return Q(e,"encoding")}(r)){const{encoding:t,order:n}=r,i=e.fieldDef(t),{aggregate:s,field:l}=i,c=o&&!a.has(l);if(en(s)||tn(s))return Qd({field:sa(i),order:n},c);if(nn(s)||!s)return Qd({op:s,field:l,order:n},c)}else{if("descending"===r)return{op:"min",field:e.vgField(t),order:"descending"};if(p(["ascending",void 0],r))return!0}return}(i,r,e):void 0;if(Xo(u)){return tc(Yd([u.datum],f,d))}const h=u;if("unaggregated"===n){const{field:e}=u;return tc([{data:i.requestDataName(m),field:sa({field:e,aggregate:"min"})},{data:i.requestDataName(m),field:sa({field:e,aggregate:"max"})}])}if(cn(h.bin)){if(yr(e))return tc("bin-ordinal"===e?[]:[{data:z(g)?i.requestDataName(m):i.requestDataName(mc.Raw),field:i.vgField(r,Fa(h,r)?{binSuffix:"range"}:{}),sort:!0!==g&&t.isObject(g)?g:{field:i.vgField(r,{}),op:"min"}}]);{const{bin:e}=h;if(cn(e)){const t=rd(i,h.field,e);return tc([new Vd((()=>{const e=i.getSignalName(t);return`[${e}.start, ${e}.stop]`}))])}return tc([{data:i.requestDataName(m),field:i.vgField(r,{})}])}}if(h.timeUnit&&p(["time","utc"],e)){const e=o[rt(r)];if(Wo(h,e,a,l)){const t=i.requestDataName(m),n=qo({fieldDef:h,fieldDef2:e,markDef:a,config:l}),o=Yr(s)&&.5!==n&&zt(r);return tc([{data:t,field:i.vgField(r,o?{suffix:Fc}:{})},{data:t,field:i.vgField(r,{suffix:o?Oc:"end"})}])}}return tc(g?[{data:z(g)?i.requestDataName(m):i.requestDataName(mc.Raw),field:i.vgField(r),sort:g}]:[{data:i.requestDataName(m),field:i.vgField(r)}])}function Qd(e,t){const{op:n,field:i,order:r}=e;return{op:n??(t?"sum":No),...i?{field:E(i)}:{},...r?{order:r}:{}}}function Jd(e,t){const n=e.component.scales[t],i=e.specifiedScales[t].domain,r=e.fieldDef(t)?.bin,o=$r(i)?i:void 0,a=fn(r)&&dn(r.extent)?r.extent:void 0;(o||a)&&n.set("selectionExtent",o??a,!0)}function Kd(e,n){const{aggregate:i,type:r}=e;return i?t.isString(i)&&!sn.has(i)?{valid:!1,reason:li(i)}:"quantitative"===r&&"log"===n?{valid:!1,reason:ci(e)}:{valid:!0}:{valid:!1,reason:si(e)}}function Zd(e,t,n,i){return e.explicit&&t.explicit&&vi(function(e,t,n,i){return`Conflicting ${t.toString()} property "${e.toString()}" (${X(n)} and ${X(i)}). Using the union of the two domains.`}(n,i,e.value,t.value)),{explicit:e.explicit,value:[...e.value,...t.value]}}function em(e){const n=b(e.map((e=>{if(xn(e)){const{sort:t,...n}=e;return n}return e})),d),i=b(e.map((e=>{if(xn(e)){const t=e.sort;return void 0===t||z(t)||("op"in t&&"count"===t.op&&delete t.field,"ascending"===t.order&&delete t.order),t}})).filter((e=>void 0!==e)),d);if(0===n.length)return;if(1===n.length){const n=e[0];if(xn(n)&&i.length>0){let e=i[0];if(i.length>1){vi(di);const n=i.filter((e=>t.isObject(e)&&"op"in e&&"min"!==e.op));e=!i.every((e=>t.isObject(e)&&"op"in e))||1!==n.length||n[0]}else if(t.isObject(e)&&"field"in e){const t=e.field;n.field===t&&(e=!e.order||{order:e.order})}return{...n,sort:e}}return n}const r=b(i.map((e=>z(e)||!("op"in e)||t.isString(e.op)&&t.hasOwnProperty(Zt,e.op)?e:(vi(function(e){return`Dropping sort property ${X(e)} as unioned domains only support boolean or op "count", "min", and "max".`}(e)),!0))),d);let o;1===r.length?o=r[0]:r.length>1&&(vi(di),o=!0);const a=b(e.map((e=>xn(e)?e.data:null)),(e=>e));if(1===a.length&&null!==a[0]){return{data:a[0],fields:n.map((e=>e.field)),...o?{sort:o}:{}}}return{fields:n,...o?{sort:o}:{}}}function tm(e){if(xn(e)&&t.isString(e.field))return e.field;if(function(e){return!t.isArray(e)&&Q(e,"fields")&&!Q(e,"data")}(e)){let n;for(const i of e.fields)if(xn(i)&&t.isString(i.field))if(n){if(n!==i.field)return vi("Detected faceted independent scales that union domain of multiple fields from different data sources. We will use the first field. The result view size may be incorrect."),n}else n=i.field;return vi("Detected faceted independent scales that union domain of the same fields from different source. We will assume that this is the same field from a different fork of the same data source. However, if this is not the case, the result view size may be incorrect."),n}if(function(e){return!t.isArray(e)&&Q(e,"fields")&&Q(e,"data")}(e)){vi("Detected faceted independent scales that union domain of multiple fields from the same data source. We will use the first field. The result view size may be incorrect.");const n=e.fields[0];return t.isString(n)?n:void 0}}function nm(e,t){const n=e.component.scales[t].get("domains").map((t=>(xn(t)&&(t.data=e.lookupDataSource(t.data)),t)));return em(n)}function im(e){return Om(e)||Fm(e)?e.children.reduce(((e,t)=>e.concat(im(t))),rm(e)):rm(e)}function rm(e){return D(e.component.scales).reduce(((n,i)=>{const r=e.component.scales[i];if(r.merged)return n;const o=r.combine(),{name:a,type:s,selectionExtent:l,domains:c,range:u,reverse:f,...d}=o,m=function(e,n,i,r){if(zt(i)){if(bn(e))return{step:{signal:`${n}_step`}}}else if(t.isObject(e)&&xn(e))return{...e,data:r.lookupDataSource(e.data)};return e}(o.range,a,i,e),p=nm(e,i),g=l?function(e,n,i,r){const o=Xu(e,n.param,n);return{signal:vr(i.get("type"))&&t.isArray(r)&&r[0]>r[1]?`isValid(${o}) && reverse(${o})`:o}}(e,l,r,p):null;return n.push({name:a,type:s,...p?{domain:p}:{},...g?{domainRaw:g}:{},range:m,...void 0!==f?{reverse:f}:{},...d}),n}),[])}class om extends Zl{merged=!1;constructor(e,t){super({},{name:e}),this.setWithExplicit("type",t)}domainHasZero(){const e=this.get("type");if(p([ar.LOG,ar.TIME,ar.UTC],e))return"definitely-not";const n=this.get("zero");if(!0===n||void 0===n&&p([ar.LINEAR,ar.SQRT,ar.POW],e))return"definitely";const i=this.get("domains");if(i.length>0){let e=!1,n=!1,r=!1;for(const o of i){if(t.isArray(o)){const i=o[0],r=o[o.length-1];if(t.isNumber(i)&&t.isNumber(r)){if(i<=0&&r>=0){e=!0;continue}n=!0;continue}}r=!0}if(e)return"definitely";if(n&&!r)return"definitely-not"}return"maybe"}}const am=["range","scheme"];function sm(e,n){const i=e.fieldDef(n);if(i?.bin){const{bin:r,field:o}=i,a=ot(n),s=e.getName(a);if(t.isObject(r)&&r.binned&&void 0!==r.step)return new Vd((()=>{const t=e.scaleName(n),i=`(domain("${t}")[1] - domain("${t}")[0]) / ${r.step}`;return`${e.getSignalName(s)} / (${i})`}));if(cn(r)){const t=rd(e,o,r);return new Vd((()=>{const n=e.getSignalName(t),i=`(${n}.stop - ${n}.start) / ${n}.step`;return`${e.getSignalName(s)} / (${i})`}))}}}function lm(e,n){const i=n.specifiedScales[e],{size:r}=n,o=n.getScaleComponent(e).get("type");for(const r of am)if(void 0!==i[r]){const a=Nr(o,r),s=Pr(e,r);if(a)if(s)vi(s);else switch(r){case"range":{const r=i.range;if(t.isArray(r)){if(zt(e))return ec(r.map((e=>{if("width"===e||"height"===e){const t=n.getName(e),i=n.getSignalName.bind(n);return Vd.fromName(i,t)}return e})))}else if(t.isObject(r))return ec({data:n.requestDataName(mc.Main),field:r.field,sort:{op:"min",field:n.vgField(e)}});return ec(r)}case"scheme":return ec(cm(i[r]))}else vi(ui(o,r,e))}const a=e===ee||"xOffset"===e?"width":"height",s=r[a];if(_s(s))if(zt(e))if(yr(o)){const t=fm(s,n,e);if(t)return ec({step:t})}else vi(fi(a));else if(At(e)){const t=e===re?"x":"y";if("band"===n.getScaleComponent(t).get("type")){const e=dm(s,o);if(e)return ec(e)}}const{rangeMin:l,rangeMax:u}=i,f=function(e,n){const{size:i,config:r,mark:o,encoding:a}=n,{type:s}=ya(a[e]),l=n.getScaleComponent(e),u=l.get("type"),{domain:f,domainMid:d}=n.specifiedScales[e];switch(e){case ee:case te:if(p(["point","band"],u)){const t=mm(e,i,r.view);if(_s(t)){return{step:fm(t,n,e)}}}return um(e,n,u);case re:case oe:return function(e,t,n){const i=e===re?"x":"y",r=t.getScaleComponent(i);if(!r)return um(i,t,n,{center:!0});const o=r.get("type"),a=t.scaleName(i),{markDef:s,config:l}=t;if("band"===o){const e=mm(i,t.size,t.config.view);if(_s(e)){const t=dm(e,n);if(t)return t}return[0,{signal:`bandwidth('${a}')`}]}{const n=t.encoding[i];if(Go(n)&&n.timeUnit){const e=Ri(n.timeUnit,(e=>`scale('${a}', ${e})`)),i=t.config.scale.bandWithNestedOffsetPaddingInner,r=qo({fieldDef:n,markDef:s,config:l})-.5,o=0!==r?` + ${r}`:"";if(i){return[{signal:`${vn(i)?`${i.signal}/2`+o:`${i/2+r}`} * (${e})`},{signal:`${vn(i)?`(1 - ${i.signal}/2)`+o:`${1-i/2+r}`} * (${e})`}]}return[0,{signal:e}]}return c(`Cannot use ${e} scale if ${i} scale is not discrete.`)}}(e,n,u);case ve:{const a=function(e,t){switch(e){case"bar":case"tick":return t.scale.minBandSize;case"line":case"trail":case"rule":return t.scale.minStrokeWidth;case"text":return t.scale.minFontSize;case"point":case"square":case"circle":return t.scale.minSize}throw new Error(ii("size",e))}(o,r),s=function(e,n,i,r){const o={x:sm(i,"x"),y:sm(i,"y")};switch(e){case"bar":case"tick":{if(void 0!==r.scale.maxBandSize)return r.scale.maxBandSize;const e=gm(n,o,r.view);return t.isNumber(e)?e-1:new Vd((()=>`${e.signal} - 1`))}case"line":case"trail":case"rule":return r.scale.maxStrokeWidth;case"text":return r.scale.maxFontSize;case"point":case"square":case"circle":{if(r.scale.maxSize)return r.scale.maxSize;const e=gm(n,o,r.view);return t.isNumber(e)?Math.pow(pm*e,2):new Vd((()=>`pow(${pm} * ${e.signal}, 2)`))}}throw new Error(ii("size",e))}(o,i,n,r);return xr(u)?function(e,t,n){const i=()=>{const i=Cn(t),r=Cn(e),o=`(${i} - ${r}) / (${n} - 1)`;return`sequence(${r}, ${i} + ${o}, ${o})`};return vn(t)?new Vd(i):{signal:i()}}(a,s,function(e,n,i,r){switch(e){case"quantile":return n.scale.quantileCount;case"quantize":return n.scale.quantizeCount;case"threshold":return void 0!==i&&t.isArray(i)?i.length+1:(vi(function(e){return`Domain for ${e} is required for threshold scale.`}(r)),3)}}(u,r,f,e)):[a,s]}case le:return[0,2*Math.PI];case be:return[0,360];case ae:return[0,new Vd((()=>`min(${n.getSignalName(Dm(n.parent)?"child_width":"width")},${n.getSignalName(Dm(n.parent)?"child_height":"height")})/2`))];case ke:return[r.scale.minStrokeWidth,r.scale.maxStrokeWidth];case Se:return[[1,0],[4,2],[2,1],[1,1],[1,2,4,2]];case ye:return"symbol";case pe:case ge:case he:return"ordinal"===u?"nominal"===s?"category":"ordinal":void 0!==d?"diverging":"rect"===o||"geoshape"===o?"heatmap":"ramp";case xe:case $e:case we:return[r.scale.minOpacity,r.scale.maxOpacity]}}(e,n);return(void 0!==l||void 0!==u)&&Nr(o,"rangeMin")&&t.isArray(f)&&2===f.length?ec([l??f[0],u??f[1]]):tc(f)}function cm(e){return function(e){return!t.isString(e)&&Q(e,"name")}(e)?{scheme:e.name,...f(e,["name"])}:{scheme:e}}function um(e,t,n){let{center:i}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};const r=ot(e),o=t.getName(r),a=t.getSignalName.bind(t);return e===te&&vr(n)?i?[Vd.fromName((e=>`${a(e)}/2`),o),Vd.fromName((e=>`-${a(e)}/2`),o)]:[Vd.fromName(a,o),0]:i?[Vd.fromName((e=>`-${a(e)}/2`),o),Vd.fromName((e=>`${a(e)}/2`),o)]:[0,Vd.fromName(a,o)]}function fm(e,n,i){const{encoding:r}=n,o=n.getScaleComponent(i),a=st(i),s=r[a];if("offset"===Ps({step:e,offsetIsDiscrete:Zo(s)&&er(s.type)})&&Ra(r,a)){const i=n.getScaleComponent(a);let r=`domain('${n.scaleName(a)}').length`;if("band"===i.get("type")){r=`bandspace(${r}, ${i.get("paddingInner")??i.get("padding")??0}, ${i.get("paddingOuter")??i.get("padding")??0})`}const s=o.get("paddingInner")??o.get("padding");return{signal:`${e.step} * ${r} / (1-${l=s,vn(l)?l.signal:t.stringValue(l)})`}}return e.step;var l}function dm(e,t){if("offset"===Ps({step:e,offsetIsDiscrete:yr(t)}))return{step:e.step}}function mm(e,t,n){const i=e===ee?"width":"height",r=t[i];return r||Ms(n,i)}const pm=.95;function gm(e,t,n){const i=_s(e.width)?e.width.step:Es(n,"width"),r=_s(e.height)?e.height.step:Es(n,"height");return t.x||t.y?new Vd((()=>`min(${[t.x?t.x.signal:i,t.y?t.y.signal:r].join(", ")})`)):Math.min(i,r)}function hm(e,t){Sm(e)?function(e,t){const n=e.component.scales,{config:i,encoding:r,markDef:o,specifiedScales:a}=e;for(const s of D(n)){const l=a[s],c=n[s],u=e.getScaleComponent(s),f=ya(r[s]),d=l[t],m=u.get("type"),p=u.get("padding"),g=u.get("paddingInner"),h=Nr(m,t),y=Pr(s,t);if(void 0!==d&&(h?y&&vi(y):vi(ui(m,t,s))),h&&void 0===y)if(void 0!==d){const e=f.timeUnit,n=f.type;switch(t){case"domainMax":case"domainMin":bi(l[t])||"temporal"===n||e?c.set(t,{signal:Sa(l[t],{type:n,timeUnit:e})},!0):c.set(t,l[t],!0);break;default:c.copyKeyFromObject(t,l)}}else{const n=Q(ym,t)?ym[t]({model:e,channel:s,fieldOrDatumDef:f,scaleType:m,scalePadding:p,scalePaddingInner:g,domain:l.domain,domainMin:l.domainMin,domainMax:l.domainMax,markDef:o,config:i,hasNestedOffsetScale:La(r,s),hasSecondaryRangeChannel:!!r[rt(s)]}):i.scale[t];void 0!==n&&c.set(t,n,!1)}}}(e,t):bm(e,t)}const ym={bins:e=>{let{model:t,fieldOrDatumDef:n}=e;return Go(n)?function(e,t){const n=t.bin;if(cn(n)){const i=rd(e,t.field,n);return new Vd((()=>e.getSignalName(i)))}if(un(n)&&fn(n)&&void 0!==n.step)return{step:n.step};return}(t,n):void 0},interpolate:e=>{let{channel:t,fieldOrDatumDef:n}=e;return function(e,t){if(p([pe,ge,he],e)&&"nominal"!==t)return"hcl";return}(t,n.type)},nice:e=>{let{scaleType:n,channel:i,domain:r,domainMin:o,domainMax:a,fieldOrDatumDef:s}=e;return function(e,n,i,r,o,a){if(ha(a)?.bin||t.isArray(i)||null!=o||null!=r||p([ar.TIME,ar.UTC],e))return;return!!zt(n)||void 0}(n,i,r,o,a,s)},padding:e=>{let{channel:t,scaleType:n,fieldOrDatumDef:i,markDef:r,config:o}=e;return function(e,t,n,i,r,o){if(zt(e)){if(br(t)){if(void 0!==n.continuousPadding)return n.continuousPadding;const{type:t,orient:a}=r;if("bar"===t&&(!Go(i)||!i.bin&&!i.timeUnit)&&("vertical"===a&&"x"===e||"horizontal"===a&&"y"===e))return o.continuousBandSize}if(t===ar.POINT)return n.pointPadding}return}(t,n,o.scale,i,r,o.bar)},paddingInner:e=>{let{scalePadding:t,channel:n,markDef:i,scaleType:r,config:o,hasNestedOffsetScale:a}=e;return function(e,t,n,i,r){let o=arguments.length>5&&void 0!==arguments[5]&&arguments[5];if(void 0!==e)return;if(zt(t)){const{bandPaddingInner:e,barBandPaddingInner:t,rectBandPaddingInner:i,tickBandPaddingInner:a,bandWithNestedOffsetPaddingInner:s}=r;return o?s:q(e,"bar"===n?t:"tick"===n?a:i)}if(At(t)&&i===ar.BAND)return r.offsetBandPaddingInner;return}(t,n,i.type,r,o.scale,a)},paddingOuter:e=>{let{scalePadding:t,channel:n,scaleType:i,scalePaddingInner:r,config:o,hasNestedOffsetScale:a}=e;return function(e,t,n,i,r){let o=arguments.length>5&&void 0!==arguments[5]&&arguments[5];if(void 0!==e)return;if(zt(t)){const{bandPaddingOuter:e,bandWithNestedOffsetPaddingOuter:t}=r;if(o)return t;if(n===ar.BAND)return q(e,vn(i)?{signal:`${i.signal}/2`}:i/2)}else if(At(t)){if(n===ar.POINT)return.5;if(n===ar.BAND)return r.offsetBandPaddingOuter}return}(t,n,i,r,o.scale,a)},reverse:e=>{let{fieldOrDatumDef:t,scaleType:n,channel:i,config:r}=e;return function(e,t,n,i){if("x"===n&&void 0!==i.xReverse)return vr(e)&&"descending"===t?vn(i.xReverse)?{signal:`!${i.xReverse.signal}`}:!i.xReverse:i.xReverse;if(vr(e)&&"descending"===t)return!0;return}(n,Go(t)?t.sort:void 0,i,r.scale)},zero:e=>{let{channel:n,fieldOrDatumDef:i,domain:r,markDef:o,scaleType:a,config:s,hasSecondaryRangeChannel:l}=e;return function(e,n,i,r,o,a,s){if(i&&"unaggregated"!==i&&vr(o)){if(t.isArray(i)){const e=i[0],n=i[i.length-1];if(t.isNumber(e)&&e<=0&&t.isNumber(n)&&n>=0)return!0}return!1}if("size"===e&&"quantitative"===n.type&&!xr(o))return!0;if((!Go(n)||!n.bin)&&p([...Ot,...Nt],e)){const{orient:t,type:n}=r;return(!p(["bar","area","line","trail"],n)||!("horizontal"===t&&"y"===e||"vertical"===t&&"x"===e))&&(!(!p(["bar","area"],n)||s)||a?.zero)}return!1}(n,i,r,o,a,s.scale,l)}};function vm(e){Sm(e)?function(e){const t=e.component.scales;for(const n of Vt){const i=t[n];if(!i)continue;const r=lm(n,e);i.setWithExplicit("range",r)}}(e):bm(e,"range")}function bm(e,t){const n=e.component.scales;for(const n of e.children)"range"===t?vm(n):hm(n,t);for(const i of D(n)){let r;for(const n of e.children){const e=n.component.scales[i];if(e){r=rc(r,e.getWithExplicit(t),t,"scale",nc(((e,n)=>"range"===t&&e.step&&n.step?e.step-n.step:0)))}}n[i].setWithExplicit(t,r)}}function xm(e,t,n,i){const r=function(e,t,n,i){switch(t.type){case"nominal":case"ordinal":if(qe(e)||"discrete"===Jt(e))return"shape"===e&&"ordinal"===t.type&&vi(ai(e,"ordinal")),"ordinal";if(zt(e)||At(e)){if(p(["rect","bar","image","rule","tick"],n.type))return"band";if(i)return"band"}else if("arc"===n.type&&e in Ct)return"band";return no(n[ot(e)])||ia(t)&&t.axis?.tickBand?"band":"point";case"temporal":return qe(e)?"time":"discrete"===Jt(e)?(vi(ai(e,"temporal")),"ordinal"):Go(t)&&t.timeUnit&&Mi(t.timeUnit).utc?"utc":"time";case"quantitative":return qe(e)?Go(t)&&cn(t.bin)?"bin-ordinal":"linear":"discrete"===Jt(e)?(vi(ai(e,"quantitative")),"ordinal"):"linear";case"geojson":return}throw new Error(ei(t.type))}(t,n,i,arguments.length>4&&void 0!==arguments[4]&&arguments[4]),{type:o}=e;return Ht(t)?void 0!==o?function(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];if(!Ht(e))return!1;switch(e){case ee:case te:case re:case oe:case le:case ae:return!!br(t)||"band"===t||"point"===t&&!n;case ve:case ke:case xe:case $e:case we:case be:return br(t)||xr(t)||p(["band","point","ordinal"],t);case pe:case ge:case he:return"band"!==t;case Se:case ye:return"ordinal"===t||xr(t)}}(t,o)?Go(n)&&(a=o,s=n.type,!(p([nr,rr],s)?void 0===a||yr(a):s===ir?p([ar.TIME,ar.UTC,void 0],a):s!==tr||mr(a)||xr(a)||void 0===a))?(vi(function(e,t){return`FieldDef does not work with "${e}" scale. We are using "${t}" scale instead.`}(o,r)),r):o:(vi(function(e,t,n){return`Channel "${e}" does not work with "${t}" scale. We are using "${n}" scale instead.`}(t,o,r)),r):r:null;var a,s}function $m(e){Sm(e)?e.component.scales=function(e){const{encoding:t,mark:n,markDef:i}=e,r={};for(const o of Vt){const a=ya(t[o]);if(a&&n===Hr&&o===ye&&a.type===or)continue;let s=a&&a.scale;if(a&&null!==s&&!1!==s){s??={};const n=xm(s,o,a,i,La(t,o));r[o]=new om(e.scaleName(`${o}`,!0),{value:n,explicit:s.type===n})}}return r}(e):e.component.scales=function(e){const t=e.component.scales={},n={},i=e.component.resolve;for(const t of e.children){$m(t);for(const r of D(t.component.scales))if(i.scale[r]??=_f(r,e),"shared"===i.scale[r]){const e=n[r],o=t.component.scales[r].getWithExplicit("type");e?lr(e.value,o.value)?n[r]=rc(e,o,"type","scale",wm):(i.scale[r]="independent",delete n[r]):n[r]=o}}for(const i of D(n)){const r=e.scaleName(i,!0),o=n[i];t[i]=new om(r,o);for(const t of e.children){const e=t.component.scales[i];e&&(t.renameScale(e.get("name"),r),e.merged=!0)}}return t}(e)}const wm=nc(((e,t)=>ur(e)-ur(t)));class km{constructor(){this.nameMap={}}rename(e,t){this.nameMap[e]=t}has(e){return void 0!==this.nameMap[e]}get(e){for(;this.nameMap[e]&&e!==this.nameMap[e];)e=this.nameMap[e];return e}}function Sm(e){return"unit"===e?.type}function Dm(e){return"facet"===e?.type}function Fm(e){return"concat"===e?.type}function Om(e){return"layer"===e?.type}class zm{constructor(e,n,i,r,o,a,c){this.type=n,this.parent=i,this.config=o,this.parent=i,this.config=o,this.view=gn(c),this.name=e.name??r,this.title=yn(e.title)?{text:e.title}:e.title?gn(e.title):void 0,this.scaleNameMap=i?i.scaleNameMap:new km,this.projectionNameMap=i?i.projectionNameMap:new km,this.signalNameMap=i?i.signalNameMap:new km,this.data=e.data,this.description=e.description,this.transforms=(e.transform??[]).map((e=>$l(e)?{filter:s(e.filter,Ki)}:e)),this.layout="layer"===n||"unit"===n?{}:function(e,n,i){const r=i[n],o={},{spacing:a,columns:s}=r;void 0!==a&&(o.spacing=a),void 0!==s&&(Mo(e)&&!jo(e.facet)||zs(e))&&(o.columns=s),Cs(e)&&(o.columns=1);for(const n of Ts)if(void 0!==e[n])if("spacing"===n){const i=e[n];o[n]=t.isNumber(i)?i:{row:i.row??a,column:i.column??a}}else o[n]=e[n];return o}(e,n,o),this.component={data:{sources:i?i.component.data.sources:[],outputNodes:i?i.component.data.outputNodes:{},outputNodeRefCounts:i?i.component.data.outputNodeRefCounts:{},isFaceted:Mo(e)||i?.component.data.isFaceted&&void 0===e.data},layoutSize:new Zl,layoutHeaders:{row:{},column:{},facet:{}},mark:null,resolve:{scale:{},axis:{},legend:{},...a?l(a):{}},selection:null,scales:null,projection:null,axes:{},legends:{}}}get width(){return this.getSizeSignalRef("width")}get height(){return this.getSizeSignalRef("height")}parse(){this.parseScale(),this.parseLayoutSize(),this.renameTopLevelLayoutSizeSignal(),this.parseSelections(),this.parseProjection(),this.parseData(),this.parseAxesAndHeaders(),this.parseLegends(),this.parseMarkGroup()}parseScale(){!function(e){let{ignoreRange:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};$m(e),Hd(e);for(const t of Cr)hm(e,t);t||vm(e)}(this)}parseProjection(){td(this)}renameTopLevelLayoutSizeSignal(){"width"!==this.getName("width")&&this.renameSignal(this.getName("width"),"width"),"height"!==this.getName("height")&&this.renameSignal(this.getName("height"),"height")}parseLegends(){Vf(this)}assembleEncodeFromView(e){const{style:t,...n}=e,i={};for(const e of D(n)){const t=n[e];void 0!==t&&(i[e]=On(t))}return i}assembleGroupEncodeEntry(e){let t={};return this.view&&(t=this.assembleEncodeFromView(this.view)),e||(this.description&&(t.description=On(this.description)),"unit"!==this.type&&"layer"!==this.type)?S(t)?void 0:t:{width:this.getSizeSignalRef("width"),height:this.getSizeSignalRef("height"),...t}}assembleLayout(){if(!this.layout)return;const{spacing:e,...t}=this.layout,{component:n,config:i}=this,r=function(e,t){const n={};for(const i of We){const r=e[i];if(r?.facetFieldDef){const{titleAnchor:e,titleOrient:o}=mf(["titleAnchor","titleOrient"],r.facetFieldDef.header,t,i),a=ff(i,o),s=Sf(e,a);void 0!==s&&(n[a]=s)}}return S(n)?void 0:n}(n.layoutHeaders,i);return{padding:e,...this.assembleDefaultLayout(),...t,...r?{titleBand:r}:{}}}assembleDefaultLayout(){return{}}assembleHeaderMarks(){const{layoutHeaders:e}=this.component;let t=[];for(const n of We)e[n].title&&t.push(hf(this,n));for(const e of pf)t=t.concat(bf(this,e));return t}assembleAxes(){return function(e,t){const{x:n=[],y:i=[]}=e;return[...n.map((e=>Ku(e,"grid",t))),...i.map((e=>Ku(e,"grid",t))),...n.map((e=>Ku(e,"main",t))),...i.map((e=>Ku(e,"main",t)))].filter((e=>e))}(this.component.axes,this.config)}assembleLegends(){return Qf(this)}assembleProjections(){return Jf(this)}assembleTitle(){const{encoding:e,...t}=this.title??{},n={...hn(this.config.title).nonMarkTitleProperties,...t,...e?{encode:{update:e}}:{}};if(n.text)return p(["unit","layer"],this.type)?p(["middle",void 0],n.anchor)&&(n.frame??="group"):n.anchor??="start",S(n)?void 0:n}assembleGroup(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];const t={};e=e.concat(this.assembleSignals()),e.length>0&&(t.signals=e);const n=this.assembleLayout();n&&(t.layout=n),t.marks=[].concat(this.assembleHeaderMarks(),this.assembleMarks());const i=!this.parent||Dm(this.parent)?im(this):[];i.length>0&&(t.scales=i);const r=this.assembleAxes();r.length>0&&(t.axes=r);const o=this.assembleLegends();return o.length>0&&(t.legends=o),t}getName(e){return C((this.name?`${this.name}_`:"")+e)}getDataName(e){return this.getName(mc[e].toLowerCase())}requestDataName(e){const t=this.getDataName(e),n=this.component.data.outputNodeRefCounts;return n[t]=(n[t]||0)+1,t}getSizeSignalRef(e){if(Dm(this.parent)){const t=Pt(Nf(e)),n=this.component.scales[t];if(n&&!n.merged){const e=n.get("type"),i=n.get("range");if(yr(e)&&bn(i)){const e=n.get("name"),i=tm(nm(this,t));if(i){return{signal:Cf(e,n,sa({aggregate:"distinct",field:i},{expr:"datum"}))}}return vi(Vn(t)),null}}}return{signal:this.signalNameMap.get(this.getName(e))}}lookupDataSource(e){const t=this.component.data.outputNodes[e];return t?t.getSource():e}getSignalName(e){return this.signalNameMap.get(e)}renameSignal(e,t){this.signalNameMap.rename(e,t)}renameScale(e,t){this.scaleNameMap.rename(e,t)}renameProjection(e,t){this.projectionNameMap.rename(e,t)}scaleName(e,t){return t?this.getName(e):Ze(e)&&Ht(e)&&this.component.scales[e]||this.scaleNameMap.has(this.getName(e))?this.scaleNameMap.get(this.getName(e)):void 0}projectionName(e){return e?this.getName("projection"):this.component.projection&&!this.component.projection.merged||this.projectionNameMap.has(this.getName("projection"))?this.projectionNameMap.get(this.getName("projection")):void 0}correctDataNames=e=>(e.from?.data&&(e.from.data=this.lookupDataSource(e.from.data)),e.from?.facet?.data&&(e.from.facet.data=this.lookupDataSource(e.from.facet.data)),e);getScaleComponent(e){if(!this.component.scales)throw new Error("getScaleComponent cannot be called before parseScale(). Make sure you have called parseScale or use parseUnitModelWithScale().");const t=this.component.scales[e];return t&&!t.merged?t:this.parent?this.parent.getScaleComponent(e):void 0}getScaleType(e){const t=this.getScaleComponent(e);return t?t.get("type"):void 0}getSelectionComponent(e,t){let n=this.component.selection[e];if(!n&&this.parent&&(n=this.parent.getSelectionComponent(e,t)),!n)throw new Error(function(e){return`Cannot find a selection named "${e}".`}(t));return n}hasAxisOrientSignalRef(){return this.component.axes.x?.some((e=>e.hasOrientSignalRef()))||this.component.axes.y?.some((e=>e.hasOrientSignalRef()))}}class Cm extends zm{vgField(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const n=this.fieldDef(e);if(n)return sa(n,t)}reduceFieldDef(e,n){return function(e,n,i,r){return e?D(e).reduce(((i,o)=>{const a=e[o];return t.isArray(a)?a.reduce(((e,t)=>n.call(r,e,t,o)),i):n.call(r,i,a,o)}),i):i}(this.getMapping(),((t,n,i)=>{const r=ha(n);return r?e(t,r,i):t}),n)}forEachFieldDef(e,t){Ba(this.getMapping(),((t,n)=>{const i=ha(t);i&&e(i,n)}),t)}}class Nm extends $c{clone(){return new Nm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const n=this.transform.as??[void 0,void 0];this.transform.as=[n[0]??"value",n[1]??"density"];const i=this.transform.resolve??"shared";this.transform.resolve=i}dependentFields(){return new Set([this.transform.density,...this.transform.groupby??[]])}producedFields(){return new Set(this.transform.as)}hash(){return`DensityTransform ${d(this.transform)}`}assemble(){const{density:e,...t}=this.transform,n={type:"kde",field:e,...t};return n.resolve=this.transform.resolve,n}}class Pm extends $c{clone(){return new Pm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t)}dependentFields(){return new Set([this.transform.extent])}producedFields(){return new Set([])}hash(){return`ExtentTransform ${d(this.transform)}`}assemble(){const{extent:e,param:t}=this.transform;return{type:"extent",field:e,signal:t}}}class _m extends $c{clone(){return new _m(this.parent,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const{flatten:n,as:i=[]}=this.transform;this.transform.as=n.map(((e,t)=>i[t]??e))}dependentFields(){return new Set(this.transform.flatten)}producedFields(){return new Set(this.transform.as)}hash(){return`FlattenTransform ${d(this.transform)}`}assemble(){const{flatten:e,as:t}=this.transform;return{type:"flatten",fields:e,as:t}}}class Am extends $c{clone(){return new Am(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const n=this.transform.as??[void 0,void 0];this.transform.as=[n[0]??"key",n[1]??"value"]}dependentFields(){return new Set(this.transform.fold)}producedFields(){return new Set(this.transform.as)}hash(){return`FoldTransform ${d(this.transform)}`}assemble(){const{fold:e,as:t}=this.transform;return{type:"fold",fields:e,as:t}}}class Tm extends $c{clone(){return new Tm(null,l(this.fields),this.geojson,this.signal)}static parseAll(e,t){if(t.component.projection&&!t.component.projection.isFit)return e;let n=0;for(const i of[[fe,ue],[me,de]]){const r=i.map((e=>{const n=ya(t.encoding[e]);return Go(n)?n.field:Xo(n)?{expr:`${n.datum}`}:ta(n)?{expr:`${n.value}`}:void 0}));(r[0]||r[1])&&(e=new Tm(e,r,null,t.getName("geojson_"+n++)))}if(t.channelHasField(ye)){const i=t.typedFieldDef(ye);i.type===or&&(e=new Tm(e,null,i.field,t.getName("geojson_"+n++)))}return e}constructor(e,t,n,i){super(e),this.fields=t,this.geojson=n,this.signal=i}dependentFields(){const e=(this.fields??[]).filter(t.isString);return new Set([...this.geojson?[this.geojson]:[],...e])}producedFields(){return new Set}hash(){return`GeoJSON ${this.geojson} ${this.signal} ${d(this.fields)}`}assemble(){return[...this.geojson?[{type:"filter",expr:`isValid(datum["${this.geojson}"])`}]:[],{type:"geojson",...this.fields?{fields:this.fields}:{},...this.geojson?{geojson:this.geojson}:{},signal:this.signal}]}}class jm extends $c{clone(){return new jm(null,this.projection,l(this.fields),l(this.as))}constructor(e,t,n,i){super(e),this.projection=t,this.fields=n,this.as=i}static parseAll(e,t){if(!t.projectionName())return e;for(const n of[[fe,ue],[me,de]]){const i=n.map((e=>{const n=ya(t.encoding[e]);return Go(n)?n.field:Xo(n)?{expr:`${n.datum}`}:ta(n)?{expr:`${n.value}`}:void 0})),r=n[0]===me?"2":"";(i[0]||i[1])&&(e=new jm(e,t.projectionName(),i,[t.getName(`x${r}`),t.getName(`y${r}`)]))}return e}dependentFields(){return new Set(this.fields.filter(t.isString))}producedFields(){return new Set(this.as)}hash(){return`Geopoint ${this.projection} ${d(this.fields)} ${d(this.as)}`}assemble(){return{type:"geopoint",projection:this.projection,fields:this.fields,as:this.as}}}class Em extends $c{clone(){return new Em(null,l(this.transform))}constructor(e,t){super(e),this.transform=t}dependentFields(){return new Set([this.transform.impute,this.transform.key,...this.transform.groupby??[]])}producedFields(){return new Set([this.transform.impute])}processSequence(e){const{start:t=0,stop:n,step:i}=e;return{signal:`sequence(${[t,n,...i?[i]:[]].join(",")})`}}static makeFromTransform(e,t){return new Em(e,t)}static makeFromEncoding(e,t){const n=t.encoding,i=n.x,r=n.y;if(Go(i)&&Go(r)){const o=i.impute?i:r.impute?r:void 0;if(void 0===o)return;const a=i.impute?r:r.impute?i:void 0,{method:s,value:l,frame:c,keyvals:u}=o.impute,f=Va(t.mark,n);return new Em(e,{impute:o.field,key:a.field,...s?{method:s}:{},...void 0!==l?{value:l}:{},...c?{frame:c}:{},...void 0!==u?{keyvals:u}:{},...f.length?{groupby:f}:{}})}return null}hash(){return`Impute ${d(this.transform)}`}assemble(){const{impute:e,key:t,keyvals:n,method:i,groupby:r,value:o,frame:a=[null,null]}=this.transform,s={type:"impute",field:e,key:t,...n?{keyvals:(l=n,Q(l,"stop")?this.processSequence(n):n)}:{},method:"value",...r?{groupby:r}:{},value:i&&"value"!==i?null:o};var l;if(i&&"value"!==i){return[s,{type:"window",as:[`imputed_${e}_value`],ops:[i],fields:[e],frame:a,ignorePeers:!1,...r?{groupby:r}:{}},{type:"formula",expr:`datum.${e} === null ? datum.imputed_${e}_value : datum.${e}`,as:e}]}return[s]}}class Mm extends $c{clone(){return new Mm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const n=this.transform.as??[void 0,void 0];this.transform.as=[n[0]??t.on,n[1]??t.loess]}dependentFields(){return new Set([this.transform.loess,this.transform.on,...this.transform.groupby??[]])}producedFields(){return new Set(this.transform.as)}hash(){return`LoessTransform ${d(this.transform)}`}assemble(){const{loess:e,on:t,...n}=this.transform;return{type:"loess",x:t,y:e,...n}}}class Rm extends $c{clone(){return new Rm(null,l(this.transform),this.secondary)}constructor(e,t,n){super(e),this.transform=t,this.secondary=n}static make(e,t,n,i){const r=t.component.data.sources,{from:o}=n;let a=null;if(function(e){return Q(e,"data")}(o)){let e=Zm(o.data,r);e||(e=new yd(o.data),r.push(e));const n=t.getName(`lookup_${i}`);a=new wc(e,n,mc.Lookup,t.component.data.outputNodeRefCounts),t.component.data.outputNodes[n]=a}else if(function(e){return Q(e,"param")}(o)){const e=o.param;let i;n={as:e,...n};try{i=t.getSelectionComponent(C(e),e)}catch(t){throw new Error(function(e){return`Lookups can only be performed on selection parameters. "${e}" is a variable parameter.`}(e))}if(a=i.materialized,!a)throw new Error(function(e){return`Cannot define and lookup the "${e}" selection in the same view. Try moving the lookup into a second, layered view?`}(e))}return new Rm(e,n,a.getSource())}dependentFields(){return new Set([this.transform.lookup])}producedFields(){return new Set(this.transform.as?t.array(this.transform.as):this.transform.from.fields)}hash(){return`Lookup ${d({transform:this.transform,secondary:this.secondary})}`}assemble(){let e;if(this.transform.from.fields)e={values:this.transform.from.fields,...this.transform.as?{as:t.array(this.transform.as)}:{}};else{let n=this.transform.as;t.isString(n)||(vi('If "from.fields" is not specified, "as" has to be a string that specifies the key to be used for the data from the secondary source.'),n="_lookup"),e={as:[n]}}return{type:"lookup",from:this.secondary,key:this.transform.from.key,fields:[this.transform.lookup],...e,...this.transform.default?{default:this.transform.default}:{}}}}class Lm extends $c{clone(){return new Lm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const n=this.transform.as??[void 0,void 0];this.transform.as=[n[0]??"prob",n[1]??"value"]}dependentFields(){return new Set([this.transform.quantile,...this.transform.groupby??[]])}producedFields(){return new Set(this.transform.as)}hash(){return`QuantileTransform ${d(this.transform)}`}assemble(){const{quantile:e,...t}=this.transform;return{type:"quantile",field:e,...t}}}class qm extends $c{clone(){return new qm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t,this.transform=l(t);const n=this.transform.as??[void 0,void 0];this.transform.as=[n[0]??t.on,n[1]??t.regression]}dependentFields(){return new Set([this.transform.regression,this.transform.on,...this.transform.groupby??[]])}producedFields(){return new Set(this.transform.as)}hash(){return`RegressionTransform ${d(this.transform)}`}assemble(){const{regression:e,on:t,...n}=this.transform;return{type:"regression",x:t,y:e,...n}}}class Um extends $c{clone(){return new Um(null,l(this.transform))}constructor(e,t){super(e),this.transform=t}addDimensions(e){this.transform.groupby=b((this.transform.groupby??[]).concat(e),(e=>e))}producedFields(){}dependentFields(){return new Set([this.transform.pivot,this.transform.value,...this.transform.groupby??[]])}hash(){return`PivotTransform ${d(this.transform)}`}assemble(){const{pivot:e,value:t,groupby:n,limit:i,op:r}=this.transform;return{type:"pivot",field:e,value:t,...void 0!==i?{limit:i}:{},...void 0!==r?{op:r}:{},...void 0!==n?{groupby:n}:{}}}}class Wm extends $c{clone(){return new Wm(null,l(this.transform))}constructor(e,t){super(e),this.transform=t}dependentFields(){return new Set}producedFields(){return new Set}hash(){return`SampleTransform ${d(this.transform)}`}assemble(){return{type:"sample",size:this.transform.sample}}}function Im(e){let t=0;return function n(i,r){if(i instanceof yd&&!i.isGenerator&&!ac(i.data)){e.push(r);r={name:null,source:r.name,transform:[]}}if(i instanceof md&&(i.parent instanceof yd&&!r.source?(r.format={...r.format,parse:i.assembleFormatParse()},r.transform.push(...i.assembleTransforms(!0))):r.transform.push(...i.assembleTransforms())),i instanceof cd)return r.name||(r.name="data_"+t++),!r.source||r.transform.length>0?(e.push(r),i.data=r.name):i.data=r.source,void e.push(...i.assemble());if((i instanceof gd||i instanceof hd||i instanceof Td||i instanceof Gu||i instanceof cf||i instanceof jm||i instanceof ld||i instanceof Rm||i instanceof Md||i instanceof Ad||i instanceof Am||i instanceof _m||i instanceof Nm||i instanceof Mm||i instanceof Lm||i instanceof qm||i instanceof pd||i instanceof Wm||i instanceof Um||i instanceof Pm)&&r.transform.push(i.assemble()),(i instanceof ad||i instanceof Dc||i instanceof Em||i instanceof Ed||i instanceof Tm)&&r.transform.push(...i.assemble()),i instanceof wc)if(r.source&&0===r.transform.length)i.setSource(r.source);else if(i.parent instanceof wc)i.setSource(r.name);else if(r.name||(r.name="data_"+t++),i.setSource(r.name),1===i.numChildren()){e.push(r);r={name:null,source:r.name,transform:[]}}switch(i.numChildren()){case 0:i instanceof wc&&(!r.source||r.transform.length>0)&&e.push(r);break;case 1:n(i.children[0],r);break;default:{r.name||(r.name="data_"+t++);let o=r.name;!r.source||r.transform.length>0?e.push(r):o=r.source;for(const e of i.children){n(e,{name:null,source:o,transform:[]})}break}}}}function Bm(e){return"top"===e||"left"===e||vn(e)?"header":"footer"}function Vm(e,n){const{facet:i,config:r,child:o,component:a}=e;if(e.channelHasField(n)){const s=i[n],l=df("title",null,r,n);let c=da(s,r,{allowDisabling:!0,includeDefault:void 0===l||!!l});o.component.layoutHeaders[n].title&&(c=t.isArray(c)?c.join(", "):c,c+=` / ${o.component.layoutHeaders[n].title}`,o.component.layoutHeaders[n].title=null);const u=df("labelOrient",s.header,r,n),f=null!==s.header&&q(s.header?.labels,r.header.labels,!0),d=p(["bottom","right"],u)?"footer":"header";a.layoutHeaders[n]={title:null!==s.header?c:null,facetFieldDef:s,[d]:"facet"===n?[]:[Hm(e,n,f)]}}}function Hm(e,t,n){const i="row"===t?"height":"width";return{labels:n,sizeSignal:e.child.component.layoutSize.get(i)?e.child.getSizeSignalRef(i):void 0,axes:[]}}function Gm(e,t){const{child:n}=e;if(n.component.axes[t]){const{layoutHeaders:i,resolve:r}=e.component;if(r.axis[t]=Af(r,t),"shared"===r.axis[t]){const r="x"===t?"column":"row",o=i[r];for(const i of n.component.axes[t]){const t=Bm(i.get("orient"));o[t]??=[Hm(e,r,!1)];const n=Ku(i,"main",e.config,{header:!0});n&&o[t][0].axes.push(n),i.mainExtracted=!0}}}}function Ym(e){for(const t of e.children)t.parseLayoutSize()}function Xm(e,t){const n=Nf(t),i=Pt(n),r=e.component.resolve,o=e.component.layoutSize;let a;for(const t of e.children){const o=t.component.layoutSize.getWithExplicit(n),s=r.scale[i]??_f(i,e);if("independent"===s&&"step"===o.value){a=void 0;break}if(a){if("independent"===s&&a.value!==o.value){a=void 0;break}a=rc(a,o,n,"")}else a=o}if(a){for(const i of e.children)e.renameSignal(i.getName(n),e.getName(t)),i.component.layoutSize.set(n,"merged",!1);o.setWithExplicit(t,a)}else o.setWithExplicit(t,{explicit:!1,value:void 0})}function Qm(e,t){const n="width"===t?"x":"y",i=e.config,r=e.getScaleComponent(n);if(r){const e=r.get("type"),n=r.get("range");if(yr(e)){const e=Ms(i.view,t);return bn(n)||_s(e)?"step":e}return js(i.view,t)}if(e.hasProjection||"arc"===e.mark)return js(i.view,t);{const e=Ms(i.view,t);return _s(e)?e.step:e}}function Jm(e,t,n){return sa(t,{suffix:`by_${sa(e)}`,...n})}class Km extends Cm{constructor(e,t,n,i){super(e,"facet",t,n,i,e.resolve),this.child=Dp(e.spec,this,this.getName("child"),void 0,i),this.children=[this.child],this.facet=this.initFacet(e.facet)}initFacet(e){if(!jo(e))return{facet:this.initFacetFieldDef(e,"facet")};const t=D(e),n={};for(const i of t){if(![J,K].includes(i)){vi(ii(i,"facet"));break}const t=e[i];if(void 0===t.field){vi(ni(t,i));break}n[i]=this.initFacetFieldDef(t,i)}return n}initFacetFieldDef(e,t){const n=xa(e,t);return n.header?n.header=gn(n.header):null===n.header&&(n.header=null),n}channelHasField(e){return Q(this.facet,e)}fieldDef(e){return this.facet[e]}parseData(){this.component.data=ep(this),this.child.parseData()}parseLayoutSize(){Ym(this)}parseSelections(){this.child.parseSelections(),this.component.selection=this.child.component.selection}parseMarkGroup(){this.child.parseMarkGroup()}parseAxesAndHeaders(){this.child.parseAxesAndHeaders(),function(e){for(const t of We)Vm(e,t);Gm(e,"x"),Gm(e,"y")}(this)}assembleSelectionTopLevelSignals(e){return this.child.assembleSelectionTopLevelSignals(e)}assembleSignals(){return this.child.assembleSignals(),[]}assembleSelectionData(e){return this.child.assembleSelectionData(e)}getHeaderLayoutMixins(){const e={};for(const t of We)for(const n of gf){const i=this.component.layoutHeaders[t],r=i[n],{facetFieldDef:o}=i;if(o){const n=df("titleOrient",o.header,this.config,t);if(["right","bottom"].includes(n)){const i=ff(t,n);e.titleAnchor??={},e.titleAnchor[i]="end"}}if(r?.[0]){const r="row"===t?"height":"width",o="header"===n?"headerBand":"footerBand";"facet"===t||this.child.component.layoutSize.get(r)||(e[o]??={},e[o][t]=.5),i.title&&(e.offset??={},e.offset["row"===t?"rowTitle":"columnTitle"]=10)}}return e}assembleDefaultLayout(){const{column:e,row:t}=this.facet,n=e?this.columnDistinctSignal():t?1:void 0;let i="all";return(t||"independent"!==this.component.resolve.scale.x)&&(e||"independent"!==this.component.resolve.scale.y)||(i="none"),{...this.getHeaderLayoutMixins(),...n?{columns:n}:{},bounds:"full",align:i}}assembleLayoutSignals(){return this.child.assembleLayoutSignals()}columnDistinctSignal(){if(!(this.parent&&this.parent instanceof Km)){return{signal:`length(data('${this.getName("column_domain")}'))`}}}assembleGroupStyle(){}assembleGroup(e){return this.parent&&this.parent instanceof Km?{...this.channelHasField("column")?{encode:{update:{columns:{field:sa(this.facet.column,{prefix:"distinct"})}}}}:{},...super.assembleGroup(e)}:super.assembleGroup(e)}getCardinalityAggregateForChild(){const e=[],t=[],n=[];if(this.child instanceof Km){if(this.child.channelHasField("column")){const i=sa(this.child.facet.column);e.push(i),t.push("distinct"),n.push(`distinct_${i}`)}}else for(const i of Ot){const r=this.child.component.scales[i];if(r&&!r.merged){const o=r.get("type"),a=r.get("range");if(yr(o)&&bn(a)){const r=tm(nm(this.child,i));r?(e.push(r),t.push("distinct"),n.push(`distinct_${r}`)):vi(Vn(i))}}}return{fields:e,ops:t,as:n}}assembleFacet(){const{name:e,data:n}=this.component.data.facetRoot,{row:i,column:r}=this.facet,{fields:o,ops:a,as:s}=this.getCardinalityAggregateForChild(),l=[];for(const e of We){const n=this.facet[e];if(n){l.push(sa(n));const{bin:c,sort:u}=n;if(cn(c)&&l.push(sa(n,{binSuffix:"end"})),Ao(u)){const{field:e,op:t=No}=u,l=Jm(n,u);i&&r?(o.push(l),a.push("max"),s.push(l)):(o.push(e),a.push(t),s.push(l))}else if(t.isArray(u)){const t=uf(n,e);o.push(t),a.push("max"),s.push(t)}}}const c=!!i&&!!r;return{name:e,data:n,groupby:l,...c||o.length>0?{aggregate:{...c?{cross:c}:{},...o.length?{fields:o,ops:a,as:s}:{}}}:{}}}facetSortFields(e){const{facet:n}=this,i=n[e];return i?Ao(i.sort)?[Jm(i,i.sort,{expr:"datum"})]:t.isArray(i.sort)?[uf(i,e,{expr:"datum"})]:[sa(i,{expr:"datum"})]:[]}facetSortOrder(e){const{facet:n}=this,i=n[e];if(i){const{sort:e}=i;return[(Ao(e)?e.order:!t.isArray(e)&&e)||"ascending"]}return[]}assembleLabelTitle(){const{facet:e,config:t}=this;if(e.facet)return $f(e.facet,"facet",t);const n={row:["top","bottom"],column:["left","right"]};for(const i of pf)if(e[i]){const r=df("labelOrient",e[i]?.header,t,i);if(n[i].includes(r))return $f(e[i],i,t)}}assembleMarks(){const{child:e}=this,t=function(e){const t=[],n=Im(t);for(const t of e.children)n(t,{source:e.name,name:null,transform:[]});return t}(this.component.data.facetRoot),n=e.assembleGroupEncodeEntry(!1),i=this.assembleLabelTitle()||e.assembleTitle(),r=e.assembleGroupStyle();return[{name:this.getName("cell"),type:"group",...i?{title:i}:{},...r?{style:r}:{},from:{facet:this.assembleFacet()},sort:{field:We.map((e=>this.facetSortFields(e))).flat(),order:We.map((e=>this.facetSortOrder(e))).flat()},...t.length>0?{data:t}:{},...n?{encode:{update:n}}:{},...e.assembleGroup(vc(this,[]))}]}getMapping(){return this.facet}}function Zm(e,t){for(const n of t){const t=n.data;if(e.name&&n.hasName()&&e.name!==n.dataName)continue;const i=e.format?.mesh,r=t.format?.feature;if(i&&r)continue;const o=e.format?.feature;if((o||r)&&o!==r)continue;const a=t.format?.mesh;if(!i&&!a||i===a)if(sc(e)&&sc(t)){if(Y(e.values,t.values))return n}else if(ac(e)&&ac(t)){if(e.url===t.url)return n}else if(lc(e)&&e.name===n.dataName)return n}return null}function ep(e){let t=function(e,t){if(e.data||!e.parent){if(null===e.data){const e=new yd({values:[]});return t.push(e),e}const n=Zm(e.data,t);if(n)return cc(e.data)||(n.data.format=y({},e.data.format,n.data.format)),!n.hasName()&&e.data.name&&(n.dataName=e.data.name),n;{const n=new yd(e.data);return t.push(n),n}}return e.parent.component.data.facetRoot?e.parent.component.data.facetRoot:e.parent.component.data.main}(e,e.component.data.sources);const{outputNodes:n,outputNodeRefCounts:i}=e.component.data,r=e.data,o=!(r&&(cc(r)||ac(r)||sc(r)))&&e.parent?e.parent.component.data.ancestorParse.clone():new oc;cc(r)?(uc(r)?t=new hd(t,r.sequence):dc(r)&&(t=new gd(t,r.graticule)),o.parseNothing=!0):null===r?.format?.parse&&(o.parseNothing=!0),t=md.makeExplicit(t,e,o)??t,t=new pd(t);const a=e.parent&&Om(e.parent);(Sm(e)||Dm(e))&&a&&(t=ad.makeFromEncoding(t,e)??t),e.transforms.length>0&&(t=function(e,t,n){let i=0;for(const r of t.transforms){let o,a;if(_l(r))a=e=new cf(e,r),o="derived";else if($l(r)){const i=fd(r);a=e=md.makeWithAncestors(e,{},i,n)??e,e=new Gu(e,t,r.filter)}else if(Al(r))a=e=ad.makeFromTransform(e,r,t),o="number";else if(jl(r))o="date",void 0===n.getWithExplicit(r.field).value&&(e=new md(e,{[r.field]:o}),n.set(r.field,o,!1)),a=e=Dc.makeFromTransform(e,r);else if(El(r))a=e=ld.makeFromTransform(e,r),o="number",Wu(t)&&(e=new pd(e));else if(wl(r))a=e=Rm.make(e,t,r,i++),o="derived";else if(Cl(r))a=e=new Md(e,r),o="number";else if(Nl(r))a=e=new Ad(e,r),o="number";else if(Ml(r))a=e=Ed.makeFromTransform(e,r),o="derived";else if(Rl(r))a=e=new Am(e,r),o="derived";else if(Ll(r))a=e=new Pm(e,r),o="derived";else if(Pl(r))a=e=new _m(e,r),o="derived";else if(kl(r))a=e=new Um(e,r),o="derived";else if(zl(r))e=new Wm(e,r);else if(Tl(r))a=e=Em.makeFromTransform(e,r),o="derived";else if(Sl(r))a=e=new Nm(e,r),o="derived";else if(Dl(r))a=e=new Lm(e,r),o="derived";else if(Fl(r))a=e=new qm(e,r),o="derived";else{if(!Ol(r)){vi(`Ignoring an invalid transform: ${X(r)}.`);continue}a=e=new Mm(e,r),o="derived"}if(a&&void 0!==o)for(const e of a.producedFields()??[])n.set(e,o,!1)}return e}(t,e,o));const s=function(e){const t={};if(Sm(e)&&e.component.selection)for(const n of D(e.component.selection)){const i=e.component.selection[n];for(const e of i.project.items)!e.channel&&L(e.field)>1&&(t[e.field]="flatten")}return t}(e),l=dd(e);t=md.makeWithAncestors(t,{},{...s,...l},o)??t,Sm(e)&&(t=Tm.parseAll(t,e),t=jm.parseAll(t,e)),(Sm(e)||Dm(e))&&(a||(t=ad.makeFromEncoding(t,e)??t),t=Dc.makeFromEncoding(t,e)??t,t=cf.parseAllForSortIndex(t,e));const c=t=tp(mc.Raw,e,t);if(Sm(e)){const n=ld.makeFromEncoding(t,e);n&&(t=n,Wu(e)&&(t=new pd(t))),t=Em.makeFromEncoding(t,e)??t,t=Ed.makeFromEncoding(t,e)??t}let u,f;if(Sm(e)){const{markDef:n,mark:i,config:r}=e,o=_n("invalid",n,r),{marks:a,scales:s}=f=pc({invalid:o,isPath:Gr(i)});a!==s&&"include-invalid-values"===s&&(u=t=tp(mc.PreFilterInvalid,e,t)),"exclude-invalid-values"===a&&(t=Td.make(t,e,f)??t)}const d=t=tp(mc.Main,e,t);let m;if(Sm(e)&&f){const{marks:n,scales:i}=f;"include-invalid-values"===n&&"exclude-invalid-values"===i&&(t=Td.make(t,e,f)??t,m=t=tp(mc.PostFilterInvalid,e,t))}Sm(e)&&function(e,t){for(const[n,i]of O(e.component.selection??{})){const r=e.getName(`lookup_${n}`);e.component.data.outputNodes[r]=i.materialized=new wc(new Gu(t,e,{param:n}),r,mc.Lookup,e.component.data.outputNodeRefCounts)}}(e,d);let p=null;if(Dm(e)){const i=e.getName("facet");t=function(e,t){const{row:n,column:i}=t;if(n&&i){let t=null;for(const r of[n,i])if(Ao(r.sort)){const{field:n,op:i=No}=r.sort;e=t=new Ad(e,{joinaggregate:[{op:i,field:n,as:Jm(r,r.sort,{forAs:!0})}],groupby:[sa(r)]})}return t}return null}(t,e.facet)??t,p=new cd(t,e,i,d.getSource()),n[i]=p}return{...e.component.data,outputNodes:n,outputNodeRefCounts:i,raw:c,main:d,facetRoot:p,ancestorParse:o,preFilterInvalid:u,postFilterInvalid:m}}function tp(e,t,n){const{outputNodes:i,outputNodeRefCounts:r}=t.component.data,o=t.getDataName(e),a=new wc(n,o,e,r);return i[o]=a,a}class np extends zm{constructor(e,t,n,i){super(e,"concat",t,n,i,e.resolve),"shared"!==e.resolve?.axis?.x&&"shared"!==e.resolve?.axis?.y||vi("Axes cannot be shared in concatenated or repeated views yet (https://github.com/vega/vega-lite/issues/2415)."),this.children=this.getChildren(e).map(((e,t)=>Dp(e,this,this.getName(`concat_${t}`),void 0,i)))}parseData(){this.component.data=ep(this);for(const e of this.children)e.parseData()}parseSelections(){this.component.selection={};for(const e of this.children){e.parseSelections();for(const t of D(e.component.selection))this.component.selection[t]=e.component.selection[t]}}parseMarkGroup(){for(const e of this.children)e.parseMarkGroup()}parseAxesAndHeaders(){for(const e of this.children)e.parseAxesAndHeaders()}getChildren(e){return Cs(e)?e.vconcat:Ns(e)?e.hconcat:e.concat}parseLayoutSize(){!function(e){Ym(e);const t=1===e.layout.columns?"width":"childWidth",n=void 0===e.layout.columns?"height":"childHeight";Xm(e,t),Xm(e,n)}(this)}parseAxisGroup(){return null}assembleSelectionTopLevelSignals(e){return this.children.reduce(((e,t)=>t.assembleSelectionTopLevelSignals(e)),e)}assembleSignals(){return this.children.forEach((e=>e.assembleSignals())),[]}assembleLayoutSignals(){const e=Ff(this);for(const t of this.children)e.push(...t.assembleLayoutSignals());return e}assembleSelectionData(e){return this.children.reduce(((e,t)=>t.assembleSelectionData(e)),e)}assembleMarks(){return this.children.map((e=>{const t=e.assembleTitle(),n=e.assembleGroupStyle(),i=e.assembleGroupEncodeEntry(!1);return{type:"group",name:e.getName("group"),...t?{title:t}:{},...n?{style:n}:{},...i?{encode:{update:i}}:{},...e.assembleGroup()}}))}assembleGroupStyle(){}assembleDefaultLayout(){const e=this.layout.columns;return{...null!=e?{columns:e}:{},bounds:"full",align:"each"}}}const ip={disable:1,gridScale:1,scale:1,...Pa,labelExpr:1,encode:1},rp=D(ip);class op extends Zl{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];super(),this.explicit=e,this.implicit=t,this.mainExtracted=n}clone(){return new op(l(this.explicit),l(this.implicit),this.mainExtracted)}hasAxisPart(e){return"axis"===e||("grid"===e||"title"===e?!!this.get(e):!(!1===(t=this.get(e))||null===t));var t}hasOrientSignalRef(){return vn(this.explicit.orient)}}const ap={bottom:"top",top:"bottom",left:"right",right:"left"};function sp(e,t){if(!e)return t.map((e=>e.clone()));{if(e.length!==t.length)return;const n=e.length;for(let i=0;i<n;i++){const n=e[i],r=t[i];if(!!n!=!!r)return;if(n&&r){const t=n.getWithExplicit("orient"),o=r.getWithExplicit("orient");if(t.explicit&&o.explicit&&t.value!==o.value)return;e[i]=lp(n,r)}}}return e}function lp(e,t){for(const n of rp){const i=rc(e.getWithExplicit(n),t.getWithExplicit(n),n,"axis",((e,t)=>{switch(n){case"title":return Ln(e,t);case"gridScale":return{explicit:e.explicit,value:q(e.value,t.value)}}return ic(e,t,n,"axis")}));e.setWithExplicit(n,i)}return e}function cp(e,t,n,i,r){if("disable"===t)return void 0!==n;switch(n=n||{},t){case"titleAngle":case"labelAngle":return e===(vn(n.labelAngle)?n.labelAngle:V(n.labelAngle));case"values":return!!n.values;case"encode":return!!n.encoding||!!n.labelAngle;case"title":if(e===lf(i,r))return!0}return e===n[t]}const up=new Set(["grid","translate","format","formatType","orient","labelExpr","tickCount","position","tickMinStep"]);function fp(e,t){let n=t.axis(e);const i=new op,r=ya(t.encoding[e]),{mark:o,config:a}=t,s=n?.orient||a["x"===e?"axisX":"axisY"]?.orient||a.axis?.orient||function(e){return"x"===e?"bottom":"left"}(e),l=t.getScaleComponent(e).get("type"),c=function(e,t,n,i){const r="band"===t?["axisDiscrete","axisBand"]:"point"===t?["axisDiscrete","axisPoint"]:mr(t)?["axisQuantitative"]:"time"===t||"utc"===t?["axisTemporal"]:[],o="x"===e?"axisX":"axisY",a=vn(n)?"axisOrient":`axis${_(n)}`,s=[...r,...r.map((e=>o+e.substr(4)))],l=["axis",a,o];return{vlOnlyAxisConfig:ef(s,i,e,n),vgAxisConfig:ef(l,i,e,n),axisConfigStyle:tf([...l,...s],i)}}(e,l,s,t.config),u=void 0!==n?!n:nf("disable",a.style,n?.style,c).configValue;if(i.set("disable",u,void 0!==n),u)return i;n=n||{};const f=function(e,t,n,i,r){const o=t?.labelAngle;if(void 0!==o)return vn(o)?o:V(o);{const{configValue:o}=nf("labelAngle",i,t?.style,r);return void 0!==o?V(o):n!==ee||!p([rr,nr],e.type)||Go(e)&&e.timeUnit?void 0:270}}(r,n,e,a.style,c),d=Do(n.formatType,r,l),m=So(r,r.type,n.format,n.formatType,a,!0),g={fieldOrDatumDef:r,axis:n,channel:e,model:t,scaleType:l,orient:s,labelAngle:f,format:m,formatType:d,mark:o,config:a};for(const r of rp){const o=r in rf?rf[r](g):Aa(r)?n[r]:void 0,s=void 0!==o,l=cp(o,r,n,t,e);if(s&&l)i.set(r,o,l);else{const{configValue:e,configFrom:t}=Aa(r)&&"values"!==r?nf(r,a.style,n.style,c):{},u=void 0!==e;s&&!u?i.set(r,o,l):("vgAxisConfig"!==t||up.has(r)&&u||za(e)||vn(e))&&i.set(r,e,!1)}}const h=n.encoding??{},y=Ca.reduce(((n,r)=>{if(!i.hasAxisPart(r))return n;const o=Pf(h[r]??{},t),a="labels"===r?function(e,t,n){const{encoding:i,config:r}=e,o=ya(i[t])??ya(i[rt(t)]),a=e.axis(t)||{},{format:s,formatType:l}=a;if(vo(l))return{text:ko({fieldOrDatumDef:o,field:"datum.value",format:s,formatType:l,config:r}),...n};if(void 0===s&&void 0===l&&r.customFormatTypes){if("quantitative"===Yo(o)){if(ia(o)&&"normalize"===o.stack&&r.normalizedNumberFormatType)return{text:ko({fieldOrDatumDef:o,field:"datum.value",format:r.normalizedNumberFormat,formatType:r.normalizedNumberFormatType,config:r}),...n};if(r.numberFormatType)return{text:ko({fieldOrDatumDef:o,field:"datum.value",format:r.numberFormat,formatType:r.numberFormatType,config:r}),...n}}if("temporal"===Yo(o)&&r.timeFormatType&&Go(o)&&!o.timeUnit)return{text:ko({fieldOrDatumDef:o,field:"datum.value",format:r.timeFormat,formatType:r.timeFormatType,config:r}),...n}}return n}(t,e,o):o;return void 0===a||S(a)||(n[r]={update:a}),n}),{});return S(y)||i.set("encode",y,!!n.encoding||void 0!==n.labelAngle),i}function dp(e,t){const{config:n}=e;return{...hu(e,{align:"ignore",baseline:"ignore",color:"include",size:"include",orient:"ignore",theta:"ignore"}),...nu("x",e,{defaultPos:"mid"}),...nu("y",e,{defaultPos:"mid"}),...Kc("size",e),...Kc("angle",e),...mp(e,n,t)}}function mp(e,t,n){return n?{shape:{value:n}}:Kc("shape",e)}const pp={vgMark:"rule",encodeEntry:e=>{const{markDef:t}=e,n=t.orient;return e.encoding.x||e.encoding.y||e.encoding.latitude||e.encoding.longitude?{...hu(e,{align:"ignore",baseline:"ignore",color:"include",orient:"ignore",size:"ignore",theta:"ignore"}),...lu("x",e,{defaultPos:"horizontal"===n?"zeroOrMax":"mid",defaultPos2:"zeroOrMin",range:"vertical"!==n}),...lu("y",e,{defaultPos:"vertical"===n?"zeroOrMax":"mid",defaultPos2:"zeroOrMin",range:"horizontal"!==n}),...Kc("size",e,{vgChannel:"strokeWidth"})}:{}}};function gp(e,t,n){if(void 0===_n("align",e,n))return"center"}function hp(e,t,n){if(void 0===_n("baseline",e,n))return"middle"}const yp={vgMark:"rect",encodeEntry:e=>{const{config:t,markDef:n}=e,i=n.orient,r="horizontal"===i?"x":"y",o="horizontal"===i?"y":"x",a="horizontal"===i?"height":"width";return{...hu(e,{align:"ignore",baseline:"ignore",color:"include",orient:"ignore",size:"ignore",theta:"ignore"}),...fu(e,r),...nu(o,e,{defaultPos:"mid",vgChannel:"y"===o?"yc":"xc"}),[a]:On(_n("thickness",n,t))}}},vp={arc:{vgMark:"arc",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",size:"ignore",orient:"ignore",theta:"ignore"}),...nu("x",e,{defaultPos:"mid"}),...nu("y",e,{defaultPos:"mid"}),...fu(e,"radius"),...fu(e,"theta")})},area:{vgMark:"area",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",orient:"include",size:"ignore",theta:"ignore"}),...lu("x",e,{defaultPos:"zeroOrMin",defaultPos2:"zeroOrMin",range:"horizontal"===e.markDef.orient}),...lu("y",e,{defaultPos:"zeroOrMin",defaultPos2:"zeroOrMin",range:"vertical"===e.markDef.orient}),...bu(e)})},bar:{vgMark:"rect",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",orient:"ignore",size:"ignore",theta:"ignore"}),...fu(e,"x"),...fu(e,"y")})},circle:{vgMark:"symbol",encodeEntry:e=>dp(e,"circle")},geoshape:{vgMark:"shape",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",size:"ignore",orient:"ignore",theta:"ignore"})}),postEncodingTransform:e=>{const{encoding:t}=e,n=t.shape;return[{type:"geoshape",projection:e.projectionName(),...n&&Go(n)&&n.type===or?{field:sa(n,{expr:"datum"})}:{}}]}},image:{vgMark:"image",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"ignore",orient:"ignore",size:"ignore",theta:"ignore"}),...fu(e,"x"),...fu(e,"y"),...Bc(e,"url")})},line:{vgMark:"line",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",size:"ignore",orient:"ignore",theta:"ignore"}),...nu("x",e,{defaultPos:"mid"}),...nu("y",e,{defaultPos:"mid"}),...Kc("size",e,{vgChannel:"strokeWidth"}),...bu(e)})},point:{vgMark:"symbol",encodeEntry:e=>dp(e)},rect:{vgMark:"rect",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",orient:"ignore",size:"ignore",theta:"ignore"}),...fu(e,"x"),...fu(e,"y")})},rule:pp,square:{vgMark:"symbol",encodeEntry:e=>dp(e,"square")},text:{vgMark:"text",encodeEntry:e=>{const{config:t,encoding:n}=e;return{...hu(e,{align:"include",baseline:"include",color:"include",size:"ignore",orient:"ignore",theta:"include"}),...nu("x",e,{defaultPos:"mid"}),...nu("y",e,{defaultPos:"mid"}),...Bc(e),...Kc("size",e,{vgChannel:"fontSize"}),...Kc("angle",e),...xu("align",gp(e.markDef,n,t)),...xu("baseline",hp(e.markDef,n,t)),...nu("radius",e,{defaultPos:null}),...nu("theta",e,{defaultPos:null})}}},tick:yp,trail:{vgMark:"trail",encodeEntry:e=>({...hu(e,{align:"ignore",baseline:"ignore",color:"include",size:"include",orient:"ignore",theta:"ignore"}),...nu("x",e,{defaultPos:"mid"}),...nu("y",e,{defaultPos:"mid"}),...Kc("size",e),...bu(e)})}};function bp(e){if(p([Mr,Tr,Ir],e.mark)){const t=Va(e.mark,e.encoding);if(t.length>0)return function(e,t){return[{name:e.getName("pathgroup"),type:"group",from:{facet:{name:xp+e.requestDataName(mc.Main),data:e.requestDataName(mc.Main),groupby:t}},encode:{update:{width:{field:{group:"width"}},height:{field:{group:"height"}}}},marks:wp(e,{fromPrefix:xp})}]}(e,t)}else if(e.mark===jr){const t=kn.some((t=>_n(t,e.markDef,e.config)));if(e.stack&&!e.fieldDef("size")&&t)return function(e){const[t]=wp(e,{fromPrefix:$p}),n=e.scaleName(e.stack.fieldChannel),i=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return e.vgField(e.stack.fieldChannel,t)},r=(e,t)=>`${e}(${[i({prefix:"min",suffix:"start",expr:t}),i({prefix:"max",suffix:"start",expr:t}),i({prefix:"min",suffix:"end",expr:t}),i({prefix:"max",suffix:"end",expr:t})].map((e=>`scale('${n}',${e})`)).join(",")})`;let o,a;"x"===e.stack.fieldChannel?(o={...u(t.encode.update,["y","yc","y2","height",...kn]),x:{signal:r("min","datum")},x2:{signal:r("max","datum")},clip:{value:!0}},a={x:{field:{group:"x"},mult:-1},height:{field:{group:"height"}}},t.encode.update={...f(t.encode.update,["y","yc","y2"]),height:{field:{group:"height"}}}):(o={...u(t.encode.update,["x","xc","x2","width"]),y:{signal:r("min","datum")},y2:{signal:r("max","datum")},clip:{value:!0}},a={y:{field:{group:"y"},mult:-1},width:{field:{group:"width"}}},t.encode.update={...f(t.encode.update,["x","xc","x2"]),width:{field:{group:"width"}}});for(const n of kn){const i=An(n,e.markDef,e.config);t.encode.update[n]?(o[n]=t.encode.update[n],delete t.encode.update[n]):i&&(o[n]=On(i)),i&&(t.encode.update[n]={value:0})}const s=[];if(e.stack.groupbyChannels?.length>0)for(const t of e.stack.groupbyChannels){const n=e.fieldDef(t),i=sa(n);i&&s.push(i),(n?.bin||n?.timeUnit)&&s.push(sa(n,{binSuffix:"end"}))}o=["stroke","strokeWidth","strokeJoin","strokeCap","strokeDash","strokeDashOffset","strokeMiterLimit","strokeOpacity"].reduce(((n,i)=>{if(t.encode.update[i])return{...n,[i]:t.encode.update[i]};{const t=An(i,e.markDef,e.config);return void 0!==t?{...n,[i]:On(t)}:n}}),o),o.stroke&&(o.strokeForeground={value:!0},o.strokeOffset={value:0});return[{type:"group",from:{facet:{data:e.requestDataName(mc.Main),name:$p+e.requestDataName(mc.Main),groupby:s,aggregate:{fields:[i({suffix:"start"}),i({suffix:"start"}),i({suffix:"end"}),i({suffix:"end"})],ops:["min","max","min","max"]}}},encode:{update:o},marks:[{type:"group",encode:{update:a},marks:[t]}]}]}(e)}return wp(e)}const xp="faceted_path_";const $p="stack_group_";function wp(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{fromPrefix:""};const{mark:i,markDef:r,encoding:o,config:a}=e,s=q(r.clip,function(e){const t=e.getScaleComponent("x"),n=e.getScaleComponent("y");return!(!t?.get("selectionExtent")&&!n?.get("selectionExtent"))||void 0}(e),function(e){const t=e.component.projection;return!(!t||t.isFit)||void 0}(e)),l=Pn(r),c=o.key,u=function(e){const{encoding:n,stack:i,mark:r,markDef:o,config:a}=e,s=n.order;if(!(!t.isArray(s)&&ta(s)&&m(s.value)||!s&&m(_n("order",o,a)))){if((t.isArray(s)||Go(s))&&!i)return En(s,{expr:"datum"});if(Gr(r)){const e="horizontal"===o.orient?"y":"x";if(Go(n[e]))return{field:e}}}}(e),f=function(e){if(!e.component.selection)return null;const t=D(e.component.selection).length;let n=t,i=e.parent;for(;i&&0===n;)n=D(i.component.selection).length,i=i.parent;return n?{interactive:t>0||"geoshape"===e.mark||!!e.encoding.tooltip||!!e.markDef.tooltip}:null}(e),d=_n("aria",r,a),p=vp[i].postEncodingTransform?vp[i].postEncodingTransform(e):null;return[{name:e.getName("marks"),type:vp[i].vgMark,...s?{clip:s}:{},...l?{style:l}:{},...c?{key:c.field}:{},...u?{sort:u}:{},...f||{},...!1===d?{aria:d}:{},from:{data:n.fromPrefix+e.requestDataName(mc.Main)},encode:{update:vp[i].encodeEntry(e)},...p?{transform:p}:{}}]}class kp extends Cm{specifiedScales={};specifiedAxes={};specifiedLegends={};specifiedProjection={};selection=[];children=[];constructor(e,n,i){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},o=arguments.length>4?arguments[4]:void 0;super(e,"unit",n,i,o,void 0,As(e)?e.view:void 0);const a=Qr(e.mark)?{...e.mark}:{type:e.mark},s=a.type;void 0===a.filled&&(a.filled=function(e,t,n){let{graticule:i}=n;if(i)return!1;const r=An("filled",e,t),o=e.type;return q(r,o!==Rr&&o!==Mr&&o!==qr)}(a,o,{graticule:e.data&&dc(e.data)}));const l=this.encoding=function(e,n,i,r){const o={};for(const t of D(e))Ze(t)||vi(`${a=t}-encoding is dropped as ${a} is not a valid encoding channel.`);var a;for(let a of ct){if(!e[a])continue;const s=e[a];if(At(a)){const e=lt(a),t=o[e];if(Go(t)&&Zi(t.type)&&Go(s)&&!t.timeUnit){vi(Zn(e));continue}}if("angle"!==a||"arc"!==n||e.theta||(vi("Arc marks uses theta channel rather than angle, replacing angle with theta."),a=le),Wa(e,a,n)){if(a===ve&&"line"===n){const t=ha(e[a]);if(t?.aggregate){vi("Line marks cannot encode size with a non-groupby field. You may want to use trail marks instead.");continue}}if(a===pe&&(i?"fill"in e:"stroke"in e))vi(ti("encoding",{fill:"fill"in e,stroke:"stroke"in e}));else if(a===Oe||a===Fe&&!t.isArray(s)&&!ta(s)||a===Ce&&t.isArray(s)){if(s){if(a===Fe){const t=e[a];if(Io(t)){o[a]=t;continue}}o[a]=t.array(s).reduce(((e,t)=>(Go(t)?e.push(xa(t,a)):vi(ni(t,a)),e)),[])}}else{if(a===Ce&&null===s)o[a]=null;else if(!(Go(s)||Xo(s)||ta(s)||Bo(s)||vn(s))){vi(ni(s,a));continue}o[a]=va(s,a,r)}}else vi(ii(a,n))}return o}(e.encoding||{},s,a.filled,o);this.markDef=ol(a,l,o),this.size=function(e){let{encoding:t,size:n}=e;for(const e of Ot){const i=ot(e);_s(n[i])&&Qo(t[e])&&(delete n[i],vi(fi(i)))}return n}({encoding:l,size:As(e)?{...r,...e.width?{width:e.width}:{},...e.height?{height:e.height}:{}}:r}),this.stack=rl(this.markDef,l),this.specifiedScales=this.initScales(s,l),this.specifiedAxes=this.initAxes(l),this.specifiedLegends=this.initLegends(l),this.specifiedProjection=e.projection,this.selection=(e.params??[]).filter((e=>Fs(e)))}get hasProjection(){const{encoding:e}=this,t=this.mark===Hr,n=e&&Re.some((t=>Zo(e[t])));return t||n}scaleDomain(e){const t=this.specifiedScales[e];return t?t.domain:void 0}axis(e){return this.specifiedAxes[e]}legend(e){return this.specifiedLegends[e]}initScales(e,t){return Vt.reduce(((e,n)=>{const i=ya(t[n]);return i&&(e[n]=this.initScale(i.scale??{})),e}),{})}initScale(e){const{domain:n,range:i}=e,r=gn(e);return t.isArray(n)&&(r.domain=n.map(Dn)),t.isArray(i)&&(r.range=i.map(Dn)),r}initAxes(e){return Ot.reduce(((t,n)=>{const i=e[n];if(Zo(i)||n===ee&&Zo(e.x2)||n===te&&Zo(e.y2)){const e=Zo(i)?i.axis:void 0;t[n]=e?this.initAxis({...e}):e}return t}),{})}initAxis(e){const t=D(e),n={};for(const i of t){const t=e[i];n[i]=za(t)?Sn(t):Dn(t)}return n}initLegends(e){return It.reduce(((t,n)=>{const i=ya(e[n]);if(i&&function(e){switch(e){case pe:case ge:case he:case ve:case ye:case xe:case ke:case Se:return!0;case $e:case we:case be:return!1}}(n)){const e=i.legend;t[n]=e?gn(e):e}return t}),{})}parseData(){this.component.data=ep(this)}parseLayoutSize(){!function(e){const{size:t,component:n}=e;for(const i of Ot){const r=ot(i);if(t[r]){const e=t[r];n.layoutSize.set(r,_s(e)?"step":e,!0)}else{const t=Qm(e,r);n.layoutSize.set(r,t,!1)}}}(this)}parseSelections(){this.component.selection=function(e,n){const i={},r=e.config.selection;if(!n||!n.length)return i;for(const o of n){const n=C(o.name),a=o.select,s=t.isString(a)?a:a.type,c=t.isObject(a)?l(a):{type:s},u=r[s];for(const e in u)"fields"!==e&&"encodings"!==e&&("mark"===e&&(c.mark={...u.mark,...c.mark}),void 0!==c[e]&&!0!==c[e]||(c[e]=l(u[e]??c[e])));const f=i[n]={...c,name:n,type:s,init:o.value,bind:o.bind,events:t.isString(c.on)?t.parseSelector(c.on,"scope"):t.array(l(c.on))},d=l(o);for(const t of qu)t.defined(f)&&t.parse&&t.parse(e,f,d)}return i}(this,this.selection)}parseMarkGroup(){this.component.mark=bp(this)}parseAxesAndHeaders(){var e;this.component.axes=(e=this,Ot.reduce(((t,n)=>(e.component.scales[n]&&(t[n]=[fp(n,e)]),t)),{}))}assembleSelectionTopLevelSignals(e){return function(e,n){let i=!1;for(const r of F(e.component.selection??{})){const o=r.name,a=t.stringValue(o+Eu);if(0===n.filter((e=>e.name===o)).length){const e="global"===r.resolve?"union":r.resolve,i="point"===r.type?", true, true)":")";n.push({name:r.name,update:`${Lu}(${a}, ${t.stringValue(e)}${i}`})}i=!0;for(const t of qu)t.defined(r)&&t.topLevelSignals&&(n=t.topLevelSignals(e,r,n))}i&&0===n.filter((e=>"unit"===e.name)).length&&n.unshift({name:"unit",value:{},on:[{events:"pointermove",update:"isTuple(group()) ? group() : unit"}]});return xc(n)}(this,e)}assembleSignals(){return[...Zu(this),...yc(this,[])]}assembleSelectionData(e){return function(e,t){const n=[...t],i=Uu(e,{escape:!1});for(const t of F(e.component.selection??{})){const e={name:t.name+Eu};if(t.project.hasSelectionId&&(e.transform=[{type:"collect",sort:{field:ws}}]),t.init){const n=t.project.items.map(gc);e.values=t.project.hasSelectionId?t.init.map((e=>({unit:i,[ws]:hc(e,!1)[0]}))):t.init.map((e=>({unit:i,fields:n,values:hc(e,!1)})))}n.filter((e=>e.name===t.name+Eu)).length||n.push(e)}return n}(this,e)}assembleLayout(){return null}assembleLayoutSignals(){return Ff(this)}assembleMarks(){let e=this.component.mark??[];return this.parent&&Om(this.parent)||(e=bc(this,e)),e.map(this.correctDataNames)}assembleGroupStyle(){const{style:e}=this.view||{};return void 0!==e?e:this.encoding.x||this.encoding.y?"cell":"view"}getMapping(){return this.encoding}get mark(){return this.markDef.type}channelHasField(e){return Ma(this.encoding,e)}fieldDef(e){return ha(this.encoding[e])}typedFieldDef(e){const t=this.fieldDef(e);return ea(t)?t:null}}class Sp extends zm{constructor(e,t,n,i,r){super(e,"layer",t,n,r,e.resolve,e.view);const o={...i,...e.width?{width:e.width}:{},...e.height?{height:e.height}:{}};this.children=e.layer.map(((e,t)=>{if(Js(e))return new Sp(e,this,this.getName(`layer_${t}`),o,r);if(ja(e))return new kp(e,this,this.getName(`layer_${t}`),o,r);throw new Error(qn(e))}))}parseData(){this.component.data=ep(this);for(const e of this.children)e.parseData()}parseLayoutSize(){var e;Ym(e=this),Xm(e,"width"),Xm(e,"height")}parseSelections(){this.component.selection={};for(const e of this.children){e.parseSelections();for(const t of D(e.component.selection))this.component.selection[t]=e.component.selection[t]}}parseMarkGroup(){for(const e of this.children)e.parseMarkGroup()}parseAxesAndHeaders(){!function(e){const{axes:t,resolve:n}=e.component,i={top:0,bottom:0,right:0,left:0};for(const i of e.children){i.parseAxesAndHeaders();for(const r of D(i.component.axes))n.axis[r]=Af(e.component.resolve,r),"shared"===n.axis[r]&&(t[r]=sp(t[r],i.component.axes[r]),t[r]||(n.axis[r]="independent",delete t[r]))}for(const r of Ot){for(const o of e.children)if(o.component.axes[r]){if("independent"===n.axis[r]){t[r]=(t[r]??[]).concat(o.component.axes[r]);for(const e of o.component.axes[r]){const{value:t,explicit:n}=e.getWithExplicit("orient");if(!vn(t)){if(i[t]>0&&!n){const n=ap[t];i[t]>i[n]&&e.set("orient",n,!1)}i[t]++}}}delete o.component.axes[r]}if("independent"===n.axis[r]&&t[r]&&t[r].length>1)for(const[e,n]of(t[r]||[]).entries())e>0&&n.get("grid")&&!n.explicit.grid&&(n.implicit.grid=!1)}}(this)}assembleSelectionTopLevelSignals(e){return this.children.reduce(((e,t)=>t.assembleSelectionTopLevelSignals(e)),e)}assembleSignals(){return this.children.reduce(((e,t)=>e.concat(t.assembleSignals())),Zu(this))}assembleLayoutSignals(){return this.children.reduce(((e,t)=>e.concat(t.assembleLayoutSignals())),Ff(this))}assembleSelectionData(e){return this.children.reduce(((e,t)=>t.assembleSelectionData(e)),e)}assembleGroupStyle(){const e=new Set;for(const n of this.children)for(const i of t.array(n.assembleGroupStyle()))e.add(i);const n=Array.from(e);return n.length>1?n:1===n.length?n[0]:void 0}assembleTitle(){let e=super.assembleTitle();if(e)return e;for(const t of this.children)if(e=t.assembleTitle(),e)return e}assembleLayout(){return null}assembleMarks(){return function(e,t){for(const n of e.children)Sm(n)&&(t=bc(n,t));return t}(this,this.children.flatMap((e=>e.assembleMarks())))}assembleLegends(){return this.children.reduce(((e,t)=>e.concat(t.assembleLegends())),Qf(this))}}function Dp(e,t,n,i,r){if(Mo(e))return new Km(e,t,n,r);if(Js(e))return new Sp(e,t,n,i,r);if(ja(e))return new kp(e,t,n,i,r);if(function(e){return Cs(e)||Ns(e)||zs(e)}(e))return new np(e,t,n,r);throw new Error(qn(e))}const Fp=n;e.accessPathDepth=L,e.accessPathWithDatum=A,e.compile=function(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};var i;n.logger&&(i=n.logger,yi=i),n.fieldTitle&&fa(n.fieldTitle);try{const i=Vs(t.mergeConfig(n.config,e.config)),r=Hl(e,i),o=Dp(r,null,"",void 0,i);o.parse(),function(e,t){Wd(e.sources);let n=0,i=0;for(let i=0;i<Ud&&Bd(e,t,!0);i++)n++;e.sources.map(Rd);for(let n=0;n<Ud&&Bd(e,t,!1);n++)i++;Wd(e.sources),Math.max(n,i)===Ud&&vi(`Maximum optimization runs(${Ud}) reached.`)}(o.component.data,o);const a=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},i=arguments.length>3?arguments[3]:void 0;const r=e.config?Xs(e.config):void 0,o=[].concat(e.assembleSelectionData([]),function(e,t){const n=[],i=Im(n);let r=0;for(const t of e.sources){t.hasName()||(t.dataName="source_"+r++);const e=t.assemble();i(t,e)}for(const e of n)0===e.transform.length&&delete e.transform;let o=0;for(const[e,t]of n.entries())0!==(t.transform??[]).length||t.source||n.splice(o++,0,n.splice(e,1)[0]);for(const t of n)for(const n of t.transform??[])"lookup"===n.type&&(n.from=e.outputNodes[n.from].getSource());for(const e of n)e.name in t&&(e.values=t[e.name]);return n}(e.component.data,n)),a=e.assembleProjections(),s=e.assembleTitle(),l=e.assembleGroupStyle(),c=e.assembleGroupEncodeEntry(!0);let u=e.assembleLayoutSignals();u=u.filter((e=>"width"!==e.name&&"height"!==e.name||void 0===e.value||(t[e.name]=+e.value,!1)));const{params:f,...d}=t;return{$schema:"https://vega.github.io/schema/vega/v5.json",...e.description?{description:e.description}:{},...d,...s?{title:s}:{},...l?{style:l}:{},...c?{encode:{update:c}}:{},data:o,...a.length>0?{projections:a}:{},...e.assembleGroup([...u,...e.assembleSelectionTopLevelSignals([]),...Os(f)]),...r?{config:r}:{},...i?{usermeta:i}:{}}}(o,function(e,n,i,r){const o=r.component.layoutSize.get("width"),a=r.component.layoutSize.get("height");void 0===n?(n={type:"pad"},r.hasAxisOrientSignalRef()&&(n.resize=!0)):t.isString(n)&&(n={type:n});if(o&&a&&(s=n.type,["fit","fit-x","fit-y"].includes(s)))if("step"===o&&"step"===a)vi(Bn()),n.type="pad";else if("step"===o||"step"===a){const e="step"===o?"width":"height";vi(Bn(Pt(e)));const t="width"===e?"height":"width";n.type=function(e){return e?`fit-${Pt(e)}`:"fit"}(t)}var s;return{...1===D(n).length&&n.type?"pad"===n.type?{}:{autosize:n.type}:{autosize:n},...Kl(i,!1),...Kl(e,!0)}}(e,r.autosize,i,o),e.datasets,e.usermeta);return{spec:a,normalized:r}}finally{n.logger&&(yi=hi),n.fieldTitle&&fa(ca)}},e.contains=p,e.deepEqual=Y,e.deleteNestedProperty=P,e.duplicate=l,e.entries=O,e.every=h,e.fieldIntersection=k,e.flatAccessWithDatum=T,e.getFirstDefined=q,e.hasIntersection=$,e.hasProperty=Q,e.hash=d,e.internalField=I,e.isBoolean=z,e.isEmpty=S,e.isEqual=function(e,t){const n=D(e),i=D(t);if(n.length!==i.length)return!1;for(const i of n)if(e[i]!==t[i])return!1;return!0},e.isInternalField=B,e.isNullOrFalse=m,e.isNumeric=H,e.keys=D,e.logicalExpr=N,e.mergeDeep=y,e.never=c,e.normalize=Hl,e.normalizeAngle=V,e.omit=f,e.pick=u,e.prefixGenerator=w,e.removePathFromField=R,e.replaceAll=M,e.replacePathInField=E,e.resetIdCounter=function(){U=42},e.setEqual=x,e.some=g,e.stringify=X,e.titleCase=_,e.unique=b,e.uniqueId=W,e.vals=F,e.varName=C,e.version=Fp}));
+//# sourceMappingURL=vega-lite.min.js.map
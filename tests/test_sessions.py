@@ -0,0 +1,148 @@
+"""
+Selection state is per session: picking a dataset in one session must not
+recompute the outputs of the others, and the shared memos must be built
+once per dataset, however many sessions read them.
+"""
+import json
+import os
+import shutil
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+import duckdb
+import pytest
+from starlette.testclient import TestClient
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+VERSION = "2025-08-20T13-52-15"
+
+OUTPUTS = [
+    "overview-table_html2",
+    "pipe-pipe_plot_ui",
+    "validation-validation_report_ui",
+    "variables-presence_plot_ui",
+    "class-class_plot_ui",
+    "labels-labels_plot_ui",
+]
+
+# Builders behind the memos shared by all sessions
+BUILDERS = [
+    ("sp3ctrapp.versions", "VersionIndex"),
+    ("sp3ctrapp.history", "schema_matrix"),
+    ("sp3ctrapp.coverage", "build_coverage"),
+    ("sp3ctrapp.tables", "table_pointer"),
+]
+
+# Work done by the reactive calcs of each session
+CALCS = [
+    ("sp3ctrapp.moduleVariables", "plot_PresenceMatrixWeb"),
+    ("sp3ctrapp.moduleClass", "plot_TypeMatrixWeb"),
+    ("sp3ctrapp.moduleLabels", "plot_LabelMatrix"),
+    ("sp3ctrapp.modulePipe", "plot_pipe"),
+    ("sp3ctrapp.moduleValidation", "report_path"),
+]
+
+
+def prepare(workdir):
+    # Copy of meta.duckdb with a second dataset "walrus" to switch to
+    data = os.path.join(workdir, "src", "sp3ctrapp", "data")
+    os.makedirs(data)
+    path = os.path.join(data, "meta.duckdb")
+    shutil.copyfile(os.path.join(ROOT, "src", "sp3ctrapp", "data", "meta.duckdb"), path)
+    con = duckdb.connect(path)
+    for table in ("pointers", "columns"):
+        con.execute(
+            f"INSERT INTO {table} SELECT * REPLACE ('walrus' AS \"table\") "
+            f"FROM {table} WHERE \"table\" = 'penguins'"
+        )
+    con.close()
+
+
+def init_message(dataset):
+    data = {".clientdata_url_hostname": "127.0.0.1", ".clientdata_pixelratio": 1}
+    for name in OUTPUTS:
+        data[f".clientdata_output_{name}_hidden"] = False
+    data["about-first_choice"] = dataset
+    data["about-second_choice"] = VERSION
+    for module in ("variables", "class", "labels"):
+        data[f"{module}-compact"] = False
+    return {"method": "init", "data": data}
+
+
+def wait_idle(ws):
+    # Drain messages until the server reports the flush cycle is done
+    while True:
+        message = ws.receive_json()
+        if message.get("busy") == "idle":
+            return
+
+
+def settle():
+    # Give other sessions the chance to (wrongly) react before counting
+    time.sleep(0.5)
+
+
+@pytest.fixture
+def calls(tmp_path, monkeypatch):
+    """Count builder and calc calls per (function, dataset) on a scratch database."""
+    import importlib
+
+    from sp3ctrapp.getduck import close_connections, swap_database
+
+    prepare(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SPECTRE_WATCH_INTERVAL", "3600")
+    monkeypatch.setenv("SPECTRE_PLOT_BACKEND", "server")
+    monkeypatch.setenv("SPECTRE_RENDER_CACHE_DIR", str(tmp_path / "render-cache"))
+    # Open the scratch copy and drop whatever the memos hold
+    swap_database(verify=False)
+
+    counts = Counter()
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            dataset = kwargs.get("table", args[0] if args else None)
+            counts[(name, dataset)] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for module_name, name in BUILDERS + CALCS:
+        module = importlib.import_module(module_name)
+        monkeypatch.setattr(module, name, counting(name, getattr(module, name)))
+
+    yield counts
+    close_connections()
+
+
+@pytest.mark.parametrize("sessions", [1, 4])
+def test_dataset_change_recomputes_only_its_session(calls, sessions):
+    from sp3ctrapp.app import app
+
+    with TestClient(app) as client, ExitStack() as stack:
+        sockets = [
+            stack.enter_context(client.websocket_connect("/websocket/")) for _ in range(sessions)
+        ]
+        for ws in sockets:
+            ws.send_text(json.dumps(init_message("penguins")))
+            wait_idle(ws)
+        settle()
+
+        # The memos are built once, the calcs run once per session
+        for _, name in BUILDERS:
+            assert calls[(name, "penguins")] == 1, name
+        for _, name in CALCS:
+            assert calls[(name, "penguins")] == sessions, name
+
+        before = calls.copy()
+        sockets[0].send_text(
+            json.dumps({"method": "update", "data": {"about-first_choice": "walrus"}})
+        )
+        wait_idle(sockets[0])
+        settle()
+
+        changed = calls - before
+        # One session picked walrus: every builder and calc ran once for it,
+        # nothing ran again for penguins in the other sessions
+        assert changed == Counter({(name, "walrus"): 1 for _, name in BUILDERS + CALCS})